@@ -20,6 +20,18 @@
 #     5-Sep-2014 (MB) Added garbage collect command
 #    16-Dec-2015 (CT) Change to `UI_Spec`
 #    11-Oct-2016 (CT) Change `GTW.HTML` to `TFL.HTML`
+#    18-Oct-2026 (RS) Add options `-batch_size`, `-max_networks`,
+#                     `-max_seconds` to `collect_garbage`;
+#                     commit the changes done by `collect_garbage`
+#    18-Oct-2026 (RS) Add option `-jobs` to `collect_garbage`,
+#                     report per-root timings, retry batches after
+#                     `Commit_Conflict`, query roots per concrete E_Type
+#    18-Oct-2026 (RS) Add sub-command `update_flags`
+#    18-Oct-2026 (RS) Add sub-command `refill_warm_cache`
+#    18-Oct-2026 (RS) Add sub-command `simulate`, option `-replay_log`
+#    18-Oct-2026 (RS) Add sub-command `dns_zones`
+#    18-Oct-2026 (RS) Add sub-command `changes`, add `create_rst`
+#    18-Oct-2026 (RS) Add sub-command `monitoring_targets`
 #    ««revision-date»»···
 #--
 
@@ -32,10 +44,16 @@ from   _TFL                     import TFL
 
 import _CNDB._Base_Command_
 import _CNDB._OMP.import_CNDB
+import _CNDB._OMP.Change_Feed
+import _CNDB._OMP.DNS_Zone_Writer
+import _CNDB._OMP.IP_Replay_Log
+import _CNDB._OMP.IP_Simulator
+import _CNDB._OMP.Monitoring_Target_Writer
 
 import _GTW._OMP._Auth.import_Auth
 import _GTW._OMP._PAP.import_PAP
 
+import _GTW._RST.RAT
 import _GTW._RST._MOM.Doc
 import _GTW._RST._MOM.Scope
 import _GTW._RST._TOP._MOM.Doc
@@ -61,8 +79,24 @@ from   _TFL._Meta.Property      import Class_Property
 
 import _TFL.CAO
 
+import multiprocessing
+import sys
+import time
+
 from   _CNDB._GTW               import RST_addons
 
+_gc_job = None
+
+def _gc_init (command, cmd, deadline) :
+    global _gc_job
+    _gc_job = (command, cmd, deadline)
+# end def _gc_init
+
+def _gc_run (pid) :
+    command, cmd, deadline = _gc_job
+    return command._collect_garbage_worker (cmd, pid, deadline)
+# end def _gc_run
+
 class _CNDB_Sub_Command_ (TFL.Command.Sub_Command) :
 
     _rn_prefix              = "_CNDB"
@@ -75,23 +109,388 @@ class CNDB_Command (CNDB._Base_Command_, GTW.Werkzeug.Command) :
 
     _opts                   = \
         ( "-auth_required:B=True?Is authorization required?"
-        ,
+        , "-replay_log:S?Append the IP network operations to this "
+            "replay log"
         )
     _template_prefixes      = dict \
         ( CNDB              = sos.path.dirname (_CNDB._JNJ.__file__)
         )
 
+    gc_conflict_delay       = 0.05
+    gc_max_conflicts        = 20
+
+    class _CNDB_Changes_ (_Sub_Command_) :
+        """Print the changes after a change id as JSON lines"""
+
+        _opts                   = \
+            ( "-after:I=0?Print the changes after this change id"
+            , "-follow:B?Keep waiting for new changes"
+            , "-limit:I=0?Maximum number of entries to print per query"
+            , "-wait:F=30?Seconds to wait for changes per query, "
+                "with `-follow`"
+            )
+
+    _Changes_ = _CNDB_Changes_ # end class
+
     class _CNDB_Collect_Garbage_ (_Sub_Command_) :
         """Collect freed IP addresses out of cooldown"""
 
+        _opts                   = \
+            ( "-batch_size:I=0?Commit after processing this many networks"
+            , "-jobs:I=1?Number of worker processes, one root network each"
+            , "-max_networks:I=0?Maximum number of networks to process"
+            , "-max_seconds:F=0?Maximum run time in seconds"
+            )
+
     _Collect_Garbage_ = _CNDB_Collect_Garbage_ # end class
 
-    def _handle_collect_garbage (self, cmd) :
+    class _CNDB_DNS_Zones_ (_Sub_Command_) :
+        """Write the forward and reverse DNS zone files of the addresses
+           of the net interfaces, bump the serials of changed zones only
+        """
+
+        _opts                   = \
+            ( "-directory:P=.?Directory to write the zone files to"
+            , "-domain:S?Domain of the forward zone"
+            , "-hostmaster:S?Mail address of the hostmaster"
+            , "-nameservers:S,?Name servers of the zones, primary first"
+            , "-reverse_mask_len_4:I=24?Mask length of the IPv4 reverse "
+                "zones"
+            , "-reverse_mask_len_6:I=64?Mask length of the IPv6 reverse "
+                "zones"
+            , "-ttl:I=3600?Default time to live of the records"
+            )
+
+    _DNS_Zones_ = _CNDB_DNS_Zones_ # end class
+
+    class _CNDB_Monitoring_Targets_ (_Sub_Command_) :
+        """Write the smokeping targets and Prometheus `file_sd` files of
+           the addresses of the net interfaces, of the nodes changed since
+           the last run only
+        """
+
+        _opts                   = \
+            ( "-directory:P=.?Directory to write the target files to"
+            , "-full:B?Write the targets of all nodes"
+            )
+
+    _Monitoring_Targets_ = _CNDB_Monitoring_Targets_ # end class
+
+    class _CNDB_Refill_Warm_Cache_ (_Sub_Command_) :
+        """Pre-split free blocks for the warm caches of the IP pools"""
+
+        _opts                   = \
+            ( "-pools:S,?Names of the pools to refill "
+                "(default: all pools with `warm_blocks`)"
+            ,
+            )
+
+    _Refill_Warm_Cache_ = _CNDB_Refill_Warm_Cache_ # end class
+
+    class _CNDB_Simulate_ (_Sub_Command_) :
+        """Replay an IP replay log, or a synthetic workload, against a
+           fresh in-memory scope
+        """
+
+        _opts                   = \
+            ( "-alloc_ratio:F=0.6?Fraction of allocations of the "
+                "synthetic workload"
+            , "-cool_down:F=86400?Cool-down period of the synthetic frees "
+                "in seconds"
+            , "-family:S=4?Address family of the synthetic workload (4, 6)"
+            , "-gc_every:I=1000?Collect garbage every this many synthetic "
+                "operations"
+            , "-log:S?Replay log to replay (default: synthetic workload)"
+            , "-ops:I=10000?Number of synthetic operations"
+            , "-report_every:I=1000?Report after this many operations"
+            , "-seed:I=42?Seed of the synthetic workload"
+            )
+
+    _Simulate_ = _CNDB_Simulate_ # end class
+
+    class _CNDB_Update_Flags_ (_Sub_Command_) :
+        """Recompute the stored flags `has_children` and `is_free` of all
+           IP networks, e.g., after a migration
+        """
+
+    _Update_Flags_ = _CNDB_Update_Flags_ # end class
+
+    def create_rst (self, cmd, ** kw) :
+        """Return the root of the RESTful api of CNDB, with the change feed
+           for superusers as `changes`.
+        """
+        result = GTW.RST.Root \
+            ( entries           =
+                [ GTW.RST.MOM.Scope
+                    ( name          = "v1"
+                    , auth_required = cmd.auth_required
+                    )
+                , GTW.RST.MOM.Doc.App_Type (name = "Doc")
+                , CNDB.OMP.RST_Change_Feed (name = "changes")
+                , GTW.RST.RAT              (name = "RAT")
+                ]
+            , ** kw
+            )
+        return result
+    # end def create_rst
+
+    def _handle_changes (self, cmd) :
         scope = self._handle_load (cmd)
-        for ipn in scope.CNDB.IP_Network.query (~MOM.Q.parent) :
-            ipn.collect_garbage ()
+        try :
+            feed  = CNDB.OMP.Change_Feed (scope)
+            after = cmd.after
+            limit = cmd.limit or None
+            while True :
+                if cmd.follow :
+                    entries = feed.wait (after, cmd.wait, limit)
+                else :
+                    entries = list (feed.entries (after, limit))
+                for entry in entries :
+                    print (feed.json_line (entry))
+                    after = entry ["cid"]
+                sys.stdout.flush ()
+                if not cmd.follow :
+                    break
+        except KeyboardInterrupt :
+            pass
+        finally :
+            scope.destroy ()
+    # end def _handle_changes
+
+    def _handle_collect_garbage (self, cmd) :
+        deadline = (time.time () + cmd.max_seconds) if cmd.max_seconds \
+            else None
+        scope    = self._handle_load (cmd)
+        ### `parent` of the partial `IP_Network` isn't usable in queries of
+        ### all backends, query the roots of each concrete E_Type
+        roots    = list \
+            ( ipn
+            for tn  in sorted (scope.CNDB.IP_Network.E_Type.children_np)
+            for ipn in scope [tn].query (~MOM.Q.parent).all ()
+            )
+        if cmd.jobs > 1 and len (roots) > 1 :
+            pids  = [ipn.pid for ipn in roots]
+            ### the workers open their own database connections
+            scope.destroy ()
+            results = self._collect_garbage_parallel (cmd, pids, deadline)
+        else :
+            results = self._collect_garbage_sequential \
+                (cmd, scope, roots, deadline)
+            scope.destroy ()
+        if cmd.verbose or cmd.jobs > 1 :
+            for name, count, seconds in results :
+                print \
+                    ( "%-40s %8s networks %8.2f s"
+                    % (name, "all" if count is None else count, seconds)
+                    )
     # end def _handle_collect_garbage
 
+    def _handle_refill_warm_cache (self, cmd) :
+        scope = self._handle_load (cmd)
+        try :
+            names = set (n.lower () for n in cmd.pools)
+            pools = list \
+                ( p
+                for tn in sorted (scope.CNDB.IP_Pool.E_Type.children_np)
+                for p  in scope [tn].query (MOM.Q.warm_blocks > 0).all ()
+                if not names or p.name.lower () in names
+                )
+            for p in pools :
+                start = time.time ()
+                ready = p.refill_warm_cache (commit = True)
+                if cmd.verbose or ready < p.warm_blocks :
+                    print \
+                        ( "%-40s %8d of %8d ready %8.2f s"
+                        % (p.name, ready, p.warm_blocks, time.time () - start)
+                        )
+        finally :
+            scope.destroy ()
+    # end def _handle_refill_warm_cache
+
+    def _handle_dns_zones (self, cmd) :
+        scope = self._handle_load (cmd)
+        try :
+            writer = CNDB.OMP.DNS_Zone_Writer \
+                ( scope, cmd.directory, cmd.domain, cmd.nameservers
+                , cmd.hostmaster
+                , ttl              = cmd.ttl
+                , reverse_mask_len =
+                    {4 : cmd.reverse_mask_len_4, 6 : cmd.reverse_mask_len_6}
+                )
+            for zone, serial, changed in writer.write_all () :
+                if changed or cmd.verbose :
+                    print \
+                        ( "%-50s %10d %s"
+                        % (zone, serial, "changed" if changed else "")
+                        )
+        finally :
+            scope.destroy ()
+    # end def _handle_dns_zones
+
+    def _handle_monitoring_targets (self, cmd) :
+        scope = self._handle_load (cmd)
+        try :
+            writer = CNDB.OMP.Monitoring_Target_Writer (scope, cmd.directory)
+            for name, action in writer.write_all (full = cmd.full) :
+                print ("%-50s %s" % (name, action))
+        finally :
+            scope.destroy ()
+    # end def _handle_monitoring_targets
+
+    def _handle_load (self, cao, * args, ** kw) :
+        result = self.__super._handle_load (cao, * args, ** kw)
+        if getattr (cao, "replay_log", None) :
+            CNDB.OMP.IP_Replay_Log.attach (result, cao.replay_log)
+        return result
+    # end def _handle_load
+
+    def _handle_simulate (self, cmd) :
+        scope = self.scope ("hps://", None, create = True)
+        try :
+            sim = CNDB.OMP.IP_Simulator (scope)
+            if cmd.log :
+                entries = CNDB.OMP.IP_Replay_Log.read (cmd.log)
+            else :
+                entries = sim.synthetic \
+                    ( family      = cmd.family
+                    , ops         = cmd.ops
+                    , seed        = cmd.seed
+                    , alloc_ratio = cmd.alloc_ratio
+                    , gc_every    = cmd.gc_every
+                    , cool_down   = cmd.cool_down
+                    )
+            print \
+                ( "%8s %10s %8s %8s %6s %10s %8s"
+                % ("ops", "ops/s", "networks", "blocks", "frag", "diverged",
+                   "errors")
+                )
+            for snap in sim.run (entries, cmd.report_every) :
+                print \
+                    ( "%(ops)8d %(rate)10.1f %(networks)8d %(blocks)8d "
+                      "%(frag)6.3f %(diverged)10d %(errors)8d" % snap
+                    )
+        finally :
+            scope.destroy ()
+    # end def _handle_simulate
+
+    def _handle_update_flags (self, cmd) :
+        scope = self._handle_load (cmd)
+        try :
+            start   = time.time ()
+            changed = scope.CNDB.IP_Network.update_all_flags (scope)
+            scope.commit ()
+            print \
+                ( "Updated the flags of %d networks in %.2f s"
+                % (changed, time.time () - start)
+                )
+        finally :
+            scope.destroy ()
+    # end def _handle_update_flags
+
+    def _collect_garbage_parallel (self, cmd, pids, deadline) :
+        """Collect garbage of the root networks `pids` in `cmd.jobs`
+           worker processes, each using its own scope.
+
+           The roots are disjoint address ranges, therefore the workers
+           don't change the same objects. The database must support
+           concurrent writers, this doesn't work for `hps` databases.
+           `cmd.max_networks` limits the work of each worker.
+        """
+        ctx  = multiprocessing.get_context ("fork")
+        pool = ctx.Pool \
+            ( min (cmd.jobs, len (pids))
+            , initializer = _gc_init
+            , initargs    = (self, cmd, deadline)
+            )
+        try :
+            return pool.map (_gc_run, pids, chunksize = 1)
+        finally :
+            pool.close ()
+            pool.join  ()
+    # end def _collect_garbage_parallel
+
+    def _collect_garbage_root (self, cmd, scope, ipn, deadline, remaining) :
+        """Collect garbage of root network `ipn`, commit after each batch.
+
+           If the commit of a batch conflicts with a concurrent commit, the
+           batch is retried up to `gc_max_conflicts` times.
+
+           Returns the number of networks processed, None if garbage was
+           collected without limits.
+        """
+        bounded   = bool (cmd.batch_size or remaining or deadline)
+        conflicts = 0
+        pid       = ipn.pid
+        result    = 0 if bounded else None
+        while True :
+            limits = [l for l in (cmd.batch_size, remaining) if l]
+            limit  = min (limits) if limits else None
+            try :
+                if bounded :
+                    count = ipn.collect_garbage \
+                        (max_networks = limit, deadline = deadline)
+                else :
+                    ipn.collect_garbage ()
+                scope.commit ()
+            except MOM.Error.Commit_Conflict :
+                ### discard the changes of the batch, then repeat it
+                scope.rollback ()
+                conflicts += 1
+                if conflicts > self.gc_max_conflicts :
+                    raise
+                time.sleep (self.gc_conflict_delay * conflicts)
+                ipn = scope.pid_query (pid)
+                continue
+            if not bounded :
+                break
+            result += count
+            if remaining is not None :
+                remaining -= count
+                if remaining <= 0 :
+                    break
+            if deadline is not None and time.time () >= deadline :
+                break
+            if limit is None or count < limit :
+                break
+        return result
+    # end def _collect_garbage_root
+
+    def _collect_garbage_sequential (self, cmd, scope, roots, deadline) :
+        """Collect garbage of `roots` one after the other. Stop after
+           `cmd.max_networks` networks or at `deadline`, whatever comes
+           first; the next run continues with the remaining work.
+        """
+        result    = []
+        remaining = cmd.max_networks or None
+        for ipn in roots :
+            start = time.time ()
+            count = self._collect_garbage_root \
+                (cmd, scope, ipn, deadline, remaining)
+            result.append \
+                ((str (ipn.net_address), count, time.time () - start))
+            if remaining is not None :
+                remaining -= count
+                if remaining <= 0 :
+                    break
+            if deadline is not None and time.time () >= deadline :
+                break
+        return result
+    # end def _collect_garbage_sequential
+
+    def _collect_garbage_worker (self, cmd, pid, deadline) :
+        """Collect garbage of root network `pid` using a new scope."""
+        start = time.time ()
+        scope = self._handle_load (cmd)
+        try :
+            ipn   = scope.pid_query (pid)
+            name  = str (ipn.net_address)
+            count = self._collect_garbage_root \
+                (cmd, scope, ipn, deadline, cmd.max_networks or None)
+        finally :
+            scope.destroy ()
+        return name, count, time.time () - start
+    # end def _collect_garbage_worker
+
 Command = CNDB_Command # end class
 
 if __name__ != "__main__" :
@@ -135,6 +135,11 @@
 #    16-Dec-2015 (CT) Fix ETM-splitting in `User_Entity.__init__`
 #    16-Dec-2015 (CT) Use `E_Type.UI_Spec`
 #    10-Jun-2016 (CT) Change `_DB_E_Type_.POST` to use `_rendered_post_esf_form`
+#    18-Oct-2026 (RS) Add bulk variant (`interfaces`) to `Allocate_IP.POST`,
+#                     use `IP_Pool.allocate_many`
+#    18-Oct-2026 (RS) Use `IP_Pool_Eligibility` in `Allocate_IP.POST`
+#    18-Oct-2026 (RS) Filter pools by quota in `Allocate_IP.POST`,
+#                     use `IP_Pool.allocate_interfaces`
 #    ««revision-date»»···
 #--
 
@@ -147,6 +152,7 @@ from   _TFL.pyk                 import pyk
 
 import _CNDB._GTW
 import _CNDB._OMP.import_CNDB
+import _CNDB._OMP.IP_Pool_Eligibility
 
 from   _GTW._MF3                import Element as MF3
 from   _GTW._RST.Permission     import Login_has_Person
@@ -1496,6 +1502,10 @@ class DB_Interface_in_IP_Network (_Ancestor) :
     class Allocate_IP (GTW.RST.TOP.Page) :
         """Resource to allocate a single IP address for the selected
            interface.
+
+           For a request with a list of `interfaces` instead of a single
+           `interface`, one IP address is allocated for each of the
+           interfaces, all from the same pool.
         """
 
         class _AIP_POST_ (GTW.RST.POST) :
@@ -1511,14 +1521,21 @@ class DB_Interface_in_IP_Network (_Ancestor) :
                 scope     = resource.scope
                 CNDB      = scope.CNDB
                 ipid      = req_data.get ("interface")
+                ipids     = req_data.get ("interfaces")
                 ppid      = req_data.get ("pool")
-                if ipid is None :
+                bulk      = ipids is not None
+                if not bulk :
+                    ipids = [] if ipid is None else [ipid]
+                if not ipids :
                     raise Bad_Req (_T ("Request must include interface pid"))
                 try :
-                    iface = scope.pid_query (ipid)
+                    ifaces = list (scope.pid_query (i) for i in ipids)
                 except LookupError as exc :
                     raise (Bad_Req (str (exc)))
-                node      = iface.my_node
+                node      = ifaces [0].my_node
+                if any (i.my_node != node for i in ifaces) :
+                    raise Bad_Req \
+                        (_T ("All interfaces must belong to the same node"))
                 if ppid is not None :
                     try :
                         pool = scope.pid_query (ppid)
@@ -1527,39 +1544,28 @@ class DB_Interface_in_IP_Network (_Ancestor) :
                     else :
                         pools = [pool]
                 else :
-                    def _query (ETM, node, user) :
-                        bitlen = ETM.left.net_address.P_Type.bitlen
-                        return ETM.query \
-                            ( Q.OR
-                                ( Q.right.node == node
-                                , Q.AND
-                                    ( ~ Q.right.node
-                                    , Q.right.group_links.right.member_links
-                                        .left == user
-                                    # possibly,
-                                    # a Q-expression checking various quotas
-                                    )
-                                )
-                            & Q.OR
-                                ( ~ Q.right.netmask_interval.upper
-                                , Q.right.netmask_interval.upper == bitlen
-                                )
-                            ).attr (Q.right).distinct ()
                     pools = list \
-                        ( p for p in ichain
-                            ( _query (CNDB.IP4_Network_in_IP4_Pool, node, user)
-                            , _query (CNDB.IP6_Network_in_IP6_Pool, node, user)
-                            )
+                        ( p for p in CNDB.OMP.IP_Pool_Eligibility
+                            .eligible_pools (scope, user, node)
                         if p.can_allocate ()
                         )
+                eligible  = pools
+                pools     = list \
+                    (p for p in eligible if p.within_quota (user, node, ifaces))
                 n_pools   = len (pools)
-                ### XXX
-                ### filter pools by quota
-                ### if none remain
-                ###   --> send feedback about the full pools available
                 template = resource.top.Templateer.get_template \
                     ("html/dashboard/app.m.jnj")
-                if not n_pools :
+                if eligible and not n_pools :
+                    result ["feedback"] = _T \
+                        ( "Quota of user %(user)s and node %(node)s exceeded "
+                          "for all available pools: %(pools)s"
+                        % dict
+                            ( user  = user
+                            , node  = node
+                            , pools = ", ".join (p.name for p in eligible)
+                            )
+                        )
+                elif not n_pools :
                     result ["feedback"] = _T \
                         ( "No pools available that allow allocation "
                           "by user %(user)s and node %(node)s"
@@ -1567,16 +1573,20 @@ class DB_Interface_in_IP_Network (_Ancestor) :
                         )
                 elif n_pools == 1 :
                     pool = TFL.first (pools)
-                    nw0  = TFL.first (pool.ip_networks)
                     try :
-                        ipa  = pool.allocate (nw0.net_address.bitlen, user)
+                        iiis = pool.allocate_interfaces (ifaces, user)
                     except Exception as exc :
                         result ["feedback"] = str (exc)
                     else :
-                        iii  = scope.CNDB.Net_Interface_in_IP_Network \
-                            (iface, ipa, mask_len = ipa.pool.net_address.mask)
-                        result ["row"] = template.call_macro \
-                            ("e_type_tree_li", resource, iii, False)
+                        rows = list \
+                            ( template.call_macro
+                                ("e_type_tree_li", resource, iii, False)
+                            for iii in iiis
+                            )
+                        if bulk :
+                            result ["rows"] = rows
+                        else :
+                            result ["row"]  = rows [0]
                 else :
                     result ["menu"] = template.call_macro \
                         ("action_button_allocate_ip_pool_menu", resource, pools)
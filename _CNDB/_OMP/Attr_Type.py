@@ -38,6 +38,7 @@
 #    11-Dec-2015 (CT) Use `attr_types_of_module`, not home-grown code
 #     9-Feb-2016 (CT) Make `_from_string` arguments `obj, glob, locl` optional
 #    28-Apr-2016 (CT) Remove `glob`, `locl` from `from_string`, `_from_string`
+#    18-Oct-2026 (RS) Add `A_IP_Allocation_Strategy`
 #    ««revision-date»»···
 #--
 
@@ -45,6 +46,7 @@ from   _CNDB                    import CNDB
 from   _MOM.import_MOM          import *
 from   _MOM.import_MOM          import _A_Unit_, _A_Float_, _A_Named_Value_
 
+import _CNDB._OMP.IP_Allocation_Strategy
 import _CNDB._OMP.Wireless_Mode
 
 from   _MOM._Attr.Number_Interval import A_Int_Interval_C
@@ -76,6 +78,15 @@ class A_Polarization (_A_Named_Value_) :
 
 # end class A_Polarization
 
+class A_IP_Allocation_Strategy (MOM.Attr._A_Named_Object_) :
+    """Strategy used for allocating networks from %(ui_type_name)s"""
+
+    example     = u"Best_Fit"
+    typ         = "ip-allocation-strategy"
+    Table       = CNDB.OMP.IP_Allocation_Strategy.Table
+
+# end class A_IP_Allocation_Strategy
+
 class A_TX_Power (_A_Unit_, _A_Float_) :
     """Transmit Power specified in multiples of W or dBW, dBm,
        converted to dBm.
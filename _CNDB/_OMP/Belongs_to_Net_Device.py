@@ -17,12 +17,14 @@
 #
 # Revision Dates
 #    14-Apr-2014 (CT) Creation
+#    18-Oct-2026 (RS) Add `Prefetched_Mixin` to `my_net_device`
 #    ««revision-date»»···
 #--
 
 from   _MOM.import_MOM          import *
 from   _CNDB                    import CNDB
 import _CNDB._OMP
+import _CNDB._OMP.Query_Prefetch
 
 _Ancestor_Essence = CNDB.OMP.Id_Entity
 
@@ -39,6 +41,7 @@ class Belongs_to_Net_Device (_Ancestor_Essence) :
             """Net_Device this %(ui_type_name)s belongs to."""
 
             kind               = Attr.Query
+            Kind_Mixins         = (CNDB.OMP.Prefetched_Mixin, )
             P_Type              = "CNDB.Net_Device"
             is_partial          = True ### `query` is defined by descendents
 
@@ -34,12 +34,19 @@
 #     4-Sep-2014 (CT) Add query attribute `my_group`
 #    12-Sep-2014 (CT) Simplify `my_group.query`, `my_person.query`
 #                     (use type restriction in `query`)
+#    18-Oct-2026 (RS) Add `Prefetched_Mixin` to `my_group`, `my_node`,
+#                     `my_person`
+#    18-Oct-2026 (RS) Add `left_refs`, `update_left_refs`, maintain stored
+#                     `left_refs` in `_main__init__`, `_set_ckd_inner`,
+#                     `_set_raw_inner`
 #    ««revision-date»»···
 #--
 
 from   _MOM.import_MOM          import *
 from   _CNDB                    import CNDB
 import _CNDB._OMP
+import _CNDB._OMP.Query_Prefetch
+from   _TFL.pyk                 import pyk
 
 _Ancestor_Essence = CNDB.OMP.Id_Entity
 
@@ -56,6 +63,7 @@ class Belongs_to_Node (_Ancestor_Essence) :
             """Group this %(ui_type_name)s is managed or owned by."""
 
             kind                = Attr.Query
+            Kind_Mixins         = (CNDB.OMP.Prefetched_Mixin, )
             P_Type              = "PAP.Group"
             query               = \
                 Q.my_node.OR (Q.manager, Q.owner) ["PAP.Group"]
@@ -67,6 +75,7 @@ class Belongs_to_Node (_Ancestor_Essence) :
             """Node this %(ui_type_name)s belongs to."""
 
             kind                = Attr.Query
+            Kind_Mixins         = (CNDB.OMP.Prefetched_Mixin, )
             P_Type              = "CNDB.Node"
             is_partial          = True ### `query` is defined by descendents
 
@@ -76,6 +85,7 @@ class Belongs_to_Node (_Ancestor_Essence) :
             """Person this %(ui_type_name)s is managed or owned by."""
 
             kind                = Attr.Query
+            Kind_Mixins         = (CNDB.OMP.Prefetched_Mixin, )
             P_Type              = "PAP.Person"
             query               = \
                 Q.my_node.OR (Q.manager, Q.owner) ["PAP.Person"]
@@ -93,10 +103,18 @@ _Mixin            = Belongs_to_Node
 class Belongs_to_Node_Left (_Mixin, _Ancestor_Essence) :
     """Mixin for the query attribute `my_node`, delegated to
        `left.my_node`.
+
+       Importing `CNDB.OMP.Stored_Left_Refs` replaces the query attributes
+       `left_refs` by stored attributes, which are kept equal to the
+       values of `left` by `_main__init__` and `update_left_refs`.
     """
 
     is_partial = True
 
+    ### attributes delegated to `left`: `my_net_device` is defined by
+    ### `Belongs_to_Net_Device_Left`, which all descendents mix in, too
+    left_refs  = ("my_net_device", "my_node")
+
     class _Attributes (_Mixin._Attributes, _Ancestor_Essence._Attributes) :
 
         _Ancestor = _Ancestor_Essence._Attributes
@@ -111,6 +129,76 @@ class Belongs_to_Node_Left (_Mixin, _Ancestor_Essence) :
 
     # end class _Attributes
 
+    @TFL.Meta.Class_and_Instance_Method
+    def stored_left_refs (soc) :
+        """Names of the attributes of `left_refs` stored in the database."""
+        attributes = soc.attributes
+        return tuple \
+            (   n for n in soc.left_refs
+            if  n in attributes and attributes [n].save_to_db
+            )
+    # end def stored_left_refs
+
+    def update_left_refs (self) :
+        """Set the stored attributes of `left_refs` to the values of `left`,
+           and those of the objects linked to `self` by their `left`, if
+           they changed; return the number of changes.
+        """
+        result = 0
+        kw     = self._left_refs_changed ()
+        if kw :
+            result = self.set (** kw)
+            for d in self._left_ref_dependents () :
+                result += d.update_left_refs ()
+        return result
+    # end def update_left_refs
+
+    def _left_ref_dependents (self) :
+        """Generate the links with stored `left_refs` whose `left` is
+           `self`.
+        """
+        scope = self.home_scope
+        ETs   = scope.CNDB.Belongs_to_Node_Left.E_Type.children_np
+        for tn, ET in sorted (pyk.iteritems (ETs)) :
+            if  (   isinstance (self, ET.left.role_type)
+                and ET.stored_left_refs ()
+                ) :
+                for d in scope [tn].query (Q.left == self) :
+                    yield d
+    # end def _left_ref_dependents
+
+    def _left_refs_changed (self) :
+        left   = self.left
+        result = {}
+        for name in self.stored_left_refs () :
+            value = getattr (left, name, None) if left is not None else None
+            if getattr (self, name) is not value :
+                result [name] = value
+        return result
+    # end def _left_refs_changed
+
+    def _main__init__ (self, * args, ** kw) :
+        self.__super._main__init__ (* args, ** kw)
+        ### set before the creation is recorded: no change of its own
+        refs = self._left_refs_changed ()
+        if refs :
+            self._set_ckd (** refs)
+    # end def _main__init__
+
+    def _set_ckd_inner (self, _pred_kinds = None, on_error = None, ** kw) :
+        result = self.__super._set_ckd_inner (_pred_kinds, on_error, ** kw)
+        if "left" in kw :
+            result += self.update_left_refs ()
+        return result
+    # end def _set_ckd_inner
+
+    def _set_raw_inner (self, _pred_kinds = None, on_error = None, ** kw) :
+        result = self.__super._set_raw_inner (_pred_kinds, on_error, ** kw)
+        if "left" in kw :
+            result += self.update_left_refs ()
+        return result
+    # end def _set_raw_inner
+
 # end class Belongs_to_Node_Left
 
 if __name__ != "__main__" :
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 Dr. Ralf Schlatterbeck All rights reserved
+# Reichergasse 131, A--3411 Weidling, Austria. rsc@runtux.com
+# #*** <License> ************************************************************#
+# This module is part of the package CNDB.OMP.
+#
+# This module is licensed under the terms of the BSD 3-Clause License
+# <http://www.c-tanzer.at/license/bsd_3c.html>.
+# #*** </License> ***********************************************************#
+#
+#++
+# Name
+#    CNDB.OMP.Bulk_Change
+#
+# Purpose
+#    Change of one attribute of many entities recorded as a single change
+#
+# Revision Dates
+#    18-Oct-2026 (RS) Creation
+#    ««revision-date»»···
+#--
+
+from   _MOM.import_MOM          import *
+from   _CNDB                    import CNDB
+import _CNDB._OMP
+
+from   _TFL.portable_repr       import portable_repr
+from   _TFL.pyk                 import pyk
+
+import _MOM._SCM.Change
+import _MOM._SCM.Recorder
+
+class Attr_Bulk (MOM.SCM.Change.Undoable) :
+    """Change of the attribute `attr_name` of many entities of the E_Type
+       `type_name`, recorded as a single change.
+
+       The values are kept as raw values by pid. `update_db` updates an
+       SQL database by one statement per table and distinct new value
+       instead of one per entity.
+    """
+
+    kind               = "Modify/Bulk"
+
+    ### Maximum number of pids in the `IN` clause of a single statement
+    chunk_size         = 500
+
+    def __init__ (self, ETM, attr_name, old_values, new_values) :
+        self.__super.__init__ ()
+        scope             = ETM.home_scope
+        self.attr_name    = attr_name
+        self.new_values   = new_values
+        self.old_values   = old_values
+        self.tool_version = scope.Version.id
+        self.type_name    = ETM.type_name
+        self.user         = scope.user
+    # end def __init__
+
+    @property
+    def attr_changes (self) :
+        return set ((self.attr_name, "last_cid"))
+    # end def attr_changes
+
+    modified_attrs = attr_changes
+
+    def entities (self, scope) :
+        """Generate the changed entities still existing in `scope`."""
+        for pid in sorted (self.new_values) :
+            try :
+                yield scope.pid_query (pid)
+            except LookupError :
+                pass
+    # end def entities
+
+    def redo (self, scope) :
+        self._restore     (scope)
+        self.__super.redo (scope)
+    # end def redo
+
+    def register (self, scope) :
+        for e in self.entities (scope) :
+            e.last_cid = self.cid
+    # end def register
+
+    def restore (self, scope) :
+        self._restore        (scope)
+        self.__super.restore (scope)
+    # end def restore
+
+    def undo (self, scope) :
+        self.__super.undo (scope)
+        self._modify      (scope, self.old_values)
+    # end def undo
+
+    def update_db (self, scope) :
+        """Write the new values to the database of `scope`, if it is an SQL
+           database, using the table wrappers of the E_Type and the
+           session of `scope.ems`.
+
+           Raises `Commit_Conflict` if an entity isn't in the database
+           anymore, e.g., because a concurrent transaction destroyed it;
+           the caller must roll back the scope.
+        """
+        session = getattr (scope.ems, "session", None)
+        ETW     = getattr (scope [self.type_name].E_Type, "_SAW", None)
+        if session is None or ETW is None :
+            return
+        names    = set (self.attr_changes)
+        entities = list (self.entities (scope))
+        for W in tuple (ETW.ancestors_r) + (ETW, ) :
+            if W.sa_table is None :
+                continue
+            kws = list \
+                (  kw for name, kw in pyk.iteritems (W.db_attrs_o)
+                if name in names and not kw.is_surrogate
+                )
+            if not kws :
+                continue
+            groups = {}
+            for e in entities :
+                values = {}
+                for kw in kws :
+                    values.update (kw.col_values (e))
+                key = tuple (sorted (values.items ()))
+                groups.setdefault (key, (values, [])) [1].append (e.spk)
+            for values, spks in groups.values () :
+                for i in range (0, len (spks), self.chunk_size) :
+                    chunk  = spks [i : i + self.chunk_size]
+                    stmt   = W.sa_table.update ().where \
+                        (W.spk_col.in_ (chunk)).values (values)
+                    result = session.connection.execute (stmt)
+                    if result.rowcount != len (chunk) :
+                        raise MOM.Error.Commit_Conflict ()
+    # end def update_db
+
+    def _modify (self, scope, values) :
+        name = self.attr_name
+        for e in self.entities (scope) :
+            raw, last_cid = values [e.pid]
+            e.set_raw (** {name : raw, "last_cid" : last_cid})
+    # end def _modify
+
+    def _pickle_attrs (self) :
+        return dict \
+            ( self.__super._pickle_attrs ()
+            , attr_name     = self.attr_name
+            , new_values    = self.new_values
+            , old_values    = self.old_values
+            , tool_version  = self.tool_version
+            , type_name     = self.type_name
+            )
+    # end def _pickle_attrs
+
+    def _repr (self) :
+        return "%s %s %s, %d entities" % \
+            ( self.kind, self.type_name, portable_repr (self.attr_name)
+            , len (self.new_values)
+            )
+    # end def _repr
+
+    def _restore (self, scope) :
+        cid = str (self.cid)
+        self._modify \
+            ( scope
+            , dict
+                ( (pid, (raw, cid))
+                for pid, (raw, _) in pyk.iteritems (self.new_values)
+                )
+            )
+    # end def _restore
+
+# end class Attr_Bulk
+
+def set_many (ETM, attr_name, changes) :
+    """Set the attribute `attr_name` of the entities of `changes`, a list of
+       `(entity, value)` pairs, and record all changes as a single
+       `Attr_Bulk` change; return the number of entities changed.
+
+       Other attributes the entities change themselves when `attr_name`
+       is set, e.g., `IP_Network.is_free`, are recorded by an `Attr_Bulk`
+       change per attribute following the one for `attr_name`. The
+       changes are written to the database by `Attr_Bulk.update_db`.
+
+       The entities must be instances of the E_Type managed by `ETM`.
+    """
+    changes = list ((e, v) for e, v in changes if getattr (e, attr_name) != v)
+    if not changes :
+        return 0
+    scope   = ETM.home_scope
+    E_Type  = ETM.E_Type
+    kinds   = [E_Type.attr_prop (attr_name)] + list \
+        (k for k in E_Type.db_attr if k.name not in (attr_name, "last_cid"))
+    old     = dict \
+        ( (e.pid, (list (k.get_raw_pid (e) for k in kinds), str (e.last_cid)))
+        for e, v in changes
+        )
+    with scope.temp_change_recorder (MOM.SCM.Ignorer) :
+        for e, v in changes :
+            e.set (** {attr_name : v})
+    for i, kind in enumerate (kinds) :
+        o_values = {}
+        n_values = {}
+        for e, v in changes :
+            raws, last_cid = old [e.pid]
+            raw            = kind.get_raw_pid (e)
+            if i == 0 or raw != raws [i] :
+                o_values [e.pid] = (raws [i], last_cid)
+                n_values [e.pid] = (raw, None)
+        if n_values :
+            change = scope.record_change \
+                (Attr_Bulk, ETM, kind.name, o_values, n_values)
+            if change is not None :
+                change.update_db (scope)
+    return len (changes)
+# end def set_many
+
+if __name__ != "__main__" :
+    CNDB.OMP._Export_Module ()
+### __END__ CNDB.OMP.Bulk_Change
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 Dr. Ralf Schlatterbeck All rights reserved
+# Reichergasse 131, A--3411 Weidling, Austria. rsc@runtux.com
+# #*** <License> ************************************************************#
+# This module is part of the package CNDB.OMP.
+#
+# This module is licensed under the terms of the BSD 3-Clause License
+# <http://www.c-tanzer.at/license/bsd_3c.html>.
+# #*** </License> ***********************************************************#
+#
+#++
+# Name
+#    CNDB.OMP.Change_Feed
+#
+# Purpose
+#    Feed of the changes of a scope after a given change id
+#
+# Revision Dates
+#    18-Oct-2026 (RS) Creation
+#    ««revision-date»»···
+#--
+
+from   _MOM.import_MOM          import Q
+from   _CNDB                    import CNDB
+from   _TFL                     import TFL
+from   _TFL.pyk                 import pyk
+
+import _CNDB._OMP
+import _CNDB._OMP.Bulk_Change
+
+import _TFL._Meta.Object
+
+import json
+import time
+
+class Change_Feed (TFL.Meta.Object) :
+    """Feed of the changes of `scope` ordered by change id (`cid`).
+
+       Each change is described by a dictionary with the `cid`, the
+       operation (`op`: the `kind` of the change, e.g., `Create`, `Modify`,
+       `Destroy`), the `type` name and `pid` of the entity changed, and the
+       names of the attributes set or changed (`attrs`, without
+       `last_cid`; for a creation, including the primary attributes). A
+       bulk change of many entities is described by one dictionary per
+       entity, all with the same `cid`.
+
+       A consumer remembers the `cid` of the last change it processed and
+       asks for the changes after it; `wait` blocks until there are any,
+       which allows long-polling. The number of descriptions returned at
+       once can be limited; the descriptions of one change are never
+       split, so that the consumer can continue after the last `cid`.
+    """
+
+    ### Seconds between two queries of `wait`
+    poll_interval = 1.0
+
+    def __init__ (self, scope) :
+        self.scope = scope
+    # end def __init__
+
+    @property
+    def last_cid (self) :
+        """Change id of the latest change committed."""
+        return self.scope.max_cid or 0
+    # end def last_cid
+
+    def entries (self, after = 0, limit = None) :
+        """Generate the descriptions of the changes after change id `after`,
+           at most `limit` descriptions.
+
+           The descriptions of a bulk change are generated together: if
+           they don't fit into `limit`, they are left for the next call,
+           unless they are the first ones, which are generated in any case.
+        """
+        after = after or 0
+        n     = 0
+        while True :
+            q = self.scope.query_changes (Q.cid > after).order_by (Q.cid)
+            if limit :
+                q = q.limit (limit)
+            changes = list (q)
+            for change in changes :
+                entries = list (self._entries (change))
+                if limit and n and n + len (entries) > limit :
+                    return
+                for entry in entries :
+                    yield entry
+                n    += len (entries)
+                after = change.cid
+                if limit and n >= limit :
+                    return
+            ### changes without descriptions, e.g., of scope attributes,
+            ### don't count: continue with the next batch of changes
+            if not limit or len (changes) < limit :
+                return
+    # end def entries
+
+    @classmethod
+    def json_line (cls, entry) :
+        """Return the compact JSON representation of `entry`."""
+        return json.dumps (entry, sort_keys = True, separators = (",", ":"))
+    # end def json_line
+
+    def wait (self, after = 0, timeout = 30, limit = None) :
+        """Return the list of descriptions of the changes after `after`;
+           if there are none, wait up to `timeout` seconds for some.
+        """
+        deadline = time.time () + (timeout or 0)
+        while True :
+            if self.last_cid > (after or 0) :
+                result = list (self.entries (after, limit))
+                if result :
+                    return result
+            remaining = deadline - time.time ()
+            if remaining <= 0 :
+                return []
+            self._refresh ()
+            time.sleep (min (self.poll_interval, remaining))
+    # end def wait
+
+    def _attrs (self, change) :
+        if change.kind == "Create" :
+            ### `new_attr` of a creation doesn't contain the primary attributes
+            names = set (change.new_attr)
+            ET    = self.scope.entity_type (change.type_name)
+            if ET is not None :
+                names.update (a.name for a in ET.primary)
+        else :
+            names = change.modified_attrs
+        return sorted (n for n in names if n != "last_cid")
+    # end def _attrs
+
+    def _entries (self, change) :
+        if isinstance (change, CNDB.OMP.Bulk_Change.Attr_Bulk) :
+            for pid in sorted (change.new_values) :
+                yield dict \
+                    ( attrs = [change.attr_name]
+                    , cid   = change.cid
+                    , op    = "Modify"
+                    , pid   = pid
+                    , type  = change.type_name
+                    )
+        elif change.pid is not None :
+            yield dict \
+                ( attrs = self._attrs (change)
+                , cid   = change.cid
+                , op    = change.kind
+                , pid   = change.pid
+                , type  = change.type_name
+                )
+    # end def _entries
+
+    def _refresh (self) :
+        """End the current database transaction, if it contains no changes
+           of our own, to see the changes committed by other processes.
+        """
+        scope = self.scope
+        if not scope.uncommitted_changes :
+            scope.rollback ()
+    # end def _refresh
+
+# end class Change_Feed
+
+if __name__ != "__main__" :
+    CNDB.OMP._Export ("*")
+### __END__ CNDB.OMP.Change_Feed
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 Dr. Ralf Schlatterbeck All rights reserved
+# Reichergasse 131, A--3411 Weidling, Austria. rsc@runtux.com
+# #*** <License> ************************************************************#
+# This module is part of the package CNDB.OMP.
+#
+# This module is licensed under the terms of the BSD 3-Clause License
+# <http://www.c-tanzer.at/license/bsd_3c.html>.
+# #*** </License> ***********************************************************#
+#
+#++
+# Name
+#    CNDB.OMP.DNS_Zone_Writer
+#
+# Purpose
+#    Write BIND zone files for the forward and reverse zones of the
+#    addresses assigned to net interfaces
+#
+# Revision Dates
+#    18-Oct-2026 (RS) Creation
+#    ««revision-date»»···
+#--
+
+from   _MOM.import_MOM          import Q
+from   _CNDB                    import CNDB
+from   _TFL                     import TFL
+from   _TFL.pyk                 import pyk
+
+import _CNDB._OMP
+
+import _TFL._Meta.Object
+
+from   datetime                 import date
+
+import hashlib
+import itertools
+import json
+import os
+import shutil
+import tempfile
+
+class DNS_Zone_Writer (TFL.Meta.Object) :
+    """Write the forward zone `domain` and the reverse zones in
+       `in-addr.arpa` and `ip6.arpa` for the single addresses linked to
+       net interfaces of `scope` into `directory`.
+
+       The name of an address is the name of its `Net_Interface_in_IP_Network`
+       followed by the name of the node, e.g., `wlan.node1.<domain>`; the
+       `IP4_DNS_Alias` and `IP6_DNS_Alias` of an address are added as
+       `<alias>.<domain>`. Reverse zones are delegated per
+       `reverse_mask_len [4]` bits of IPv4 and `reverse_mask_len [6]`
+       bits of IPv6 addresses, which must be multiples of 8 and 4,
+       respectively.
+
+       The records are written while iterating over the query results,
+       i.e., memory doesn't grow with the size of a zone. A zone file is
+       written, with an incremented SOA serial, only if the hash of the
+       zone's contents differs from the one of the last run, kept with the
+       serial in the file `state_name` in `directory`. A zone of an
+       earlier run without any records left is written with just its SOA
+       and NS records.
+    """
+
+    expire           = 1209600
+    minimum          = 3600
+    refresh          = 28800
+    retry            = 7200
+    reverse_mask_len = {4 : 24, 6 : 64}
+    state_name       = "zones.state"
+    file_mode        = 0o644
+
+    def __init__ \
+            ( self, scope, directory, domain, nameservers, hostmaster
+            , ttl = 3600, reverse_mask_len = {}, today = None
+            ) :
+        if not nameservers :
+            raise ValueError ("At least one nameserver is needed")
+        self.scope            = scope
+        self.directory        = directory
+        self.domain           = self._fqdn (domain)
+        self.nameservers      = list (self._fqdn (ns) for ns in nameservers)
+        self.hostmaster       = self._fqdn (hostmaster.replace ("@", "."))
+        self.ttl              = ttl
+        self.reverse_mask_len = dict (self.reverse_mask_len)
+        self.reverse_mask_len.update (reverse_mask_len)
+        for family, unit in ((4, 8), (6, 4)) :
+            if self.reverse_mask_len [family] % unit :
+                raise ValueError \
+                    ( "Reverse zones of IPv%s must be split at multiples "
+                      "of %s bits, not %s"
+                    % (family, unit, self.reverse_mask_len [family])
+                    )
+        self.today            = today or date.today ()
+        self.state            = self._read_state ()
+    # end def __init__
+
+    def forward_records (self) :
+        """Generate the `(name, type, value)` records of the forward zone."""
+        scope = self.scope
+        for family, ETM, type in self._families () :
+            for network, link in self._linked (ETM) :
+                name = self.host_name (link)
+                if name :
+                    yield name, type, self._address (network)
+        for tn in ("CNDB.IP4_DNS_Alias", "CNDB.IP6_DNS_Alias") :
+            type = "A" if tn == "CNDB.IP4_DNS_Alias" else "AAAA"
+            for alias in scope [tn].query ().order_by (Q.name) :
+                network = alias.address.right
+                if self._is_host (network) :
+                    yield alias.name.lower (), type, self._address (network)
+    # end def forward_records
+
+    def host_name (self, link) :
+        """Name of the address of `link`, a `Net_Interface_in_IP_Network`,
+           relative to `domain`.
+        """
+        node   = link.my_node
+        labels = (link.name, node.name if node is not None else None)
+        return ".".join (l.lower () for l in labels if l)
+    # end def host_name
+
+    def reverse_records (self) :
+        """Generate `(zone, records)` for the reverse zones, with
+           `records` generating the `(name, type, value)` records of the
+           zone.
+        """
+        for family, ETM, type in self._families () :
+            records = self._reverse_records (family, ETM)
+            for zone, group in itertools.groupby (records, lambda r : r [0]) :
+                yield zone, (r [1:] for r in group)
+    # end def reverse_records
+
+    def write_all (self) :
+        """Write all zones; return a list of `(zone, serial, changed)`."""
+        result  = [self.write_zone (self.domain, self.forward_records ())]
+        written = set ((self.domain, ))
+        for zone, records in self.reverse_records () :
+            result.append (self.write_zone (zone, records))
+            written.add   (zone)
+        ### a zone that lost all its records must still be served, with
+        ### SOA and NS only, as long as it is configured in the name server
+        for zone in sorted (set (self.state) - written) :
+            result.append (self.write_zone (zone, ()))
+        self._write_state ()
+        return result
+    # end def write_all
+
+    def write_zone (self, zone, records) :
+        """Write the zone file of `zone` with `records` if its contents
+           changed; return `(zone, serial, changed)`.
+        """
+        old_serial, old_hash = self.state.get (zone, (0, None))
+        hash = hashlib.sha256 ()
+        hash.update (self._soa (zone, "").encode ("utf-8"))
+        with tempfile.TemporaryFile \
+                ("w+", dir = self.directory, encoding = "utf-8") as body :
+            for name, type, value in records :
+                line = "%-40s IN %-5s %s\n" % (name, type, value)
+                hash.update (line.encode ("utf-8"))
+                body.write  (line)
+            digest = hash.hexdigest ()
+            if digest == old_hash :
+                return zone, old_serial, False
+            serial = max \
+                (old_serial + 1, int (self.today.strftime ("%Y%m%d00")))
+            path   = self.zone_path (zone)
+            with tempfile.NamedTemporaryFile \
+                    ( "w", dir = self.directory, encoding = "utf-8"
+                    , delete = False
+                    ) as f :
+                f.write (self._soa (zone, serial))
+                body.seek (0)
+                shutil.copyfileobj (body, f)
+            os.chmod   (f.name, self.file_mode)
+            os.replace (f.name, path)
+        self.state [zone] = (serial, digest)
+        return zone, serial, True
+    # end def write_zone
+
+    def zone_path (self, zone) :
+        return os.path.join (self.directory, "db.%s" % (zone.rstrip ("."), ))
+    # end def zone_path
+
+    def _address (self, network) :
+        return str (network.net_address).split ("/") [0]
+    # end def _address
+
+    def _families (self) :
+        CNDB = self.scope.CNDB
+        yield 4, CNDB.IP4_Network, "A"
+        yield 6, CNDB.IP6_Network, "AAAA"
+    # end def _families
+
+    def _fqdn (self, name) :
+        return name if name.endswith (".") else name + "."
+    # end def _fqdn
+
+    def _is_host (self, network) :
+        na = network.net_address
+        return na.mask_len == na.bitlen
+    # end def _is_host
+
+    def _linked (self, ETM) :
+        """Generate `(network, link)` for the single addresses of `ETM`
+           linked to a net interface, ordered by address.
+        """
+        for network in ETM.query \
+                (Q.net_interface_link).order_by (Q.net_address) :
+            if self._is_host (network) :
+                yield network, network.net_interface_link
+    # end def _linked
+
+    def _read_state (self) :
+        try :
+            with open (os.path.join (self.directory, self.state_name)) as f :
+                return dict \
+                    ((k, tuple (v)) for k, v in pyk.iteritems (json.load (f)))
+        except (IOError, OSError) :
+            return {}
+    # end def _read_state
+
+    def _reverse_labels (self, family, na) :
+        if family == 4 :
+            unit   = 8
+            labels = list \
+                (str ((na.ip >> s) & 0xFF) for s in range (0, 32, 8))
+            suffix = "in-addr.arpa."
+        else :
+            unit   = 4
+            labels = list ("%032x" % (na.ip, )) [::-1]
+            suffix = "ip6.arpa."
+        split = (na.bitlen - self.reverse_mask_len [family]) // unit
+        zone  = ".".join (labels [split:] + [suffix])
+        return zone, ".".join (labels [:split])
+    # end def _reverse_labels
+
+    def _reverse_records (self, family, ETM) :
+        for network, link in self._linked (ETM) :
+            name = self.host_name (link)
+            if name :
+                zone, label = self._reverse_labels \
+                    (family, network.net_address)
+                yield zone, label, "PTR", "%s.%s" % (name, self.domain)
+    # end def _reverse_records
+
+    def _soa (self, zone, serial) :
+        ns     = self.nameservers
+        result = \
+            [ "$ORIGIN %s" % (zone, )
+            , "$TTL %s" % (self.ttl, )
+            , "@ IN SOA %s %s (%s %s %s %s %s)" %
+                ( ns [0], self.hostmaster, serial
+                , self.refresh, self.retry, self.expire, self.minimum
+                )
+            ]
+        result.extend ("@ IN NS %s" % (n, ) for n in ns)
+        return "\n".join (result) + "\n"
+    # end def _soa
+
+    def _write_state (self) :
+        path = os.path.join (self.directory, self.state_name)
+        with tempfile.NamedTemporaryFile \
+                ("w", dir = self.directory, delete = False) as f :
+            json.dump (self.state, f, indent = 1, sort_keys = True)
+        os.replace (f.name, path)
+    # end def _write_state
+
+# end class DNS_Zone_Writer
+
+if __name__ != "__main__" :
+    CNDB.OMP._Export ("*")
+### __END__ CNDB.OMP.DNS_Zone_Writer
@@ -19,6 +19,8 @@
 #     1-Mar-2013 (CT) Creation
 #    20-Jun-2014 (RS) Add `Cannot_Expire_Network`
 #    16-Sep-2014 (CT) Add `No_Network_in_Pool`
+#    18-Oct-2026 (RS) Add `Quota_Exceeded`
+#    18-Oct-2026 (RS) Add `Uncommitted_Changes`
 #    ««revision-date»»···
 #--
 
@@ -85,6 +87,42 @@ class No_Network_in_Pool (Error, ValueError) :
 
 # end class No_Network_in_Pool
 
+class Quota_Exceeded (Error, ValueError) :
+    """Allocation would exceed a quota of the IP pool."""
+
+    def __init__ (self, pool, user, node) :
+        self.__super.__init__ \
+            ( _T ( "Allocation from pool %(pool)s would exceed the quota "
+                   "of user %(user)s or node %(node)s"
+                 )
+            % dict
+                ( pool = pool.ui_display
+                , user = getattr (user, "ui_display", user)
+                , node = getattr (node, "ui_display", node)
+                )
+            )
+        self.pool = pool
+        self.user = user
+        self.node = node
+    # end def __init__
+
+# end class Quota_Exceeded
+
+class Uncommitted_Changes (Error, ValueError) :
+    """Scope has uncommitted changes."""
+
+    def __init__ (self, scope) :
+        self.__super.__init__ \
+            ( _T ( "Scope has %(n)s uncommitted change(s) that would be "
+                   "lost if the commit had to be retried"
+                 )
+            % dict (n = len (scope.uncommitted_changes))
+            )
+        self.scope = scope
+    # end def __init__
+
+# end class Uncommitted_Changes
+
 class Cannot_Free_Network (Error, ValueError) :
     """Can't free IP_Network object"""
 
@@ -23,6 +23,7 @@
 #     2-Apr-2014 (CT) Add `pool.rev_ref_attr_name`
 #     3-Apr-2014 (CT) Change `pool` to `parent`
 #    20-Jun-2014 (RS) Re-add `pool`
+#    18-Oct-2026 (RS) Set `counter_mask_len`
 #    ««revision-date»»···
 #--
 
@@ -42,6 +43,8 @@ _Ancestor_Essence = CNDB.OMP.IP_Network
 class IP6_Network (_Ancestor_Essence) :
     """IPv6 Network of CNDB"""
 
+    counter_mask_len = 64
+
     class _Attributes (_Ancestor_Essence._Attributes) :
 
         _Ancestor = _Ancestor_Essence._Attributes
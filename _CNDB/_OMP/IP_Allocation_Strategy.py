@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 Dr. Ralf Schlatterbeck All rights reserved
+# Reichergasse 131, A--3411 Weidling, Austria. rsc@runtux.com
+# #*** <License> ************************************************************#
+# This module is part of the package CNDB.OMP.
+#
+# This module is licensed under the terms of the BSD 3-Clause License
+# <http://www.c-tanzer.at/license/bsd_3c.html>.
+# #*** </License> ***********************************************************#
+#
+#++
+# Name
+#    CNDB.OMP.IP_Allocation_Strategy
+#
+# Purpose
+#    Strategies choosing where `IP_Network.allocate` puts a new network
+#
+# Revision Dates
+#    18-Oct-2026 (RS) Creation
+#    ««revision-date»»···
+#--
+
+from   _CNDB                    import CNDB
+import _CNDB._OMP
+from   _TFL                     import TFL
+
+import _TFL._Meta.Object
+
+class M_IP_Allocation_Strategy (TFL.Meta.Object.__class__) :
+    """Meta class for allocation-strategy classes"""
+
+    Table = {}
+
+    def __init__ (cls, name, bases, dct) :
+        cls.__m_super.__init__ (name, bases, dct)
+        if name != "IP_Allocation_Strategy" :
+            cls._m_add (name, cls.Table)
+    # end def __init__
+
+    def __str__ (cls) :
+        return cls.__name__
+    # end def __str__
+
+    def _m_add (cls, name, Table) :
+        name = str (name)
+        assert name not in Table, "Name clash: `%s` <-> `%s`" % \
+            (name, Table [name].__class__)
+        Table [name] = cls
+    # end def _m_add
+
+# end class M_IP_Allocation_Strategy
+
+class IP_Allocation_Strategy \
+          (TFL.Meta.Object, metaclass = M_IP_Allocation_Strategy) :
+    """Base class of strategies choosing the free block to allocate a
+       network from and the position of the network inside that block.
+
+       The candidate blocks are passed smallest first, unless
+       `largest_first` is set; blocks of the same size are passed in the
+       order of their addresses.
+    """
+
+    largest_first = False
+
+    @classmethod
+    def choose (cls, candidates, mask_len) :
+        """Return `(pid, ip, mask_len)` of the block of `candidates` to
+           allocate a network of `mask_len` from, None if there is none.
+        """
+        for block in candidates :
+            return block
+    # end def choose
+
+    @classmethod
+    def place (cls, ip, ml, mask_len, bitlen) :
+        """Return the address of the network of `mask_len` to allocate from
+           the free block `ip/ml`.
+        """
+        return ip
+    # end def place
+
+    @classmethod
+    def select (cls, index, mask_len, bitlen) :
+        """Return the pid of the network containing the block to allocate
+           from and the address of the network of `mask_len` to allocate,
+           None if `index` contains no suitable block.
+        """
+        block = cls.choose \
+            (index.candidates (mask_len, cls.largest_first), mask_len)
+        if block is not None :
+            pid, ip, ml = block
+            return pid, cls.place (ip, ml, mask_len, bitlen)
+    # end def select
+
+# end class IP_Allocation_Strategy
+
+class Best_Fit (IP_Allocation_Strategy) :
+    """Allocate from the smallest free block with room for the network,
+       at the start of the block; this keeps large blocks intact.
+    """
+
+# end class Best_Fit
+
+class First_Fit (IP_Allocation_Strategy) :
+    """Allocate from the free block with the lowest address with room for
+       the network; this fills the address range from the bottom.
+    """
+
+    @classmethod
+    def choose (cls, candidates, mask_len) :
+        result = None
+        for block in candidates :
+            if result is None or block [1] < result [1] :
+                result = block
+        return result
+    # end def choose
+
+# end class First_Fit
+
+class Spread (IP_Allocation_Strategy) :
+    """Allocate in the middle of the largest free block; this keeps
+       networks allocated one after the other as far apart as possible,
+       e.g., to separate neighbors.
+    """
+
+    largest_first = True
+
+    @classmethod
+    def place (cls, ip, ml, mask_len, bitlen) :
+        if ml < mask_len :
+            ip += 1 << (bitlen - ml - 1)
+        return ip
+    # end def place
+
+# end class Spread
+
+class Aligned (IP_Allocation_Strategy) :
+    """Allocate at the start of the smallest free block with room for a
+       network `growth` bits larger than requested, so that the network
+       can later grow into the rest of that block. Falls back to
+       `Best_Fit` if there is no such block.
+    """
+
+    growth = 2
+
+    @classmethod
+    def choose (cls, candidates, mask_len) :
+        result = None
+        for block in candidates :
+            if block [2] <= mask_len - cls.growth :
+                return block
+            if result is None :
+                result = block
+        return result
+    # end def choose
+
+# end class Aligned
+
+if __name__ != "__main__" :
+    CNDB.OMP._Export ("*")
+### __END__ CNDB.OMP.IP_Allocation_Strategy
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 Dr. Ralf Schlatterbeck All rights reserved
+# Reichergasse 131, A--3411 Weidling, Austria. rsc@runtux.com
+# #*** <License> ************************************************************#
+# This module is part of the package CNDB.OMP.
+#
+# This module is licensed under the terms of the BSD 3-Clause License
+# <http://www.c-tanzer.at/license/bsd_3c.html>.
+# #*** </License> ***********************************************************#
+#
+#++
+# Name
+#    CNDB.OMP.IP_Cooldown_Cache
+#
+# Purpose
+#    Cache of the cool-down periods of the IP pools of IP networks
+#
+# Revision Dates
+#    18-Oct-2026 (RS) Creation
+#    ««revision-date»»···
+#--
+
+from   _MOM.import_MOM          import Q
+from   _CNDB                    import CNDB
+import _CNDB._OMP
+
+import _CNDB._OMP.IP_Free_Index
+import _CNDB._OMP.Scope_Cache
+
+from   _CNDB._OMP.IP_Free_Index import _masked
+
+_Ancestor = CNDB.OMP.Scope_Cache
+
+class IP_Cooldown_Cache (_Ancestor) :
+    """Cool-down periods of the `IP_Pool` links of type `key`.
+
+       For each network linked to an `IP_Pool` with a `cool_down_period`,
+       the cache holds the `cool_down_period` of its own pool and the
+       effective cool-down, i.e., the minimum `cool_down_period` of the
+       pools of the network and all networks containing it.
+
+       Besides the usual invalidation on changes of the scope, the cache is
+       invalidated when an `IP_Network_in_IP_Pool` link is destroyed during
+       an `operation`, e.g., by the garbage collection of a network.
+    """
+
+    def __init__ (self, scope, key) :
+        self.__super.__init__ (scope, key)
+        self._clear ()
+    # end def __init__
+
+    @classmethod
+    def for_network (cls, network) :
+        return cls.for_scope (network.home_scope, cls._key (network.ETM))
+    # end def for_network
+
+    @classmethod
+    def invalidate_for (cls, link) :
+        """Invalidate the cache for the type of `link`."""
+        cache = cls.cached (link.home_scope, link.type_name)
+        if cache is not None :
+            cache.invalidate ()
+    # end def invalidate_for
+
+    def cooldown (self, net_address) :
+        """Return the minimum `cool_down_period` of the pools of the
+           networks containing `net_address` (including `net_address`
+           itself), None if there is no such pool.
+        """
+        ip, ml = net_address.ip, net_address.mask_len
+        bitlen = net_address.bitlen
+        eff    = self._effective
+        for l in range (ml, -1, -1) :
+            key = (_masked (ip, l, bitlen), l)
+            if key in eff :
+                return eff [key]
+    # end def cooldown
+
+    def own (self, net_address) :
+        """Return the `cool_down_period` of the pool of `net_address`."""
+        return self._own.get ((net_address.ip, net_address.mask_len))
+    # end def own
+
+    def _build (self) :
+        self._clear ()
+        ETM   = self.scope [self.key]
+        links = ETM.query (Q.ip_pool.cool_down_period != None)
+        own   = self._own
+        for link in links :
+            na  = link.left.net_address
+            own [(na.ip, na.mask_len)] = link.right.cool_down_period
+            self._bitlen = na.bitlen
+        eff   = self._effective
+        for ip, ml in sorted (own, key = lambda k : k [1]) :
+            ### containing networks have smaller mask lengths and are
+            ### already done
+            result = own [(ip, ml)]
+            for l in range (ml - 1, -1, -1) :
+                key = (_masked (ip, l, self._bitlen), l)
+                if key in eff :
+                    result = min (result, eff [key])
+                    break
+            eff [(ip, ml)] = result
+    # end def _build
+
+    def _clear (self) :
+        self._bitlen    = None
+        self._effective = {}
+        self._own       = {}
+    # end def _clear
+
+    @classmethod
+    def _key (cls, ETM) :
+        return ETM.ip_pool_link.P_Type.type_name
+    # end def _key
+
+# end class IP_Cooldown_Cache
+
+if __name__ != "__main__" :
+    CNDB.OMP._Export ("*")
+### __END__ CNDB.OMP.IP_Cooldown_Cache
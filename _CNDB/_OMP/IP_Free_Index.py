@@ -0,0 +1,498 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 Dr. Ralf Schlatterbeck All rights reserved
+# Reichergasse 131, A--3411 Weidling, Austria. rsc@runtux.com
+# #*** <License> ************************************************************#
+# This module is part of the package CNDB.OMP.
+#
+# This module is licensed under the terms of the BSD 3-Clause License
+# <http://www.c-tanzer.at/license/bsd_3c.html>.
+# #*** </License> ***********************************************************#
+#
+#++
+# Name
+#    CNDB.OMP.IP_Free_Index
+#
+# Purpose
+#    In-memory index of the free blocks of an IP_Network used as pool
+#
+# Revision Dates
+#    18-Oct-2026 (RS) Creation
+#    18-Oct-2026 (RS) Add implicit free blocks for `sparse_split`
+#    18-Oct-2026 (RS) Add `block_for`, `plan`
+#    18-Oct-2026 (RS) Add `usage`
+#    18-Oct-2026 (RS) Add `candidates`
+#    18-Oct-2026 (RS) Add `exact_block`, `n_electric`
+#    18-Oct-2026 (RS) Add `_split_mask_len`, `_split_rest`, add `split_bits`
+#                     to `plan`
+#    ««revision-date»»···
+#--
+
+from   _MOM.import_MOM          import Q
+from   _CNDB                    import CNDB
+from   _TFL                     import TFL
+from   _TFL.pyk                 import pyk
+import _CNDB._OMP
+
+import _CNDB._OMP.Scope_Cache
+
+import _TFL._Meta.Object
+
+from   heapq                    import heappop, heappush
+
+def _aligned_blocks (start, end, bitlen) :
+    """Generate `(ip, mask_len)` of the maximal aligned blocks covering the
+       address range from `start` (inclusive) to `end` (exclusive).
+    """
+    while start < end :
+        size = start & - start if start else 1 << bitlen
+        while size > end - start :
+            size >>= 1
+        yield start, bitlen - size.bit_length () + 1
+        start += size
+# end def _aligned_blocks
+
+def _masked (ip, mask_len, bitlen) :
+    """Return `ip` with all bits beyond `mask_len` cleared."""
+    return ip & ~ ((1 << (bitlen - mask_len)) - 1)
+# end def _masked
+
+def _pid (obj) :
+    return getattr (obj, "pid", None)
+# end def _pid
+
+def _split_mask_len (mask_len, target, split_bits) :
+    """Return the mask length of the subnets created by splitting a block
+       of `mask_len` on the way to a network of `target`: the next
+       multiple of `split_bits`, but not beyond `target`.
+    """
+    return min (target, (mask_len // split_bits + 1) * split_bits)
+# end def _split_mask_len
+
+def _split_rest (ip, ml, mask_len, bitlen, split_bits) :
+    """Generate `(ip, mask_len)` of the blocks left free by splitting the
+       block of `ml` containing `ip` down to the network `ip/mask_len`.
+    """
+    while ml < mask_len :
+        sml  = _split_mask_len (ml, mask_len, split_bits)
+        base = _masked (ip, ml,  bitlen)
+        own  = _masked (ip, sml, bitlen)
+        for i in range (1 << (sml - ml)) :
+            sub = base + (i << (bitlen - sml))
+            if sub != own :
+                yield sub, sml
+        ml = sml
+# end def _split_rest
+
+class _Free_List_ (TFL.Meta.Object) :
+    """Addresses of the free blocks of one mask length, kept in a heap.
+
+       Removing a block doesn't touch the heap: entries for which `valid`
+       returns False are skipped, dropped when they reach the top of the
+       heap, and the heap is compacted when they outnumber the valid
+       entries. Adding and removing a block thus takes O(log n) amortized
+       time, `first` returns the lowest address in O(1) amortized time.
+    """
+
+    def __init__ (self, valid) :
+        self.count = 0
+        self.heap  = []
+        self.valid = valid
+    # end def __init__
+
+    def __iter__ (self) :
+        """Generate the addresses in ascending order; the heap must not
+           change while iterating.
+        """
+        heap  = self.heap
+        valid = self.valid
+        n     = len (heap)
+        todo  = [(heap [0], 0)] if heap else []
+        last  = None
+        while todo :
+            ip, i = heappop (todo)
+            for c in (2 * i + 1, 2 * i + 2) :
+                if c < n :
+                    heappush (todo, (heap [c], c))
+            ### a block removed and added again has two entries
+            if ip != last and valid (ip) :
+                last = ip
+                yield ip
+    # end def __iter__
+
+    def add (self, ip) :
+        heappush (self.heap, ip)
+        self.count += 1
+    # end def add
+
+    def discard (self) :
+        """Account for a block that isn't `valid` anymore."""
+        self.count -= 1
+        if len (self.heap) > 2 * self.count + 16 :
+            valid     = self.valid
+            ### a sorted list is a heap
+            self.heap = sorted (set (ip for ip in self.heap if valid (ip)))
+    # end def discard
+
+    def first (self) :
+        heap  = self.heap
+        valid = self.valid
+        while heap and not valid (heap [0]) :
+            heappop (heap)
+        if heap :
+            return heap [0]
+    # end def first
+
+# end class _Free_List_
+
+_Ancestor = CNDB.OMP.Scope_Cache
+
+class IP_Free_Index (_Ancestor) :
+    """Free list of the `IP_Network` with pid `key`, organized by mask
+       length like the free lists of a buddy allocator.
+
+       The index contains the same networks `find_closest_mask` would
+       consider: free networks with the same `pool` and `owner` as the
+       pool network. For each mask length, the addresses of all free
+       blocks and of the electric free blocks are kept in a heap
+       (`_Free_List_`), so that the smallest free block (with the lowest
+       address) big enough for a requested mask length is found without
+       querying the database. Adding or removing a block takes O(log n)
+       amortized time for `n` blocks of its mask length, finding a block
+       O(log n) per mask length tried; `candidates` generates the blocks
+       of a mask length in O(log n) time per block.
+
+       For an E_Type with `sparse_split`, the index also contains the
+       implicit free blocks of the pool network and its electric subnets:
+       the parts of their address range not covered by a materialized
+       subnet. An implicit block is indexed with the pid of the network
+       containing it.
+    """
+
+    def __init__ (self, scope, key) :
+        self.__super.__init__ (scope, key)
+        self._clear ()
+    # end def __init__
+
+    @classmethod
+    def for_network (cls, network) :
+        return cls.for_scope (network.home_scope, network.pid)
+    # end def for_network
+
+    @classmethod
+    def live_for (cls, network) :
+        """Return the live index of the pool of `network`, if any."""
+        pool = network.pool
+        if pool is not None :
+            return cls.live (network.home_scope, pool.pid)
+    # end def live_for
+
+    def __len__ (self) :
+        return len (self._blocks)
+    # end def __len__
+
+    def __contains__ (self, network) :
+        return network.pid in self._pids
+    # end def __contains__
+
+    def add (self, network, electric = None) :
+        """Add free `network` to index."""
+        if electric is None :
+            electric = network.electric
+        na = network.net_address
+        self._add (network.pid, na.ip, na.mask_len, electric)
+    # end def add
+
+    def block_for (self, net_address) :
+        """Return pid of the free block containing `net_address`, if any."""
+        key = self._covering (net_address)
+        if key is not None :
+            return self._blocks [key] [0]
+    # end def block_for
+
+    def candidates (self, mask_len, largest_first = False) :
+        """Generate `(pid, ip, mask_len)` of the free blocks with room for
+           a network of `mask_len` (see `closest`), smallest blocks first
+           (largest first if `largest_first`); blocks of the same size are
+           generated in the order of their addresses.
+        """
+        blocks = self._blocks
+        for ml in sorted (self._free, reverse = not largest_first) :
+            if ml > mask_len :
+                continue
+            ips = self._free [ml] if ml < mask_len \
+                else self._electric.get (ml, ())
+            for ip in ips :
+                yield blocks [(ip, ml)] [0], ip, ml
+    # end def candidates
+
+    def carve (self, pid, net_address) :
+        """Remove `net_address` from the implicit free block of network
+           `pid` containing it; the rest of the block stays free.
+
+           Returns False if no such block is in the index.
+        """
+        key = self._covering (net_address)
+        if key is None or self._blocks [key] [0] != pid :
+            return False
+        self._discard_key (key)
+        ip, ml = net_address.ip, net_address.mask_len
+        bitlen = net_address.bitlen
+        for k in range (key [1] + 1, ml + 1) :
+            buddy = _masked (ip, k, bitlen) ^ (1 << (bitlen - k))
+            self._add (pid, buddy, k, True)
+        return True
+    # end def carve
+
+    def closest (self, mask_len) :
+        """Return pid of the smallest free block in the index with room for
+           a network of `mask_len`.
+
+           Blocks with exactly `mask_len` are only eligible if they are
+           electric, i.e., not explicitly allocated.
+        """
+        block = self.closest_block (mask_len)
+        if block is not None :
+            return block [0]
+    # end def closest
+
+    def closest_block (self, mask_len) :
+        """Return `(pid, ip, mask_len)` of the block `closest` chooses."""
+        result = self.exact_block (mask_len)
+        if result is None :
+            smaller = [ml for ml in self._free if ml < mask_len]
+            if smaller :
+                ml     = max (smaller)
+                ip     = self._free [ml].first ()
+                result = self._blocks [(ip, ml)] [0], ip, ml
+        return result
+    # end def closest_block
+
+    def discard (self, network) :
+        """Remove `network` and its implicit free blocks from index."""
+        for key in tuple (self._pids.get (network.pid, ())) :
+            self._discard_key (key)
+    # end def discard
+
+    def exact_block (self, mask_len) :
+        """Return `(pid, ip, mask_len)` of the electric free block of
+           exactly `mask_len` with the lowest address, None if there is
+           none.
+        """
+        electric = self._electric.get (mask_len)
+        if electric is not None :
+            ip = electric.first ()
+            return self._blocks [(ip, mask_len)] [0], ip, mask_len
+    # end def exact_block
+
+    def n_electric (self, mask_len) :
+        """Return the number of electric free blocks of exactly
+           `mask_len`.
+        """
+        electric = self._electric.get (mask_len)
+        return electric.count if electric is not None else 0
+    # end def n_electric
+
+    def plan (self, mask_lens, bitlen, seed = (), split_bits = 1) :
+        """Return the addresses of the networks to allocate for `mask_lens`
+           without changing the index, None for each mask length that
+           doesn't fit.
+
+           The largest networks are placed first, each into the smallest
+           free block with room for it, so that networks allocated
+           together are packed into as few free blocks as possible.
+           `seed` specifies additional free blocks as tuples
+           `(pid, ip, mask_len, electric)`, `split_bits` the number of
+           bits each split of a block adds to the mask length.
+        """
+        ### change the index like the allocations would, undo the changes
+        ### afterwards: `undo` holds the keys changed and their old blocks
+        undo   = []
+        def _add (pid, ip, ml, electric) :
+            key = (ip, ml)
+            undo.append ((key, self._blocks.get (key)))
+            self._add (pid, ip, ml, electric)
+        result = [None] * len (mask_lens)
+        try :
+            for pid, ip, ml, electric in seed :
+                _add (pid, ip, ml, electric)
+            for i in sorted \
+                    (range (len (mask_lens)), key = lambda i : mask_lens [i]) :
+                mask_len = mask_lens [i]
+                block    = self.closest_block (mask_len)
+                if block is None :
+                    continue
+                pid, ip, ml = block
+                key         = (ip, ml)
+                undo.append ((key, self._blocks [key]))
+                self._discard_key (key)
+                for sip, sml in _split_rest \
+                        (ip, ml, mask_len, bitlen, split_bits) :
+                    _add (pid, sip, sml, True)
+                result [i] = ip
+        finally :
+            for key, block in reversed (undo) :
+                if key in self._blocks :
+                    self._discard_key (key)
+                if block is not None :
+                    self._add (block [0], key [0], key [1], block [1])
+        return result
+    # end def plan
+
+    def release (self, pid, net_address, container_mask_len) :
+        """Add `net_address` as implicit free block of network `pid`,
+           merge it with free buddies of the same network.
+        """
+        ip, ml = net_address.ip, net_address.mask_len
+        bitlen = net_address.bitlen
+        while ml > container_mask_len :
+            key   = (ip ^ (1 << (bitlen - ml)), ml)
+            block = self._blocks.get (key)
+            if block is None or block [0] != pid :
+                break
+            self._discard_key (key)
+            ip  = min (ip, key [0])
+            ml -= 1
+        self._add (pid, ip, ml, True)
+    # end def release
+
+    def update (self, network) :
+        """Re-evaluate whether `network` belongs into the index."""
+        na  = network.net_address
+        key = (na.ip, na.mask_len)
+        if self._blocks.get (key, (None, )) [0] == network.pid :
+            self._discard_key (key)
+        pool = self.scope.pid_query (self.key)
+        if (   _pid (network.pool)  == pool.pid
+           and _pid (network.owner) == _pid (pool.owner)
+           and network.is_free
+           ) :
+            self.add (network)
+    # end def update
+
+    def usage (self, bitlen, unit_mask_len) :
+        """Return the number of blocks of `unit_mask_len` in the electric
+           blocks of the index and the smallest mask length `closest` finds
+           a block for (None if there is none up to `bitlen`).
+
+           Free blocks which aren't electric have been allocated explicitly
+           (to the owner of the pool) and aren't counted.
+        """
+        count    = 0
+        smallest = None
+        for ml in self._free :
+            n = self.n_electric (ml)
+            if n and ml <= unit_mask_len :
+                count += n << (unit_mask_len - ml)
+            l = ml if n else ml + 1
+            if l <= bitlen and (smallest is None or l < smallest) :
+                smallest = l
+        return count, smallest
+    # end def usage
+
+    def _add (self, pid, ip, ml, electric) :
+        key = (ip, ml)
+        if key in self._blocks :
+            self._discard_key (key)
+        self._blocks [key] = (pid, bool (electric))
+        self._pids.setdefault (pid, set ()).add (key)
+        self._free_list (self._free, ml, False).add (ip)
+        if electric :
+            self._free_list (self._electric, ml, True).add (ip)
+    # end def _add
+
+    def _build (self) :
+        self._clear ()
+        pool = self.scope.pid_query (self.key)
+        ETM  = pool.ETM
+        free = ETM.query \
+            ( Q.is_free
+            , Q.owner == pool.owner
+            , Q.pool  == pool
+            , Q.net_address.IN (pool.net_address)
+            ).distinct ().attrs ("pid", "net_address", "electric")
+        for pid, na, electric in free :
+            self._add (pid, na.ip, na.mask_len, electric)
+        if pool.sparse_split :
+            self._build_implicit (pool)
+    # end def _build
+
+    def _build_implicit (self, pool) :
+        """Add the implicit free blocks of `pool` and its electric subnets."""
+        ETM  = pool.ETM
+        subs = ETM.query \
+            ( Q.net_address.IN (pool.net_address)
+            , (Q.parent == pool)
+            | ( Q.parent.electric
+              & (Q.parent.pool  == pool)
+              & (Q.parent.owner == pool.owner)
+              )
+            ).distinct ()
+        covered = {}
+        for n in subs :
+            covered.setdefault (n.parent, []).append (n.net_address)
+        for container, nas in pyk.iteritems (covered) :
+            na     = container.net_address
+            bitlen = na.bitlen
+            pos    = na.ip
+            for sub in sorted (nas, key = lambda x : x.ip) + [None] :
+                if sub is None :
+                    end = na.ip + (1 << (bitlen - na.mask_len))
+                else :
+                    end = sub.ip
+                for ip, ml in _aligned_blocks (pos, end, bitlen) :
+                    self._add (container.pid, ip, ml, True)
+                if sub is not None :
+                    pos = sub.ip + (1 << (bitlen - sub.mask_len))
+    # end def _build_implicit
+
+    def _covering (self, net_address) :
+        ip, ml = net_address.ip, net_address.mask_len
+        bitlen = net_address.bitlen
+        for l in range (ml, -1, -1) :
+            key = (_masked (ip, l, bitlen), l)
+            if key in self._blocks :
+                return key
+    # end def _covering
+
+    def _discard_key (self, key) :
+        pid, electric = self._blocks.pop (key)
+        keys   = self._pids [pid]
+        keys.discard (key)
+        if not keys :
+            del self._pids [pid]
+        ml = key [1]
+        for free, used in ((self._free, True), (self._electric, electric)) :
+            if used :
+                fl = free [ml]
+                fl.discard ()
+                if not fl.count :
+                    del free [ml]
+    # end def _discard_key
+
+    def _clear (self) :
+        self._blocks   = {}
+        self._electric = {}
+        self._free     = {}
+        self._pids     = {}
+    # end def _clear
+
+    def _free_list (self, free, ml, electric) :
+        result = free.get (ml)
+        if result is None :
+            blocks = self._blocks
+            if electric :
+                def valid (ip) :
+                    block = blocks.get ((ip, ml))
+                    return block is not None and block [1]
+            else :
+                def valid (ip) :
+                    return (ip, ml) in blocks
+            result = free [ml] = _Free_List_ (valid)
+        return result
+    # end def _free_list
+
+# end class IP_Free_Index
+
+if __name__ != "__main__" :
+    CNDB.OMP._Export ("*")
+### __END__ CNDB.OMP.IP_Free_Index
@@ -58,6 +58,40 @@
 #                     `collect_garbage` now frees /32 or /128 networks
 #                     without a `net_interface_link`
 #     5-Sep-2014 (CT) Add missing `pool.P_Type`
+#    18-Oct-2026 (RS) Use `IP_Free_Index` in `find_closest_mask`, keep it
+#                     up-to-date in `_reserve`, `free`, `_collect_garbage`
+#    18-Oct-2026 (RS) Add `sparse_split`, `_find_free_block`,
+#                     `_collect_garbage_sparse`, `_reserve_sparse`;
+#                     relax `net_address_in_parent` for `sparse_split`
+#    18-Oct-2026 (RS) Add `allocate_many`
+#    18-Oct-2026 (RS) Add `max_networks`, `deadline` to `collect_garbage`
+#                     for incremental garbage collection,
+#                     set `expiration_date.use_index`
+#    18-Oct-2026 (RS) Use `IP_Cooldown_Cache` in `min_cooldown_period`,
+#                     `_fix_expiration_date`
+#    18-Oct-2026 (RS) Add `free_many`, split `_free` into `_check_free`
+#                     and `_mark_free`
+#    18-Oct-2026 (RS) Add address counters `addresses_allocated`,
+#                     `addresses_cooling`, `addresses_free`, `largest_free`,
+#                     `update_counters`
+#    18-Oct-2026 (RS) Keep `IP_Pool_Usage` up-to-date in `_reserve`,
+#                     `_mark_free`
+#    18-Oct-2026 (RS) Add `allocation_strategy`, use it in `allocate`
+#    18-Oct-2026 (RS) Add `alloc_version`, `_claim`
+#    18-Oct-2026 (RS) Use `IP_Prefix_Index` in `find_closest_address`,
+#                     add `containing_mask_lens`, `_destroy`
+#    18-Oct-2026 (RS) Store `has_children` and `is_free` if
+#                     `Stored_Network_Flags` is imported, add `stored_flags`,
+#                     `update_flags`, `update_all_flags`
+#    18-Oct-2026 (RS) Add `use_range_indices`, import `CNDB.OMP.SAW`
+#    18-Oct-2026 (RS) Add `allocate_warm`, `refill_warm`, add `electric` to
+#                     `_reserve_sparse`
+#    18-Oct-2026 (RS) Replace `_fix_expiration_date` by set-based
+#                     `_clamp_expiration_dates`, use `Bulk_Change.set_many`
+#                     in `_mark_free`, `update_all_flags`
+#    18-Oct-2026 (RS) Add opt-in `split_bits`, `mask_len` to `split`,
+#                     collect all siblings in `_collect_garbage`
+#    18-Oct-2026 (RS) Log operations to `IP_Replay_Log`, add `clock`
 #    ««revision-date»»···
 #--
 
@@ -66,14 +100,90 @@ from   _CNDB                    import CNDB
 import _CNDB._OMP
 from   _TFL.pyk                 import pyk
 
+import _CNDB._OMP.Bulk_Change
 import _CNDB._OMP.Error
-
+import _CNDB._OMP.IP_Allocation_Strategy
+import _CNDB._OMP.IP_Cooldown_Cache
+import _CNDB._OMP.IP_Free_Index
+import _CNDB._OMP.IP_Pool_Usage
+import _CNDB._OMP.IP_Prefix_Index
+import _CNDB._OMP.IP_Replay_Log
+import _CNDB._OMP.Scope_Cache
+
+from   _CNDB._OMP.IP_Free_Index import _split_mask_len
 from   _GTW._OMP._NET           import NET
 from   _GTW._OMP._PAP           import PAP, Subject
 
 from   datetime                 import datetime
 
 import _GTW._OMP._NET.Attr_Type
+import _TFL._Meta.Object
+
+import time
+
+class _GC_Budget_ (TFL.Meta.Object) :
+    """Limit the work done by one call of `IP_Network.collect_garbage`."""
+
+    def __init__ (self, max_networks = None, deadline = None) :
+        self.count        = 0
+        self.deadline     = deadline
+        self.max_networks = max_networks
+    # end def __init__
+
+    @property
+    def exhausted (self) :
+        return \
+            (  (self.max_networks is not None and self.remaining <= 0)
+            or (self.deadline is not None and time.time () >= self.deadline)
+            )
+    # end def exhausted
+
+    @property
+    def remaining (self) :
+        if self.max_networks is not None :
+            return self.max_networks - self.count
+    # end def remaining
+
+    def limited (self, query) :
+        """Return the networks of `query` that fit into the budget."""
+        if self.exhausted :
+            return
+        if self.max_networks is not None :
+            query = query.limit (max (self.remaining, 0))
+        for n in query.all () :
+            if self.exhausted :
+                break
+            yield n
+            self.count += 1
+    # end def limited
+
+# end class _GC_Budget_
+
+class _Counter_Update_ (TFL.Meta.Object) :
+    """Pending update of the address counters of an `IP_Network`."""
+
+    def __init__ (self, network) :
+        self.cooling = 0
+        self.network = network
+    # end def __init__
+
+    def __call__ (self) :
+        network = self.network
+        if not network :
+            ### destroyed during the operation
+            return
+        if network.addresses_free is not None :
+            network._set_counters (network.addresses_cooling + self.cooling)
+        elif network.parent is None or network.ip_pool :
+            network.update_counters ()
+    # end def __call__
+
+# end class _Counter_Update_
+
+### attributes `is_free` is derived from, besides `net_interface_links`
+_is_free_deps = frozenset (("expiration_date", "has_children"))
+
+_logged = CNDB.OMP.IP_Replay_Log.logged_method
 
 _Ancestor_Essence = CNDB.OMP.Object
 
@@ -128,9 +238,150 @@ class IP_Network (_Ancestor_Essence) :
         reservations during reservation/allocation. The pool of a
         reserved/allocated ``IP_Network`` is the next enclosing
         ``IP_Network`` which is not ``electric``.
+
+        Where ``allocate`` puts a new network is decided by the
+        ``allocation_strategy`` of the ``IP_Pool`` of the network
+        allocated from (``Best_Fit`` by default): ``Best_Fit``,
+        ``First_Fit``, ``Spread``, and ``Aligned`` are defined in
+        ``CNDB.OMP.IP_Allocation_Strategy``.
+
+        Sparse split
+        ------------
+
+        Splitting materializes all the buddy halves between the block
+        allocated from and the allocated ``IP_Network``, e.g., allocating
+        a /64 from an IPv6 /32 creates 64 electric objects. If the E_Type
+        has ``sparse_split`` set, an allocation creates only the
+        allocated ``IP_Network``, as direct subnet of the pool or
+        ``electric`` ``IP_Network`` it is allocated from. The part of the
+        address range of such a network not covered by its subnets is
+        implicitly free; ``IP_Free_Index`` keeps track of these implicit
+        blocks. Garbage collection destroys expired networks, returning
+        their address range to the implicit free space of their
+        ``parent``.
+
+        ``has_children``, ``is_free``, and ``find_closest_address`` apply
+        to materialized objects only, exactly like before. Trees created
+        without ``sparse_split`` can be used with ``sparse_split``, but not
+        vice versa.
+
+        Stored flags
+        ------------
+
+        ``has_children`` and ``is_free`` are queries of the ``subnets`` and
+        ``net_interface_links`` by default. An application importing
+        ``CNDB.OMP.Stored_Network_Flags`` before creating the app-type
+        stores them in indexed columns instead, so that the queries for
+        allocation and garbage collection don't need correlated
+        subqueries. ``stored_flags`` returns the flags stored. Stored
+        flags are maintained: ``split`` and ``_reserve_sparse`` set
+        ``has_children`` of the network split, destroying the last subnet
+        of a network resets it. ``is_free`` is updated when
+        ``expiration_date`` or ``has_children`` change and when a
+        ``Net_Interface_in_IP_Network`` link to the network is created or
+        destroyed.
+        ``update_flags`` recomputes the stored flags of one network,
+        ``update_all_flags`` those of all networks of a scope: a database
+        migrated from an app-type without the stored flags needs a call of
+        ``update_all_flags``, e.g., by the command ``update_flags``, before
+        it is used.
+
+        Address counters
+        ----------------
+
+        Top-level ``IP_Network`` objects and ``IP_Network`` objects in an
+        ``IP_Pool`` keep counters of the addresses allocated, free, and
+        cooling down and the mask length of the largest network that can
+        be allocated. The counters are initialized by the first
+        allocation, free, or garbage collection touching the network and
+        updated at the end of each later one, ``update_counters`` recounts
+        them after changes done by other means. For IPv6, the counters
+        count /64 networks (``counter_mask_len``), not single addresses.
+
+        Warm blocks
+        -----------
+
+        ``refill_warm`` splits free blocks ahead of time until a number of
+        free ``electric`` blocks of one mask length, e.g., single
+        addresses, are ready; ``allocate_warm`` claims one of them without
+        walking or splitting the tree. ``IP_Pool.allocate`` does this for
+        pools with ``warm_blocks``; the command ``refill_warm_cache``
+        refills these pools in batch.
+
+        Nibble-aligned splits
+        ---------------------
+
+        Each split adds ``split_bits`` to the mask length, splitting a
+        network into ``2 ** split_bits`` subnets; a split towards a
+        smaller network stops at that network, e.g., splitting a /124 for
+        a /127 creates eight /127. ``split_bits`` is 1 by default; an
+        application opts into nibble-aligned splits by setting
+        ``split_bits`` of ``IP6_Network`` to 4: the delegated /48, /56,
+        and /64 prefixes and all intermediate networks then start at a
+        nibble boundary, like the zones of reverse-DNS delegation in
+        ``ip6.arpa``, and the tree is a quarter as deep as with binary
+        splits. The changed layout applies to splits done after that,
+        existing trees keep theirs.
+
+        Each nibble split materializes 15 siblings instead of the single
+        buddy half of a binary split, so this increases the number of
+        rows. To keep the siblings implicit, combine it with
+        ``sparse_split``.
+
+        Replay log
+        ----------
+
+        If an ``IP_Replay_Log`` is attached to the scope, ``allocate``,
+        ``allocate_many``, ``allocate_warm``, ``reserve``, ``free``,
+        ``free_many``, ``refill_warm``, and ``collect_garbage`` append
+        their parameters and results to it. ``IP_Simulator`` replays such
+        a log, or a synthetic workload, against a fresh scope using
+        ``clock`` as simulated time; the command ``simulate`` reports
+        throughput, tree size, and fragmentation while doing that.
+
+        Range indices
+        -------------
+
+        The ``net_address`` of each E_Type has a database index supporting
+        ``CONTAINS`` and ``IN`` (``use_range_indices``): a GiST index with
+        ``inet_ops`` on PostgreSQL, a B-tree index on the numeric address,
+        upper bound, and mask length on other databases. The indices are
+        declared when the tables are created, existing databases need a
+        ``CREATE INDEX`` (see ``CNDB.OMP.SAW.range_index``).
+
+        Concurrent allocation
+        ---------------------
+
+        The free blocks of a pool are read before one of them is split,
+        possibly from a cache. To keep parallel transactions from
+        splitting the same block, each allocation and free bumps the
+        ``alloc_version`` of the pool network before changing anything
+        (``_claim``): the database lets only one of two transactions
+        changing the same pool commit. If somebody else changed the
+        database since the free blocks were read, ``_claim`` raises
+        ``Commit_Conflict``. ``IP_Pool.allocate`` with ``commit = True``
+        commits the allocation and retries it on conflicts.
     """
 
-    is_partial = True
+    is_partial   = True
+
+    ### Current time used for expiration dates, redefined by simulations
+    clock        = datetime.now
+
+    ### Mask length of the unit counted by the address counters,
+    ### None for single addresses
+    counter_mask_len = None
+
+    ### Set to True to keep intermediate buddy halves implicit
+    sparse_split = False
+
+    ### Number of bits added to the mask length by each split, set to 4
+    ### for nibble-aligned splits of IPv6 networks
+    split_bits   = 1
+
+    ### Attributes getting a database index supporting `CONTAINS` and
+    ### `IN`, see `CNDB.OMP.SAW`
+    use_range_indices = ("net_address", )
 
     class _Attributes (_Ancestor_Essence._Attributes) :
 
@@ -147,6 +398,47 @@ class IP_Network (_Ancestor_Essence) :
 
         ### Non-primary attributes
 
+        class addresses_allocated (A_Int) :
+            """Number of addresses allocated from this `%(ui_type_name)s`
+               or split off for allocations.
+            """
+
+            kind               = Attr.Internal
+            max_value          = A_Int.max_value_64
+
+        # end class addresses_allocated
+
+        class addresses_cooling (A_Int) :
+            """Number of addresses of this `%(ui_type_name)s` freed but
+               still cooling down.
+            """
+
+            kind               = Attr.Internal
+            max_value          = A_Int.max_value_64
+
+        # end class addresses_cooling
+
+        class addresses_free (A_Int) :
+            """Number of addresses of this `%(ui_type_name)s` free for
+               allocation.
+            """
+
+            kind               = Attr.Internal
+            max_value          = A_Int.max_value_64
+
+        # end class addresses_free
+
+        class alloc_version (A_Int) :
+            """Number of changes of the free blocks of this
+               `%(ui_type_name)s` used as pool.
+            """
+
+            kind               = Attr.Internal
+            default            = 0
+            max_value          = A_Int.max_value_64
+
+        # end class alloc_version
+
         class desc (A_String) :
             """Description of and remarks about the IP_Network"""
 
@@ -162,6 +454,7 @@ class IP_Network (_Ancestor_Essence) :
             """
 
             kind               = Attr.Internal
+            use_index          = True
 
         # end class expiration_date
 
@@ -187,6 +480,16 @@ class IP_Network (_Ancestor_Essence) :
 
         # end class is_free
 
+        class largest_free (A_Int) :
+            """Smallest mask length of a network that can be allocated
+               from this `%(ui_type_name)s`.
+            """
+
+            kind               = Attr.Internal
+            max_value          = 128
+
+        # end class largest_free
+
         class owner (A_Id_Entity) :
             """Owner of the `%(ui_type_name)s`."""
 
@@ -199,6 +502,7 @@ class IP_Network (_Ancestor_Essence) :
             """Parent of the `%(ui_type_name)s`."""
 
             kind               = Attr.Internal
+            use_index          = True
 
         # end class parent
 
@@ -230,7 +534,11 @@ class IP_Network (_Ancestor_Essence) :
             kind               = Pred.Object
             assertion          = " and ".join \
                 ( ( "net_address in parent.net_address"
-                  , "net_address.mask_len == parent.net_address.mask_len + 1"
+                  , "net_address.mask_len > parent.net_address.mask_len"
+                  , "( this.sparse_split"
+                    " or net_address.mask_len <= this.split_bits"
+                    " * (parent.net_address.mask_len // this.split_bits + 1)"
+                    " )"
                   )
                 )
             attributes         = \
@@ -253,15 +561,91 @@ class IP_Network (_Ancestor_Essence) :
 
     # end class _Predicates
 
+    @_logged ("allocate")
     def allocate (self, mask_len, owner) :
         # FIXME: Don't allocate if self is electric
         #        We need this when checking permissions on pools
-        frm      = self.find_closest_mask (mask_len)
-        net_addr = next (frm.net_address.subnets (mask_len))
-        return self._reserve (self, frm, net_addr, owner)
+        with CNDB.OMP.Scope_Cache.operation (self.home_scope) :
+            frm, net_addr = self._find_free_subnet (mask_len)
+            return self._reserve (self, frm, net_addr, owner)
     # end def allocate
 
-    def collect_garbage (self) :
+    @_logged ("allocate_many")
+    def allocate_many (self, requests, owner) :
+        """Allocate networks for `requests`, a list of `(mask_len, count)`
+           pairs, for `owner`; return them in the order of `requests`.
+
+           All networks are planned against the free blocks of `self`
+           before anything is changed: if one of them doesn't fit, no
+           network is allocated. The plan always packs the networks
+           best-fit, independent of `allocation_strategy`.
+        """
+        mask_lens = list \
+            (ml for ml, count in requests for i in range (count))
+        with CNDB.OMP.Scope_Cache.operation (self.home_scope) :
+            index = CNDB.OMP.IP_Free_Index.for_network (self)
+            na    = self.net_address
+            seed  = ()
+            if self not in index and self.is_free :
+                seed = ((self.pid, na.ip, na.mask_len, False), )
+            plan  = index.plan (mask_lens, na.bitlen, seed, self.split_bits)
+            for mask_len, ip in zip (mask_lens, plan) :
+                if ip is None :
+                    raise self._no_free_address_range (mask_len)
+            result = [None] * len (mask_lens)
+            ### reserve in the order `plan` placed the networks: splitting
+            ### a block for a small network first can leave no block for a
+            ### larger one planned next to it
+            for i in sorted \
+                    (range (len (mask_lens)), key = lambda i : mask_lens [i]) :
+                net_addr = na.__class__ (plan [i], mask_lens [i])
+                pid      = index.block_for (net_addr)
+                if pid is not None :
+                    frm  = self.home_scope.pid_query (pid)
+                elif seed :
+                    ### the first network is carved from the free `self`
+                    frm  = self
+                    seed = ()
+                else :
+                    raise self._no_free_address_range \
+                        ( mask_lens [i]
+                        , "Planned network %s isn't in a free block of %s"
+                        % (net_addr, self.net_address)
+                        )
+                result [i] = self._reserve (self, frm, net_addr, owner)
+            return result
+    # end def allocate_many
+
+    @_logged ("allocate_warm")
+    def allocate_warm (self, mask_len, owner) :
+        """Allocate a network of `mask_len` for `owner` by claiming a free
+           electric block of exactly `mask_len`, e.g., one pre-split by
+           `refill_warm`; return None if there is no such block.
+
+           This doesn't split anything and ignores `allocation_strategy`.
+        """
+        with CNDB.OMP.Scope_Cache.operation (self.home_scope) :
+            index = CNDB.OMP.IP_Free_Index.for_network (self)
+            block = index.exact_block (mask_len)
+            if block is not None :
+                pid, ip, ml = block
+                frm = self.home_scope.pid_query (pid)
+                return self._reserve \
+                    (self, frm, self.net_address.__class__ (ip, ml), owner)
+    # end def allocate_warm
+
+    @property
+    def allocation_strategy (self) :
+        """Strategy used by `allocate`: the `allocation_strategy` of the
+           `IP_Pool` of `self`, `Best_Fit` if there is none.
+        """
+        ip_pool = self.ip_pool
+        result  = getattr (ip_pool, "allocation_strategy", None)
+        return result or CNDB.OMP.Best_Fit
+    # end def allocation_strategy
+
+    @_logged ("collect_garbage")
+    def collect_garbage (self, max_networks = None, deadline = None) :
         """ First search for single IP addresses that are not allocated
             to a Network_Interface and free() them.
 
@@ -277,50 +661,71 @@ class IP_Network (_Ancestor_Essence) :
 
             After this first step, we loop over all now-free nodes with
             an expiration_date < now and free them.
-        """
-        # Find allocated networks with maximum netmask
-        # and no associated interface
-        nw = self.ETM.query \
-            ( Q.net_address.mask_len == self.net_address.bitlen
-            , Q.net_address.IN (self.net_address)
-            , ~ Q.net_interface_link
-            , ~ Q.electric
-            , ~ ~ Q.owner
-            ).distinct ()
-        for n in nw :
-            n.free ()
-        now = datetime.now ()
-        nw = self.ETM.query \
-            ( Q.expiration_date
-            , Q.net_address.IN (self.net_address)
-            , sort_key = TFL.Sorted_By ("net_address.mask_len")
-            )
-        done = dict ()
-        for n in nw :
-            if n.net_address not in done :
-                n._fix_expiration_date (now, done)
 
-        # get free leaf nodes
-        nw = self.ETM.query \
-            ( Q.expiration_date != None
-            , Q.expiration_date <= now
-            , ~ Q.has_children
-            , Q.net_address.IN (self.net_address)
-            ).all ()
-        for n in nw :
-            n._collect_garbage (now)
+            If `max_networks` or `deadline` (a `time.time` value) is
+            specified, garbage is collected incrementally: at most
+            `max_networks` networks are freed, get a new expiration_date,
+            or are collected, and no further network is processed after
+            `deadline`. The expiration dates are then clamped by queries
+            for networks needing it, not by recursion, and expired
+            networks are collected in the order of their expiration_date.
+            Each step only finds networks still needing work, so the next
+            call continues where the last one stopped.
+
+            Incremental garbage collection returns the number of networks
+            processed.
+        """
+        if max_networks is not None or deadline is not None :
+            budget = _GC_Budget_ (max_networks, deadline)
+            with CNDB.OMP.Scope_Cache.operation (self.home_scope) :
+                self._collect_garbage_incremental (budget)
+            return budget.count
+        with CNDB.OMP.Scope_Cache.operation (self.home_scope) :
+            # Find allocated networks with maximum netmask
+            # and no associated interface
+            nw = self.ETM.query \
+                ( Q.net_address.mask_len == self.net_address.bitlen
+                , Q.net_address.IN (self.net_address)
+                , ~ Q.net_interface_link
+                , ~ Q.electric
+                , ~ ~ Q.owner
+                ).distinct ()
+            for n in nw :
+                n.free ()
+            now = self.clock ()
+            self._clamp_expiration_dates (now)
+
+            # get free leaf nodes
+            nw = self.ETM.query \
+                ( Q.expiration_date != None
+                , Q.expiration_date <= now
+                , ~ Q.has_children
+                , Q.net_address.IN (self.net_address)
+                ).all ()
+            for n in nw :
+                n._collect_garbage (now)
     # end def collect_garbage
 
+    def containing_mask_lens (self) :
+        """Return the sorted mask lengths of `self` and all networks
+           containing it.
+        """
+        index = CNDB.OMP.IP_Prefix_Index.for_network (self)
+        return sorted (l for l, pid in index.containing (self.net_address))
+    # end def containing_mask_lens
+
     def find_closest_address (self, net_addr) :
+        """Return the network with the longest prefix containing
+           `net_addr`, which must be in the address range of `self`.
+
+           The network is looked up in the `IP_Prefix_Index` of the E_Type
+           of `self`, not in the database.
+        """
         if net_addr in self.net_address :
-            blocks = self.ETM.query \
-                ( Q.net_address.CONTAINS (net_addr)
-                , sort_key = TFL.Sorted_By ("-net_address.mask_len")
-                )
-            try :
-                return TFL.first (blocks)
-            except IndexError :
-                pass
+            index = CNDB.OMP.IP_Prefix_Index.for_network (self)
+            pid   = index.longest_match (net_addr)
+            if pid is not None :
+                return self.home_scope.pid_query (pid)
         msg = \
             ( "Address %s not in the address range [%s] of this %s"
             % (net_addr, self.net_address, self.ui_name)
@@ -330,31 +735,18 @@ class IP_Network (_Ancestor_Essence) :
     # end def find_closest_address
 
     def find_closest_mask (self, mask_len) :
-        if self.is_free and self.net_address.mask_len < mask_len :
-            return self
-        blocks = self.ETM.query \
-            ( Q.is_free
-            , Q.owner == self.owner
-            , Q.pool == self
-            , Q.net_address.IN (self.net_address)
-            , (  Q.net_address.mask_len <  mask_len)
-            | ( (Q.net_address.mask_len == mask_len)
-              &  Q.electric
-              )
-            , sort_key = TFL.Sorted_By ("-net_address.mask_len", "net_address")
-            )
-        try :
-            return TFL.first (blocks)
-        except IndexError :
-            msg = \
-                ( "Address range [%s] of this %s doesn't contain a "
-                  "free subrange for mask length %s"
-                % (self.net_address, self.ui_name, mask_len)
-                )
-            raise CNDB.OMP.Error.No_Free_Address_Range \
-                (self.net_address, mask_len, msg)
+        """Return the smallest free block of `self` with room for a network
+           of `mask_len`; if there are several, the one with the lowest
+           address.
+
+           The candidates are looked up in the `IP_Free_Index` of `self`,
+           not in the database. For `sparse_split`, the result can be the
+           network containing an implicit free block.
+        """
+        return self._find_free_block (mask_len) [0]
     # end def find_closest_mask
 
+    @_logged ("free")
     def free (self, cool_down_period = None) :
         """ Mark this network as free for reuse, set the expiration date
             according to the pool's settings. If the pool has no
@@ -362,34 +754,49 @@ class IP_Network (_Ancestor_Essence) :
             We allow override (but only with a *lower* delta) of the
             cool_down_period of the pool.
         """
-        if self.pool == self or not self.pool :
-            msg = "Cannot free toplevel network %s" % self.net_address
-            raise CNDB.OMP.Error.Cannot_Free_Network (self.net_address, msg)
-        now = datetime.now ()
-        # check if there are leaf-nodes (without self)
-        # which are non-electric and have an owner
-        allocated_children = self.ETM.query \
-            ( Q.net_address.IN (self.net_address)
-            , ~ Q.has_children
-            , Q.net_address.mask_len > self.net_address.mask_len
-            , Q.owner
-            , ~ Q.electric
-            ).first ()
-        if allocated_children :
-            net = self.net_address
-            msg = "Cannot free network with allocations: %s" % net
-            raise CNDB.OMP.Error.Cannot_Free_Network (self.net_address, msg)
-        cooldown   = self.min_cooldown_period (cool_down_period)
-        # If no cool_down_period is found, expire now
-        expiration = now
-        if cooldown is not None :
-            expiration += cooldown
-        self.set (expiration_date = expiration, owner = None)
-        # Remove network link if any
-        if self.net_interface_link :
-            self.net_interface_link.destroy ()
+        self._check_free ()
+        with CNDB.OMP.Scope_Cache.operation (self.home_scope) :
+            self._mark_free ((self, ), self.clock (), cool_down_period)
     # end def free
 
+    @classmethod
+    @_logged ("free_many")
+    def free_many (cls, networks, cool_down_period = None) :
+        """ Free all `networks` like `free` does for a single network.
+
+            All networks are checked before any of them is changed; if one
+            of them cannot be freed, nothing is freed. A network
+            containing allocations can be freed if all these allocations
+            are freed, too.
+
+            Networks expiring immediately, i.e., without cool_down_period,
+            are collected right away. This is done in a single pass over
+            the networks, smallest networks first, so that free buddies
+            are coalesced bottom-up.
+        """
+        networks = list (dict ((n.pid, n) for n in networks).values ())
+        if not networks :
+            return
+        pids = set (n.pid for n in networks)
+        for n in networks :
+            n._check_free (pids)
+        smallest_first = sorted \
+            ( networks
+            , key = lambda n : (- n.net_address.mask_len, n.net_address.ip)
+            )
+        now = cls.clock ()
+        with CNDB.OMP.Scope_Cache.operation (networks [0].home_scope) :
+            cls._mark_free (networks, now, cool_down_period)
+            for n in smallest_first :
+                ### `n` is False if it was destroyed by coalescing
+                if (   n
+                   and n.expiration_date is not None
+                   and n.expiration_date <= now
+                   and not n.has_children
+                   ) :
+                    n._collect_garbage (now)
+    # end def free_many
+
     def min_cooldown_period (self, cool_down_period = None) :
         """ Get minimum cool_down_period of self and all parents.
             Note: We only find parents which have an IP_Pool. If an
@@ -399,44 +806,161 @@ class IP_Network (_Ancestor_Essence) :
             Additionally an initial cool_down_period may be specified.
         """
         cooldown = cool_down_period
-        IPPL_ETM  = self.home_scope [self.ETM.ip_pool_link.P_Type]
-        minipl  = IPPL_ETM.query \
-            ( Q.ip_network.net_address.CONTAINS (self.pool.net_address)
-            , Q.ip_pool.cool_down_period != None
-            , sort_key = TFL.Sorted_By ("ip_pool.cool_down_period")
-            ).first ()
-        minpool = (minipl and minipl.right) or None
-
-        if minpool is not None :
-            if cooldown is None or minpool.cool_down_period < cooldown :
-                cooldown = minpool.cool_down_period
+        cache    = CNDB.OMP.IP_Cooldown_Cache.for_network (self)
+        mincd    = cache.cooldown (self.pool.net_address)
+        if mincd is not None :
+            if cooldown is None or mincd < cooldown :
+                cooldown = mincd
         return cooldown
     # end def min_cooldown_period
 
+    @_logged ("refill_warm")
+    def refill_warm (self, mask_len, count) :
+        """Split free blocks of `self` until `count` free electric blocks
+           of exactly `mask_len` are ready for `allocate_warm`, or no free
+           block is left to split; return the number of ready blocks.
+
+           The smallest free blocks are split first, like `Best_Fit` would
+           do. For `sparse_split`, the ready blocks are materialized as
+           electric subnets of the block they are carved from.
+        """
+        with CNDB.OMP.Scope_Cache.operation (self.home_scope) :
+            index   = CNDB.OMP.IP_Free_Index.for_network (self)
+            na      = self.net_address
+            claimed = False
+            while index.n_electric (mask_len) < count :
+                block = index.closest_block (mask_len - 1)
+                if block is not None :
+                    pid, ip, _ = block
+                    frm = self.home_scope.pid_query (pid)
+                elif (   self.is_free
+                     and self not in index
+                     and na.mask_len < mask_len
+                     ) :
+                    frm, ip = self, na.ip
+                else :
+                    break
+                if not claimed :
+                    self._claim ()
+                    self._counters_changed ()
+                    claimed = True
+                if self.sparse_split and (frm is self or frm.electric) :
+                    self._reserve_sparse \
+                        ( self, frm, na.__class__ (ip, mask_len), self.owner
+                        , electric = True
+                        )
+                else :
+                    index.discard (frm)
+                    for sn in frm.split (self, mask_len) :
+                        if sn.owner is self.owner :
+                            index.add (sn, electric = True)
+            return index.n_electric (mask_len)
+    # end def refill_warm
+
+    @_logged ("reserve")
     def reserve (self, net_addr, owner = None) :
         # FIXME: Don't reserve if self is electric
         #        We need this when checking permissions on pools
-        if isinstance (net_addr, pyk.string_types) :
-            net_addr = self.E_Type.attr_prop ("net_address").P_Type (net_addr)
-        if owner is None :
-            owner = self.owner
-        frm = self.find_closest_address (net_addr)
-        if not (   frm.is_free
-               and frm.owner is self.owner
-               and not frm.net_interface
-               ) :
-            msg = \
-                ( "Address %s already in use by '%s'"
-                % (net_addr, frm.FO.owner)
-                )
-            raise CNDB.OMP.Error.Address_Already_Used \
-                (net_addr, frm.FO.owner, str (owner.FO), msg)
-        return self._reserve (self, frm, net_addr, owner)
+        with CNDB.OMP.Scope_Cache.operation (self.home_scope) :
+            return self._reserve_addr (net_addr, owner)
     # end def reserve
 
-    def split (self, pool) :
+    @TFL.Meta.Class_and_Instance_Method
+    def stored_flags (soc) :
+        """Names of the flags `has_children` and `is_free` stored in the
+           database, see `CNDB.OMP.Stored_Network_Flags`.
+        """
+        attributes = soc.attributes
+        return tuple \
+            (   n for n in ("has_children", "is_free")
+            if  attributes [n].save_to_db
+            )
+    # end def stored_flags
+
+    def update_flags (self) :
+        """Recompute the stored flags `has_children` and `is_free` from
+           the `subnets` and `net_interface_links` of `self`.
+        """
+        stored = self.stored_flags ()
+        if stored :
+            has_children = bool (self.subnets)
+            is_free      = self._is_free_with \
+                (has_children, self.expiration_date)
+            kw           = dict \
+                ( (n, v)
+                for n, v in
+                    (("has_children", has_children), ("is_free", is_free))
+                if  n in stored and getattr (self, n) != v
+                )
+            if kw :
+                self.set (** kw)
+    # end def update_flags
+
+    @classmethod
+    def update_all_flags (cls, scope) :
+        """Recompute the stored flags `has_children` and `is_free` of all
+           networks of `scope` like `update_flags` does; return the number
+           of networks changed.
+
+           The flags are set by one `Attr_Bulk` change per flag and
+           E_Type. A database migrated from an app-type without the stored
+           flags needs this to fill them in.
+        """
+        Bulk   = CNDB.OMP.Bulk_Change
+        result = set ()
+        for tn in sorted (scope.CNDB.IP_Network.E_Type.children_np) :
+            ETM     = scope [tn]
+            if not ETM.E_Type.stored_flags () :
+                continue
+            nws     = ETM.query ().all ()
+            parents = set (n.parent.pid for n in nws if n.parent is not None)
+            linked  = set (n.pid for n in ETM.query (Q.net_interface_link))
+            c_free  = []
+            c_split = []
+            for n in nws :
+                has_children = n.pid in parents
+                is_free      = not \
+                    (has_children or n.expiration_date or n.pid in linked)
+                if is_free != n.is_free :
+                    c_free.append ((n, is_free))
+                if has_children != n.has_children :
+                    c_split.append ((n, has_children))
+            Bulk.set_many (ETM, "is_free",      c_free)
+            Bulk.set_many (ETM, "has_children", c_split)
+            result.update (n.pid for n, _ in c_free + c_split)
+        return len (result)
+    # end def update_all_flags
+
+    def update_counters (self) :
+        """Recount the addresses allocated from, free, and cooling down in
+           `self`, and the largest network that can be allocated from it.
+
+           The counters are kept up-to-date by allocation, `free`, and
+           garbage collection; changes done by other means need a call of
+           `update_counters`.
+        """
+        with CNDB.OMP.Scope_Cache.operation (self.home_scope) :
+            cooling = self.ETM.query \
+                ( Q.pool == self
+                , Q.expiration_date != None
+                , Q.pid != self.pid
+                ).distinct ()
+            self._set_counters \
+                (sum (self._counter_size (n.net_address) for n in cooling))
+    # end def update_counters
+
+    def split (self, pool, mask_len = None) :
+        """Split `self` into the subnets of the next split on the way to a
+           network of `mask_len` (default: the smallest network), see
+           `split_bits`.
+        """
         ETM         = self.ETM
         net_address = self.net_address
+        sub_len     = _split_mask_len \
+            ( net_address.mask_len
+            , mask_len or net_address.bitlen
+            , self.split_bits
+            )
         results     = list \
             (ETM ( sn
                  , pool     = pool
@@ -444,68 +968,508 @@ class IP_Network (_Ancestor_Essence) :
                  , parent   = self
                  , electric = True
                  )
-            for sn in net_address.subnets (net_address.mask_len + 1)
+            for sn in net_address.subnets (sub_len)
             )
+        self._set_has_children (True)
+        index       = CNDB.OMP.IP_Prefix_Index.live_for (self)
+        if index is not None :
+            for r in results :
+                index.add (r)
         return results
     # end def split
 
+    def _check_free (self, pids = ()) :
+        """Raise `Cannot_Free_Network` if self cannot be freed together with
+           the networks with `pids`.
+        """
+        if self.pool == self or not self.pool :
+            msg = "Cannot free toplevel network %s" % self.net_address
+            raise CNDB.OMP.Error.Cannot_Free_Network (self.net_address, msg)
+        # check if there are leaf-nodes (without self)
+        # which are non-electric and have an owner
+        allocated_children = self.ETM.query \
+            ( Q.net_address.IN (self.net_address)
+            , ~ Q.has_children
+            , Q.net_address.mask_len > self.net_address.mask_len
+            , Q.owner
+            , ~ Q.electric
+            )
+        if any (c.pid not in pids for c in allocated_children) :
+            net = self.net_address
+            msg = "Cannot free network with allocations: %s" % net
+            raise CNDB.OMP.Error.Cannot_Free_Network (self.net_address, msg)
+    # end def _check_free
+
     def _collect_garbage (self, now) :
+        Index   = CNDB.OMP.IP_Free_Index
         parent  = self.parent
         if parent is None :
+            index = Index.live_for (self)
+            if index is not None :
+                index.update (self)
             return
-        sibling = self.ETM.query \
+        cooling = 0
+        if self.expiration_date is not None :
+            cooling = - self._counter_size (self.net_address)
+        self.pool._counters_changed (cooling)
+        if self.sparse_split and (parent.electric or self.pool == parent) :
+            return self._collect_garbage_sparse (parent, now)
+        siblings = self.ETM.query \
             ( Q.parent == self.parent
             , Q.pid != self.pid
-            ).first ()
+            ).all ()
         assert parent.electric or self.pool == parent
-        if sibling :
-            if  (sibling.has_children or not sibling.electric) :
+        if siblings :
+            if any (s.has_children or not s.electric for s in siblings) :
                 self.set \
                     ( owner = self.pool.owner
                     , electric = True
                     , expiration_date = None
                     )
+                index = Index.live_for (self)
+                if index is not None :
+                    index.update (self)
                 return
             parent.set (owner = self.parent.pool.owner)
-            sibling.destroy ()
+            for sibling in siblings :
+                index = Index.live_for (sibling)
+                if index is not None :
+                    index.discard (sibling)
+                sibling.destroy ()
+        index = Index.live_for (self)
+        if index is not None :
+            index.discard (self)
         self.destroy ()
         parent._collect_garbage (now)
     # end def _collect_garbage
 
-    def _fix_expiration_date (self, now, done, date = None, cooldown = None) :
-        assert self.expiration_date is not None
-        done [self.net_address] = 1
-        if cooldown is None :
-            cooldown = self.min_cooldown_period ()
-        elif self.ip_pool and self.ip_pool.cool_down_period is not None :
-            if self.ip_pool.cool_down_period < cooldown :
-                cooldown = self.ip_pool.cool_down_period
-        if date is None or date > self.expiration_date :
-            date = self.expiration_date
-        if cooldown is not None and now + cooldown < date :
-            date = now + cooldown
-        if date < self.expiration_date :
-            self.set (expiration_date = date)
-        for n in self.subnets :
+    def _collect_garbage_incremental (self, budget) :
+        ETM = self.ETM
+        # Find allocated networks with maximum netmask
+        # and no associated interface
+        nw  = ETM.query \
+            ( Q.net_address.mask_len == self.net_address.bitlen
+            , Q.net_address.IN (self.net_address)
+            , ~ Q.net_interface_link
+            , ~ Q.electric
+            , ~ ~ Q.owner
+            , sort_key = TFL.Sorted_By ("pid")
+            ).distinct ()
+        for n in budget.limited (nw) :
+            n.free ()
+        now = self.clock ()
+        # Clamp expiration dates to the cool_down_period of the pools
+        IPPL_ETM = self.home_scope [ETM.ip_pool_link.P_Type]
+        links    = IPPL_ETM.query \
+            ( Q.ip_network.net_address.IN (self.net_address)
+            , Q.ip_pool.cool_down_period != None
+            , sort_key = TFL.Sorted_By ("ip_network.net_address")
+            )
+        for link in links.all () :
+            limit = now + link.right.cool_down_period
+            nw    = ETM.query \
+                ( Q.expiration_date > limit
+                , Q.net_address.IN (link.left.net_address)
+                , sort_key = TFL.Sorted_By ("pid")
+                )
+            for n in budget.limited (nw) :
+                n.set (expiration_date = limit)
+        # Clamp expiration dates of children to the one of their parent,
+        # repeat for grand-children whose parent was just clamped
+        while not budget.exhausted :
+            nw = ETM.query \
+                ( Q.expiration_date != None
+                , Q.parent.expiration_date != None
+                , Q.expiration_date > Q.parent.expiration_date
+                , ~ Q.electric
+                , Q.net_address.IN (self.net_address)
+                , sort_key = TFL.Sorted_By ("net_address.mask_len", "pid")
+                )
+            clamped = 0
+            for n in budget.limited (nw) :
+                n.set (expiration_date = n.parent.expiration_date)
+                clamped += 1
+            if not clamped :
+                break
+        # Collect expired leaf nodes, oldest first
+        nw = ETM.query \
+            ( Q.expiration_date != None
+            , Q.expiration_date <= now
+            , ~ Q.has_children
+            , Q.net_address.IN (self.net_address)
+            , sort_key = TFL.Sorted_By ("expiration_date", "pid")
+            )
+        for n in budget.limited (nw) :
+            n._collect_garbage (now)
+    # end def _collect_garbage_incremental
+
+    def _collect_garbage_sparse (self, parent, now) :
+        """Destroy `self`, return its address range to the implicit free
+           space of `parent`.
+        """
+        ### electric siblings are remnants of a split without
+        ### `sparse_split`: destroy the free ones, too
+        siblings = self.ETM.query \
+            ( Q.parent == parent
+            , Q.pid != self.pid
+            , Q.electric
+            , Q.is_free
+            ).all ()
+        index    = CNDB.OMP.IP_Free_Index.live_for (self)
+        p_ml     = parent.net_address.mask_len
+        for n in siblings + [self] :
+            na = n.net_address
+            if index is not None :
+                index.discard (n)
+            n.destroy ()
+            if index is not None :
+                index.release (parent.pid, na, p_ml)
+        if parent.electric and parent.pool != parent and not parent.subnets :
+            parent._collect_garbage (now)
+        elif index is not None :
+            index.update (parent)
+    # end def _collect_garbage_sparse
+
+    def _counter_size (self, net_address) :
+        """Number of units counted by the address counters in
+           `net_address`.
+        """
+        unit = self.counter_mask_len or net_address.bitlen
+        ml   = net_address.mask_len
+        return (1 << (unit - ml)) if ml <= unit else 0
+    # end def _counter_size
+
+    def _clamp_expiration_dates (self, now) :
+        """Clamp the expiration dates of the networks in `self`: no network
+           expires after the (clamped) expiration date of the network it
+           was allocated from, nor later than the `cool_down_period` of the
+           pools containing it allows.
+
+           All networks are clamped by a single pass over one query,
+           biggest networks first, and the new dates are recorded as a
+           single `Attr_Bulk` change.
+        """
+        cache  = CNDB.OMP.IP_Cooldown_Cache.for_network (self)
+        nws    = self.ETM.query \
+            ( Q.expiration_date
+            , Q.net_address.IN (self.net_address)
+            , sort_key = TFL.Sorted_By ("net_address.mask_len", "pid")
+            )
+        dates  = {}
+        clamps = []
+        for n in nws :
+            date = n.expiration_date
             if not n.electric :
-                n._fix_expiration_date (now, done, date, cooldown)
-    # end def _fix_expiration_date
+                ### non-electric subnets expire with their parent
+                p_date = dates.get (getattr (n.parent, "pid", None))
+                if p_date is not None and p_date < date :
+                    date = p_date
+            cooldown = cache.cooldown (n.net_address)
+            if cooldown is not None and now + cooldown < date :
+                date = now + cooldown
+            dates [n.pid] = date
+            if date < n.expiration_date :
+                clamps.append ((n, date))
+        CNDB.OMP.Bulk_Change.set_many (self.ETM, "expiration_date", clamps)
+    # end def _clamp_expiration_dates
+
+    def _claim (self) :
+        """Claim the free blocks of `self`, used as pool, for a change.
+
+           Bumps `alloc_version` so that concurrent transactions changing
+           the same pool conflict in the database. As the free blocks were
+           read before, it is an error if somebody else changed the
+           database since the start of the running operation: in that case
+           `Commit_Conflict` is raised; the caller must roll back the scope
+           before it retries the transaction.
+        """
+        self.set (alloc_version = self.alloc_version + 1)
+        if CNDB.OMP.Scope_Cache.changed_elsewhere (self.home_scope) :
+            raise MOM.Error.Commit_Conflict ()
+    # end def _claim
+
+    def _counters_changed (self, cooling = 0) :
+        """Update the address counters of `self` at the end of the running
+           operation, `cooling` is the change of the addresses cooling down.
+        """
+        pending = CNDB.OMP.Scope_Cache.at_end \
+            ( self.home_scope, (_Counter_Update_, self.pid)
+            , lambda : _Counter_Update_ (self)
+            )
+        if pending is not None :
+            pending.cooling += cooling
+        elif self.addresses_free is not None :
+            ### cannot keep counters up-to-date outside of an operation
+            self.set \
+                ( addresses_allocated = None
+                , addresses_cooling   = None
+                , addresses_free      = None
+                , largest_free        = None
+                )
+    # end def _counters_changed
+
+    def _destroy (self) :
+        index = CNDB.OMP.IP_Prefix_Index.live_for (self)
+        if index is not None :
+            index.discard (self)
+        parent = self.parent
+        self.__super._destroy ()
+        if (   parent is not None
+           and "has_children" in parent.stored_flags ()
+           and parent.has_children
+           and not isinstance (parent, MOM._Id_Entity_Destroyed_Mixin_)
+           ) :
+            sibling = self.ETM.query \
+                (Q.parent == parent, Q.pid != self.pid).first ()
+            if sibling is None :
+                parent._set_has_children (False)
+    # end def _destroy
+
+    def _find_free_block (self, mask_len) :
+        """Return the network to allocate a network of `mask_len` from and
+           the address range of the free block used.
+        """
+        index = CNDB.OMP.IP_Free_Index.for_network (self)
+        block = index.closest_block (mask_len)
+        if block is not None :
+            pid, ip, ml = block
+            result = self.home_scope.pid_query (pid)
+            na     = result.net_address
+            if (ip, ml) != (na.ip, na.mask_len) :
+                na = na.__class__ (ip, ml)
+            return result, na
+        if self.is_free and self.net_address.mask_len < mask_len :
+            return self, self.net_address
+        else :
+            raise self._no_free_address_range (mask_len)
+    # end def _find_free_block
+
+    def _find_free_subnet (self, mask_len) :
+        """Return the network to allocate a network of `mask_len` from and
+           the address of that network, as chosen by `allocation_strategy`.
+        """
+        strategy = self.allocation_strategy
+        index    = CNDB.OMP.IP_Free_Index.for_network (self)
+        na       = self.net_address
+        choice   = strategy.select (index, mask_len, na.bitlen)
+        if choice is not None :
+            pid, ip = choice
+            return self.home_scope.pid_query (pid), na.__class__ (ip, mask_len)
+        if self.is_free and na.mask_len < mask_len :
+            ip = strategy.place (na.ip, na.mask_len, mask_len, na.bitlen)
+            return self, na.__class__ (ip, mask_len)
+        else :
+            raise self._no_free_address_range (mask_len)
+    # end def _find_free_subnet
+
+    def _is_free_with (self, has_children, expiration_date) :
+        return not \
+            (has_children or expiration_date or self.net_interface_links)
+    # end def _is_free_with
+
+    def _is_implicitly_free (self, frm, net_addr) :
+        """True if `net_addr` is in the implicit free space of `frm`."""
+        return \
+            (   self.sparse_split
+            and frm.net_address != net_addr
+            and (frm is self or (frm.electric and frm.pool is self))
+            and frm.owner is self.owner
+            and frm.expiration_date is None
+            and not frm.net_interface
+            and self.ETM.query (Q.net_address.IN (net_addr)).first () is None
+            )
+    # end def _is_implicitly_free
+
+    @classmethod
+    def _mark_free (cls, networks, now, cool_down_period) :
+        """Mark `networks` as free, expiring after their cool down period.
+
+           Each distinct pool is claimed once and the expiration dates are
+           set by one `Attr_Bulk` change per E_Type; `set_many` records
+           the resulting changes of a stored `is_free`, too.
+        """
+        Index  = CNDB.OMP.IP_Free_Index
+        pools  = dict ((n.pool.pid, n.pool) for n in networks)
+        for pid in sorted (pools) :
+            pools [pid]._claim ()
+        dates  = {}
+        for n in networks :
+            cooldown   = n.min_cooldown_period (cool_down_period)
+            # If no cool_down_period is found, expire now
+            expiration = now
+            if cooldown is not None :
+                expiration += cooldown
+            index = Index.live_for (n)
+            if index is not None :
+                index.discard (n)
+            n.pool._counters_changed (n._counter_size (n.net_address))
+            if n.expiration_date is None :
+                n._usage_changed (-1)
+            n.set (owner = None)
+            dates.setdefault (n.ETM, []).append ((n, expiration))
+        for ETM, changes in sorted \
+                (pyk.iteritems (dates), key = lambda x : x [0].type_name) :
+            CNDB.OMP.Bulk_Change.set_many (ETM, "expiration_date", changes)
+        for n in networks :
+            # Remove network link if any
+            if n.net_interface_link :
+                n.net_interface_link.destroy ()
+    # end def _mark_free
+
+    def _no_free_address_range (self, mask_len, msg = None) :
+        if msg is None :
+            msg = \
+                ( "Address range [%s] of this %s doesn't contain a "
+                  "free subrange for mask length %s"
+                % (self.net_address, self.ui_name, mask_len)
+                )
+        return CNDB.OMP.Error.No_Free_Address_Range \
+            (self.net_address, mask_len, msg)
+    # end def _no_free_address_range
 
     def _reserve (self, pool, frm, net_addr, owner) :
+        Index  = CNDB.OMP.IP_Free_Index
+        pool._claim ()
+        pool._counters_changed ()
+        if (   self.sparse_split
+           and frm.net_address != net_addr
+           and (frm is pool or frm.electric)
+           ) :
+            result = self._reserve_sparse (pool, frm, net_addr, owner)
+            result._usage_changed (+1)
+            return result
+        index  = Index.live_for (frm)
+        if index is not None :
+            index.discard (frm)
+        index  = Index.live (self.home_scope, pool.pid)
         result = frm
         while result.net_address != net_addr :
-            p1, p2 = result.split (frm)
-            if net_addr in p1.net_address :
-                result, other = p1, p2
-            else :
-                other, result = p1, p2
-            other.set  (pool = pool)
+            for sn in result.split (frm, net_addr.mask_len) :
+                if net_addr in sn.net_address :
+                    result = sn
+                else :
+                    sn.set (pool = pool)
+                    if index is not None and sn.owner is pool.owner :
+                        index.add (sn, electric = True)
         result.set (pool = pool, owner = owner, electric = False)
+        if index is not None :
+            index.update (result)
+        result._usage_changed (+1)
         return result
     # end def _reserve
 
+    def _set_counters (self, cooling) :
+        index         = CNDB.OMP.IP_Free_Index.for_network (self)
+        na            = self.net_address
+        total         = self._counter_size (na)
+        free, largest = index.usage \
+            (na.bitlen, self.counter_mask_len or na.bitlen)
+        if not len (index) and self.is_free :
+            free = total
+            if na.mask_len < na.bitlen :
+                largest = na.mask_len + 1
+        self.set \
+            ( addresses_allocated = total - free - cooling
+            , addresses_cooling   = cooling
+            , addresses_free      = free
+            , largest_free        = largest
+            )
+    # end def _set_counters
+
+    def _set_ckd_inner (self, _pred_kinds = None, on_error = None, ** kw) :
+        result = self.__super._set_ckd_inner (_pred_kinds, on_error, ** kw)
+        return result + self._update_is_free (kw)
+    # end def _set_ckd_inner
+
+    def _set_raw_inner (self, _pred_kinds = None, on_error = None, ** kw) :
+        result = self.__super._set_raw_inner (_pred_kinds, on_error, ** kw)
+        return result + self._update_is_free (kw)
+    # end def _set_raw_inner
+
+    def _set_has_children (self, value) :
+        if (   "has_children" in self.stored_flags ()
+           and self.has_children != value
+           ) :
+            self.set (has_children = value)
+    # end def _set_has_children
+
+    def _reserve_addr (self, net_addr, owner) :
+        if isinstance (net_addr, pyk.string_types) :
+            net_addr = self.E_Type.attr_prop ("net_address").P_Type (net_addr)
+        if owner is None :
+            owner = self.owner
+        frm = self.find_closest_address (net_addr)
+        if not (   (   frm.is_free
+                   and frm.owner is self.owner
+                   and not frm.net_interface
+                   )
+               or self._is_implicitly_free (frm, net_addr)
+               ) :
+            msg = \
+                ( "Address %s already in use by '%s'"
+                % (net_addr, frm.FO.owner)
+                )
+            raise CNDB.OMP.Error.Address_Already_Used \
+                (net_addr, frm.FO.owner, str (owner.FO), msg)
+        return self._reserve (self, frm, net_addr, owner)
+    # end def _reserve_addr
+
+    def _reserve_sparse (self, pool, frm, net_addr, owner, electric = False) :
+        """Create `net_addr` as direct subnet of `frm`, keep the rest of
+           `frm` implicit.
+        """
+        index  = CNDB.OMP.IP_Free_Index.live (self.home_scope, pool.pid)
+        result = self.ETM \
+            ( net_addr
+            , owner    = owner
+            , parent   = frm
+            , pool     = pool
+            , electric = electric
+            )
+        frm._set_has_children (True)
+        prefixes = CNDB.OMP.IP_Prefix_Index.live_for (result)
+        if prefixes is not None :
+            prefixes.add (result)
+        if index is not None :
+            if frm is pool and frm not in index :
+                ### a free pool isn't contained in its own index
+                index.add (frm)
+            if index.carve (frm.pid, net_addr) :
+                index.update (result)
+            else :
+                index.invalidate ()
+        return result
+    # end def _reserve_sparse
+
+    def _update_is_free (self, kw) :
+        ### `is_free` is set by a change of its own: the change recorded for
+        ### `kw` only contains the attributes passed in `kw`
+        if (   "is_free" not in kw
+           and _is_free_deps.intersection (kw)
+           and "is_free" in self.stored_flags ()
+           ) :
+            is_free = self._is_free_with \
+                (self.has_children, self.expiration_date)
+            if is_free != self.is_free :
+                return self.set (is_free = is_free)
+        return 0
+    # end def _update_is_free
+
+    def _usage_changed (self, sign) :
+        if self.electric or self.pool is self :
+            return
+        usage = CNDB.OMP.IP_Pool_Usage.live_for (self)
+        if usage is not None :
+            usage.add (self, sign)
+    # end def _usage_changed
+
 # end class IP_Network
 
 if __name__ != "__main__" :
     CNDB.OMP._Export ("*")
+
+    @CNDB._Add_Import_Callback ("_MOM._DBW._SAW.Attr")
+    def _import_saw (module) :
+        import _CNDB._OMP.SAW
+    # end def _import_saw
 ### __END__ CNDB.OMP.IP_Network
@@ -18,6 +18,7 @@
 # Revision Dates
 #     3-Jul-2014 (RS) Creation
 #    16-Sep-2014 (CT) Add `left.rev_ref_attr_name`
+#    18-Oct-2026 (RS) Add `_destroy` to invalidate `IP_Cooldown_Cache`
 #    ««revision-date»»···
 #--
 
@@ -25,6 +26,7 @@ from   _MOM.import_MOM        import *
 from   _CNDB                  import CNDB
 import _CNDB._OMP
 
+import _CNDB._OMP.IP_Cooldown_Cache
 import _CNDB._OMP.IP_Network
 import _CNDB._OMP.IP_Pool
 
@@ -59,6 +61,11 @@ class IP_Network_in_IP_Pool (_Ancestor_Essence) :
 
     # end class _Attributes
 
+    def _destroy (self) :
+        CNDB.OMP.IP_Cooldown_Cache.invalidate_for (self)
+        self.__super._destroy ()
+    # end def _destroy
+
 # end class IP_Network_in_IP_Pool
 
 if __name__ != "__main__" :
@@ -23,6 +23,16 @@
 #    16-Sep-2014 (CT) Add `allocate` method
 #    23-Sep-2014 (CT) Add `ui_display_x`
 #    30-Sep-2014 (CT) Add `can_allocate`
+#    18-Oct-2026 (RS) Add `allocate_many`
+#    18-Oct-2026 (RS) Add address counters, `update_counters`,
+#                     use `largest_free` in `can_allocate`
+#    18-Oct-2026 (RS) Add `allocate_interfaces`, `within_quota`
+#    18-Oct-2026 (RS) Add `allocation_strategy`, use `allocate` in
+#                     `allocate_interfaces` for a single interface
+#    18-Oct-2026 (RS) Add `commit` to `allocate`, `allocate_interfaces`,
+#                     `allocate_many`, retry on commit conflicts
+#    18-Oct-2026 (RS) Add `warm_blocks`, `warm_mask_len`,
+#                     `refill_warm_cache`, use warm blocks in `allocate`
 #    ««revision-date»»···
 #--
 
@@ -30,10 +40,60 @@ from   _MOM.import_MOM            import *
 from   _CNDB                      import CNDB
 import _CNDB._OMP
 from   _CNDB._OMP.Attr_Type             import _A_IP_Netmask_Interval_
+from   _CNDB._OMP.Attr_Type             import A_IP_Allocation_Strategy
 
 from   _MOM._Attr.Date_Time_Delta import A_Date_Time_Delta
 
 import _CNDB._OMP.IP_Network
+import _CNDB._OMP.IP_Pool_Usage
+import _CNDB._OMP.Scope_Cache
+
+import random
+import time
+
+class _Pid_ (int) :
+    """Pid of an entity passed to a method retried by `_committed`."""
+
+    @classmethod
+    def from_entities (cls, value) :
+        """Replace the entities in `value` by their pids."""
+        if isinstance (value, MOM.Id_Entity) :
+            return cls (value.pid)
+        elif isinstance (value, (list, tuple)) :
+            return value.__class__ (cls.from_entities (v) for v in value)
+        return value
+    # end def from_entities
+
+    @classmethod
+    def to_entities (cls, scope, value) :
+        """Replace the pids in `value` by the entities of `scope`."""
+        if isinstance (value, cls) :
+            return scope.pid_query (value)
+        elif isinstance (value, (list, tuple)) :
+            return value.__class__ (cls.to_entities (scope, v) for v in value)
+        return value
+    # end def to_entities
+
+# end class _Pid_
+
+class _A_Pool_Counter_ (A_Int) :
+    """Sum of the address counter of the same name of the networks of the
+       pool; None if the counter of one of the networks isn't known.
+    """
+
+    kind               = Attr.Computed
+
+    def computed (self, obj) :
+        result = 0
+        for nw in obj.ip_networks :
+            value = getattr (nw, self.name)
+            if value is None :
+                return None
+            result += value
+        return result
+    # end def computed
+
+# end class _A_Pool_Counter_
 
 _Ancestor_Essence = CNDB.OMP.Object
 
@@ -42,6 +102,12 @@ class IP_Pool (_Ancestor_Essence) :
 
     is_partial  = True
 
+    ### Backoff of `allocate` with `commit` after a commit conflict: the
+    ### delay doubles with each conflict, up to `conflict_delay_max`
+    conflict_delay      = 0.05
+    conflict_delay_max  = 1.0
+    max_conflicts       = 8
+
     class _Attributes (_Ancestor_Essence._Attributes) :
 
         _Ancestor = _Ancestor_Essence._Attributes
@@ -59,6 +125,37 @@ class IP_Pool (_Ancestor_Essence) :
 
         ### Non-primary attributes
 
+        class addresses_allocated (_A_Pool_Counter_) :
+            """Number of addresses allocated from the networks of this
+               %(ui_type_name)s.
+            """
+
+        # end class addresses_allocated
+
+        class addresses_cooling (_A_Pool_Counter_) :
+            """Number of addresses of the networks of this
+               %(ui_type_name)s cooling down.
+            """
+
+        # end class addresses_cooling
+
+        class addresses_free (_A_Pool_Counter_) :
+            """Number of free addresses of the networks of this
+               %(ui_type_name)s.
+            """
+
+        # end class addresses_free
+
+        class allocation_strategy (A_IP_Allocation_Strategy) :
+            """Strategy used for allocating networks from this
+               %(ui_type_name)s.
+            """
+
+            kind               = Attr.Optional
+            raw_default        = "Best_Fit"
+
+        # end class allocation_strategy
+
         class cool_down_period (A_Date_Time_Delta) :
             """Cool down period for this %(ui_type_name)s."""
 
@@ -66,6 +163,24 @@ class IP_Pool (_Ancestor_Essence) :
 
         # end class cool_down_period
 
+        class largest_free (A_Int) :
+            """Smallest mask length of a network that can be allocated
+               from this %(ui_type_name)s.
+            """
+
+            kind               = Attr.Computed
+
+            def computed (self, obj) :
+                values = list \
+                    (  nw.largest_free for nw in obj.ip_networks
+                    if nw.largest_free is not None
+                    )
+                if values :
+                    return min (values)
+            # end def computed
+
+        # end class largest_free
+
         class netmask_interval (_A_IP_Netmask_Interval_) :
             """Limit netmasks to allocate from this %(ui_type_name)s."""
 
@@ -99,13 +214,60 @@ class IP_Pool (_Ancestor_Essence) :
 
         # end class ui_display_x
 
+        class warm_blocks (A_Int) :
+            """Number of free blocks of `warm_mask_len` kept ready for
+               allocation by `refill_warm_cache`.
+            """
+
+            kind               = Attr.Optional
+            default            = 0
+            min_value          = 0
+
+        # end class warm_blocks
+
+        class warm_mask_len (A_Int) :
+            """Mask length of the blocks kept ready for allocation
+               (default: single address).
+            """
+
+            kind               = Attr.Optional
+            Kind_Mixins        = (Attr.Computed_Set_Mixin, )
+            max_value          = 128
+            min_value          = 0
+
+            def computed (self, obj) :
+                if obj :
+                    return obj.E_Type.netmask_interval.attr.upper.max_value
+            # end def computed
+
+        # end class warm_mask_len
+
     # end class _Attributes
 
-    def allocate (self, mask_len, owner) :
+    def allocate (self, mask_len, owner, commit = False) :
+        """Allocate a network of `mask_len` for `owner` from the first
+           network of the pool with room for it.
+
+           With `commit`, the allocation is committed; if the commit
+           conflicts with a concurrent transaction, the allocation is
+           rolled back and retried (see `_committed`).
+
+           If the pool has `warm_blocks`, a network of `warm_mask_len` is
+           allocated by claiming a block pre-split by `refill_warm_cache`,
+           if there is one left, independent of `allocation_strategy`.
+        """
+        if commit :
+            return self._committed ("allocate", mask_len, owner)
         errors   = []
         networks = self.ip_networks
         if networks :
-            for nw in sorted (networks, key = Q.net_address) :
+            networks = sorted (networks, key = Q.net_address)
+            if self.warm_blocks and mask_len == self.warm_mask_len :
+                for nw in networks :
+                    result = nw.allocate_warm (mask_len, owner)
+                    if result is not None :
+                        return result
+            for nw in networks :
                 try :
                     return nw.allocate (mask_len, owner)
                 except CNDB.OMP.Error.No_Free_Address_Range as exc :
@@ -115,11 +277,76 @@ class IP_Pool (_Ancestor_Essence) :
             raise CNDB.OMP.Error.No_Network_in_Pool (self)
     # end def allocate
 
+    def allocate_interfaces (self, ifaces, owner, commit = False) :
+        """Allocate a single address for each of `ifaces`, all from the same
+           network of the pool, and assign it to the interface; return the
+           `Net_Interface_in_IP_Network` links.
+
+           The address of a single interface is allocated by `allocate`,
+           i.e., from a warm block or as chosen by `allocation_strategy`;
+           the addresses of several interfaces by `allocate_many`.
+
+           Raises `Quota_Exceeded` if that exceeds a quota of `owner`.
+           `commit` works like for `allocate`.
+        """
+        if commit :
+            return self._committed ("allocate_interfaces", ifaces, owner)
+        scope = self.home_scope
+        node  = ifaces [0].my_node if ifaces else None
+        with CNDB.OMP.Scope_Cache.operation (scope) :
+            usage = CNDB.OMP.IP_Pool_Usage.for_pool (self)
+            if not usage.within_quota (owner, node, ifaces) :
+                raise CNDB.OMP.Error.Quota_Exceeded (self, owner, node)
+            mask_len = self.E_Type.netmask_interval.attr.upper.max_value
+            if len (ifaces) == 1 :
+                networks = [self.allocate (mask_len, owner)]
+            else :
+                networks = self.allocate_many \
+                    ([(mask_len, len (ifaces))], owner)
+            result   = []
+            for iface, nw in zip (ifaces, networks) :
+                result.append \
+                    ( scope.CNDB.Net_Interface_in_IP_Network
+                        (iface, nw, mask_len = nw.pool.net_address.mask)
+                    )
+                usage.assign (nw, iface)
+            return result
+    # end def allocate_interfaces
+
+    def allocate_many (self, requests, owner, commit = False) :
+        """Allocate networks for `requests`, a list of `(mask_len, count)`
+           pairs, all from the same network of the pool. `commit` works like
+           for `allocate`.
+        """
+        if commit :
+            return self._committed ("allocate_many", requests, owner)
+        errors   = []
+        networks = self.ip_networks
+        if networks :
+            for nw in sorted (networks, key = Q.net_address) :
+                try :
+                    return nw.allocate_many (requests, owner)
+                except CNDB.OMP.Error.No_Free_Address_Range as exc :
+                    errors.append (exc)
+            raise errors [-1]
+        else :
+            raise CNDB.OMP.Error.No_Network_in_Pool (self)
+    # end def allocate_many
+
     def can_allocate (self, mask_len = None) :
+        """True if a network of `mask_len` can be allocated from `self`.
+
+           Uses the address counters of the networks of `self`; only
+           networks without counters are searched for a free block.
+        """
         Cannot_Allocate = CNDB.OMP.Error.No_Free_Address_Range
         if mask_len is None :
             mask_len = self.E_Type.netmask_interval.attr.upper.max_value
         for nw in self.ip_networks :
+            if nw.addresses_free is not None :
+                if nw.largest_free is not None and nw.largest_free <= mask_len :
+                    return True
+                continue
             try :
                 nw.find_closest_mask (mask_len)
             except Cannot_Allocate :
@@ -129,6 +356,86 @@ class IP_Pool (_Ancestor_Essence) :
         return False
     # end def can_allocate
 
+    def refill_warm_cache (self, commit = False) :
+        """Split free blocks of the networks of the pool until
+           `warm_blocks` free blocks of `warm_mask_len` are ready for
+           `allocate`; return the number of ready blocks.
+
+           Refilling is meant to run in batch, e.g., by the command
+           `refill_warm_cache`, so that allocations of `warm_mask_len`
+           don't pay for splitting. `commit` works like for `allocate`.
+        """
+        if commit :
+            return self._committed ("refill_warm_cache")
+        mask_len = self.warm_mask_len
+        missing  = self.warm_blocks
+        result   = 0
+        for nw in sorted (self.ip_networks, key = Q.net_address) :
+            if missing <= 0 :
+                break
+            ready    = nw.refill_warm (mask_len, missing)
+            result  += ready
+            missing -= ready
+        return result
+    # end def refill_warm_cache
+
+    def update_counters (self) :
+        """Recount the address counters of the networks of `self`."""
+        for nw in self.ip_networks :
+            nw.update_counters ()
+    # end def update_counters
+
+    def within_quota (self, user, node, ifaces, mask_len = None) :
+        """True if `user` may allocate a network of `mask_len` (default:
+           a single address) for each of `ifaces` of `node` without
+           exceeding a quota of a group permitting `user` to allocate from
+           `self`.
+        """
+        return CNDB.OMP.IP_Pool_Usage.for_pool (self).within_quota \
+            (user, node, ifaces, mask_len)
+    # end def within_quota
+
+    def _committed (self, name, * args) :
+        """Call method `name` of the pool with `args` and commit, return
+           its result.
+
+           If the commit conflicts with a concurrent transaction, e.g.,
+           another allocation from the same pool, the scope is rolled back
+           and the method is called again after a randomized, exponentially
+           growing delay. After `max_conflicts` retries, the conflict is
+           raised to the caller.
+
+           A rollback discards all uncommitted changes of the scope:
+           `_committed` raises `Uncommitted_Changes` if there are any
+           when it is called. The entities in `args` are passed as pids
+           and loaded again for each call, like the pool itself.
+        """
+        scope     = self.home_scope
+        if scope.uncommitted_changes :
+            raise CNDB.OMP.Error.Uncommitted_Changes (scope)
+        pid       = self.pid
+        args      = _Pid_.from_entities (args)
+        conflicts = 0
+        while True :
+            try :
+                pool   = scope.pid_query (pid)
+                result = getattr (pool, name) \
+                    (* _Pid_.to_entities (scope, args))
+                scope.commit ()
+            except MOM.Error.Commit_Conflict :
+                scope.rollback ()
+                conflicts += 1
+                if conflicts > self.max_conflicts :
+                    raise
+                delay = min \
+                    ( self.conflict_delay * (1 << (conflicts - 1))
+                    , self.conflict_delay_max
+                    )
+                time.sleep (delay * random.uniform (0.5, 1.0))
+            else :
+                return result
+    # end def _committed
+
 # end class IP_Pool
 
 if __name__ != "__main__" :
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 Dr. Ralf Schlatterbeck All rights reserved
+# Reichergasse 131, A--3411 Weidling, Austria. rsc@runtux.com
+# #*** <License> ************************************************************#
+# This module is part of the package CNDB.OMP.
+#
+# This module is licensed under the terms of the BSD 3-Clause License
+# <http://www.c-tanzer.at/license/bsd_3c.html>.
+# #*** </License> ***********************************************************#
+#
+#++
+# Name
+#    CNDB.OMP.IP_Pool_Eligibility
+#
+# Purpose
+#    Cache of the IP pools a user may allocate from for a node
+#
+# Revision Dates
+#    18-Oct-2026 (RS) Creation
+#    ««revision-date»»···
+#--
+
+from   _MOM.import_MOM          import Q
+from   _CNDB                    import CNDB
+from   _TFL                     import TFL
+import _CNDB._OMP
+
+import _CNDB._OMP.Scope_Cache
+
+import _TFL.Sorted_By
+
+_Ancestor = CNDB.OMP.Scope_Cache
+
+class IP_Pool_Eligibility (_Ancestor) :
+    """Pools of the `IP_Network_in_IP_Pool` links of type `key` eligible
+       for allocating single addresses, indexed by node and by user.
+
+       A pool is eligible for a node if it is reserved for that node. A
+       pool not reserved for any node is eligible for the members of the
+       groups it permits. Pools restricting the netmask to anything but
+       single addresses are never eligible.
+
+       The cache depends only on the pools, their networks, the groups
+       they permit, and the group memberships: it stays valid as long as
+       the number and the maximum `last_cid` of the objects of these types
+       don't change, even if the scope changes otherwise.
+    """
+
+    def __init__ (self, scope, key) :
+        self.__super.__init__ (scope, key)
+        self._deps = None
+        self._clear ()
+    # end def __init__
+
+    @classmethod
+    def eligible_pools (cls, scope, user, node) :
+        """Return the pools `user` may allocate an address from for `node`,
+           IPv4 pools first.
+        """
+        result = []
+        links  = scope.CNDB.IP_Network_in_IP_Pool.E_Type.children_np
+        for type_name in sorted (links) :
+            cache = cls.for_scope (scope, type_name)
+            result.extend \
+                (scope.pid_query (pid) for pid in cache.pools (user, node))
+        return result
+    # end def eligible_pools
+
+    @property
+    def is_valid (self) :
+        if self.__super.is_valid :
+            return True
+        if self._deps is not None and self._deps == self._dependencies () :
+            self._stamp = self._scope_stamp (self.scope)
+            return True
+        return False
+    # end def is_valid
+
+    def pools (self, user, node) :
+        """Return the sorted pids of the pools eligible for `user` and
+           `node`.
+        """
+        result = set (self._by_node.get (getattr (node, "pid", None), ()))
+        result.update (self._by_user.get (getattr (user, "pid", None), ()))
+        return sorted (result)
+    # end def pools
+
+    def _build (self) :
+        self._clear ()
+        scope  = self.scope
+        ETM    = scope [self.key]
+        bitlen = ETM.left.net_address.P_Type.bitlen
+        links  = ETM.query \
+            ( Q.OR
+                ( ~ Q.right.netmask_interval.upper
+                , Q.right.netmask_interval.upper == bitlen
+                )
+            )
+        open_pools = set ()
+        for link in links :
+            pool = link.right
+            if pool.node is not None :
+                self._by_node.setdefault (pool.node.pid, set ()).add (pool.pid)
+            else :
+                open_pools.add (pool.pid)
+        by_group = {}
+        for P_ETM in self._permit_ETMs () :
+            for permit in P_ETM.query () :
+                if permit.left.pid in open_pools :
+                    by_group.setdefault (permit.right.pid, set ()).add \
+                        (permit.left.pid)
+        for member in scope.PAP.Person_in_Group.query () :
+            pools = by_group.get (member.right.pid)
+            if pools :
+                self._by_user.setdefault (member.left.pid, set ()).update \
+                    (pools)
+        self._deps = self._dependencies ()
+    # end def _build
+
+    def _clear (self) :
+        self._by_node = {}
+        self._by_user = {}
+    # end def _clear
+
+    def _dependencies (self) :
+        """Return count and maximum `last_cid` of the objects of all types
+           the cache depends on.
+        """
+        scope  = self.scope
+        ETM    = scope [self.key]
+        result = []
+        for D in \
+                ( [ETM, scope [ETM.E_Type.right.role_type.type_name]]
+                + self._permit_ETMs ()
+                + [scope.PAP.Person_in_Group]
+                ) :
+            last = D.query (sort_key = TFL.Sorted_By ("-last_cid")).first ()
+            result.append ((D.count, last.last_cid if last else None))
+        return result
+    # end def _dependencies
+
+    def _permit_ETMs (self) :
+        ### a query of the partial `IP_Pool_permits_Group` doesn't find
+        ### anything with some backends: query the concrete types instead
+        scope = self.scope
+        types = scope.CNDB.IP_Pool_permits_Group.E_Type.children_np
+        return list (scope [t] for t in sorted (types))
+    # end def _permit_ETMs
+
+# end class IP_Pool_Eligibility
+
+if __name__ != "__main__" :
+    CNDB.OMP._Export ("*")
+### __END__ CNDB.OMP.IP_Pool_Eligibility
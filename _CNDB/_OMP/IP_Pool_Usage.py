@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 Dr. Ralf Schlatterbeck All rights reserved
+# Reichergasse 131, A--3411 Weidling, Austria. rsc@runtux.com
+# #*** <License> ************************************************************#
+# This module is part of the package CNDB.OMP.
+#
+# This module is licensed under the terms of the BSD 3-Clause License
+# <http://www.c-tanzer.at/license/bsd_3c.html>.
+# #*** </License> ***********************************************************#
+#
+#++
+# Name
+#    CNDB.OMP.IP_Pool_Usage
+#
+# Purpose
+#    Usage counters of an IP_Pool per user, node, and network interface
+#
+# Revision Dates
+#    18-Oct-2026 (RS) Creation
+#    ««revision-date»»···
+#--
+
+from   _MOM.import_MOM          import Q
+from   _CNDB                    import CNDB
+import _CNDB._OMP
+
+import _CNDB._OMP.Scope_Cache
+
+def _pid (obj) :
+    return getattr (obj, "pid", None)
+# end def _pid
+
+_Ancestor = CNDB.OMP.Scope_Cache
+
+class IP_Pool_Usage (_Ancestor) :
+    """Number of addresses allocated from the networks of the `IP_Pool`
+       with pid `key`, indexed by the pid of the owner, of the network
+       interface the allocated network is assigned to, and of the node of
+       that interface.
+
+       The cache also holds the quotas of each user permitted to allocate
+       from the pool, i.e., of the members of the groups of the
+       `IP_Pool_permits_Group` links of the pool. If a user is member of
+       several such groups, the largest quota applies; a missing quota
+       means no restriction.
+
+       Allocation and `free` keep a live cache up-to-date.
+    """
+
+    quota_kinds = ("user_quota", "node_quota", "iface_quota")
+
+    def __init__ (self, scope, key) :
+        self.__super.__init__ (scope, key)
+        self._clear ()
+    # end def __init__
+
+    @classmethod
+    def for_pool (cls, ip_pool) :
+        return cls.for_scope (ip_pool.home_scope, ip_pool.pid)
+    # end def for_pool
+
+    @classmethod
+    def live_for (cls, network) :
+        """Return the live cache of the `IP_Pool` of the pool of `network`,
+           if any.
+        """
+        pool = network.pool
+        if pool is not None and pool.ip_pool is not None :
+            return cls.live (network.home_scope, pool.ip_pool.pid)
+    # end def live_for
+
+    def add (self, network, sign = +1) :
+        """Add allocated `network` to the usage counters (subtract it for
+           negative `sign`).
+        """
+        self._count (network, sign, network.owner)
+        iface = network.net_interface
+        if iface is not None :
+            self._count (network, sign, iface, iface.my_node)
+    # end def add
+
+    def assign (self, network, iface) :
+        """Add `network`, newly assigned to `iface`, to the usage counters
+           of `iface` and its node.
+        """
+        self._count (network, +1, iface, iface.my_node)
+    # end def assign
+
+    def discard (self, network) :
+        """Remove `network` from the usage counters."""
+        self.add (network, -1)
+    # end def discard
+
+    def usage (self, obj) :
+        """Return the number of addresses allocated for `obj`, a user,
+           node, or network interface.
+        """
+        return self._usage.get (_pid (obj), 0)
+    # end def usage
+
+    def within_quota (self, user, node, ifaces, mask_len = None) :
+        """True if allocating a network of `mask_len` for each of `ifaces`
+           of `node` by `user` doesn't exceed the quotas of `user`.
+        """
+        quotas = self._quotas.get (_pid (user))
+        if not quotas or self._bitlen is None :
+            return True
+        bitlen = self._bitlen
+        size   = 1 << (bitlen - (bitlen if mask_len is None else mask_len))
+        need   = size * len (ifaces)
+        user_q, node_q, iface_q = \
+            ( None if q is None else 1 << (bitlen - q)
+            for q in quotas
+            )
+        if user_q is not None and self.usage (user) + need > user_q :
+            return False
+        if node_q is not None and self.usage (node) + need > node_q :
+            return False
+        if iface_q is not None :
+            for iface in ifaces :
+                if self.usage (iface) + size > iface_q :
+                    return False
+        return True
+    # end def within_quota
+
+    def _build (self) :
+        self._clear ()
+        ip_pool = self.scope.pid_query (self.key)
+        for pool in ip_pool.ip_networks :
+            self._bitlen = pool.net_address.bitlen
+            allocated    = pool.ETM.query \
+                ( Q.pool == pool
+                , Q.pid  != pool.pid
+                , Q.expiration_date == None
+                , ~ Q.electric
+                ).distinct ()
+            for nw in allocated :
+                self.add (nw)
+        quotas = self._quotas
+        for permit in ip_pool.group_links :
+            pq = tuple (getattr (permit, k) for k in self.quota_kinds)
+            for member in permit.right.member_links :
+                pid = member.left.pid
+                q   = pq
+                if pid in quotas :
+                    ### largest quota (i.e., smallest netmask) applies
+                    q = tuple \
+                        ( None if a is None or b is None else min (a, b)
+                        for a, b in zip (quotas [pid], pq)
+                        )
+                quotas [pid] = q
+    # end def _build
+
+    def _count (self, network, sign, * objs) :
+        na    = network.net_address
+        size  = sign << (na.bitlen - na.mask_len)
+        usage = self._usage
+        for obj in objs :
+            k = _pid (obj)
+            if k is not None :
+                usage [k] = usage.get (k, 0) + size
+    # end def _count
+
+    def _clear (self) :
+        self._bitlen = None
+        self._quotas = {}
+        self._usage  = {}
+    # end def _clear
+
+# end class IP_Pool_Usage
+
+if __name__ != "__main__" :
+    CNDB.OMP._Export ("*")
+### __END__ CNDB.OMP.IP_Pool_Usage
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 Dr. Ralf Schlatterbeck All rights reserved
+# Reichergasse 131, A--3411 Weidling, Austria. rsc@runtux.com
+# #*** <License> ************************************************************#
+# This module is part of the package CNDB.OMP.
+#
+# This module is licensed under the terms of the BSD 3-Clause License
+# <http://www.c-tanzer.at/license/bsd_3c.html>.
+# #*** </License> ***********************************************************#
+#
+#++
+# Name
+#    CNDB.OMP.IP_Prefix_Index
+#
+# Purpose
+#    In-memory longest-prefix-match index of the networks of an IP_Network
+#    E_Type
+#
+# Revision Dates
+#    18-Oct-2026 (RS) Creation
+#    18-Oct-2026 (RS) Add `_catch_up`, set `catch_up_committed`
+#    ««revision-date»»···
+#--
+
+from   _CNDB                    import CNDB
+import _CNDB._OMP
+
+import _CNDB._OMP.Scope_Cache
+
+from   _CNDB._OMP.IP_Free_Index import _masked
+
+_Ancestor = CNDB.OMP.Scope_Cache
+
+class IP_Prefix_Index (_Ancestor) :
+    """Networks of the `IP_Network` E_Type with name `key`, indexed by
+       address and mask length.
+
+       The networks containing an address are found by masking the address
+       with each mask length used by a network of the E_Type, longest
+       first, and looking up the result; this takes at most one dictionary
+       lookup per bit of the prefix instead of a `CONTAINS` query, which
+       most databases cannot answer with an index.
+
+       Splitting, sparse allocation, and destroying a network keep a live
+       index up-to-date. Other changes of the scope, including the ones
+       committed by other processes, are caught up with when the index is
+       used next: creating or destroying networks of the E_Type patches
+       the index, changes of other objects, e.g., links created by a bulk
+       import, don't affect it at all.
+    """
+
+    catch_up_committed = True
+
+    def __init__ (self, scope, key) :
+        self.__super.__init__ (scope, key)
+        self._clear ()
+    # end def __init__
+
+    @classmethod
+    def for_network (cls, network) :
+        return cls.for_scope (network.home_scope, network.ETM.type_name)
+    # end def for_network
+
+    @classmethod
+    def live_for (cls, network) :
+        """Return the live index of the E_Type of `network`, if any."""
+        return cls.live (network.home_scope, network.ETM.type_name)
+    # end def live_for
+
+    def __len__ (self) :
+        return len (self._nets)
+    # end def __len__
+
+    def add (self, network) :
+        """Add `network` to index."""
+        na = network.net_address
+        self._add (network.pid, na.ip, na.mask_len)
+    # end def add
+
+    def containing (self, net_address) :
+        """Generate `(mask_len, pid)` of the networks containing
+           `net_address` (including `net_address` itself), longest prefix
+           first.
+        """
+        ip, ml = net_address.ip, net_address.mask_len
+        bitlen = net_address.bitlen
+        nets   = self._nets
+        for l in self._mask_lens () :
+            if l <= ml :
+                pid = nets.get ((_masked (ip, l, bitlen), l))
+                if pid is not None :
+                    yield l, pid
+    # end def containing
+
+    def discard (self, network) :
+        """Remove `network` from index."""
+        self._discard_pid (network.pid)
+    # end def discard
+
+    def longest_match (self, net_address) :
+        """Return pid of the network with the longest prefix containing
+           `net_address`, None if there is none.
+        """
+        for l, pid in self.containing (net_address) :
+            return pid
+    # end def longest_match
+
+    def _add (self, pid, ip, ml) :
+        key = (ip, ml)
+        old = self._nets.get (key)
+        if old is not None :
+            del self._pids [old]
+        else :
+            n = self._lens.get (ml, 0)
+            if not n :
+                self._sorted = None
+            self._lens [ml] = n + 1
+        self._nets [key] = pid
+        self._pids [pid] = key
+    # end def _add
+
+    def _build (self) :
+        self._clear ()
+        ETM = self.scope [self.key]
+        for pid, na in ETM.query ().attrs ("pid", "net_address") :
+            self._add (pid, na.ip, na.mask_len)
+    # end def _build
+
+    def _catch_up (self, changes) :
+        scope = self.scope
+        for c in self._flattened (changes) :
+            if getattr (c, "type_name", None) != self.key :
+                continue
+            if c.kind in ("Create", "Copy") :
+                try :
+                    network = scope.pid_query (c.pid)
+                except LookupError :
+                    ### destroyed later on, nothing to add
+                    continue
+                self.add (network)
+            elif c.kind == "Destroy" :
+                self._discard_pid (c.pid)
+            elif "net_address" in c.attr_changes :
+                return False
+        return True
+    # end def _catch_up
+
+    def _clear (self) :
+        self._lens   = {}
+        self._nets   = {}
+        self._pids   = {}
+        self._sorted = None
+    # end def _clear
+
+    def _discard_pid (self, pid) :
+        key = self._pids.pop (pid, None)
+        if key is not None :
+            del self._nets [key]
+            ml = key [1]
+            n  = self._lens [ml] - 1
+            if n :
+                self._lens [ml] = n
+            else :
+                del self._lens [ml]
+                self._sorted = None
+    # end def _discard_pid
+
+    def _flattened (self, changes) :
+        for c in changes :
+            yield c
+            for x in self._flattened (c.children) :
+                yield x
+    # end def _flattened
+
+    def _mask_lens (self) :
+        result = self._sorted
+        if result is None :
+            result = self._sorted = sorted (self._lens, reverse = True)
+        return result
+    # end def _mask_lens
+
+# end class IP_Prefix_Index
+
+if __name__ != "__main__" :
+    CNDB.OMP._Export ("*")
+### __END__ CNDB.OMP.IP_Prefix_Index
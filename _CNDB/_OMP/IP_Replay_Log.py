@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 Dr. Ralf Schlatterbeck All rights reserved
+# Reichergasse 131, A--3411 Weidling, Austria. rsc@runtux.com
+# #*** <License> ************************************************************#
+# This module is part of the package CNDB.OMP.
+#
+# This module is licensed under the terms of the BSD 3-Clause License
+# <http://www.c-tanzer.at/license/bsd_3c.html>.
+# #*** </License> ***********************************************************#
+#
+#++
+# Name
+#    CNDB.OMP.IP_Replay_Log
+#
+# Purpose
+#    Append-only log of the allocations, reservations, frees, and garbage
+#    collections of the IP networks of a scope
+#
+# Revision Dates
+#    18-Oct-2026 (RS) Creation
+#    ««revision-date»»···
+#--
+
+from   _CNDB                    import CNDB
+from   _TFL                     import TFL
+from   _TFL.pyk                 import pyk
+
+import _CNDB._OMP
+
+import _TFL._Meta.Object
+import _TFL.Decorator
+
+from   datetime                 import datetime, timedelta
+
+import functools
+import json
+import time
+import weakref
+
+class IP_Replay_Log (TFL.Meta.Object) :
+    """Append-only log of the operations changing the IP networks of a
+       scope, one JSON object per line.
+
+       Each entry contains the name of the operation (`op`), its time
+       (`t`, seconds since the epoch according to `IP_Network.clock`),
+       its duration (`seconds`), the E_Type
+       and `network` it was applied to, its parameters, and its `result`
+       or the name of the exception it raised (`error`). Networks are
+       written as addresses, owners as pids, periods in seconds.
+
+       Only the outermost operation is logged, e.g., the networks freed
+       by `collect_garbage` aren't. Operations are logged when they are
+       done, not when they are committed: operations rolled back, e.g.,
+       after a `Commit_Conflict`, are in the log, too.
+
+       `CNDB.OMP.IP_Simulator` replays a log against a fresh scope.
+    """
+
+    _scope_map = weakref.WeakKeyDictionary ()
+
+    def __init__ (self, file) :
+        self.count = 0
+        self.depth = 0
+        self.file  = file
+    # end def __init__
+
+    @classmethod
+    def attach (cls, scope, file) :
+        """Attach a new log writing to `file`, a file name or an open file,
+           to `scope`; return the log.
+        """
+        if isinstance (file, pyk.string_types) :
+            file = open (file, "a", buffering = 1)
+        result = cls._scope_map [scope] = cls (file)
+        return result
+    # end def attach
+
+    @classmethod
+    def detach (cls, scope) :
+        """Detach the log of `scope`, if any, and close the file it was
+           opened for.
+        """
+        log = cls._scope_map.pop (scope, None)
+        if log is not None :
+            log.file.flush ()
+            if getattr (log.file, "name", None) :
+                log.file.close ()
+    # end def detach
+
+    @classmethod
+    def for_scope (cls, scope) :
+        """Return the log attached to `scope`, None if there is none."""
+        return cls._scope_map.get (scope)
+    # end def for_scope
+
+    @classmethod
+    @TFL.Contextmanager
+    def logged (cls, scope, op, ** kw) :
+        """Context manager logging operation `op` with the parameters `kw`
+           to the log of `scope`, if there is one. The body of the `with`
+           statement puts the result into the `result` of the dictionary
+           returned.
+        """
+        log = cls._scope_map.get (scope)
+        if log is None or log.depth :
+            if log is not None :
+                log.depth += 1
+            try :
+                yield {}
+            finally :
+                if log is not None :
+                    log.depth -= 1
+            return
+        entry = log._entry (op, kw)
+        start = time.time ()
+        log.depth = 1
+        try :
+            yield entry
+        except Exception as exc :
+            entry ["error"] = exc.__class__.__name__
+            raise
+        finally :
+            log.depth = 0
+            entry ["seconds"] = round (time.time () - start, 6)
+            log.write (entry)
+    # end def logged
+
+    @classmethod
+    def logged_method (cls, op) :
+        """Decorator logging the calls of an `IP_Network` method as
+           operation `op`, see `logged`.
+
+           The network the method is called for is logged as `network`;
+           for a class method, the method must take a list of `networks`.
+        """
+        def decorator (method) :
+            code  = method.__code__
+            names = code.co_varnames [1 : code.co_argcount]
+            @functools.wraps (method)
+            def _ (this, * args, ** kw) :
+                kw.update (zip (names, args))
+                params = dict (kw)
+                if "networks" in kw :
+                    networks = kw ["networks"] = list (kw ["networks"])
+                    if not networks :
+                        return method (this, ** kw)
+                    scope = networks [0].home_scope
+                    params ["networks"] = networks
+                else :
+                    scope = this.home_scope
+                    params ["network"] = this
+                with cls.logged (scope, op, ** params) as entry :
+                    result = entry ["result"] = method (this, ** kw)
+                return result
+            return _
+        return decorator
+    # end def logged_method
+
+    @classmethod
+    def read (cls, file) :
+        """Generate the entries of the log in `file`, a file name or an
+           open file.
+        """
+        if isinstance (file, pyk.string_types) :
+            with open (file) as f :
+                for entry in cls.read (f) :
+                    yield entry
+            return
+        for line in file :
+            line = line.strip ()
+            if line :
+                yield json.loads (line)
+    # end def read
+
+    def write (self, entry) :
+        line = json.dumps \
+            (self._jsonable (entry), sort_keys = True, separators = (",", ":"))
+        self.file.write (line + "\n")
+        self.count += 1
+    # end def write
+
+    def _entry (self, op, kw) :
+        network = kw.get ("network")
+        if network is None and kw.get ("networks") :
+            network = kw ["networks"] [0]
+        now     = datetime.now () if network is None else network.clock ()
+        result  = dict (op = op, t = self._timestamp (now))
+        if network is not None :
+            result ["type"] = network.type_name
+        if op.startswith ("allocate") and "network" in kw :
+            result ["strategy"] = network.allocation_strategy
+        if op == "free" :
+            ### log the cool-down period in effect: a replay doesn't know
+            ### the pools
+            kw ["cool_down_period"] = network.min_cooldown_period \
+                (kw.get ("cool_down_period"))
+        elif op == "free_many" :
+            cdp = kw.get ("cool_down_period")
+            kw ["cool_down_period"] = list \
+                (n.min_cooldown_period (cdp) for n in kw ["networks"])
+        result.update (kw)
+        ### convert now: the operation might destroy networks, e.g., free
+        return self._jsonable (result)
+    # end def _entry
+
+    def _jsonable (self, value) :
+        if isinstance (value, dict) :
+            return dict \
+                ((k, self._jsonable (v)) for k, v in pyk.iteritems (value))
+        elif isinstance (value, (list, tuple)) :
+            return list (self._jsonable (v) for v in value)
+        elif isinstance (value, timedelta) :
+            return value.total_seconds ()
+        elif isinstance (value, (bool, float, pyk.int_types)) :
+            return value
+        elif value is None or isinstance (value, pyk.string_types) :
+            return value
+        na = getattr (value, "net_address", None)
+        if na is not None :
+            return str (na)
+        pid = getattr (value, "pid", None)
+        if pid is not None :
+            return pid
+        return str (value)
+    # end def _jsonable
+
+    def _timestamp (self, dt) :
+        return round (time.mktime (dt.timetuple ()) + dt.microsecond / 1e6, 6)
+    # end def _timestamp
+
+# end class IP_Replay_Log
+
+if __name__ != "__main__" :
+    CNDB.OMP._Export ("*")
+### __END__ CNDB.OMP.IP_Replay_Log
@@ -0,0 +1,393 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 Dr. Ralf Schlatterbeck All rights reserved
+# Reichergasse 131, A--3411 Weidling, Austria. rsc@runtux.com
+# #*** <License> ************************************************************#
+# This module is part of the package CNDB.OMP.
+#
+# This module is licensed under the terms of the BSD 3-Clause License
+# <http://www.c-tanzer.at/license/bsd_3c.html>.
+# #*** </License> ***********************************************************#
+#
+#++
+# Name
+#    CNDB.OMP.IP_Simulator
+#
+# Purpose
+#    Replay an `IP_Replay_Log` or a synthetic workload against a scope
+#
+# Revision Dates
+#    18-Oct-2026 (RS) Creation
+#    ««revision-date»»···
+#--
+
+from   _MOM.import_MOM          import Q
+from   _CNDB                    import CNDB
+from   _TFL                     import TFL
+from   _TFL.pyk                 import pyk
+
+import _CNDB._OMP
+import _CNDB._OMP.Error
+import _CNDB._OMP.IP_Free_Index
+import _CNDB._OMP.IP_Replay_Log
+
+import _TFL._Meta.Object
+import _TFL._Meta.Once_Property
+import _TFL.Decorator
+
+from   datetime                 import datetime, timedelta
+
+import random
+import time
+
+class IP_Simulator (TFL.Meta.Object) :
+    """Replay the entries of an `IP_Replay_Log`, or a synthetic workload,
+       against `scope`, normally a fresh one.
+
+       The entries are applied using the real `IP_Network` code, with
+       `IP_Network.clock` following the times of the entries (starting at
+       `epoch`), so that replaying the same entries gives the same result.
+
+       Networks referenced by an entry but missing from `scope` are
+       reserved from the network containing them, if any, or created as
+       top-level networks. Owners are replaced by persons created for
+       their pids. The `allocation_strategy` logged with an allocation is
+       applied by an `IP_Pool` of the network allocated from. The
+       `deadline` of `collect_garbage` isn't replayed.
+
+       A replayed entry whose result or error differs from the logged one
+       is counted as `diverged`.
+    """
+
+    epoch      = datetime (2000, 1, 1)
+
+    ### E_Type, top-level network, and weighted mask lengths of the
+    ### synthetic workloads, per address family
+    workloads  = dict \
+        ( { "4" :
+              ( "CNDB.IP4_Network", "10.0.0.0/8"
+              , ((32, 80), (30, 10), (29, 5), (28, 5))
+              )
+          , "6" :
+              ( "CNDB.IP6_Network", "2001:db8::/32"
+              , ((64, 70), (128, 10), (60, 10), (56, 10))
+              )
+          }
+        )
+
+    def __init__ (self, scope) :
+        self.scope    = scope
+        self.diverged = 0
+        self.errors   = 0
+        self.now      = self.epoch
+        self.ops      = 0
+        self.owners   = {}
+        self.roots    = {}
+        self.skipped  = 0
+        self.start    = None
+        self._t0      = None
+    # end def __init__
+
+    def apply (self, entry) :
+        """Apply `entry`, put the result into `entry ["replayed"]` and the
+           name of the exception raised, if any, into
+           `entry ["replay_error"]`.
+        """
+        t = entry.get ("t")
+        if t is not None :
+            if self._t0 is None :
+                self._t0 = t
+            now = self.epoch + timedelta (seconds = t - self._t0)
+            if now > self.now :
+                self.now = now
+        handler = getattr (self, "_op_" + entry.get ("op", ""), None)
+        if handler is None :
+            self.skipped += 1
+            return
+        self.ops += 1
+        error     = None
+        result    = None
+        try :
+            result = handler (entry)
+        except CNDB.OMP.Error.Error as exc :
+            error = exc.__class__.__name__
+            self.errors += 1
+        entry ["replayed"]     = result
+        entry ["replay_error"] = error
+        if "result" in entry or "error" in entry :
+            replayed = self._jsonable (result)
+            if (entry.get ("error"), entry.get ("result")) != \
+                    (error, None if error else replayed) :
+                self.diverged += 1
+    # end def apply
+
+    def clock (self) :
+        return self.now
+    # end def clock
+
+    def fragmentation (self) :
+        """Return the number of free blocks of the top-level networks and
+           the fraction of their free address space not in the largest
+           free block of the top-level network containing it.
+        """
+        return self.network_fragmentation (pyk.itervalues (self.roots))
+    # end def fragmentation
+
+    @classmethod
+    def network_fragmentation (cls, networks) :
+        """Return the number of free blocks of `networks` and the fraction
+           of their free address space not in the largest free block of
+           the network containing it.
+        """
+        blocks  = 0
+        largest = 0
+        total   = 0
+        for root in networks :
+            index  = CNDB.OMP.IP_Free_Index.for_network (root)
+            bitlen = root.net_address.bitlen
+            sizes  = list \
+                ( 1 << (bitlen - ml)
+                for pid, ip, ml in index.candidates (bitlen)
+                )
+            if not sizes and root.is_free :
+                sizes = [1 << (bitlen - root.net_address.mask_len)]
+            if sizes :
+                blocks  += len (sizes)
+                largest += max (sizes)
+                total   += sum (sizes)
+        return blocks, (1.0 - float (largest) / total) if total else 0.0
+    # end def network_fragmentation
+
+    def run (self, entries, report_every = 1000) :
+        """Apply `entries`, generate a `snapshot` after every
+           `report_every` operations and after the last one.
+        """
+        self.start = time.time ()
+        last       = None
+        with self.simulated_time () :
+            for entry in entries :
+                self.apply (entry)
+                if report_every and self.ops and self.ops != last \
+                        and not self.ops % report_every :
+                    last = self.ops
+                    yield self.snapshot ()
+            if self.ops != last :
+                yield self.snapshot ()
+    # end def run
+
+    @TFL.Contextmanager
+    def simulated_time (self) :
+        """Context manager using `clock` as `IP_Network.clock`."""
+        E_Types = list \
+            ( self.scope [tn].E_Type
+            for tn in sorted (self.scope.CNDB.IP_Network.E_Type.children_np)
+            )
+        for ET in E_Types :
+            ET.clock = self.clock
+        try :
+            yield
+        finally :
+            for ET in E_Types :
+                del ET.clock
+    # end def simulated_time
+
+    def snapshot (self) :
+        """Return a dictionary with the state of the simulation."""
+        seconds      = time.time () - (self.start or time.time ())
+        blocks, frag = self.fragmentation ()
+        return dict \
+            ( blocks   = blocks
+            , diverged = self.diverged
+            , errors   = self.errors
+            , frag     = frag
+            , networks = self.scope.CNDB.IP_Network.count
+            , now      = self.now
+            , ops      = self.ops
+            , rate     = (self.ops / seconds) if seconds else 0.0
+            , seconds  = seconds
+            , skipped  = self.skipped
+            )
+    # end def snapshot
+
+    @classmethod
+    def synthetic \
+            ( cls, family = "4", ops = 10000, seed = 42
+            , alloc_ratio = 0.6, gc_every = 1000, cool_down = 86400
+            , owners = 10, step = 60
+            ) :
+        """Generate the entries of a synthetic workload of `ops` operations
+           for address `family`: allocations (`alloc_ratio`) and frees of
+           random allocations with `cool_down` seconds, one operation per
+           `step` seconds, garbage collection every `gc_every` operations.
+
+           The networks freed are chosen from the `replayed` results of the
+           allocations, i.e., the entries must be applied before the next
+           one is generated. Allocations freed by garbage collection, i.e.,
+           single addresses not linked to an interface, aren't freed
+           again.
+        """
+        type_name, net, masks = cls.workloads [family]
+        rand      = random.Random (seed)
+        weights   = []
+        for ml, w in masks :
+            weights.extend ([ml] * w)
+        allocated = []
+        t         = 0
+        for i in range (ops) :
+            entry = dict (t = t, type = type_name)
+            if allocated and rand.random () >= alloc_ratio :
+                n = allocated.pop (rand.randrange (len (allocated)))
+                entry.update \
+                    ( op               = "free"
+                    , network          = str (n.net_address)
+                    , cool_down_period = cool_down
+                    )
+                yield entry
+            else :
+                entry.update \
+                    ( op       = "allocate"
+                    , network  = net
+                    , mask_len = rand.choice (weights)
+                    , owner    = rand.randrange (owners)
+                    )
+                yield entry
+                if entry.get ("replayed") is not None :
+                    allocated.append (entry ["replayed"])
+            t += step
+            if gc_every and not (i + 1) % gc_every :
+                yield dict \
+                    ( op = "collect_garbage", t = t, type = type_name
+                    , network = net
+                    )
+                ### destroyed networks are False
+                allocated = list \
+                    (n for n in allocated if n and n.expiration_date is None)
+    # end def synthetic
+
+    def _ETM (self, entry) :
+        return self.scope [entry ["type"]]
+    # end def _ETM
+
+    def _jsonable (self, value) :
+        if isinstance (value, (list, tuple)) :
+            return list (self._jsonable (v) for v in value)
+        na = getattr (value, "net_address", None)
+        return value if na is None else str (na)
+    # end def _jsonable
+
+    def _network (self, ETM, address) :
+        """Return the network with `address`, create it if necessary."""
+        result = ETM.instance (address, raw = True)
+        if result is not None :
+            if result.parent is None :
+                self.roots.setdefault (address, result)
+        else :
+            na   = ETM.net_address.P_Type (address)
+            root = ETM.query \
+                ( Q.net_address.CONTAINS (na)
+                , ~ Q.parent
+                ).first ()
+            if root is None :
+                result = self.roots [address] = ETM \
+                    (address, owner = self._pool_owner, raw = True)
+            else :
+                result = root.reserve (na, root.owner)
+        return result
+    # end def _network
+
+    def _owner (self, key) :
+        if key is None :
+            return None
+        result = self.owners.get (key)
+        if result is None :
+            result = self.owners [key] = self.scope.PAP.Person \
+                ("Simulated", "Owner %s" % (key, ), raw = True)
+        return result
+    # end def _owner
+
+    @TFL.Meta.Once_Property
+    def _pool_owner (self) :
+        return self.scope.PAP.Association \
+            ("Simulation", short_name = "Sim", raw = True)
+    # end def _pool_owner
+
+    def _period (self, seconds) :
+        if seconds is not None :
+            return timedelta (seconds = seconds)
+    # end def _period
+
+    def _set_strategy (self, network, strategy) :
+        """Make `network` allocate with `strategy`."""
+        if not strategy or str (network.allocation_strategy) == strategy :
+            return
+        ip_pool = network.ip_pool
+        if ip_pool is None :
+            scope   = self.scope
+            Link    = scope [network.ETM.ip_pool_link.P_Type]
+            ip_pool = scope [Link.E_Type.right.P_Type] \
+                (name = "sim-%s" % (network.pid, ), raw = True)
+            Link (network, ip_pool)
+        ip_pool.set_raw (allocation_strategy = strategy)
+    # end def _set_strategy
+
+    def _op_allocate (self, entry) :
+        network = self._network (self._ETM (entry), entry ["network"])
+        self._set_strategy (network, entry.get ("strategy"))
+        return network.allocate \
+            (entry ["mask_len"], self._owner (entry.get ("owner")))
+    # end def _op_allocate
+
+    def _op_allocate_many (self, entry) :
+        network = self._network (self._ETM (entry), entry ["network"])
+        return network.allocate_many \
+            ( list (tuple (r) for r in entry ["requests"])
+            , self._owner (entry.get ("owner"))
+            )
+    # end def _op_allocate_many
+
+    def _op_allocate_warm (self, entry) :
+        network = self._network (self._ETM (entry), entry ["network"])
+        return network.allocate_warm \
+            (entry ["mask_len"], self._owner (entry.get ("owner")))
+    # end def _op_allocate_warm
+
+    def _op_collect_garbage (self, entry) :
+        network = self._network (self._ETM (entry), entry ["network"])
+        return network.collect_garbage \
+            (max_networks = entry.get ("max_networks"))
+    # end def _op_collect_garbage
+
+    def _op_free (self, entry) :
+        network = self._network (self._ETM (entry), entry ["network"])
+        return network.free (self._period (entry.get ("cool_down_period")))
+    # end def _op_free
+
+    def _op_free_many (self, entry) :
+        ETM     = self._ETM (entry)
+        periods = entry.get ("cool_down_period")
+        if not isinstance (periods, list) :
+            periods = [periods] * len (entry ["networks"])
+        groups  = {}
+        for address, period in zip (entry ["networks"], periods) :
+            groups.setdefault (period, []).append \
+                (self._network (ETM, address))
+        for period, networks in sorted \
+                (groups.items (), key = lambda x : (x [0] is not None, x [0])) :
+            ETM.free_many (networks, self._period (period))
+    # end def _op_free_many
+
+    def _op_refill_warm (self, entry) :
+        network = self._network (self._ETM (entry), entry ["network"])
+        return network.refill_warm (entry ["mask_len"], entry ["count"])
+    # end def _op_refill_warm
+
+    def _op_reserve (self, entry) :
+        network = self._network (self._ETM (entry), entry ["network"])
+        return network.reserve \
+            (entry ["net_addr"], self._owner (entry.get ("owner")))
+    # end def _op_reserve
+
+# end class IP_Simulator
+
+if __name__ != "__main__" :
+    CNDB.OMP._Export ("*")
+### __END__ CNDB.OMP.IP_Simulator
@@ -0,0 +1,363 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 Dr. Ralf Schlatterbeck All rights reserved
+# Reichergasse 131, A--3411 Weidling, Austria. rsc@runtux.com
+# #*** <License> ************************************************************#
+# This module is part of the package CNDB.OMP.
+#
+# This module is licensed under the terms of the BSD 3-Clause License
+# <http://www.c-tanzer.at/license/bsd_3c.html>.
+# #*** </License> ***********************************************************#
+#
+#++
+# Name
+#    CNDB.OMP.Monitoring_Target_Writer
+#
+# Purpose
+#    Write smokeping targets and Prometheus `file_sd` target files for the
+#    addresses assigned to net interfaces, grouped by zone and node
+#
+# Revision Dates
+#    18-Oct-2026 (RS) Creation
+#    18-Oct-2026 (RS) Prefetch `my_node` of the changed parts
+#    ««revision-date»»···
+#--
+
+from   _MOM.import_MOM          import Q
+from   _CNDB                    import CNDB
+from   _TFL                     import TFL
+from   _TFL.pyk                 import pyk
+
+import _CNDB._OMP
+import _CNDB._OMP.Query_Prefetch
+
+import _TFL._Meta.Object
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+
+class Monitoring_Target_Writer (TFL.Meta.Object) :
+    """Write monitoring targets for the single addresses linked to the net
+       interfaces of `scope` into `directory`.
+
+       The targets are grouped by zone and node: the zone of an address is
+       the name of the `IP_Pool` of the pool network the address was
+       allocated from, or the address of that pool network if it doesn't
+       belong to an `IP_Pool`. For each group, the files
+       `<zone>/<node>.conf`, a smokeping `++` section with one `+++`
+       target per address, and `<zone>/<node>.json`, a Prometheus
+       `file_sd` file with one target group per interface, are written;
+       `Targets` contains the smokeping `*** Targets ***` section with a
+       `+` section per zone including the group files.
+
+       The addresses are read with one query per `Net_Interface_in_IP_Network`
+       E_Type that fetches the node, interface, address, and pool network of
+       all links at once, instead of following `my_node` and `right` for
+       each link.
+
+       The change id (`cid`) of the last run is kept in the file
+       `state_name` in `directory`. The next run only reads the addresses of
+       the nodes changed since then. Changes that cannot be attributed to a
+       node, e.g., destroying an interface or renaming an `IP_Pool`, lead
+       to reading all addresses. In both cases, only group files whose
+       contents changed are written.
+    """
+
+    file_mode    = 0o644
+    main_name    = "Targets"
+    menu         = "Top"
+    probe        = "FPing"
+    probe_6      = "FPing6"
+    state_name   = "targets.state"
+    title        = "Network Latency Grapher"
+
+    _label_pat   = re.compile (r"[^-_0-9a-zA-Z]")
+
+    def __init__ (self, scope, directory) :
+        self.scope     = scope
+        self.directory = directory
+        self.state     = self._read_state ()
+    # end def __init__
+
+    def changed_nodes (self, after) :
+        """Return the set of pids of the nodes whose targets might have
+           changed after change id `after`, or None if all targets must be
+           read.
+
+           The changed devices, interfaces, and links are loaded with one
+           query per E_Type; if one of them doesn't exist anymore, all
+           targets are read.
+        """
+        scope   = self.scope
+        CNDB    = scope.CNDB
+        Node    = CNDB.Node.E_Type
+        Parts   = tuple \
+            ( scope [tn].E_Type for tn in
+                ( "CNDB.Net_Device", "CNDB.Net_Interface"
+                , "CNDB.Net_Interface_in_IP_Network"
+                )
+            )
+        Pool    = CNDB.IP_Pool.E_Type
+        In_Pool = CNDB.IP_Network_in_IP_Pool.E_Type
+        parts   = {}
+        result  = set ()
+        for change in scope.query_changes (Q.cid > after) :
+            ET = scope.entity_type (change.type_name)
+            if ET is None or change.pid is None :
+                continue
+            if issubclass (ET, Node) :
+                result.add (change.pid)
+            elif issubclass (ET, Parts) :
+                if change.kind == "Destroy" or \
+                        {"left", "node"} & set (change.modified_attrs) :
+                    return None
+                parts.setdefault (change.type_name, set ()).add (change.pid)
+            elif issubclass (ET, In_Pool) :
+                return None
+            elif issubclass (ET, Pool) and change.kind != "Create" :
+                if change.kind == "Destroy" or \
+                        "name" in change.modified_attrs :
+                    return None
+        for tn, pids in sorted (pyk.iteritems (parts)) :
+            entities = CNDB.OMP.Query_Prefetch.prefetch \
+                (scope [tn].query (Q.pid.IN (sorted (pids))), "my_node")
+            if len (entities) < len (pids) :
+                return None
+            for entity in entities :
+                node = getattr (entity, "my_node", None)
+                if node is not None :
+                    result.add (node.pid)
+        return result
+    # end def changed_nodes
+
+    def group_name (self, zone, node) :
+        return "%s/%s" % (zone, node)
+    # end def group_name
+
+    def targets (self, node_pids = None) :
+        """Generate `(zone, node, iface, address, family)` for the single
+           addresses linked to net interfaces, restricted to the nodes
+           with `node_pids`, if specified. `node` is the node entity,
+           `address` the `net_address`.
+        """
+        scope = self.scope
+        zones = self._pool_zones ()
+        Links = scope.CNDB.Net_Interface_in_IP_Network.E_Type
+        ### the partial E_Types of the links can't be queried on all
+        ### backends, query each concrete E_Type
+        for tn in sorted (Links.children_np) :
+            filters = []
+            if node_pids is not None :
+                filters.append (Q.left.left.node.IN (sorted (node_pids)))
+            rows    = scope [tn].query (* filters).attrs \
+                ( Q.left.left.node, Q.left.name, Q.name
+                , Q.right.net_address, Q.right.pool.net_address
+                )
+            for node, iface_name, name, na, pool_na in rows :
+                if na.mask_len != na.bitlen :
+                    continue
+                if pool_na is None :
+                    zone = "default"
+                else :
+                    zone = zones.get (str (pool_na)) or str (pool_na)
+                yield \
+                    ( self._label (zone), node, name or iface_name, na
+                    , 6 if na.bitlen == 128 else 4
+                    )
+    # end def targets
+
+    def write_all (self, full = False) :
+        """Write the target files of the nodes changed since the last
+           run, or of all nodes if `full`; return a list of
+           `(name, action)` for the files written or removed.
+        """
+        state     = self.state
+        groups    = state.setdefault ("groups", {})
+        last_cid  = state.get ("last_cid")
+        max_cid   = self.scope.max_cid or 0
+        node_pids = None
+        if not (full or last_cid is None) :
+            if last_cid >= max_cid :
+                return []
+            node_pids = self.changed_nodes (last_cid)
+        result    = []
+        if node_pids is None or node_pids :
+            new = {}
+            for zone, node, iface, na, family in self.targets (node_pids) :
+                key = self.group_name (zone, node.name)
+                new.setdefault (key, (zone, node, [])) [2].append \
+                    ((family, na.ip, iface, str (na).split ("/") [0]))
+            for key in sorted (new) :
+                zone, node, targets = new [key]
+                targets.sort ()
+                if self._write_group (key, zone, node, targets) :
+                    result.append ((key, "changed"))
+            for key, info in sorted (pyk.iteritems (dict (groups))) :
+                if key not in new and \
+                        (node_pids is None or info ["node"] in node_pids) :
+                    self._remove_group (key)
+                    result.append ((key, "removed"))
+            if self._write_main () :
+                result.append ((self.main_name, "changed"))
+        state ["last_cid"] = max_cid
+        self._write_state ()
+        return result
+    # end def write_all
+
+    def _label (self, name) :
+        return self._label_pat.sub ("_", name)
+    # end def _label
+
+    def _main (self) :
+        result = \
+            [ "*** Targets ***"
+            , ""
+            , "probe = %s" % (self.probe, )
+            , "menu = %s"  % (self.menu, )
+            , "title = %s" % (self.title, )
+            ]
+        zone = None
+        for key, info in sorted (pyk.iteritems (self.state ["groups"])) :
+            if info ["zone"] != zone :
+                zone = info ["zone"]
+                result.extend \
+                    ( ( ""
+                      , "+ %s"            % (zone, )
+                      , "menu = %s"       % (zone, )
+                      , "title = Zone %s" % (zone, )
+                      , ""
+                      )
+                    )
+            result.append ("@include %s" % (self._path (key, ".conf"), ))
+        return "\n".join (result) + "\n"
+    # end def _main
+
+    def _path (self, key, ext) :
+        return os.path.join (os.path.abspath (self.directory), key + ext)
+    # end def _path
+
+    def _pool_zones (self) :
+        """Map the addresses of the pool networks to the names of their
+           `IP_Pool`.
+        """
+        scope  = self.scope
+        result = {}
+        Links  = scope.CNDB.IP_Network_in_IP_Pool.E_Type
+        for tn in sorted (Links.children_np) :
+            for na, name in scope [tn].query ().attrs \
+                    (Q.left.net_address, Q.right.name) :
+                result [str (na)] = name
+        return result
+    # end def _pool_zones
+
+    def _prometheus (self, zone, node, targets) :
+        ifaces = {}
+        for family, ip, iface, address in targets :
+            ifaces.setdefault (iface, []).append (address)
+        result = list \
+            ( dict
+                ( labels  = dict
+                    (interface = iface, node = node.name, zone = zone)
+                , targets = addresses
+                )
+            for iface, addresses in sorted (pyk.iteritems (ifaces))
+            )
+        return json.dumps (result, indent = 1, sort_keys = True) + "\n"
+    # end def _prometheus
+
+    def _read_state (self) :
+        try :
+            with open (os.path.join (self.directory, self.state_name)) as f :
+                return json.load (f)
+        except (IOError, OSError) :
+            return {}
+    # end def _read_state
+
+    def _remove_group (self, key) :
+        for ext in (".conf", ".json") :
+            try :
+                os.remove (self._path (key, ext))
+            except OSError :
+                pass
+        try :
+            os.rmdir (os.path.dirname (self._path (key, "")))
+        except OSError :
+            pass
+        del self.state ["groups"] [key]
+    # end def _remove_group
+
+    def _smokeping (self, zone, node, targets) :
+        result = \
+            [ "++ %s" % (self._label (node.name), )
+            , "menu = %s"  % (node.name, )
+            , "title = %s" % (node.name, )
+            ]
+        for family, ip, iface, address in targets :
+            result.extend \
+                ( ( ""
+                  , "+++ %s" % (self._label ("%s_%s" % (iface, address)), )
+                  , "menu = %s %s"     % (iface, address)
+                  , "title = %s %s %s" % (node.name, iface, address)
+                  , "host = %s"        % (address, )
+                  )
+                )
+            if family == 6 :
+                result.append ("probe = %s" % (self.probe_6, ))
+        return "\n".join (result) + "\n"
+    # end def _smokeping
+
+    def _write (self, path, text) :
+        dir = os.path.dirname (path)
+        if not os.path.isdir (dir) :
+            os.makedirs (dir)
+        with tempfile.NamedTemporaryFile \
+                ("w", dir = dir, encoding = "utf-8", delete = False) as f :
+            f.write (text)
+        os.chmod   (f.name, self.file_mode)
+        os.replace (f.name, path)
+    # end def _write
+
+    def _write_group (self, key, zone, node, targets) :
+        """Write the files of group `key` if their contents changed;
+           return True if they did.
+        """
+        conf   = self._smokeping  (zone, node, targets)
+        sd     = self._prometheus (zone, node, targets)
+        digest = hashlib.sha256 ((conf + sd).encode ("utf-8")).hexdigest ()
+        groups = self.state ["groups"]
+        old    = groups.get (key, {})
+        if old.get ("hash") == digest and \
+                os.path.exists (self._path (key, ".conf")) :
+            return False
+        self._write (self._path (key, ".conf"), conf)
+        self._write (self._path (key, ".json"), sd)
+        groups [key] = dict (hash = digest, node = node.pid, zone = zone)
+        return True
+    # end def _write_group
+
+    def _write_main (self) :
+        text   = self._main ()
+        digest = hashlib.sha256 (text.encode ("utf-8")).hexdigest ()
+        path   = os.path.join (self.directory, self.main_name)
+        if self.state.get ("main_hash") == digest and os.path.exists (path) :
+            return False
+        self._write (path, text)
+        self.state ["main_hash"] = digest
+        return True
+    # end def _write_main
+
+    def _write_state (self) :
+        path = os.path.join (self.directory, self.state_name)
+        with tempfile.NamedTemporaryFile \
+                ("w", dir = self.directory, delete = False) as f :
+            json.dump (self.state, f, indent = 1, sort_keys = True)
+        os.replace (f.name, path)
+    # end def _write_state
+
+# end class Monitoring_Target_Writer
+
+if __name__ != "__main__" :
+    CNDB.OMP._Export ("*")
+### __END__ CNDB.OMP.Monitoring_Target_Writer
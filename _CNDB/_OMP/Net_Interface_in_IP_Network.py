@@ -28,6 +28,9 @@
 #     7-Apr-2014 (CT) Remove `~ electric` from `valid_mask_len` query
 #    13-Jun-2014 (RS) Add `name`
 #     5-Sep-2014 (CT) Mixin `Belongs_to_Node_Left`, `Belongs_to_Net_Device_Left`
+#    18-Oct-2026 (RS) Use `right.containing_mask_lens` in `valid_mask_len`
+#    18-Oct-2026 (RS) Add `_destroy` and `_main__init__` to update a
+#                     stored `right.is_free`
 #    ««revision-date»»···
 #--
 
@@ -128,12 +131,7 @@ class Net_Interface_in_IP_Network (_Mixin_1, _Mixin_2, _Ancestor_Essence) :
             assertion          = "mask_len in possible_mask_lens"
             attributes         = ("mask_len", "right.net_address")
             bindings           = dict \
-                ( possible_mask_lens =
-                    """sorted """
-                      """( right.ETM.query """
-                            """( (Q.net_address.CONTAINS (right.net_address))"""
-                            """).attr ("net_address.mask_len")"""
-                      """)"""
+                ( possible_mask_lens = "right.containing_mask_lens ()"
                 )
 
         # end class valid_mask_len
@@ -153,6 +151,27 @@ class Net_Interface_in_IP_Network (_Mixin_1, _Mixin_2, _Ancestor_Essence) :
 
     # end class _Predicates
 
+    def _destroy (self) :
+        network = self.right
+        self.__super._destroy ()
+        if (   network is not None
+           and "is_free" in network.stored_flags ()
+           and not network.is_free
+           ) :
+            is_free = not (network.has_children or network.expiration_date)
+            network.set (is_free = is_free)
+    # end def _destroy
+
+    def _main__init__ (self, * args, ** kw) :
+        self.__super._main__init__ (* args, ** kw)
+        network = self.right
+        if (   network is not None
+           and "is_free" in network.stored_flags ()
+           and network.is_free
+           ) :
+            network.set (is_free = False)
+    # end def _main__init__
+
 # end class Net_Interface_in_IP_Network
 
 if __name__ != "__main__" :
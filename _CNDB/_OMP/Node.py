@@ -42,6 +42,7 @@
 #    13-Jun-2014 (RS) Add `ui_name` for `desc`
 #    13-Jun-2014 (RS) `Node` is no longer a `PAP.Subject`
 #     4-Sep-2014 (RS) Change `manager` from `PAP.Person` to `PAP.Subject`
+#    18-Oct-2026 (RS) Add `release_addresses`
 #    ««revision-date»»···
 #--
 
@@ -149,6 +150,20 @@ class Node (_Mixin, _Ancestor_Essence) :
 
     # end class _Attributes
 
+    def release_addresses (self, cool_down_period = None) :
+        """Free all IP networks assigned to the interfaces of this node,
+           return the number of networks freed.
+        """
+        scope    = self.home_scope
+        networks = list \
+            ( link.right
+            for link in scope.CNDB.Net_Interface_in_IP_Network.query
+                (Q.my_node == self)
+            )
+        scope.CNDB.IP_Network.free_many (networks, cool_down_period)
+        return len (networks)
+    # end def release_addresses
+
 # end class Node
 
 if __name__ != "__main__" :
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 Dr. Ralf Schlatterbeck All rights reserved
+# Reichergasse 131, A--3411 Weidling, Austria. rsc@runtux.com
+# #*** <License> ************************************************************#
+# This module is part of the package CNDB.OMP.
+#
+# This module is licensed under the terms of the BSD 3-Clause License
+# <http://www.c-tanzer.at/license/bsd_3c.html>.
+# #*** </License> ***********************************************************#
+#
+#++
+# Name
+#    CNDB.OMP.Query_Prefetch
+#
+# Purpose
+#    Prefetch the values of query attributes, e.g., `my_node`, for many
+#    objects at once
+#
+# Revision Dates
+#    18-Oct-2026 (RS) Creation
+#    ««revision-date»»···
+#--
+
+from   _MOM.import_MOM          import MOM, Q
+from   _CNDB                    import CNDB
+from   _TFL                     import TFL
+
+import _CNDB._OMP
+import _CNDB._OMP.Scope_Cache
+
+class Query_Prefetch (CNDB.OMP.Scope_Cache) :
+    """Values of query attributes of the objects of a scope, prefetched
+       by `prefetch`.
+
+       `prefetch` reads the values of a query attribute for all objects
+       passed with one query per concrete E_Type and `chunk_size` objects,
+       which lets the database resolve the attribute's chain of references,
+       e.g., `Q.interface.my_node` -> `Q.left.my_node` -> `Q.node` for an
+       `Antenna`, with joins. The objects referred to are then loaded with
+       one query per E_Type and chunk, too.
+
+       The query attributes `via_node` can't be resolved by all databases;
+       their values are computed from the prefetched `my_node` of the
+       objects after loading the attributes `node_refs` of these nodes.
+
+       Query attributes with the kind mixin `Prefetched_Mixin` return the
+       prefetched values. The prefetched values are valid until the scope
+       changes, like any `Scope_Cache`: they are dropped by any change
+       of an object, a rollback, or a commit by somebody else.
+    """
+
+    chunk_size   = 500
+    live_updates = False
+    node_refs    = ("manager", "owner")
+    via_node     = ("my_group", "my_person")
+
+    def __init__ (self, scope, key = None) :
+        self.__super.__init__ (scope, key)
+        self.values = {}
+    # end def __init__
+
+    @classmethod
+    def lookup (cls, obj, name) :
+        """Return `(True, value)` if the value of the query attribute
+           `name` of `obj` was prefetched, `(False, None)` otherwise.
+        """
+        cache = cls.valid_for (obj.home_scope)
+        if cache is not None :
+            values = cache.values.get (name)
+            if values is not None and obj.pid in values :
+                return True, values [obj.pid]
+        return False, None
+    # end def lookup
+
+    @classmethod
+    def prefetch (cls, objects, * names) :
+        """Prefetch the values of the query attributes `names` for
+           `objects`, e.g., the result of a query; return the list of
+           `objects`.
+
+           Objects without an attribute in `names` are ignored for that
+           attribute.
+        """
+        result = list (objects)
+        if result :
+            cache = cls.for_scope (result [0].home_scope, None)
+            for name in names :
+                cache._prefetch (result, name)
+        return result
+    # end def prefetch
+
+    @classmethod
+    def valid_for (cls, scope) :
+        """Return the prefetched values of `scope` if they are still valid,
+           None otherwise.
+        """
+        result = cls.cached (scope, None)
+        if result is not None and result.is_valid :
+            return result
+    # end def valid_for
+
+    def _build (self) :
+        self.values = {}
+    # end def _build
+
+    def _chunks (self, pids) :
+        pids = sorted (pids)
+        size = self.chunk_size
+        for i in range (0, len (pids), size) :
+            yield pids [i : i + size]
+    # end def _chunks
+
+    def _entities (self, P_Type, pids) :
+        """Load the objects of `P_Type` with `pids`, a collection of pids or
+           a query returning them; return a dictionary mapping pid to
+           object.
+        """
+        scope  = self.scope
+        ### the partial E_Types can't be queried on all backends, query
+        ### each concrete E_Type
+        tns    = sorted (P_Type.children_np) if P_Type.is_partial \
+            else [P_Type.type_name]
+        chunks = list (self._chunks (pids)) \
+            if isinstance (pids, (set, list, tuple)) else [pids]
+        result = {}
+        for tn in tns :
+            for chunk in chunks :
+                for e in scope [tn].query (Q.pid.IN (chunk)) :
+                    result [e.pid] = e
+        return result
+    # end def _entities
+
+    def _prefetch (self, objects, name) :
+        values = self.values.setdefault (name, {})
+        todo   = list \
+            ( o for o in objects
+            if o.pid not in values and name in o.attributes
+            )
+        if not todo :
+            return
+        if name in self.via_node :
+            self._prefetch_via_node (todo, name, values)
+            return
+        scope  = self.scope
+        by_tn  = {}
+        for o in todo :
+            by_tn.setdefault (o.type_name, []).append (o.pid)
+        for tn, o_pids in sorted (by_tn.items ()) :
+            ETM    = scope [tn]
+            P_Type = ETM.E_Type.attributes [name].P_Type
+            for chunk in self._chunks (o_pids) :
+                query    = ETM.query (Q.pid.IN (chunk))
+                entities = {}
+                if P_Type is not None :
+                    ### some backends load the objects referred to one by
+                    ### one while iterating over `attrs`; load them first
+                    ### with a subquery
+                    entities = self._entities \
+                        (P_Type, query.attrs (getattr (Q, name).pid))
+                for pid, value in query.attrs (Q.pid, getattr (Q, name)) :
+                    if isinstance (value, TFL.Undef) :
+                        value = None
+                    elif isinstance (value, int) :
+                        ### some backends return the pid, not the object
+                        value = entities.get (value)
+                    values [pid] = value
+        for o in todo :
+            values.setdefault (o.pid, None)
+    # end def _prefetch
+
+    def _prefetch_via_node (self, todo, name, values) :
+        self._prefetch (todo, "my_node")
+        my_node = self.values ["my_node"]
+        nodes   = dict \
+            ( (n.pid, n) for n in
+                (my_node.get (o.pid) for o in todo)
+            if n is not None
+            )
+        if nodes :
+            Node = self.scope.CNDB.Node.E_Type
+            for ref in self.node_refs :
+                kind = Node.attributes [ref]
+                ### the cooked value is the pid of a reference not yet
+                ### loaded (don't use `getattr (n, ref)`, which loads it)
+                pids = set \
+                    ( v for v in
+                        (getattr (n, kind.attr.ckd_name, None)
+                        for n in nodes.values ()
+                        )
+                    if isinstance (v, int)
+                    )
+                if pids :
+                    self._entities (kind.attr.P_Type, pids)
+        for o in todo :
+            node = my_node.get (o.pid)
+            values [o.pid] = getattr (node, name) if node is not None \
+                else None
+    # end def _prefetch_via_node
+
+# end class Query_Prefetch
+
+class Prefetched_Mixin (MOM.Attr.Kind) :
+    """Kind mixin for query attributes returning the values prefetched by
+       `Query_Prefetch`, if any.
+    """
+
+    def _get_computed (self, obj) :
+        if obj is not None :
+            found, value = Query_Prefetch.lookup (obj, self.name)
+            if found :
+                return value
+        return self.__super._get_computed (obj)
+    # end def _get_computed
+
+# end class Prefetched_Mixin
+
+if __name__ != "__main__" :
+    CNDB.OMP._Export ("*")
+### __END__ CNDB.OMP.Query_Prefetch
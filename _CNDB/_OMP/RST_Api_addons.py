@@ -13,10 +13,14 @@
 #    CNDB.OMP.RST_Api_addons
 #
 # Purpose
-#    Define RESTful resource for CNDB-Net_Interface and its descendents
+#    Define RESTful resource for CNDB-Net_Interface and its descendents,
+#    and for the change feed
 #
 # Revision Dates
 #    20-May-2013 (CT) Creation
+#    18-Oct-2026 (RS) Document `RBL_NI_6.mask_len`
+#    18-Oct-2026 (RS) Add `RST_Change_Feed` for superusers and renderer
+#                     `RST_JSONL`
 #    ««revision-date»»···
 #--
 
@@ -27,6 +31,11 @@ from   _MOM                     import MOM
 from   _TFL                     import TFL
 
 import _CNDB._OMP.import_CNDB
+import _CNDB._OMP.Change_Feed
+
+import _GTW._RST.Mime_Type
+import _GTW._RST.Permission
+import _GTW._RST.Resource
 
 import _GTW._RST._MOM.Role_Bound_Links
 
@@ -46,7 +55,6 @@ class RBL_NI (_Ancestor) :
         _real_name                 = "POST"
 
         def _apply_attrs (self, resource, request, response, attrs) :
-            obj   = resource.obj
             rr    = resource.E_Type.right
             scope = resource.scope
             user  = resource.top.user
@@ -76,7 +84,8 @@ class RBL_NI_4 (RBL_NI) :
 class RBL_NI_6 (RBL_NI) :
     """RBL_NI for IP6_Network"""
 
-    mask_len = 64 ### XXX ???
+    ### each interface gets a /64, the smallest prefix delegated
+    mask_len = 64
 
 # end class RBL_NI_6
 
@@ -85,6 +94,74 @@ CNDB.OMP.Net_Interface.GTW.rst_mom_rbl_spec = dict \
     , ip6_network_links = RBL_NI_6
     )
 
+class RST_JSONL (GTW.RST.Mime_Type._Base_) :
+    """Renderer for JSON lines: one compact JSON object per line for each
+       element of `body ["entries"]`.
+    """
+
+    _real_name                 = "JSONL"
+    force_charset              = "utf-8"
+    mime_types                 = ("application/x-ndjson", )
+
+    def rendered (self, request, response, body) :
+        json_line = CNDB.OMP.Change_Feed.json_line
+        return "".join \
+            (json_line (e) + "\n" for e in body.get ("entries", ()))
+    # end def rendered
+
+# end class RST_JSONL
+
+_Ancestor = GTW.RST.Leaf
+
+class RST_Change_Feed (_Ancestor) :
+    """RESTful resource for the changes after the change id given by the
+       query argument `after`, see `CNDB.OMP.Change_Feed`.
+
+       The query argument `limit` restricts the number of entries returned
+       (a bulk change has one entry per entity, its entries are never
+       split), `wait` makes the request wait up to that many seconds (at
+       most `max_wait`) for changes if there are none (long-polling).
+       Continue with the `last_cid` of the result as `after`.
+
+       The feed lists changes of all types, including accounts and persons,
+       without regard to `query_filters_restricted`: it is for superusers
+       only. `CNDB.Command.create_rst` mounts it as `changes` beside the
+       `GTW.RST.MOM.Scope` of the RESTful api.
+    """
+
+    max_wait                   = 60
+    skip_etag                  = True
+    _auth_required             = True
+    _r_permission              = GTW.RST.Is_Superuser
+
+    class RST_Change_Feed_GET (_Ancestor.GET) :
+
+        _real_name             = "GET"
+        _renderers             = (GTW.RST.Mime_Type.JSON, RST_JSONL)
+
+        def _response_body (self, resource, request, response) :
+            req_data = request.req_data
+            try :
+                after, limit, wait = \
+                    ( int   (req_data.get ("after", 0) or 0)
+                    , int   (req_data.get ("limit", 0) or 0)
+                    , float (req_data.get ("wait",  0) or 0)
+                    )
+            except ValueError as exc :
+                raise resource.Status.Bad_Request (str (exc))
+            feed    = CNDB.OMP.Change_Feed (resource.top.scope)
+            entries = feed.wait \
+                (after, min (wait, resource.max_wait), limit or None)
+            return dict \
+                ( entries  = entries
+                , last_cid = entries [-1] ["cid"] if entries else after
+                )
+        # end def _response_body
+
+    GET = RST_Change_Feed_GET # end class
+
+# end class RST_Change_Feed
+
 if __name__ != "__main__" :
     CNDB.OMP._Export ("*")
 ### __END__ CNDB.OMP.RST_Api_addons
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 Dr. Ralf Schlatterbeck All rights reserved
+# Reichergasse 131, A--3411 Weidling, Austria. rsc@runtux.com
+# #*** <License> ************************************************************#
+# This module is part of the package CNDB.OMP.
+#
+# This module is licensed under the terms of the BSD 3-Clause License
+# <http://www.c-tanzer.at/license/bsd_3c.html>.
+# #*** </License> ***********************************************************#
+#
+#++
+# Name
+#    CNDB.OMP.SAW
+#
+# Purpose
+#    SAW specific index declarations for CNDB.OMP
+#
+# Revision Dates
+#    18-Oct-2026 (RS) Creation
+#    ««revision-date»»···
+#--
+
+from   _CNDB                      import CNDB
+import _CNDB._OMP
+
+from   _MOM._DBW._SAW             import SA
+
+### Order of the accidental columns of a CIDR attribute in a range index:
+### the leading columns are the ones `CONTAINS` and `IN` restrict by range
+_range_postfixes = \
+    ( "numeric__hi", "numeric__lo", "numeric"
+    , "upper_bound__hi", "upper_bound__lo", "upper_bound"
+    , "mask_len"
+    )
+
+def range_index (table, col, dialect_name) :
+    """Return a new index on the CIDR column `col` of `table` supporting
+       `CONTAINS` and `IN`, None if `dialect_name` needs none.
+
+       PostgreSQL stores CIDR attributes in a single `cidr` column and
+       compiles `CONTAINS` and `IN` to `>>=` and `<<=`: these are
+       supported by a GiST index with operator class `inet_ops`. Other
+       databases compare the accidental columns with the numeric address,
+       upper bound, and mask length of the network: these are supported
+       by a composite B-tree index.
+    """
+    name = "__".join ((table.name, col.name, "range"))
+    akw  = col.MOM_Wrapper
+    acs  = getattr (akw, "_accidental_columns", None)
+    if acs :
+        columns = sorted \
+            (acs, key = lambda c : _range_postfixes.index (c._saw_postfix))
+        return SA.schema.Index (name, * columns)
+    elif dialect_name == "postgresql" :
+        return SA.schema.Index \
+            ( name, col
+            , postgresql_using = "gist"
+            , postgresql_ops   = {col.name : "inet_ops"}
+            )
+# end def range_index
+
+def range_indices (table) :
+    """Return the range indices of `table` already declared."""
+    return [i for i in table.indexes if i.name.endswith ("__range")]
+# end def range_indices
+
+def _range_columns (table) :
+    for col in table.columns :
+        akw = getattr (col, "MOM_Wrapper", None)
+        if akw is not None and not getattr (col, "MOM_Is_Raw", False) :
+            e_type = akw.ETW.e_type
+            if akw.attr.name in getattr (e_type, "use_range_indices", ()) :
+                yield col
+# end def _range_columns
+
+@SA.event.listens_for (SA.schema.Table, "before_create")
+def _add_range_indices (table, connection, ** kw) :
+    """Declare the range indices of the `use_range_indices` of the E_Type
+       of `table` right before the table is created.
+
+       The indices depend on the database: the columns of the tables
+       differ and PostgreSQL needs an index method other than B-tree.
+    """
+    names = set (i.name for i in table.indexes)
+    for col in tuple (_range_columns (table)) :
+        if "__".join ((table.name, col.name, "range")) not in names :
+            range_index (table, col, connection.dialect.name)
+# end def _add_range_indices
+
+if __name__ != "__main__" :
+    CNDB.OMP._Export_Module ()
+### __END__ CNDB.OMP.SAW
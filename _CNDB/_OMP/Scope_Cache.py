@@ -0,0 +1,346 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 Dr. Ralf Schlatterbeck All rights reserved
+# Reichergasse 131, A--3411 Weidling, Austria. rsc@runtux.com
+# #*** <License> ************************************************************#
+# This module is part of the package CNDB.OMP.
+#
+# This module is licensed under the terms of the BSD 3-Clause License
+# <http://www.c-tanzer.at/license/bsd_3c.html>.
+# #*** </License> ***********************************************************#
+#
+#++
+# Name
+#    CNDB.OMP.Scope_Cache
+#
+# Purpose
+#    Base class for in-memory caches kept per scope
+#
+# Revision Dates
+#    18-Oct-2026 (RS) Creation
+#    18-Oct-2026 (RS) Remove invalidated cache from `live`
+#    18-Oct-2026 (RS) Add `at_end`
+#    18-Oct-2026 (RS) Add `changed_elsewhere`
+#    18-Oct-2026 (RS) Add `_catch_up`, `_changes_since`,
+#                     `catch_up_committed`
+#    18-Oct-2026 (RS) Add `live_updates`
+#    ««revision-date»»···
+#--
+
+from   _MOM.import_MOM          import Q
+from   _CNDB                    import CNDB
+from   _TFL                     import TFL
+
+import _CNDB._OMP
+
+import _TFL._Meta.Object
+import _TFL.Decorator
+
+import weakref
+
+def _n_cids (change) :
+    """Return the number of change ids used by `change` and its children."""
+    return (change.cid is not None) + sum (_n_cids (c) for c in change.children)
+# end def _n_cids
+
+class _Scope_State_ (TFL.Meta.Object) :
+    """Caches and operation state of a single scope."""
+
+    def __init__ (self) :
+        self.at_end  = {}
+        self.caches  = {}
+        self.changes = None
+        self.depth   = 0
+        self.live    = None
+        self.stamp   = None
+    # end def __init__
+
+# end class _Scope_State_
+
+class Scope_Cache (TFL.Meta.Object) :
+    """Base class for in-memory caches derived from the objects of a scope.
+
+       A cache is valid as long as the scope didn't change since the cache
+       was built or last synchronized. The state of a scope is identified by
+       its `max_cid` and its pending `uncommitted_changes` (the latter
+       detects rollbacks which don't reset `max_cid`).
+
+       Methods changing objects of the scope can keep caches up-to-date by
+       running inside `operation` and updating all caches returned by
+       `live`. At the end of the outermost `operation`, the live caches are
+       marked as valid for the new state of the scope; if the operation
+       raises an exception, they are invalidated.
+
+       Work to be done once per operation, e.g., updating summary
+       attributes of objects changed several times, can be deferred to
+       the end of the outermost `operation` by `at_end`.
+
+       If somebody else changes the database during an `operation`, the
+       live caches are invalidated at its end; `changed_elsewhere` allows
+       to detect that earlier.
+
+       A cache depending only on some types can redefine `_catch_up` to
+       stay valid across changes of other objects made by this scope
+       outside of an `operation`, or to apply such changes incrementally.
+       With `catch_up_committed`, `_catch_up` also gets the changes
+       committed since, e.g., by another process, read from the database.
+
+       A cache that isn't kept up-to-date by operations sets
+       `live_updates` to False: it is never live, any change of the scope
+       invalidates it.
+    """
+
+    catch_up_committed = False
+    live_updates       = True
+
+    _scope_map = weakref.WeakKeyDictionary ()
+
+    def __init__ (self, scope, key) :
+        self.scope  = scope
+        self.key    = key
+        self._stamp = None
+    # end def __init__
+
+    @classmethod
+    def at_end (cls, scope, key, factory) :
+        """Return the callback registered for `key` to be called at the
+           end of the running outermost `operation`, register the result
+           of `factory ()` if there is none yet.
+
+           Returns None if no `operation` is running.
+        """
+        state = cls._scope_map.get (scope)
+        if state is not None and state.depth :
+            result = state.at_end.get (key)
+            if result is None :
+                result = state.at_end [key] = factory ()
+            return result
+    # end def at_end
+
+    @classmethod
+    def cached (cls, scope, key) :
+        """Return cache for `key` without building or validating it."""
+        state = cls._scope_map.get (scope)
+        if state is not None :
+            return state.caches.get ((cls, key))
+    # end def cached
+
+    @classmethod
+    def changed_elsewhere (cls, scope) :
+        """True if somebody else changed the database since the start of
+           the running outermost `operation`.
+        """
+        state = cls._scope_map.get (scope)
+        if state is not None and state.depth :
+            n_stamp = cls._scope_stamp (scope)
+            return \
+                ( n_stamp [0] - state.stamp [0]
+                > scope.changes - state.changes
+                )
+        return False
+    # end def changed_elsewhere
+
+    @classmethod
+    def for_scope (cls, scope, key) :
+        """Return valid cache for `key`, (re)build it if necessary."""
+        state  = cls._scope_state (scope)
+        result = state.caches.get ((cls, key))
+        if result is None :
+            result = state.caches [(cls, key)] = cls (scope, key)
+        if not result.is_valid :
+            result.rebuild ()
+        return result
+    # end def for_scope
+
+    @classmethod
+    def invalidate_all (cls, scope) :
+        state = cls._scope_map.get (scope)
+        if state is not None :
+            for c in state.caches.values () :
+                c.invalidate ()
+    # end def invalidate_all
+
+    @property
+    def is_live (self) :
+        state = self._scope_map.get (self.scope)
+        return \
+            (   state is not None
+            and state.live is not None
+            and state.caches.get ((self.__class__, self.key)) is self
+            and self in state.live
+            )
+    # end def is_live
+
+    @property
+    def is_valid (self) :
+        if self.is_live :
+            return True
+        stamp = self._scope_stamp (self.scope)
+        if self._stamp_matches (stamp) :
+            return True
+        changes = self._changes_since (stamp)
+        if changes is not None and self._catch_up (changes) :
+            self._stamp = stamp
+            return True
+        return False
+    # end def is_valid
+
+    @classmethod
+    def live (cls, scope, key) :
+        """Return cache for `key` if it is kept up-to-date by the running
+           `operation`, None otherwise.
+        """
+        state = cls._scope_map.get (scope)
+        if state is not None and state.live is not None :
+            result = state.caches.get ((cls, key))
+            if result is not None and result in state.live :
+                return result
+    # end def live
+
+    @classmethod
+    @TFL.Contextmanager
+    def operation (cls, scope) :
+        """Context manager for an operation keeping caches up-to-date."""
+        state = cls._scope_state (scope)
+        if state.depth :
+            state.depth += 1
+            try :
+                yield state
+            finally :
+                state.depth -= 1
+            return
+        state.stamp   = stamp = cls._scope_stamp (scope)
+        state.changes = scope.changes
+        state.live    = set \
+            (   c for c in state.caches.values ()
+            if  c.live_updates and c._stamp_matches (stamp)
+            )
+        state.depth   = 1
+        try :
+            yield state
+            while state.at_end :
+                key = next (iter (state.at_end))
+                state.at_end.pop (key) ()
+        except :
+            for c in list (state.live) :
+                c.invalidate ()
+            raise
+        else :
+            if cls.changed_elsewhere (scope) :
+                for c in list (state.live) :
+                    c.invalidate ()
+            else :
+                n_stamp = cls._scope_stamp (scope)
+                for c in state.live :
+                    c._stamp = n_stamp
+        finally :
+            state.at_end  = {}
+            state.changes = None
+            state.depth   = 0
+            state.live    = None
+            state.stamp   = None
+    # end def operation
+
+    def invalidate (self) :
+        """Invalidate cache, it won't be live for the running `operation`."""
+        self._stamp = None
+        state = self._scope_map.get (self.scope)
+        if state is not None and state.live :
+            state.live.discard (self)
+    # end def invalidate
+
+    def rebuild (self) :
+        self._build ()
+        state = self._scope_map.get (self.scope)
+        if state is not None and state.live is not None and self.live_updates :
+            state.live.add (self)
+        self._stamp = self._scope_stamp (self.scope)
+    # end def rebuild
+
+    def _stamp_matches (self, stamp) :
+        mine = self._stamp
+        return \
+            (   mine is not None
+            and mine [0] == stamp [0]
+            and mine [1] is stamp [1]
+            )
+    # end def _stamp_matches
+
+    def _build (self) :
+        raise NotImplementedError \
+            ("%s must redefine `_build`" % (self.__class__.__name__, ))
+    # end def _build
+
+    def _catch_up (self, changes) :
+        """Apply `changes` of the scope made since the cache was last
+           valid; return False if the cache must be rebuilt instead.
+        """
+        return False
+    # end def _catch_up
+
+    def _changes_since (self, stamp) :
+        """Return the changes of the scope made since the cache was last
+           valid, None if these aren't known.
+
+           The uncommitted changes of the running transaction are used if
+           they account for all new change ids. Otherwise, e.g., after a
+           commit by somebody else, the changes are read from the database
+           if `catch_up_committed` is set, unless the cache contains
+           changes rolled back since.
+        """
+        mine = self._stamp
+        if mine is None :
+            return None
+        if mine [1] is stamp [1] :
+            result = []
+            n      = 0
+            for c in reversed (stamp [1].changes) :
+                if c.cid is None or c.cid <= mine [0] :
+                    break
+                result.append (c)
+                n += _n_cids (c)
+            if n == stamp [0] - mine [0] :
+                result.reverse ()
+                return result
+        elif mine [1] :
+            ### the changes of a rolled back transaction may be in the cache
+            return None
+        if self.catch_up_committed and stamp [0] >= mine [0] :
+            ### children are linked to their parent, `_catch_up` gets them
+            ### from there
+            return list \
+                (  c for c in self.scope.query_changes
+                       (Q.cid > mine [0]).order_by (Q.cid)
+                if c.parent is None
+                )
+    # end def _changes_since
+
+    @classmethod
+    def _after_commit (cls, scope, ucc) :
+        state = cls._scope_map.get (scope)
+        if state is not None :
+            n_ucc = scope.uncommitted_changes
+            for c in state.caches.values () :
+                stamp = c._stamp
+                if stamp is not None and stamp [1] is ucc :
+                    c._stamp = (stamp [0], n_ucc)
+    # end def _after_commit
+
+    @classmethod
+    def _scope_stamp (cls, scope) :
+        return (scope.max_cid, scope.uncommitted_changes)
+    # end def _scope_stamp
+
+    @classmethod
+    def _scope_state (cls, scope) :
+        result = cls._scope_map.get (scope)
+        if result is None :
+            result = cls._scope_map [scope] = _Scope_State_ ()
+            scope.add_after_commit_callback (cls._after_commit)
+        return result
+    # end def _scope_state
+
+# end class Scope_Cache
+
+if __name__ != "__main__" :
+    CNDB.OMP._Export ("*")
+### __END__ CNDB.OMP.Scope_Cache
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 Dr. Ralf Schlatterbeck All rights reserved
+# Reichergasse 131, A--3411 Weidling, Austria. rsc@runtux.com
+# #*** <License> ************************************************************#
+# This module is part of the package CNDB.OMP.
+#
+# This module is licensed under the terms of the BSD 3-Clause License
+# <http://www.c-tanzer.at/license/bsd_3c.html>.
+# #*** </License> ***********************************************************#
+#
+#++
+# Name
+#    CNDB.OMP.Stored_Left_Refs
+#
+# Purpose
+#    Store `my_node` and `my_net_device` of the links deriving from
+#    `Belongs_to_Node_Left` and `Belongs_to_Net_Device_Left` in indexed
+#    columns instead of computing them by queries
+#
+#    This module must be imported before the app-type is created. Queries
+#    restricting these attributes, e.g., the permission filter
+#    `Q.my_person == person`, then need an index lookup instead of joins
+#    through interfaces and devices. `Belongs_to_Node_Left` keeps the
+#    stored values equal to the ones of `left` when a link is created or
+#    its `left` changes; databases migrated from an app-type without
+#    these columns need a call of `update_all` to fill them in.
+#
+# Revision Dates
+#    18-Oct-2026 (RS) Creation
+#    ««revision-date»»···
+#--
+
+from   _MOM.import_MOM          import *
+from   _CNDB                    import CNDB
+import _CNDB._OMP
+import _CNDB._OMP.Belongs_to_Net_Device
+import _CNDB._OMP.Belongs_to_Node
+
+from   _TFL.Decorator           import eval_function_body
+
+class my_net_device (A_Id_Entity) :
+    """Net_Device this %(ui_type_name)s belongs to."""
+
+    kind                = Attr.Internal
+    P_Type              = "CNDB.Net_Device"
+    use_index           = True
+
+# end class my_net_device
+
+class my_node (A_Id_Entity) :
+    """Node this %(ui_type_name)s belongs to."""
+
+    kind                = Attr.Internal
+    P_Type              = "CNDB.Node"
+    use_index           = True
+
+# end class my_node
+
+def update_all (scope) :
+    """Update the stored `left_refs` of all links of `scope`; return the
+       number of changes.
+    """
+    result = 0
+    ETs    = scope.CNDB.Belongs_to_Node_Left.E_Type.children_np
+    ### `left` of the links refer to the ones with smaller `g_rank`, e.g.,
+    ### `Net_Interface_in_IP_Network.left` to a `Net_Interface`
+    for ET in sorted (ETs.values (), key = lambda ET : ET.g_rank) :
+        if ET.stored_left_refs () :
+            for link in scope [ET.type_name].query () :
+                result += link.update_left_refs ()
+    return result
+# end def update_all
+
+@eval_function_body
+def _inject_stored_left_refs () :
+    for Mixin, attr in \
+            ( (CNDB.OMP.Belongs_to_Net_Device_Left, my_net_device)
+            , (CNDB.OMP.Belongs_to_Node_Left,       my_node)
+            ) :
+        for Essence in tuple (Mixin._S_Extension) :
+            if issubclass (Essence, Mixin) :
+                ### each essential type needs its own attribute type:
+                ### `M_Prop_Spec` records the defining E_Type in it
+                Essence.add_attribute \
+                    ( attr.__class__
+                        ( attr.__name__, (attr, )
+                        , dict (__module__ = Essence.__module__)
+                        )
+                    , override = True
+                    )
+# end def _inject_stored_left_refs
+
+if __name__ != "__main__" :
+    CNDB.OMP._Export_Module ()
+### __END__ CNDB.OMP.Stored_Left_Refs
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 Dr. Ralf Schlatterbeck All rights reserved
+# Reichergasse 131, A--3411 Weidling, Austria. rsc@runtux.com
+# #*** <License> ************************************************************#
+# This module is part of the package CNDB.OMP.
+#
+# This module is licensed under the terms of the BSD 3-Clause License
+# <http://www.c-tanzer.at/license/bsd_3c.html>.
+# #*** </License> ***********************************************************#
+#
+#++
+# Name
+#    CNDB.OMP.Stored_Network_Flags
+#
+# Purpose
+#    Store `has_children` and `is_free` of `IP_Network` in indexed columns
+#    instead of computing them by queries
+#
+#    This module must be imported before the app-type is created. The
+#    queries of allocation and garbage collection restricting these flags
+#    then need an index lookup instead of correlated subqueries over the
+#    subnets and interface links. `IP_Network` and
+#    `Net_Interface_in_IP_Network` keep the stored values up to date;
+#    databases migrated from an app-type without these columns need a
+#    call of `update_all` to fill them in.
+#
+# Revision Dates
+#    18-Oct-2026 (RS) Creation
+#    ««revision-date»»···
+#--
+
+from   _MOM.import_MOM          import *
+from   _CNDB                    import CNDB
+import _CNDB._OMP
+import _CNDB._OMP.IP_Network
+import _CNDB._OMP.IP4_Network
+import _CNDB._OMP.IP6_Network
+
+from   _TFL.Decorator           import eval_function_body
+
+class has_children (A_Boolean) :
+    """Indicates whether this `%(ui_type_name)s` is split into parts."""
+
+    kind                = Attr.Internal
+    default             = False
+    use_index           = True
+
+# end class has_children
+
+class is_free (A_Boolean) :
+    """Indicates whether this `%(ui_type_name)s` can be assigned"""
+
+    kind                = Attr.Internal
+    default             = True
+    use_index           = True
+
+# end class is_free
+
+def update_all (scope) :
+    """Update the stored flags of all networks of `scope`; return the
+       number of networks changed.
+    """
+    return scope.CNDB.IP_Network.E_Type.update_all_flags (scope)
+# end def update_all
+
+@eval_function_body
+def _inject_stored_network_flags () :
+    Network = CNDB.OMP.IP_Network
+    for Essence in tuple (Network._S_Extension) :
+        if issubclass (Essence, Network) :
+            for attr in (has_children, is_free) :
+                ### each essential type needs its own attribute type:
+                ### `M_Prop_Spec` records the defining E_Type in it
+                Essence.add_attribute \
+                    ( attr.__class__
+                        ( attr.__name__, (attr, )
+                        , dict (__module__ = Essence.__module__)
+                        )
+                    , override = True
+                    )
+# end def _inject_stored_network_flags
+
+if __name__ != "__main__" :
+    CNDB.OMP._Export_Module ()
+### __END__ CNDB.OMP.Stored_Network_Flags
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 Dr. Ralf Schlatterbeck All rights reserved
+# Reichergasse 131, A--3411 Weidling, Austria. rsc@runtux.com
+# #*** <License> ************************************************************#
+# This module is part of the package CNDB.OMP.__test__.
+#
+# This module is licensed under the terms of the BSD 3-Clause License
+# <http://www.c-tanzer.at/license/bsd_3c.html>.
+# #*** </License> ***********************************************************#
+#
+#++
+# Name
+#    CNDB.OMP.__test__.DNS_Zones
+#
+# Purpose
+#    Test generation of DNS zone files
+#
+# Revision Dates
+#    18-Oct-2026 (RS) Creation
+#    ««revision-date»»···
+#--
+
+from   _CNDB._OMP.__test__.model      import *
+from   _CNDB._OMP.__test__.fixtures   import create as std_fixtures
+from   datetime                 import date
+
+import _CNDB._OMP.DNS_Zone_Writer
+
+import os
+import shutil
+import tempfile
+
+_test_zones = """
+    >>> scope = Scaffold.scope (%(p1)s, %(n1)s) # doctest:+ELLIPSIS
+    Creating new scope MOMT__...
+
+    >>> CNDB = scope.CNDB
+    >>> std_fixtures (scope)
+    >>> tmp  = tempfile.mkdtemp ()
+    >>> def writer (day = 18) :
+    ...     return CNDB.OMP.DNS_Zone_Writer \\
+    ...         ( scope, tmp, "ff.example", ["ns1.ff.example"]
+    ...         , "hostmaster@ff.example", today = date (2026, 10, day)
+    ...         )
+    >>> def show_zone (name) :
+    ...     with open (os.path.join (tmp, "db." + name)) as f :
+    ...         print (f.read ().strip ())
+
+    >>> for z in writer ().write_all () :
+    ...     print (z)
+    ('ff.example.', 2026101800, True)
+    ('23.168.192.in-addr.arpa.', 2026101800, True)
+    >>> show_zone ("ff.example")
+    $ORIGIN ff.example.
+    $TTL 3600
+    @ IN SOA ns1.ff.example. hostmaster.ff.example. (2026101800 28800 7200 1209600 3600)
+    @ IN NS ns1.ff.example.
+    wr.node2                                 IN A     192.168.23.1
+    wl.node2                                 IN A     192.168.23.2
+    wr.node2                                 IN A     192.168.23.3
+    wl.node2                                 IN A     192.168.23.4
+    >>> show_zone ("23.168.192.in-addr.arpa")
+    $ORIGIN 23.168.192.in-addr.arpa.
+    $TTL 3600
+    @ IN SOA ns1.ff.example. hostmaster.ff.example. (2026101800 28800 7200 1209600 3600)
+    @ IN NS ns1.ff.example.
+    1                                        IN PTR   wr.node2.ff.example.
+    2                                        IN PTR   wl.node2.ff.example.
+    3                                        IN PTR   wr.node2.ff.example.
+    4                                        IN PTR   wl.node2.ff.example.
+
+    Unchanged zones keep their serials
+
+    >>> for z in writer ().write_all () :
+    ...     print (z)
+    ('ff.example.', 2026101800, False)
+    ('23.168.192.in-addr.arpa.', 2026101800, False)
+
+    Adding an IPv6 address and an alias changes the forward zone and adds
+    a reverse zone in `ip6.arpa`
+
+    >>> wr  = CNDB.Wired_Interface.query (name = "wr").one ()
+    >>> net = CNDB.IP6_Network ("2001:db8::/64", raw = True)
+    >>> lnk = CNDB.Net_Interface_in_IP6_Network \\
+    ...     (wr, net.reserve ("2001:db8::1/128"), mask_len = 64)
+    >>> als = CNDB.IP6_DNS_Alias (lnk, "www", raw = True)
+    >>> scope.commit ()
+
+    >>> for z in writer ().write_all () :
+    ...     print (z)
+    ('ff.example.', 2026101801, True)
+    ('23.168.192.in-addr.arpa.', 2026101800, False)
+    ('0.0.0.0.0.0.0.0.8.b.d.0.1.0.0.2.ip6.arpa.', 2026101800, True)
+    >>> show_zone ("0.0.0.0.0.0.0.0.8.b.d.0.1.0.0.2.ip6.arpa")
+    $ORIGIN 0.0.0.0.0.0.0.0.8.b.d.0.1.0.0.2.ip6.arpa.
+    $TTL 3600
+    @ IN SOA ns1.ff.example. hostmaster.ff.example. (2026101800 28800 7200 1209600 3600)
+    @ IN NS ns1.ff.example.
+    1.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0          IN PTR   wr.node2.ff.example.
+
+    On a later day, serials of changed zones restart at that day
+
+    >>> als.destroy ()
+    >>> scope.commit ()
+    >>> for z in writer (day = 20).write_all () :
+    ...     print (z)
+    ('ff.example.', 2026102000, True)
+    ('23.168.192.in-addr.arpa.', 2026101800, False)
+    ('0.0.0.0.0.0.0.0.8.b.d.0.1.0.0.2.ip6.arpa.', 2026101800, False)
+
+    Reverse zones that lost all their records are rewritten with SOA and NS
+    records only
+
+    >>> for l in CNDB.Net_Interface_in_IP_Network.query ().all () :
+    ...     l.destroy ()
+    >>> scope.commit ()
+    >>> for z in writer (day = 20).write_all () :
+    ...     print (z)
+    ('ff.example.', 2026102001, True)
+    ('0.0.0.0.0.0.0.0.8.b.d.0.1.0.0.2.ip6.arpa.', 2026102000, True)
+    ('23.168.192.in-addr.arpa.', 2026102000, True)
+    >>> show_zone ("23.168.192.in-addr.arpa")
+    $ORIGIN 23.168.192.in-addr.arpa.
+    $TTL 3600
+    @ IN SOA ns1.ff.example. hostmaster.ff.example. (2026102000 28800 7200 1209600 3600)
+    @ IN NS ns1.ff.example.
+    >>> for z in writer (day = 20).write_all () :
+    ...     print (z)
+    ('ff.example.', 2026102001, False)
+    ('0.0.0.0.0.0.0.0.8.b.d.0.1.0.0.2.ip6.arpa.', 2026102000, False)
+    ('23.168.192.in-addr.arpa.', 2026102000, False)
+
+    Reverse zones must be split at label boundaries
+
+    >>> CNDB.OMP.DNS_Zone_Writer \\
+    ...     ( scope, tmp, "ff.example", ["ns1.ff.example"], "hostmaster"
+    ...     , reverse_mask_len = {4 : 20}
+    ...     )
+    Traceback (most recent call last):
+      ...
+    ValueError: Reverse zones of IPv4 must be split at multiples of 8 bits, not 20
+
+    >>> shutil.rmtree (tmp)
+
+"""
+
+__test__ = Scaffold.create_test_dict \
+  ( dict
+      ( test_zones = _test_zones
+      )
+  )
+
+### __END__ CNDB.OMP.__test__.DNS_Zones
@@ -55,12 +55,36 @@
 #    12-Mar-2015 (CT) Fix backend dependent tests
 #    19-Mar-2018 (CT) Use `expect_except` (Python-3 compatibility)
 #    19-Mar-2018 (CT) Don't use `raw = True` for cooked `I6N.net_address.P_Type`
+#    18-Oct-2026 (RS) Add `_test_free_index`
+#    18-Oct-2026 (RS) Add `_test_sparse`
+#    18-Oct-2026 (RS) Add `_test_allocate_many`
+#    18-Oct-2026 (RS) Add `_test_gc_incremental`
+#    18-Oct-2026 (RS) Add `_test_cooldown_cache`
+#    18-Oct-2026 (RS) Add `_test_free_many`
+#    18-Oct-2026 (RS) Add `_test_counters`
+#    18-Oct-2026 (RS) Add `_test_pool_eligibility`
+#    18-Oct-2026 (RS) Add `_test_quota`
+#    18-Oct-2026 (RS) Add `_test_strategies`
+#    18-Oct-2026 (RS) Add `_test_commit`, `_test_commit_conflict`
+#    18-Oct-2026 (RS) Add `_test_prefix_index`
+#    18-Oct-2026 (RS) Add `_test_warm_cache`
+#    18-Oct-2026 (RS) Add `_test_gc_bulk`, check bulk change in
+#                     `_test_free_many`
+#    18-Oct-2026 (RS) Add `_test_nibble`
+#    18-Oct-2026 (RS) Add `_test_replay`
+#    18-Oct-2026 (RS) Test `limit` of `Change_Feed.entries` with a bulk
+#                     change in `_test_free_many`
 #    ««revision-date»»···
 #--
 
 from   _CNDB._OMP.__test__.model      import *
-from   datetime                 import datetime
+from   _TFL.portable_repr       import portable_repr
+from   datetime                 import datetime, timedelta
+from   io                       import StringIO
 
+import _CNDB._OMP.Change_Feed
+import _CNDB._OMP.IP_Pool_Eligibility
+import _CNDB._OMP.IP_Simulator
 import _GTW._RST._TOP._MOM.Query_Restriction
 
 from _MOM._Attr.Date_Time_Delta import A_Date_Time_Delta
@@ -847,7 +871,12 @@ _test_alloc_sq = """
     ...   )
     SQL: SELECT
            cndb_ip4_network."desc" AS cndb_ip4_network_desc,
+           cndb_ip4_network.addresses_allocated AS cndb_ip4_network_addresses_allocated,
+           cndb_ip4_network.addresses_cooling AS cndb_ip4_network_addresses_cooling,
+           cndb_ip4_network.addresses_free AS cndb_ip4_network_addresses_free,
+           cndb_ip4_network.alloc_version AS cndb_ip4_network_alloc_version,
            cndb_ip4_network.expiration_date AS cndb_ip4_network_expiration_date,
+           cndb_ip4_network.largest_free AS cndb_ip4_network_largest_free,
            cndb_ip4_network.net_address AS cndb_ip4_network_net_address,
            cndb_ip4_network.net_address__mask_len AS cndb_ip4_network_net_address__mask_len,
            cndb_ip4_network.net_address__numeric AS cndb_ip4_network_net_address__numeric,
@@ -922,9 +951,14 @@ _test_AQ = """
     <last_cid.AQ [Attr.Type.Querier Ckd]>
     <pid.AQ [Attr.Type.Querier Ckd]>
     <type_name.AQ [Attr.Type.Querier String]>
+    <addresses_allocated.AQ [Attr.Type.Querier Ckd]>
+    <addresses_cooling.AQ [Attr.Type.Querier Ckd]>
+    <addresses_free.AQ [Attr.Type.Querier Ckd]>
+    <alloc_version.AQ [Attr.Type.Querier Ckd]>
     <expiration_date.AQ [Attr.Type.Querier Ckd]>
     <has_children.AQ [Attr.Type.Querier Boolean]>
     <is_free.AQ [Attr.Type.Querier Boolean]>
+    <largest_free.AQ [Attr.Type.Querier Ckd]>
     <parent.AQ [Attr.Type.Querier Id_Entity]>
     <ip_pool.AQ [Attr.Type.Querier Rev_Ref]>
     <net_interface.AQ [Attr.Type.Querier Rev_Ref]>
@@ -943,9 +977,14 @@ _test_AQ = """
     <pool.desc.AQ [Attr.Type.Querier String]> -----
     <pool.owner.AQ [Attr.Type.Querier Id_Entity]> PAP.Subject
     <pool.pool.AQ [Attr.Type.Querier Id_Entity]> CNDB.IP4_Network
-    <pool.expiration_date.AQ [Attr.Type.Querier Ckd]> expiration_date__277__type_desc
+    <pool.addresses_allocated.AQ [Attr.Type.Querier Ckd]> -----
+    <pool.addresses_cooling.AQ [Attr.Type.Querier Ckd]> -----
+    <pool.addresses_free.AQ [Attr.Type.Querier Ckd]> -----
+    <pool.alloc_version.AQ [Attr.Type.Querier Ckd]> -----
+    <pool.expiration_date.AQ [Attr.Type.Querier Ckd]> expiration_date__283__type_desc
     <pool.has_children.AQ [Attr.Type.Querier Boolean]> -----
     <pool.is_free.AQ [Attr.Type.Querier Boolean]> -----
+    <pool.largest_free.AQ [Attr.Type.Querier Ckd]> -----
     <pool.parent.AQ [Attr.Type.Querier Id_Entity]> CNDB.IP4_Network
     <creation.AQ [Attr.Type.Querier Rev_Ref]> MOM.MD_Change
     <creation.c_time.AQ [Attr.Type.Querier Ckd]> c_time__126__type_desc
@@ -962,20 +1001,31 @@ _test_AQ = """
     <last_cid.AQ [Attr.Type.Querier Ckd]> -----
     <pid.AQ [Attr.Type.Querier Ckd]> -----
     <type_name.AQ [Attr.Type.Querier String]> -----
-    <expiration_date.AQ [Attr.Type.Querier Ckd]> expiration_date__277__type_desc
+    <addresses_allocated.AQ [Attr.Type.Querier Ckd]> -----
+    <addresses_cooling.AQ [Attr.Type.Querier Ckd]> -----
+    <addresses_free.AQ [Attr.Type.Querier Ckd]> -----
+    <alloc_version.AQ [Attr.Type.Querier Ckd]> -----
+    <expiration_date.AQ [Attr.Type.Querier Ckd]> expiration_date__283__type_desc
     <has_children.AQ [Attr.Type.Querier Boolean]> -----
     <is_free.AQ [Attr.Type.Querier Boolean]> -----
+    <largest_free.AQ [Attr.Type.Querier Ckd]> -----
     <parent.AQ [Attr.Type.Querier Id_Entity]> CNDB.IP4_Network
     <parent.net_address.AQ [Attr.Type.Querier Ckd]> -----
     <parent.desc.AQ [Attr.Type.Querier String]> -----
     <parent.owner.AQ [Attr.Type.Querier Id_Entity]> PAP.Subject
     <parent.pool.AQ [Attr.Type.Querier Id_Entity]> CNDB.IP4_Network
-    <parent.expiration_date.AQ [Attr.Type.Querier Ckd]> expiration_date__277__type_desc
+    <parent.addresses_allocated.AQ [Attr.Type.Querier Ckd]> -----
+    <parent.addresses_cooling.AQ [Attr.Type.Querier Ckd]> -----
+    <parent.addresses_free.AQ [Attr.Type.Querier Ckd]> -----
+    <parent.alloc_version.AQ [Attr.Type.Querier Ckd]> -----
+    <parent.expiration_date.AQ [Attr.Type.Querier Ckd]> expiration_date__283__type_desc
     <parent.has_children.AQ [Attr.Type.Querier Boolean]> -----
     <parent.is_free.AQ [Attr.Type.Querier Boolean]> -----
+    <parent.largest_free.AQ [Attr.Type.Querier Ckd]> -----
     <parent.parent.AQ [Attr.Type.Querier Id_Entity]> CNDB.IP4_Network
     <ip_pool.AQ [Attr.Type.Querier Rev_Ref]> CNDB.IP4_Pool
     <ip_pool.name.AQ [Attr.Type.Querier String]> -----
+    <ip_pool.allocation_strategy.AQ [Attr.Type.Querier Ckd]> -----
     <ip_pool.cool_down_period.AQ [Attr.Type.Querier Ckd]> -----
     <ip_pool.node.AQ [Attr.Type.Querier Id_Entity]> CNDB.Node
     <ip_pool.node.name.AQ [Attr.Type.Querier String]> -----
@@ -994,6 +1044,8 @@ _test_AQ = """
     <ip_pool.node.position.lon.AQ [Attr.Type.Querier Raw]> -----
     <ip_pool.node.position.height.AQ [Attr.Type.Querier Ckd]> -----
     <ip_pool.node.show_in_map.AQ [Attr.Type.Querier Boolean]> -----
+    <ip_pool.warm_blocks.AQ [Attr.Type.Querier Ckd]> -----
+    <ip_pool.warm_mask_len.AQ [Attr.Type.Querier Ckd]> -----
     <ip_pool.netmask_interval.AQ [Attr.Type.Querier Composite]> MOM.Int_Interval_C__IP_Netmask_Interval__IP4_Netmask_Interval
     <ip_pool.netmask_interval.lower.AQ [Attr.Type.Querier Ckd]> -----
     <ip_pool.netmask_interval.upper.AQ [Attr.Type.Querier Ckd]> -----
@@ -1460,9 +1512,14 @@ _test_AQ = """
     'Pool/Description'
     'Pool/Owner'
     'Pool/Pool'
+    'Pool/Addresses allocated'
+    'Pool/Addresses cooling'
+    'Pool/Addresses free'
+    'Pool/Alloc version'
     'Pool/Expiration date'
     'Pool/Has children'
     'Pool/Is free'
+    'Pool/Largest free'
     'Pool/Parent'
     'Creation'
     'Creation/C time'
@@ -1479,20 +1536,31 @@ _test_AQ = """
     'Last cid'
     'Pid'
     'Type name'
+    'Addresses allocated'
+    'Addresses cooling'
+    'Addresses free'
+    'Alloc version'
     'Expiration date'
     'Has children'
     'Is free'
+    'Largest free'
     'Parent'
     'Parent/Net address'
     'Parent/Description'
     'Parent/Owner'
     'Parent/Pool'
+    'Parent/Addresses allocated'
+    'Parent/Addresses cooling'
+    'Parent/Addresses free'
+    'Parent/Alloc version'
     'Parent/Expiration date'
     'Parent/Has children'
     'Parent/Is free'
+    'Parent/Largest free'
     'Parent/Parent'
     'Ip pool'
     'Ip pool/Name'
+    'Ip pool/Allocation strategy'
     'Ip pool/Cool down period'
     'Ip pool/Node'
     'Ip pool/Node/Name'
@@ -1511,6 +1579,8 @@ _test_AQ = """
     'Ip pool/Node/Position/Longitude'
     'Ip pool/Node/Position/Height'
     'Ip pool/Node/Show in map'
+    'Ip pool/Warm blocks'
+    'Ip pool/Warm mask len'
     'Ip pool/Netmask interval'
     'Ip pool/Netmask interval/Lower'
     'Ip pool/Netmask interval/Upper'
@@ -1976,9 +2046,14 @@ _test_AQ = """
     <desc.AQ [Attr.Type.Querier String]>
     <pool.net_address.AQ [Attr.Type.Querier Ckd]>
     <pool.desc.AQ [Attr.Type.Querier String]>
+    <pool.addresses_allocated.AQ [Attr.Type.Querier Ckd]>
+    <pool.addresses_cooling.AQ [Attr.Type.Querier Ckd]>
+    <pool.addresses_free.AQ [Attr.Type.Querier Ckd]>
+    <pool.alloc_version.AQ [Attr.Type.Querier Ckd]>
     <pool.expiration_date.AQ [Attr.Type.Querier Ckd]>
     <pool.has_children.AQ [Attr.Type.Querier Boolean]>
     <pool.is_free.AQ [Attr.Type.Querier Boolean]>
+    <pool.largest_free.AQ [Attr.Type.Querier Ckd]>
     <creation.c_time.AQ [Attr.Type.Querier Ckd]>
     <creation.kind.AQ [Attr.Type.Querier String]>
     <creation.time.AQ [Attr.Type.Querier Ckd]>
@@ -1988,15 +2063,26 @@ _test_AQ = """
     <last_cid.AQ [Attr.Type.Querier Ckd]>
     <pid.AQ [Attr.Type.Querier Ckd]>
     <type_name.AQ [Attr.Type.Querier String]>
+    <addresses_allocated.AQ [Attr.Type.Querier Ckd]>
+    <addresses_cooling.AQ [Attr.Type.Querier Ckd]>
+    <addresses_free.AQ [Attr.Type.Querier Ckd]>
+    <alloc_version.AQ [Attr.Type.Querier Ckd]>
     <expiration_date.AQ [Attr.Type.Querier Ckd]>
     <has_children.AQ [Attr.Type.Querier Boolean]>
     <is_free.AQ [Attr.Type.Querier Boolean]>
+    <largest_free.AQ [Attr.Type.Querier Ckd]>
     <parent.net_address.AQ [Attr.Type.Querier Ckd]>
     <parent.desc.AQ [Attr.Type.Querier String]>
+    <parent.addresses_allocated.AQ [Attr.Type.Querier Ckd]>
+    <parent.addresses_cooling.AQ [Attr.Type.Querier Ckd]>
+    <parent.addresses_free.AQ [Attr.Type.Querier Ckd]>
+    <parent.alloc_version.AQ [Attr.Type.Querier Ckd]>
     <parent.expiration_date.AQ [Attr.Type.Querier Ckd]>
     <parent.has_children.AQ [Attr.Type.Querier Boolean]>
     <parent.is_free.AQ [Attr.Type.Querier Boolean]>
+    <parent.largest_free.AQ [Attr.Type.Querier Ckd]>
     <ip_pool.name.AQ [Attr.Type.Querier String]>
+    <ip_pool.allocation_strategy.AQ [Attr.Type.Querier Ckd]>
     <ip_pool.cool_down_period.AQ [Attr.Type.Querier Ckd]>
     <ip_pool.node.name.AQ [Attr.Type.Querier String]>
     <ip_pool.node.address.street.AQ [Attr.Type.Querier String]>
@@ -2010,6 +2096,8 @@ _test_AQ = """
     <ip_pool.node.position.lon.AQ [Attr.Type.Querier Raw]>
     <ip_pool.node.position.height.AQ [Attr.Type.Querier Ckd]>
     <ip_pool.node.show_in_map.AQ [Attr.Type.Querier Boolean]>
+    <ip_pool.warm_blocks.AQ [Attr.Type.Querier Ckd]>
+    <ip_pool.warm_mask_len.AQ [Attr.Type.Querier Ckd]>
     <ip_pool.netmask_interval.lower.AQ [Attr.Type.Querier Ckd]>
     <ip_pool.netmask_interval.upper.AQ [Attr.Type.Querier Ckd]>
     <ip_pool.netmask_interval.center.AQ [Attr.Type.Querier Ckd]>
@@ -2517,6 +2605,22 @@ _test_AQ = """
                 , 'sig_key' : 2
                 , 'ui_name' : 'Pool'
                 }
+              , { 'name' : 'addresses_allocated'
+                , 'sig_key' : 0
+                , 'ui_name' : 'Addresses allocated'
+                }
+              , { 'name' : 'addresses_cooling'
+                , 'sig_key' : 0
+                , 'ui_name' : 'Addresses cooling'
+                }
+              , { 'name' : 'addresses_free'
+                , 'sig_key' : 0
+                , 'ui_name' : 'Addresses free'
+                }
+              , { 'name' : 'alloc_version'
+                , 'sig_key' : 0
+                , 'ui_name' : 'Alloc version'
+                }
               , { 'name' : 'expiration_date'
                 , 'sig_key' : 0
                 , 'ui_name' : 'Expiration date'
@@ -2529,6 +2633,10 @@ _test_AQ = """
                 , 'sig_key' : 1
                 , 'ui_name' : 'Is free'
                 }
+              , { 'name' : 'largest_free'
+                , 'sig_key' : 0
+                , 'ui_name' : 'Largest free'
+                }
               , { 'Class' : 'Entity'
                 , 'name' : 'parent'
                 , 'sig_key' : 2
@@ -2769,6 +2877,22 @@ _test_AQ = """
           , 'sig_key' : 3
           , 'ui_name' : 'Type name'
           }
+        , { 'name' : 'addresses_allocated'
+          , 'sig_key' : 0
+          , 'ui_name' : 'Addresses allocated'
+          }
+        , { 'name' : 'addresses_cooling'
+          , 'sig_key' : 0
+          , 'ui_name' : 'Addresses cooling'
+          }
+        , { 'name' : 'addresses_free'
+          , 'sig_key' : 0
+          , 'ui_name' : 'Addresses free'
+          }
+        , { 'name' : 'alloc_version'
+          , 'sig_key' : 0
+          , 'ui_name' : 'Alloc version'
+          }
         , { 'name' : 'expiration_date'
           , 'sig_key' : 0
           , 'ui_name' : 'Expiration date'
@@ -2781,6 +2905,10 @@ _test_AQ = """
           , 'sig_key' : 1
           , 'ui_name' : 'Is free'
           }
+        , { 'name' : 'largest_free'
+          , 'sig_key' : 0
+          , 'ui_name' : 'Largest free'
+          }
         , { 'Class' : 'Entity'
           , 'attrs' :
               [ { 'name' : 'net_address'
@@ -2872,6 +3000,22 @@ _test_AQ = """
                 , 'sig_key' : 2
                 , 'ui_name' : 'Pool'
                 }
+              , { 'name' : 'addresses_allocated'
+                , 'sig_key' : 0
+                , 'ui_name' : 'Addresses allocated'
+                }
+              , { 'name' : 'addresses_cooling'
+                , 'sig_key' : 0
+                , 'ui_name' : 'Addresses cooling'
+                }
+              , { 'name' : 'addresses_free'
+                , 'sig_key' : 0
+                , 'ui_name' : 'Addresses free'
+                }
+              , { 'name' : 'alloc_version'
+                , 'sig_key' : 0
+                , 'ui_name' : 'Alloc version'
+                }
               , { 'name' : 'expiration_date'
                 , 'sig_key' : 0
                 , 'ui_name' : 'Expiration date'
@@ -2884,6 +3028,10 @@ _test_AQ = """
                 , 'sig_key' : 1
                 , 'ui_name' : 'Is free'
                 }
+              , { 'name' : 'largest_free'
+                , 'sig_key' : 0
+                , 'ui_name' : 'Largest free'
+                }
               , { 'Class' : 'Entity'
                 , 'name' : 'parent'
                 , 'sig_key' : 2
@@ -2900,6 +3048,10 @@ _test_AQ = """
                 , 'sig_key' : 3
                 , 'ui_name' : 'Name'
                 }
+              , { 'name' : 'allocation_strategy'
+                , 'sig_key' : 0
+                , 'ui_name' : 'Allocation strategy'
+                }
               , { 'name' : 'cool_down_period'
                 , 'sig_key' : 0
                 , 'ui_name' : 'Cool down period'
@@ -3123,6 +3275,14 @@ _test_AQ = """
                 , 'sig_key' : 2
                 , 'ui_name' : 'Node'
                 }
+              , { 'name' : 'warm_blocks'
+                , 'sig_key' : 0
+                , 'ui_name' : 'Warm blocks'
+                }
+              , { 'name' : 'warm_mask_len'
+                , 'sig_key' : 0
+                , 'ui_name' : 'Warm mask len'
+                }
               , { 'attrs' :
                     [ { 'name' : 'lower'
                       , 'sig_key' : 0
@@ -8483,13 +8643,23 @@ _test_AQ = """
     Ip4 networks/Pool/Description
     Ip4 networks/Pool/Owner
     Ip4 networks/Pool/Pool
+    Ip4 networks/Pool/Addresses allocated
+    Ip4 networks/Pool/Addresses cooling
+    Ip4 networks/Pool/Addresses free
+    Ip4 networks/Pool/Alloc version
     Ip4 networks/Pool/Expiration date
     Ip4 networks/Pool/Has children
     Ip4 networks/Pool/Is free
+    Ip4 networks/Pool/Largest free
     Ip4 networks/Pool/Parent
+    Ip4 networks/Addresses allocated
+    Ip4 networks/Addresses cooling
+    Ip4 networks/Addresses free
+    Ip4 networks/Alloc version
     Ip4 networks/Expiration date
     Ip4 networks/Has children
     Ip4 networks/Is free
+    Ip4 networks/Largest free
     Ip4 networks/Parent
     Ip6 networks
     Ip6 networks/Net address
@@ -8500,13 +8670,23 @@ _test_AQ = """
     Ip6 networks/Pool/Description
     Ip6 networks/Pool/Owner
     Ip6 networks/Pool/Pool
+    Ip6 networks/Pool/Addresses allocated
+    Ip6 networks/Pool/Addresses cooling
+    Ip6 networks/Pool/Addresses free
+    Ip6 networks/Pool/Alloc version
     Ip6 networks/Pool/Expiration date
     Ip6 networks/Pool/Has children
     Ip6 networks/Pool/Is free
+    Ip6 networks/Pool/Largest free
     Ip6 networks/Pool/Parent
+    Ip6 networks/Addresses allocated
+    Ip6 networks/Addresses cooling
+    Ip6 networks/Addresses free
+    Ip6 networks/Alloc version
     Ip6 networks/Expiration date
     Ip6 networks/Has children
     Ip6 networks/Is free
+    Ip6 networks/Largest free
     Ip6 networks/Parent
     Documents
     Documents/Url
@@ -8780,6 +8960,1122 @@ _test_std_fixtures = """
 
 """
 
+_test_free_index = """
+    >>> scope = Scaffold.scope (%(p1)s, %(n1)s) # doctest:+ELLIPSIS
+    Creating new scope MOMT__...
+
+    >>> CNDB = scope.CNDB
+    >>> PAP = scope.PAP
+    >>> Index = CNDB.OMP.IP_Free_Index
+    >>> ff  = PAP.Association ("Funkfeuer", short_name = "0xFF", raw = True)
+    >>> rs  = PAP.Person ("Schlatterbeck", "Ralf", raw = True)
+    >>> ct  = PAP.Person ("Tanzer", "Christian", raw = True)
+
+    >>> pool = CNDB.IP4_Network ('10.0.0.0/24', owner = ff, raw = True)
+    >>> show_free_index (pool)
+    10.0.0.0/24        F
+
+    >>> index = Index.for_network (pool)
+    >>> a1 = pool.allocate (28, rs)
+    >>> a2 = pool.allocate (30, ct)
+    >>> Index.for_network (pool) is index
+    True
+    >>> show_free_index (pool)
+    10.0.0.20/30       T
+    10.0.0.24/29       T
+    10.0.0.32/27       T
+    10.0.0.64/26       T
+    10.0.0.128/25      T
+
+    >>> a3 = pool.reserve ('10.0.0.64/26', owner = ff)
+    >>> show_free_index (pool)
+    10.0.0.20/30       T
+    10.0.0.24/29       T
+    10.0.0.32/27       T
+    10.0.0.64/26       F
+    10.0.0.128/25      T
+
+    >>> pool.find_closest_mask (26).net_address
+    10.0.0.128/25
+    >>> pool.find_closest_mask (29).net_address
+    10.0.0.24/29
+
+    >>> a2.free (A_Date_Time_Delta.cooked ("0d"))
+    >>> show_free_index (pool)
+    10.0.0.20/30       T
+    10.0.0.24/29       T
+    10.0.0.32/27       T
+    10.0.0.64/26       F
+    10.0.0.128/25      T
+
+    >>> scope.commit ()
+    >>> Index.for_network (pool) is index
+    True
+
+    >>> pool.collect_garbage ()
+    >>> show_free_index (pool)
+    10.0.0.16/28       T
+    10.0.0.32/27       T
+    10.0.0.64/26       F
+    10.0.0.128/25      T
+
+    >>> a1.free (A_Date_Time_Delta.cooked ("0d"))
+    >>> pool.collect_garbage ()
+    >>> show_free_index (pool)
+    10.0.0.0/26        T
+    10.0.0.64/26       F
+    10.0.0.128/25      T
+
+    >>> scope.rollback ()
+    >>> show_free_index (pool)
+    10.0.0.20/30       T
+    10.0.0.24/29       T
+    10.0.0.32/27       T
+    10.0.0.64/26       F
+    10.0.0.128/25      T
+
+"""
+
+_test_sparse = """
+    >>> scope = Scaffold.scope (%(p1)s, %(n1)s) # doctest:+ELLIPSIS
+    Creating new scope MOMT__...
+
+    >>> CNDB = scope.CNDB
+    >>> PAP = scope.PAP
+    >>> ETM = CNDB.IP4_Network
+    >>> ETM.E_Type.sparse_split = True
+    >>> ff  = PAP.Association ("Funkfeuer", short_name = "0xFF", raw = True)
+    >>> rs  = PAP.Person ("Schlatterbeck", "Ralf", raw = True)
+    >>> ct  = PAP.Person ("Tanzer", "Christian", raw = True)
+
+    >>> pool = CNDB.IP4_Network ('10.0.0.0/16', owner = ff, raw = True)
+    >>> a1 = pool.allocate (32, rs)
+    >>> show_network_count (scope, ETM)
+    CNDB.IP4_Network count: 2
+
+    >>> a2 = pool.allocate (28, ct)
+    >>> a3 = pool.reserve ('10.0.1.0/24', owner = rs)
+    >>> a4 = pool.allocate (31, rs)
+    >>> tree_view (pool)
+    10.0.0.0/16
+     10.0.0.0
+     10.0.0.2/31
+     10.0.0.16/28
+     10.0.1.0/24
+
+    >>> show_free_index (pool)
+    10.0.0.1           T in 10.0.0.0/16
+    10.0.0.4/30        T in 10.0.0.0/16
+    10.0.0.8/29        T in 10.0.0.0/16
+    10.0.0.32/27       T in 10.0.0.0/16
+    10.0.0.64/26       T in 10.0.0.0/16
+    10.0.0.128/25      T in 10.0.0.0/16
+    10.0.2.0/23        T in 10.0.0.0/16
+    10.0.4.0/22        T in 10.0.0.0/16
+    10.0.8.0/21        T in 10.0.0.0/16
+    10.0.16.0/20       T in 10.0.0.0/16
+    10.0.32.0/19       T in 10.0.0.0/16
+    10.0.64.0/18       T in 10.0.0.0/16
+    10.0.128.0/17      T in 10.0.0.0/16
+
+    >>> pool.has_children, pool.is_free, a1.is_free
+    (True, False, True)
+    >>> pool.find_closest_address (a1.net_address)
+    CNDB.IP4_Network ("10.0.0.0")
+    >>> pool.find_closest_address (ETM.net_address.P_Type ("10.0.5.1/32"))
+    CNDB.IP4_Network ("10.0.0.0/16")
+    >>> pool.find_closest_mask (24)
+    CNDB.IP4_Network ("10.0.0.0/16")
+
+    >>> with expect_except (CNDB.OMP.Error.Address_Already_Used) :
+    ...   x = pool.reserve ('10.0.1.0/25', owner = ct)
+    Address_Already_Used: Address 10.0.1.0/25 already in use by 'Schlatterbeck Ralf'
+    >>> with expect_except (CNDB.OMP.Error.Address_Already_Used) :
+    ...   x = pool.reserve ('10.0.0.0/24', owner = ct)
+    Address_Already_Used: Address 10.0.0.0/24 already in use by 'Funkfeuer'
+
+    >>> scope.commit ()
+    >>> a5  = pool.reserve ('10.0.2.0/23', owner = ct)
+    >>> sub = a5.allocate (30, rs)
+    >>> show_free_index (a5)
+    10.0.2.4/30        T in 10.0.2.0/23
+    10.0.2.8/29        T in 10.0.2.0/23
+    10.0.2.16/28       T in 10.0.2.0/23
+    10.0.2.32/27       T in 10.0.2.0/23
+    10.0.2.64/26       T in 10.0.2.0/23
+    10.0.2.128/25      T in 10.0.2.0/23
+    10.0.3.0/24        T in 10.0.2.0/23
+
+    >>> a2.free (A_Date_Time_Delta.cooked ("0d"))
+    >>> a4.free (A_Date_Time_Delta.cooked ("0d"))
+    >>> pool.collect_garbage ()
+    >>> tree_view (pool)
+    10.0.0.0/16
+     10.0.1.0/24
+     10.0.2.0/23
+      10.0.2.0/30
+
+    >>> show_free_index (pool)
+    10.0.0.0/24        T in 10.0.0.0/16
+    10.0.4.0/22        T in 10.0.0.0/16
+    10.0.8.0/21        T in 10.0.0.0/16
+    10.0.16.0/20       T in 10.0.0.0/16
+    10.0.32.0/19       T in 10.0.0.0/16
+    10.0.64.0/18       T in 10.0.0.0/16
+    10.0.128.0/17      T in 10.0.0.0/16
+
+    >>> for n in (a3, sub, a5) :
+    ...     n.free (A_Date_Time_Delta.cooked ("0d"))
+    >>> a5.collect_garbage ()
+    >>> pool.collect_garbage ()
+    >>> tree_view (pool)
+    10.0.0.0/16
+    >>> show_free_index (pool)
+    10.0.0.0/16        F
+    >>> show_network_count (scope, ETM)
+    CNDB.IP4_Network count: 1
+
+    >>> del ETM.E_Type.sparse_split
+
+"""
+
+_test_allocate_many = """
+    >>> scope = Scaffold.scope (%(p1)s, %(n1)s) # doctest:+ELLIPSIS
+    Creating new scope MOMT__...
+
+    >>> CNDB = scope.CNDB
+    >>> PAP = scope.PAP
+    >>> ETM = CNDB.IP4_Network
+    >>> ff  = PAP.Association ("Funkfeuer", short_name = "0xFF", raw = True)
+    >>> rs  = PAP.Person ("Schlatterbeck", "Ralf", raw = True)
+
+    >>> pool = CNDB.IP4_Network ('10.0.0.0/24', owner = ff, raw = True)
+    >>> x    = pool.allocate (30, rs)
+    >>> nws  = pool.allocate_many ([(32, 5), (28, 2)], rs)
+    >>> for n in nws :
+    ...     print (n.net_address, n.FO.owner)
+    10.0.0.4 Schlatterbeck Ralf
+    10.0.0.5 Schlatterbeck Ralf
+    10.0.0.6 Schlatterbeck Ralf
+    10.0.0.7 Schlatterbeck Ralf
+    10.0.0.8 Schlatterbeck Ralf
+    10.0.0.16/28 Schlatterbeck Ralf
+    10.0.0.32/28 Schlatterbeck Ralf
+
+    >>> show_free_index (pool)
+    10.0.0.9           T
+    10.0.0.10/31       T
+    10.0.0.12/30       T
+    10.0.0.48/28       T
+    10.0.0.64/26       T
+    10.0.0.128/25      T
+
+    >>> show_network_count (scope, ETM)
+    CNDB.IP4_Network count: 27
+    >>> with expect_except (CNDB.OMP.Error.No_Free_Address_Range) :
+    ...   x = pool.allocate_many ([(25, 1), (26, 2)], rs)
+    No_Free_Address_Range: Address range [10.0.0.0/24] of this IP4_Network doesn't contain a free subrange for mask length 26
+    >>> show_network_count (scope, ETM)
+    CNDB.IP4_Network count: 27
+
+    >>> sub = pool.allocate (27, ff)
+    >>> [str (n.net_address) for n in sub.allocate_many ([(30, 2)], rs)]
+    ['10.0.0.64/30', '10.0.0.68/30']
+
+    >>> p1 = CNDB.IP4_Pool (name = "p1", raw = True)
+    >>> i1 = CNDB.IP4_Network_in_IP4_Pool (pool, p1)
+    >>> [str (n.net_address) for n in p1.allocate_many ([(29, 2)], rs)]
+    ['10.0.0.48/29', '10.0.0.56/29']
+
+"""
+
+_test_gc_incremental = """
+    >>> scope = Scaffold.scope (%(p1)s, %(n1)s) # doctest:+ELLIPSIS
+    Creating new scope MOMT__...
+
+    >>> CNDB = scope.CNDB
+    >>> PAP = scope.PAP
+    >>> ETM = CNDB.IP4_Network
+    >>> ff  = PAP.Association ("Funkfeuer", short_name = "0xFF", raw = True)
+    >>> rs  = PAP.Person ("Schlatterbeck", "Ralf", raw = True)
+
+    >>> pool = CNDB.IP4_Network ('10.0.0.0/24', owner = ff, raw = True)
+    >>> ipp  = CNDB.IP4_Pool (name = "ff", cool_down_period = '1w', raw = True)
+    >>> _    = CNDB.IP4_Network_in_IP4_Pool (pool, ipp)
+    >>> net  = pool.allocate (28, rs)
+    >>> h1   = net.allocate (32, rs)
+    >>> n1   = net.allocate (29, rs)
+    >>> h2   = pool.allocate (32, rs)
+    >>> for n in (h1, n1, net) :
+    ...     n.free ()
+    >>> now  = datetime.now ()
+    >>> net.set (expiration_date = now)
+    1
+    >>> ipp.set_raw (cool_down_period = '1d')
+    1
+
+    >>> show_expiring (ETM, now)
+    10.0.0.0/28         0
+    10.0.0.0            6
+    10.0.0.8/29         6
+
+    >>> pool.collect_garbage (max_networks = 2)
+    2
+    >>> show_expiring (ETM, now)
+    10.0.0.0/28         0
+    10.0.0.0            6
+    10.0.0.8/29         1
+    10.0.0.16           1
+
+    >>> pool.collect_garbage (max_networks = 2)
+    2
+    >>> show_expiring (ETM, now)
+    10.0.0.0/28         0
+    10.0.0.0            1
+    10.0.0.8/29         0
+    10.0.0.16           1
+
+    >>> pool.collect_garbage (max_networks = 2)
+    1
+    >>> show_expiring (ETM, now)
+    10.0.0.0/28         0
+    10.0.0.0            1
+    10.0.0.16           1
+
+    >>> pool.collect_garbage (max_networks = 2)
+    0
+    >>> pool.collect_garbage (deadline = 0)
+    0
+
+"""
+
+_test_gc_bulk = """
+    >>> scope = Scaffold.scope (%(p1)s, %(n1)s) # doctest:+ELLIPSIS
+    Creating new scope MOMT__...
+
+    >>> CNDB = scope.CNDB
+    >>> PAP = scope.PAP
+    >>> ETM = CNDB.IP4_Network
+    >>> ff  = PAP.Association ("Funkfeuer", short_name = "0xFF", raw = True)
+    >>> rs  = PAP.Person ("Schlatterbeck", "Ralf", raw = True)
+
+    >>> pool = CNDB.IP4_Network ('10.0.0.0/24', owner = ff, raw = True)
+    >>> ipp  = CNDB.IP4_Pool (name = "ff", cool_down_period = '1w', raw = True)
+    >>> _    = CNDB.IP4_Network_in_IP4_Pool (pool, ipp)
+    >>> net  = pool.allocate (28, rs)
+    >>> nets = list (net.allocate (32, rs) for i in range (4))
+    >>> for n in nets :
+    ...     n.free ()
+    >>> scope.commit ()
+    >>> now  = datetime.now ()
+    >>> ipp.set_raw (cool_down_period = '1d')
+    1
+
+    >>> show_expiring (ETM, now)
+    10.0.0.0            6
+    10.0.0.1            6
+    10.0.0.2            6
+    10.0.0.3            6
+
+    Shortening the cool-down period clamps all expiration dates with a
+    single change
+
+    >>> pool.collect_garbage ()
+    >>> show_expiring (ETM, now)
+    10.0.0.0            1
+    10.0.0.1            1
+    10.0.0.2            1
+    10.0.0.3            1
+    >>> [c for c in scope.uncommitted_changes if c.kind == "Modify/Bulk"]
+    [<Modify/Bulk CNDB.IP4_Network 'expiration_date', 4 entities>]
+    >>> scope.commit ()
+
+    >>> pool.collect_garbage ()
+    >>> len (scope.uncommitted_changes)
+    0
+
+"""
+
+_test_cooldown_cache = """
+    >>> scope = Scaffold.scope (%(p1)s, %(n1)s) # doctest:+ELLIPSIS
+    Creating new scope MOMT__...
+
+    >>> CNDB = scope.CNDB
+    >>> PAP = scope.PAP
+    >>> Cache = CNDB.OMP.IP_Cooldown_Cache
+    >>> ff  = PAP.Association ("Funkfeuer", short_name = "0xFF", raw = True)
+    >>> rs  = PAP.Person ("Schlatterbeck", "Ralf", raw = True)
+
+    >>> pool = CNDB.IP4_Network ('10.0.0.0/16', owner = ff, raw = True)
+    >>> p1   = CNDB.IP4_Pool (name = "p1", cool_down_period = '1d', raw = True)
+    >>> l1   = CNDB.IP4_Network_in_IP4_Pool (pool, p1)
+    >>> sub  = pool.allocate (24, ff)
+    >>> p2   = CNDB.IP4_Pool (name = "p2", cool_down_period = '2h', raw = True)
+    >>> l2   = CNDB.IP4_Network_in_IP4_Pool (sub, p2)
+    >>> a1   = sub.allocate (32, rs)
+    >>> a2   = pool.allocate (32, rs)
+
+    >>> print (a1.min_cooldown_period (), a2.min_cooldown_period ())
+    2:00:00 1 day, 0:00:00
+    >>> cache = Cache.for_network (a1)
+    >>> print (cache.cooldown (a1.net_address), cache.own (sub.net_address))
+    2:00:00 2:00:00
+
+    >>> with CNDB.OMP.Scope_Cache.operation (scope) :
+    ...     l2.destroy ()
+    ...     cache.is_valid
+    False
+    >>> print (a1.min_cooldown_period ())
+    1 day, 0:00:00
+
+    >>> p1.set_raw (cool_down_period = '1h')
+    1
+    >>> print (a1.min_cooldown_period (), a2.min_cooldown_period ())
+    1:00:00 1:00:00
+    >>> print (a1.min_cooldown_period (A_Date_Time_Delta.cooked ("10m")))
+    0:10:00
+
+"""
+
+_test_free_many = """
+    >>> scope = Scaffold.scope (%(p1)s, %(n1)s) # doctest:+ELLIPSIS
+    Creating new scope MOMT__...
+
+    >>> CNDB = scope.CNDB
+    >>> PAP = scope.PAP
+    >>> ETM = CNDB.IP4_Network
+    >>> ff  = PAP.Association ("Funkfeuer", short_name = "0xFF", raw = True)
+    >>> rs  = PAP.Person ("Schlatterbeck", "Ralf", raw = True)
+
+    >>> pool = CNDB.IP4_Network ('10.0.0.0/24', owner = ff, raw = True)
+    >>> node = CNDB.Node (name = "n1", manager = rs, raw = True)
+    >>> dt   = CNDB.Net_Device_Type.instance_or_new (name = 'Generic', raw = True)
+    >>> dev  = CNDB.Net_Device (left = dt, node = node, name = 'dev', raw = True)
+    >>> wr   = CNDB.Wired_Interface (left = dev, name = 'wr', raw = True)
+    >>> wl   = CNDB.Wireless_Interface (left = dev, name = 'wl', raw = True)
+    >>> a1   = pool.allocate (32, rs)
+    >>> a2   = pool.allocate (32, rs)
+    >>> a3   = pool.allocate (30, rs)
+    >>> net  = pool.allocate (28, rs)
+    >>> a4   = net.allocate (32, rs)
+    >>> _    = CNDB.Net_Interface_in_IP4_Network (wr, a1, mask_len = 24)
+    >>> _    = CNDB.Net_Interface_in_IP4_Network (wl, a2, mask_len = 24)
+    >>> _    = CNDB.Net_Interface_in_IP4_Network (wl, a3, mask_len = 30)
+
+    >>> with expect_except (CNDB.OMP.Error.Cannot_Free_Network) :
+    ...     CNDB.IP_Network.free_many ([a3, net])
+    Cannot_Free_Network: Cannot free network with allocations: 10.0.0.16/28
+    >>> print (a3.FO.owner, a3.expiration_date)
+    Schlatterbeck Ralf None
+
+    The pool is claimed once and all expiration dates are set by a single
+    bulk change
+
+    >>> version = pool.alloc_version
+    >>> scope.commit ()
+    >>> CNDB.IP_Network.free_many ([a3, a4, net], A_Date_Time_Delta.cooked ("1d"))
+    >>> for n in (a3, a4, net) :
+    ...     print (n.net_address, n.owner, n.expiration_date is not None)
+    10.0.0.4/30 None True
+    10.0.0.16 None True
+    10.0.0.16/28 None True
+    >>> pool.alloc_version - version
+    1
+    >>> [c for c in scope.uncommitted_changes if c.kind == "Modify/Bulk"]
+    [<Modify/Bulk CNDB.IP4_Network 'expiration_date', 3 entities>]
+    >>> a4.is_free
+    False
+
+    The change feed describes each network of a bulk change; its `limit`
+    counts these descriptions, but doesn't split a change
+
+    >>> bulk    = [c for c in scope.uncommitted_changes if c.kind == "Modify/Bulk"] [0]
+    >>> scope.commit ()
+    >>> feed    = CNDB.OMP.Change_Feed (scope)
+    >>> entries = list (feed.entries (bulk.cid - 1, limit = 1))
+    >>> [(e ["cid"] == bulk.cid, e ["attrs"]) for e in entries]
+    [(True, ['expiration_date']), (True, ['expiration_date']), (True, ['expiration_date'])]
+    >>> [e ["pid"] for e in entries] == sorted (n.pid for n in (a3, a4, net))
+    True
+
+    >>> node.release_addresses (A_Date_Time_Delta.cooked ("0d"))
+    2
+    >>> CNDB.Net_Interface_in_IP4_Network.count
+    0
+    >>> tree_view (pool)
+    10.0.0.0/24
+     10.0.0.0/25 E
+      10.0.0.0/26 E
+       10.0.0.0/27 E
+        10.0.0.0/28 E
+         10.0.0.0/29 E
+          10.0.0.0/30 E
+          10.0.0.4/30
+         10.0.0.8/29 E
+        10.0.0.16/28
+         10.0.0.16/29 E
+          10.0.0.16/30 E
+           10.0.0.16/31 E
+            10.0.0.16
+            10.0.0.17 E
+           10.0.0.18/31 E
+          10.0.0.20/30 E
+         10.0.0.24/29 E
+       10.0.0.32/27 E
+      10.0.0.64/26 E
+     10.0.0.128/25 E
+
+"""
+
+_test_counters = """
+    >>> scope = Scaffold.scope (%(p1)s, %(n1)s) # doctest:+ELLIPSIS
+    Creating new scope MOMT__...
+
+    >>> CNDB = scope.CNDB
+    >>> PAP = scope.PAP
+    >>> ETM = CNDB.IP4_Network
+    >>> ff  = PAP.Association ("Funkfeuer", short_name = "0xFF", raw = True)
+    >>> rs  = PAP.Person ("Schlatterbeck", "Ralf", raw = True)
+
+    >>> pool = ETM ('10.0.0.0/24', owner = ff, raw = True)
+    >>> ipp  = CNDB.IP4_Pool (name = "pool", cool_down_period = "1d", raw = True)
+    >>> _    = CNDB.IP4_Network_in_IP4_Pool (pool, ipp)
+
+    The counters are initialized by the first allocation
+
+    >>> show_counters (pool)
+    10.0.0.0/24          None   None   None None
+    >>> ipp.addresses_free, ipp.can_allocate (24), ipp.can_allocate (25)
+    (None, False, True)
+
+    >>> a1   = pool.allocate (32, rs)
+    >>> net  = pool.allocate (28, rs)
+    >>> a2   = net.allocate (32, rs)
+    >>> show_counters (pool, net)
+    10.0.0.0/24            17    239      0 25
+    10.0.0.16/28         None   None   None None
+
+    >>> a1.free ()
+    >>> CNDB.IP_Network.free_many ([net, a2], A_Date_Time_Delta.cooked ("0d"))
+    >>> show_counters (pool)
+    10.0.0.0/24             0    255      1 25
+
+    >>> print (ipp.addresses_allocated, ipp.addresses_cooling, ipp.addresses_free, ipp.largest_free)
+    0 1 255 25
+    >>> ipp.can_allocate (24), ipp.can_allocate (25)
+    (False, True)
+
+    >>> ETM.query (Q.addresses_free > 200).all ()
+    [CNDB.IP4_Network ("10.0.0.0/24")]
+
+    >>> big = pool.allocate (25, rs)
+    >>> show_counters (pool)
+    10.0.0.0/24           128    127      1 26
+    >>> ipp.can_allocate (25)
+    False
+
+    `update_counters` recounts from scratch
+
+    >>> ipp.update_counters ()
+    >>> show_counters (pool)
+    10.0.0.0/24           128    127      1 26
+
+    For IPv6, /64 networks are counted
+
+    >>> p6   = CNDB.IP6_Network ('2001:db8::/48', owner = ff, raw = True)
+    >>> b1   = p6.allocate (64, rs)
+    >>> b2   = p6.allocate (128, rs)
+    >>> show_counters (p6)
+    2001:db8::/48           2  65534      0 49
+
+"""
+
+_test_pool_eligibility = """
+    >>> scope = Scaffold.scope (%(p1)s, %(n1)s) # doctest:+ELLIPSIS
+    Creating new scope MOMT__...
+
+    >>> CNDB = scope.CNDB
+    >>> PAP = scope.PAP
+    >>> Elig = CNDB.OMP.IP_Pool_Eligibility
+    >>> ff  = PAP.Association ("Funkfeuer", short_name = "0xFF", raw = True)
+    >>> rs  = PAP.Person ("Schlatterbeck", "Ralf", raw = True)
+    >>> jd  = PAP.Person ("Doe", "John", raw = True)
+    >>> n1  = CNDB.Node (name = "n1", manager = rs, raw = True)
+    >>> n2  = CNDB.Node (name = "n2", manager = jd, raw = True)
+    >>> grp = PAP.Adhoc_Group (name = "users", raw = True)
+    >>> _   = PAP.Person_in_Group (rs, grp)
+
+    >>> def pool (ETM, addr, name, ** kw) :
+    ...     nw  = ETM (addr, owner = ff, raw = True)
+    ...     ipp = scope [ETM.ip_pool.P_Type] (name = name, raw = True, ** kw)
+    ...     _   = scope [ETM.ip_pool_link.P_Type] (nw, ipp)
+    ...     return ipp
+    >>> def show (user, node) :
+    ...     print (", ".join (p.name for p in Elig.eligible_pools (scope, user, node)) or "-")
+
+    >>> p1 = pool (CNDB.IP4_Network, "10.1.0.0/24", "node", node = n1)
+    >>> p2 = pool (CNDB.IP4_Network, "10.2.0.0/24", "group")
+    >>> p3 = pool \\
+    ...     ( CNDB.IP4_Network, "10.3.0.0/24", "subnets"
+    ...     , netmask_interval = dict (lower = "24", upper = "28")
+    ...     )
+    >>> p4 = pool (CNDB.IP6_Network, "2001:db8::/48", "group6")
+    >>> p5 = pool (CNDB.IP4_Network, "10.5.0.0/24", "nobody")
+    >>> _  = CNDB.IP4_Pool_permits_Group (p2, grp)
+    >>> _  = CNDB.IP4_Pool_permits_Group (p3, grp)
+    >>> _  = CNDB.IP6_Pool_permits_Group (p4, grp)
+    >>> scope.commit ()
+
+    Pools reserved for a node are eligible for that node, the other pools
+    for the members of the groups they permit; pools not allocating single
+    addresses are never eligible
+
+    >>> show (rs, n1)
+    node, group, group6
+    >>> show (jd, n1)
+    node
+    >>> show (jd, n2)
+    -
+
+    Changes of other objects don't invalidate the cache
+
+    >>> cache = Elig.cached (scope, "CNDB.IP4_Network_in_IP4_Pool")
+    >>> _ = CNDB.Node (name = "n3", manager = jd, raw = True)
+    >>> scope.commit ()
+    >>> cache.is_valid
+    True
+
+    Changes of group memberships or pools do
+
+    >>> _ = PAP.Person_in_Group (jd, grp)
+    >>> cache.is_valid
+    False
+    >>> show (jd, n2)
+    group, group6
+    >>> p6 = pool (CNDB.IP4_Network, "10.6.0.0/24", "node2", node = n2)
+    >>> show (jd, n2)
+    group, node2, group6
+
+"""
+
+_test_quota = """
+    >>> scope = Scaffold.scope (%(p1)s, %(n1)s) # doctest:+ELLIPSIS
+    Creating new scope MOMT__...
+
+    >>> CNDB = scope.CNDB
+    >>> PAP = scope.PAP
+    >>> ff  = PAP.Association ("Funkfeuer", short_name = "0xFF", raw = True)
+    >>> rs  = PAP.Person ("Schlatterbeck", "Ralf", raw = True)
+    >>> grp = PAP.Adhoc_Group (name = "users", raw = True)
+    >>> _   = PAP.Person_in_Group (rs, grp)
+    >>> dt  = CNDB.Net_Device_Type.instance_or_new (name = 'Generic', raw = True)
+    >>> n1  = CNDB.Node (name = "n1", manager = rs, raw = True)
+    >>> n2  = CNDB.Node (name = "n2", manager = rs, raw = True)
+    >>> d1  = CNDB.Net_Device (left = dt, node = n1, name = 'dev', raw = True)
+    >>> d2  = CNDB.Net_Device (left = dt, node = n2, name = 'dev', raw = True)
+    >>> i1  = CNDB.Wired_Interface (left = d1, name = 'i1', raw = True)
+    >>> i2  = CNDB.Wired_Interface (left = d1, name = 'i2', raw = True)
+    >>> i3  = CNDB.Wired_Interface (left = d1, name = 'i3', raw = True)
+    >>> j1  = CNDB.Wired_Interface (left = d2, name = 'j1', raw = True)
+    >>> j2  = CNDB.Wired_Interface (left = d2, name = 'j2', raw = True)
+
+    >>> pool = CNDB.IP4_Network ('10.0.0.0/24', owner = ff, raw = True)
+    >>> ipp  = CNDB.IP4_Pool (name = "pool", raw = True)
+    >>> _    = CNDB.IP4_Network_in_IP4_Pool (pool, ipp)
+    >>> _    = CNDB.IP4_Pool_permits_Group \\
+    ...     (ipp, grp, user_quota = 30, node_quota = 31, iface_quota = 32, raw = True)
+    >>> scope.commit ()
+
+    >>> usage = CNDB.OMP.IP_Pool_Usage.for_pool (ipp)
+    >>> def show_usage (* objs) :
+    ...     print (" ".join ("%%s" %% usage.usage (o) for o in objs))
+
+    >>> ipp.within_quota (rs, n1, [i1, i2]), ipp.within_quota (rs, n1, [i1, i2, i3])
+    (True, False)
+    >>> ipp.allocate_interfaces ([i1], rs)
+    [CNDB.Wired_Interface_in_IP4_Network (((('generic', '', ''), ('n1', ), 'dev'), '', 'i1'), ("10.0.0.0", ))]
+    >>> show_usage (rs, n1, i1, i2)
+    1 1 1 0
+    >>> ipp.within_quota (rs, n1, [i1]), ipp.within_quota (rs, n1, [i2])
+    (False, True)
+
+    >>> _ = ipp.allocate_interfaces ([i2], rs)
+    >>> with expect_except (CNDB.OMP.Error.Quota_Exceeded) :
+    ...     ipp.allocate_interfaces ([i3], rs)
+    Quota_Exceeded: Allocation from pool pool would exceed the quota of user Schlatterbeck Ralf or node n1
+
+    >>> links = ipp.allocate_interfaces ([j1, j2], rs)
+    >>> show_usage (rs, n1, n2)
+    4 2 2
+    >>> ipp.within_quota (rs, n2, [j1])
+    False
+
+    The usage counters are kept up-to-date by `free`
+
+    >>> scope.commit ()
+    >>> links [0].right.free ()
+    >>> show_usage (rs, n1, n2, j1)
+    3 2 1 0
+    >>> usage.is_valid, CNDB.OMP.IP_Pool_Usage.for_pool (ipp) is usage
+    (True, True)
+    >>> usage.rebuild ()
+    >>> show_usage (rs, n1, n2, j1)
+    3 2 1 0
+
+"""
+
+_test_strategies = """
+    >>> scope = Scaffold.scope (%(p1)s, %(n1)s) # doctest:+ELLIPSIS
+    Creating new scope MOMT__...
+
+    >>> CNDB = scope.CNDB
+    >>> PAP = scope.PAP
+    >>> ff  = PAP.Association ("Funkfeuer", short_name = "0xFF", raw = True)
+    >>> rs  = PAP.Person ("Schlatterbeck", "Ralf", raw = True)
+    >>> sorted (CNDB.OMP.IP_Allocation_Strategy.Table)
+    ['Aligned', 'Best_Fit', 'First_Fit', 'Spread']
+
+    >>> def run (i, strategy) :
+    ...     nw = CNDB.IP4_Network ("10.0.%%s.0/24" %% i, owner = ff, raw = True)
+    ...     p  = CNDB.IP4_Pool \\
+    ...         (name = strategy, allocation_strategy = strategy, raw = True)
+    ...     _  = CNDB.IP4_Network_in_IP4_Pool (nw, p)
+    ...     x  = p.allocate (25, rs)
+    ...     y  = p.allocate (32, rs)
+    ...     CNDB.IP_Network.free_many ([x], A_Date_Time_Delta.cooked ("0d"))
+    ...     r  = list (p.allocate (ml, rs) for ml in (32, 32, 28))
+    ...     print ("%%-10s" %% p.allocation_strategy, y.net_address, ", ".join (str (n.net_address) for n in r))
+
+    >>> for i, s in enumerate (("Best_Fit", "First_Fit", "Spread", "Aligned")) :
+    ...     run (i, s)
+    Best_Fit   10.0.0.128 10.0.0.129, 10.0.0.130, 10.0.0.144/28
+    First_Fit  10.0.1.128 10.0.1.0, 10.0.1.1, 10.0.1.16/28
+    Spread     10.0.2.64 10.0.2.192, 10.0.2.32, 10.0.2.160/28
+    Aligned    10.0.3.128 10.0.3.132, 10.0.3.136, 10.0.3.192/28
+
+    Networks not in an `IP_Pool` use `Best_Fit`
+
+    >>> CNDB.IP4_Network ("10.1.0.0/24", owner = ff, raw = True).allocation_strategy
+    <class '_CNDB._OMP.IP_Allocation_Strategy.Best_Fit'>
+
+    The address of a single interface allocated by `allocate_interfaces`,
+    e.g., by the dashboard, is placed by the strategy of the pool, too
+
+    >>> dt  = CNDB.Net_Device_Type.instance_or_new (name = 'Generic', raw = True)
+    >>> nd  = CNDB.Node (name = "n1", manager = rs, raw = True)
+    >>> dev = CNDB.Net_Device (left = dt, node = nd, name = 'dev', raw = True)
+    >>> ifs = [CNDB.Wired_Interface (left = dev, name = n, raw = True) for n in ("i1", "i2")]
+    >>> nw  = CNDB.IP4_Network ("10.2.0.0/24", owner = ff, raw = True)
+    >>> sp  = CNDB.IP4_Pool (name = "spread2", allocation_strategy = "Spread", raw = True)
+    >>> _   = CNDB.IP4_Network_in_IP4_Pool (nw, sp)
+    >>> [str (l.right.net_address) for i in ifs for l in sp.allocate_interfaces ([i], rs)]
+    ['10.2.0.128', '10.2.0.64']
+
+"""
+
+_test_commit = """
+    >>> scope = Scaffold.scope (%(p1)s, %(n1)s) # doctest:+ELLIPSIS
+    Creating new scope MOMT__...
+
+    >>> CNDB = scope.CNDB
+    >>> PAP = scope.PAP
+    >>> SC  = CNDB.OMP.Scope_Cache
+    >>> ff  = PAP.Association ("Funkfeuer", short_name = "0xFF", raw = True)
+    >>> rs  = PAP.Person ("Schlatterbeck", "Ralf", raw = True)
+    >>> nw  = CNDB.IP4_Network ("10.0.0.0/28", owner = ff, raw = True)
+    >>> p   = CNDB.IP4_Pool (name = "commit", raw = True)
+    >>> _   = CNDB.IP4_Network_in_IP4_Pool (nw, p)
+    >>> scope.commit ()
+
+    Each allocation bumps the `alloc_version` of the pool network; with
+    `commit`, the allocation is committed
+
+    >>> a = p.allocate (30, rs, commit = True)
+    >>> a.net_address, nw.alloc_version, len (scope.uncommitted_changes)
+    (10.0.0.0/30, 1, 0)
+
+    Simulate two concurrent changes of the database detected by `_claim`:
+    the allocation is rolled back and retried
+
+    >>> changed_elsewhere = SC.__dict__ ["changed_elsewhere"]
+    >>> conflicts = [True, True]
+    >>> def fake_changed_elsewhere (cls, scope) :
+    ...     return bool (conflicts) and conflicts.pop ()
+    >>> SC.changed_elsewhere = classmethod (fake_changed_elsewhere)
+
+    >>> b = p.allocate (30, rs, commit = True)
+    >>> b.net_address, nw.alloc_version, len (scope.uncommitted_changes)
+    (10.0.0.4/30, 2, 0)
+    >>> conflicts
+    []
+
+    With uncommitted changes, `commit` is refused: a rollback on conflict
+    would discard these changes
+
+    >>> _ = PAP.Person ("Tanzer", "Christian", raw = True)
+    >>> conflicts = [True]
+    >>> with expect_except (CNDB.OMP.Error.Uncommitted_Changes) :
+    ...     p.allocate (30, rs, commit = True)
+    Uncommitted_Changes: Scope has 1 uncommitted change(s) that would be lost if the commit had to be retried
+    >>> PAP.Person.query (last_name = "tanzer").count ()
+    1
+    >>> nw.alloc_version, conflicts
+    (2, [True])
+
+    >>> SC.changed_elsewhere = changed_elsewhere
+
+"""
+
+_test_commit_conflict = """
+    >>> scope = Scaffold.scope (%(p1)s, %(n1)s) # doctest:+ELLIPSIS
+    Creating new scope MOMT__...
+
+    >>> CNDB = scope.CNDB
+    >>> PAP = scope.PAP
+    >>> ff  = PAP.Association ("Funkfeuer", short_name = "0xFF", raw = True)
+    >>> rs  = PAP.Person ("Schlatterbeck", "Ralf", raw = True)
+    >>> dt  = CNDB.Net_Device_Type.instance_or_new (name = 'Generic', raw = True)
+    >>> nd  = CNDB.Node (name = "n1", manager = rs, raw = True)
+    >>> dev = CNDB.Net_Device (left = dt, node = nd, name = 'dev', raw = True)
+    >>> wr  = CNDB.Wired_Interface (left = dev, name = 'wr', raw = True)
+    >>> nw  = CNDB.IP4_Network ("10.0.0.0/28", owner = ff, raw = True)
+    >>> p   = CNDB.IP4_Pool (name = "conflict", raw = True)
+    >>> _   = CNDB.IP4_Network_in_IP4_Pool (nw, p)
+    >>> scope.commit ()
+    >>> p.can_allocate (30)
+    True
+
+    A second scope allocates from the same pool and commits; the
+    allocation of the first scope, planned against free blocks read
+    before, conflicts, is retried with the interface and owner loaded
+    again, and gets the next free address
+
+    >>> s2  = Scaffold.scope (%(p1)s, %(n1)s, create = False, verbose = False)
+    >>> p2  = s2.CNDB.IP4_Pool.instance ("conflict")
+    >>> rs2 = s2.PAP.Person.instance ("Schlatterbeck", "Ralf")
+    >>> p2.allocate (32, rs2, commit = True)
+    CNDB.IP4_Network ("10.0.0.0")
+    >>> s2.destroy ()
+
+    >>> links = p.allocate_interfaces ([wr], rs, commit = True)
+    >>> [str (l.right.net_address) for l in links], len (scope.uncommitted_changes)
+    (['10.0.0.1'], 0)
+    >>> sorted (str (n.net_address) for n in CNDB.IP4_Network.query (~ Q.electric, Q.pid != nw.pid))
+    ['10.0.0.0', '10.0.0.1']
+
+"""
+
+_test_prefix_index = """
+    >>> scope = Scaffold.scope (%(p1)s, %(n1)s) # doctest:+ELLIPSIS
+    Creating new scope MOMT__...
+
+    >>> CNDB = scope.CNDB
+    >>> PAP = scope.PAP
+    >>> Adr = CNDB.IP4_Network.net_address.P_Type
+    >>> Index = CNDB.OMP.IP_Prefix_Index
+    >>> ff  = PAP.Association ("Funkfeuer", short_name = "0xFF", raw = True)
+    >>> rs  = PAP.Person ("Schlatterbeck", "Ralf", raw = True)
+    >>> n1  = CNDB.IP4_Network ('10.0.0.0/16', owner = ff, raw = True)
+    >>> n2  = CNDB.IP4_Network ('192.168.0.0/24', owner = ff, raw = True)
+    >>> a1  = n1.reserve ('10.0.1.0/24', owner = rs)
+
+    >>> index = Index.for_network (n1)
+    >>> len (index) == CNDB.IP4_Network.count
+    True
+    >>> scope.pid_query (index.longest_match (Adr ('10.0.1.42'))) is a1
+    True
+    >>> n1.find_closest_address (Adr ('10.0.2.42')).net_address
+    10.0.2.0/23
+    >>> print (index.longest_match (Adr ('10.1.0.0/24')))
+    None
+    >>> a1.containing_mask_lens ()
+    [16, 17, 18, 19, 20, 21, 22, 23, 24]
+
+    Reserving and destroying networks keeps the index up-to-date
+
+    >>> a2 = a1.reserve ('10.0.1.42', owner = rs)
+    >>> Index.for_network (n1) is index
+    True
+    >>> len (index) == CNDB.IP4_Network.count
+    True
+    >>> n1.find_closest_address (Adr ('10.0.1.42')) is a2
+    True
+    >>> a2.destroy ()
+    >>> n1.find_closest_address (Adr ('10.0.1.42')).net_address
+    10.0.1.42/31
+    >>> n2.find_closest_address (Adr ('192.168.0.1')) is n2
+    True
+
+    Changes of other objects don't affect the index, networks created or
+    destroyed directly are patched into it: the index isn't rebuilt
+
+    >>> _build  = Index.__dict__ ["_build"]
+    >>> builds  = []
+    >>> def counting_build (self) :
+    ...     builds.append (self.key)
+    ...     _build (self)
+    >>> Index._build = counting_build
+
+    >>> scope.commit ()
+    >>> ct  = PAP.Person ("Tanzer", "Christian", raw = True)
+    >>> n3  = CNDB.IP4_Network ('10.0.0.0/8', owner = ct, raw = True)
+    >>> n1.containing_mask_lens ()
+    [8, 16]
+    >>> n3.find_closest_address (Adr ('10.1.0.1')) is n3
+    True
+    >>> n3.destroy ()
+    >>> n1.containing_mask_lens ()
+    [16]
+    >>> builds
+    []
+
+    >>> scope.rollback ()
+    >>> n1.find_closest_address (Adr ('10.0.1.42')).net_address
+    10.0.1.42/31
+    >>> builds
+    ['CNDB.IP4_Network']
+
+    Changes committed since the index was used last, e.g., by another
+    process, are read from the database: the index isn't rebuilt
+
+    >>> del builds [:]
+    >>> n4  = CNDB.IP4_Network ('172.16.0.0/12', owner = ff, raw = True)
+    >>> scope.commit ()
+    >>> print (index.longest_match (Adr ('172.16.0.1')))
+    None
+    >>> n4.find_closest_address (Adr ('172.16.0.1')) is n4
+    True
+    >>> scope.rollback ()
+    >>> n1.find_closest_address (Adr ('10.0.1.42')).net_address
+    10.0.1.42/31
+    >>> builds
+    []
+
+    >>> Index._build = _build
+
+"""
+
+_test_warm_cache = """
+    >>> scope = Scaffold.scope (%(p1)s, %(n1)s) # doctest:+ELLIPSIS
+    Creating new scope MOMT__...
+
+    >>> CNDB = scope.CNDB
+    >>> PAP = scope.PAP
+    >>> ff  = PAP.Association ("Funkfeuer", short_name = "0xFF", raw = True)
+    >>> rs  = PAP.Person ("Schlatterbeck", "Ralf", raw = True)
+    >>> def show_ready () :
+    ...     q = CNDB.IP4_Network.query \\
+    ...         ( Q.is_free, Q.electric, Q.net_address.mask_len == 32
+    ...         , sort_key = TFL.Sorted_By ("net_address")
+    ...         )
+    ...     print (", ".join (str (n.net_address) for n in q))
+
+    >>> nw   = CNDB.IP4_Network ("10.0.0.0/24", owner = ff, raw = True)
+    >>> pool = CNDB.IP4_Pool \\
+    ...     (name = "warm", allocation_strategy = "Spread", warm_blocks = 3, raw = True)
+    >>> _    = CNDB.IP4_Network_in_IP4_Pool (nw, pool)
+    >>> pool.warm_mask_len, pool.warm_blocks
+    (32, 3)
+
+    `refill_warm_cache` splits free blocks until `warm_blocks` single
+    addresses are ready
+
+    >>> pool.refill_warm_cache ()
+    4
+    >>> show_ready ()
+    10.0.0.0, 10.0.0.1, 10.0.0.2, 10.0.0.3
+    >>> CNDB.IP4_Network.count
+    19
+
+    Allocations of `warm_mask_len` claim a ready block without splitting,
+    independent of the `allocation_strategy`; other mask lengths use the
+    strategy
+
+    >>> pool.allocate (32, rs)
+    CNDB.IP4_Network ("10.0.0.0")
+    >>> pool.allocate (32, rs)
+    CNDB.IP4_Network ("10.0.0.1")
+    >>> CNDB.IP4_Network.count
+    19
+    >>> pool.allocate (28, rs)
+    CNDB.IP4_Network ("10.0.0.192/28")
+    >>> show_ready ()
+    10.0.0.2, 10.0.0.3
+    >>> pool.refill_warm_cache ()
+    4
+    >>> show_ready ()
+    10.0.0.2, 10.0.0.3, 10.0.0.4, 10.0.0.5
+
+    `allocate_interfaces` claims a ready block for a single interface
+
+    >>> dt  = CNDB.Net_Device_Type.instance_or_new (name = 'Generic', raw = True)
+    >>> nd  = CNDB.Node (name = "n1", manager = rs, raw = True)
+    >>> dev = CNDB.Net_Device (left = dt, node = nd, name = 'dev', raw = True)
+    >>> wr  = CNDB.Wired_Interface (left = dev, name = 'wr', raw = True)
+    >>> [str (l.right.net_address) for l in pool.allocate_interfaces ([wr], rs)]
+    ['10.0.0.2']
+    >>> show_ready ()
+    10.0.0.3, 10.0.0.4, 10.0.0.5
+
+    Pools without `warm_blocks` don't pre-split anything
+
+    >>> CNDB.IP4_Pool (name = "cold", raw = True).refill_warm_cache ()
+    0
+    >>> scope.commit ()
+
+"""
+
+_test_nibble = """
+    >>> scope = Scaffold.scope (%(p1)s, %(n1)s) # doctest:+ELLIPSIS
+    Creating new scope MOMT__...
+
+    >>> CNDB = scope.CNDB
+    >>> PAP = scope.PAP
+    >>> ETM = CNDB.IP6_Network
+    >>> ff  = PAP.Association ("Funkfeuer", short_name = "0xFF", raw = True)
+    >>> rs  = PAP.Person ("Schlatterbeck", "Ralf", raw = True)
+
+    By default, IPv6 networks are split in halves like IPv4 networks;
+    with `split_bits = 4`, they are split at nibble boundaries, in 16
+    subnets each
+
+    >>> ETM.E_Type.split_bits
+    1
+    >>> ETM.E_Type.split_bits = 4
+    >>> pool = CNDB.IP6_Network ('2001:db8::/40', owner = ff, raw = True)
+    >>> a48  = pool.allocate (48, rs)
+    >>> a56  = pool.allocate (56, rs)
+    >>> a64  = pool.allocate (64, rs)
+    >>> a48, a56, a64
+    (CNDB.IP6_Network ("2001:db8::/48"), CNDB.IP6_Network ("2001:db8:1::/56"), CNDB.IP6_Network ("2001:db8:1:100::/64"))
+    >>> sorted (set (n.net_address.mask_len for n in ETM.query ()))
+    [40, 44, 48, 52, 56, 60, 64]
+    >>> show_network_count (scope, ETM)
+    CNDB.IP6_Network count: 97
+
+    A split towards a network not on a nibble boundary stops at that
+    network
+
+    >>> a127 = pool.allocate (127, rs)
+    >>> a127, a127.parent
+    (CNDB.IP6_Network ("2001:db8:1:101::/127"), CNDB.IP6_Network ("2001:db8:1:101::/124"))
+    >>> len (a127.parent.subnets)
+    8
+
+    Networks allocated together are planned with the same splits
+
+    >>> many = pool.allocate_many (((64, 2), (60, 1)), rs)
+    >>> [str (n.net_address) for n in many]
+    ['2001:db8:1:102::/64', '2001:db8:1:103::/64', '2001:db8:1:110::/60']
+
+    Freeing all allocations of a split collects all 16 subnets
+
+    >>> for n in (a127, a64) + tuple (many) :
+    ...     n.free ()
+    >>> pool.collect_garbage ()
+    >>> sorted (str (n.net_address) for n in a56.parent.subnets if not n.electric)
+    ['2001:db8:1::/56']
+    >>> show_network_count (scope, ETM)
+    CNDB.IP6_Network count: 65
+
+    Networks of different mask lengths allocated together from one nibble
+    are reserved in the order they were planned, largest first
+
+    >>> p44  = CNDB.IP6_Network ('2001:db8:100::/44', owner = ff, raw = True)
+    >>> [str (n.net_address) for n in p44.allocate_many ([(128, 1), (127, 1)], rs)]
+    ['2001:db8:100::2', '2001:db8:100::/127']
+    >>> [str (n.net_address) for n in p44.allocate_many ([(127, 1), (125, 1)], rs)]
+    ['2001:db8:100::4/127', '2001:db8:100::10/125']
+
+    Combined with `sparse_split`, no siblings are materialized: each
+    allocation creates a single network
+
+    >>> ETM.E_Type.sparse_split = True
+    >>> count = ETM.count
+    >>> p36   = CNDB.IP6_Network ('2001:db8:1000::/36', owner = ff, raw = True)
+    >>> nets  = [p36.allocate (ml, rs) for ml in (48, 56, 64)]
+    >>> ETM.count - count, all (n.parent == p36 for n in nets)
+    (4, True)
+
+    >>> del ETM.E_Type.sparse_split
+    >>> del ETM.E_Type.split_bits
+
+"""
+
+_test_replay = """
+    >>> scope = Scaffold.scope (%(p1)s, %(n1)s) # doctest:+ELLIPSIS
+    Creating new scope MOMT__...
+
+    >>> CNDB = scope.CNDB
+    >>> PAP = scope.PAP
+    >>> Log = CNDB.OMP.IP_Replay_Log
+    >>> ff  = PAP.Association ("Funkfeuer", short_name = "0xFF", raw = True)
+    >>> rs  = PAP.Person ("Schlatterbeck", "Ralf", raw = True)
+    >>> pool = CNDB.IP4_Network ('10.0.0.0/24', owner = ff, raw = True)
+
+    Without a log attached, nothing is logged
+
+    >>> print (Log.for_scope (scope))
+    None
+
+    With a log attached, the outermost operations are logged with their
+    parameters and results
+
+    >>> log = Log.attach (scope, StringIO ())
+    >>> a1 = pool.allocate (30, rs)
+    >>> a2 = pool.allocate (28, rs)
+    >>> a3 = pool.reserve ('10.0.0.128/32', rs)
+    >>> a2.free (timedelta (hours = 1))
+    >>> CNDB.IP4_Network.free_many ([a1, a3])
+    >>> with expect_except (CNDB.OMP.Error.No_Free_Address_Range) :
+    ...     pool.allocate (16, rs)
+    No_Free_Address_Range: Address range [10.0.0.0/24] of this IP4_Network doesn't contain a free subrange for mask length 16
+    >>> pool.collect_garbage ()
+    >>> log.count
+    7
+    >>> entries = list (Log.read (StringIO (log.file.getvalue ())))
+    >>> for e in entries :
+    ...     print (portable_repr (dict ((k, v) for k, v in e.items () if k not in ("seconds", "t"))))
+    {'mask_len' : 30, 'network' : '10.0.0.0/24', 'op' : 'allocate', 'owner' : 2, 'result' : '10.0.0.0/30', 'strategy' : 'Best_Fit', 'type' : 'CNDB.IP4_Network'}
+    {'mask_len' : 28, 'network' : '10.0.0.0/24', 'op' : 'allocate', 'owner' : 2, 'result' : '10.0.0.16/28', 'strategy' : 'Best_Fit', 'type' : 'CNDB.IP4_Network'}
+    {'net_addr' : '10.0.0.128/32', 'network' : '10.0.0.0/24', 'op' : 'reserve', 'owner' : 2, 'result' : '10.0.0.128', 'type' : 'CNDB.IP4_Network'}
+    {'cool_down_period' : 3600, 'network' : '10.0.0.16/28', 'op' : 'free', 'result' : None, 'type' : 'CNDB.IP4_Network'}
+    {'cool_down_period' : [None, None], 'networks' : ['10.0.0.0/30', '10.0.0.128'], 'op' : 'free_many', 'result' : None, 'type' : 'CNDB.IP4_Network'}
+    {'error' : 'No_Free_Address_Range', 'mask_len' : 16, 'network' : '10.0.0.0/24', 'op' : 'allocate', 'owner' : 2, 'strategy' : 'Best_Fit', 'type' : 'CNDB.IP4_Network'}
+    {'network' : '10.0.0.0/24', 'op' : 'collect_garbage', 'result' : None, 'type' : 'CNDB.IP4_Network'}
+
+    >>> Log.detach (scope)
+    >>> print (Log.for_scope (scope))
+    None
+
+    Replaying the log against a fresh scope gives the same results
+
+    >>> scope.destroy ()
+    >>> scope = Scaffold.scope (%(p1)s, %(n1)s) # doctest:+ELLIPSIS
+    Creating new scope MOMT__...
+    >>> CNDB = scope.CNDB
+    >>> sim = CNDB.OMP.IP_Simulator (scope)
+    >>> snaps = list (sim.run (entries))
+    >>> [(s ["ops"], s ["diverged"], s ["errors"]) for s in snaps]
+    [(7, 0, 1)]
+
+    A synthetic workload uses simulated time
+
+    >>> scope.destroy ()
+    >>> scope = Scaffold.scope (%(p1)s, %(n1)s) # doctest:+ELLIPSIS
+    Creating new scope MOMT__...
+    >>> CNDB = scope.CNDB
+    >>> sim = CNDB.OMP.IP_Simulator (scope)
+    >>> work = sim.synthetic (ops = 60, gc_every = 30, cool_down = 300)
+    >>> for s in sim.run (work, report_every = 20) :
+    ...     print (s ["ops"], s ["now"], s ["networks"], s ["blocks"], s ["errors"])
+    20 2000-01-01 00:19:00 73 20 0
+    40 2000-01-01 00:38:00 61 21 0
+    60 2000-01-01 00:58:00 81 20 0
+    62 2000-01-01 01:00:00 43 21 0
+
+"""
+
 _test_debug = """
     >>> scope = Scaffold.scope (%(p1)s, %(n1)s) # doctest:+ELLIPSIS
     Creating new scope MOMT__...
@@ -8830,6 +10126,46 @@ def show_by_pid (ETM) :
     show_query_by_pid (ETM.query ())
 # end def show_by_pid
 
+def show_counters (* networks) :
+    for n in networks :
+        print \
+            ( "%-18s %6s %6s %6s %s"
+            % ( n.net_address, n.addresses_allocated, n.addresses_free
+              , n.addresses_cooling, n.largest_free
+              )
+            )
+# end def show_counters
+
+def show_expiring (ETM, now) :
+    """Show the days left until expiration for all expiring networks."""
+    nws = ETM.query \
+        ( Q.expiration_date != None
+        , sort_key = TFL.Sorted_By ("net_address")
+        )
+    for n in nws :
+        print ("%-18s %2d" % (n.net_address, (n.expiration_date - now).days))
+# end def show_expiring
+
+def show_free_index (pool) :
+    """Show the free blocks in the `IP_Free_Index` of `pool` after checking
+       that they match the blocks found by a fresh index.
+    """
+    Index = pool.home_scope.CNDB.OMP.IP_Free_Index
+    index = Index.for_network (pool)
+    fresh = Index (pool.home_scope, pool.pid)
+    fresh._build ()
+    assert index._blocks == fresh._blocks, (index._blocks, fresh._blocks)
+    ETM   = pool.ETM
+    for (ip, ml), (pid, electric) in sorted (index._blocks.items ()) :
+        nw = ETM.pid_query (pid)
+        na = nw.net_address
+        if (ip, ml) != (na.ip, na.mask_len) :
+            ### implicit free block of `nw`
+            print ("%-18s %1.1s in %s" % (na.__class__ (ip, ml), electric, na))
+        else :
+            print ("%-18s %1.1s" % (na, electric))
+# end def show_free_index
+
 def show_networks (scope, ETM, * qargs, ** qkw) :
     sk = TFL.Sorted_By ("electric", "-has_children", "net_address")
     pool = qkw.pop ("pool", None)
@@ -8872,9 +10208,35 @@ __test__ = Scaffold.create_test_dict \
       , test_order_4       = _test_order_4
       , test_order_6       = _test_order_6
       , test_std_fixtures  = _test_std_fixtures
+      , test_free_index    = _test_free_index
+      , test_sparse        = _test_sparse
+      , test_allocate_many = _test_allocate_many
+      , test_gc_incremental = _test_gc_incremental
+      , test_gc_bulk       = _test_gc_bulk
+      , test_nibble        = _test_nibble
+      , test_replay        = _test_replay
+      , test_cooldown_cache = _test_cooldown_cache
+      , test_free_many     = _test_free_many
+      , test_counters      = _test_counters
+      , test_pool_eligibility = _test_pool_eligibility
+      , test_quota         = _test_quota
+      , test_strategies    = _test_strategies
+      , test_commit        = _test_commit
+      , test_prefix_index  = _test_prefix_index
+      , test_warm_cache    = _test_warm_cache
       )
   )
 
+### a second scope needs a database shared between scopes
+__test__.update \
+    ( Scaffold.create_test_dict
+        ( dict
+            ( test_commit_conflict = _test_commit_conflict
+            )
+        , ignore = ("HPS", "MYS", "SQL")
+        )
+    )
+
 __test__.update \
     ( Scaffold.create_test_dict
         ( dict
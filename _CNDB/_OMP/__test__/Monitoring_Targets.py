@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 Dr. Ralf Schlatterbeck All rights reserved
+# Reichergasse 131, A--3411 Weidling, Austria. rsc@runtux.com
+# #*** <License> ************************************************************#
+# This module is part of the package CNDB.OMP.__test__.
+#
+# This module is licensed under the terms of the BSD 3-Clause License
+# <http://www.c-tanzer.at/license/bsd_3c.html>.
+# #*** </License> ***********************************************************#
+#
+#++
+# Name
+#    CNDB.OMP.__test__.Monitoring_Targets
+#
+# Purpose
+#    Test generation of smokeping and Prometheus monitoring targets
+#
+# Revision Dates
+#    18-Oct-2026 (RS) Creation
+#    ««revision-date»»···
+#--
+
+from   _CNDB._OMP.__test__.model      import *
+from   _CNDB._OMP.__test__.fixtures   import create as std_fixtures
+
+import _CNDB._OMP.Monitoring_Target_Writer
+
+import json
+import os
+import shutil
+import tempfile
+
+_test_targets = """
+    >>> scope = Scaffold.scope (%(p1)s, %(n1)s) # doctest:+ELLIPSIS
+    Creating new scope MOMT__...
+
+    >>> CNDB = scope.CNDB
+    >>> std_fixtures (scope)
+    >>> scope.commit ()
+    >>> tmp  = tempfile.mkdtemp ()
+    >>> def writer () :
+    ...     return CNDB.OMP.Monitoring_Target_Writer (scope, tmp)
+    >>> def show_file (name) :
+    ...     with open (os.path.join (tmp, name)) as f :
+    ...         print (f.read ().replace (tmp, "<dir>").strip ())
+
+    >>> for x in writer ().write_all () :
+    ...     print (x)
+    ('192_168_23_0_24/node2', 'changed')
+    ('Targets', 'changed')
+    >>> show_file ("Targets")
+    *** Targets ***
+    <BLANKLINE>
+    probe = FPing
+    menu = Top
+    title = Network Latency Grapher
+    <BLANKLINE>
+    + 192_168_23_0_24
+    menu = 192_168_23_0_24
+    title = Zone 192_168_23_0_24
+    <BLANKLINE>
+    @include <dir>/192_168_23_0_24/node2.conf
+    >>> show_file ("192_168_23_0_24/node2.conf")
+    ++ node2
+    menu = node2
+    title = node2
+    <BLANKLINE>
+    +++ wr_192_168_23_1
+    menu = wr 192.168.23.1
+    title = node2 wr 192.168.23.1
+    host = 192.168.23.1
+    <BLANKLINE>
+    +++ wl_192_168_23_2
+    menu = wl 192.168.23.2
+    title = node2 wl 192.168.23.2
+    host = 192.168.23.2
+    <BLANKLINE>
+    +++ wr_192_168_23_3
+    menu = wr 192.168.23.3
+    title = node2 wr 192.168.23.3
+    host = 192.168.23.3
+    <BLANKLINE>
+    +++ wl_192_168_23_4
+    menu = wl 192.168.23.4
+    title = node2 wl 192.168.23.4
+    host = 192.168.23.4
+    >>> with open (os.path.join (tmp, "192_168_23_0_24/node2.json")) as f :
+    ...     for tg in json.load (f) :
+    ...         print (sorted (tg ["labels"].items ()), tg ["targets"])
+    [('interface', 'wl'), ('node', 'node2'), ('zone', '192_168_23_0_24')] ['192.168.23.2', '192.168.23.4']
+    [('interface', 'wr'), ('node', 'node2'), ('zone', '192_168_23_0_24')] ['192.168.23.1', '192.168.23.3']
+
+    Without changes, nothing is written
+
+    >>> writer ().write_all ()
+    []
+
+    Putting the network into an `IP_Pool` moves its addresses to the zone
+    of the pool; this change isn't attributed to a node, all targets are
+    read
+
+    >>> net = CNDB.IP4_Network.query (net_address = "192.168.23.0/24").one ()
+    >>> ipp = CNDB.IP4_Pool (name = "housing", raw = True)
+    >>> lnk = CNDB.IP4_Network_in_IP4_Pool (net, ipp)
+    >>> scope.commit ()
+    >>> w = writer ()
+    >>> print (w.changed_nodes (w.state ["last_cid"]))
+    None
+    >>> for x in w.write_all () :
+    ...     print (x)
+    ('housing/node2', 'changed')
+    ('192_168_23_0_24/node2', 'removed')
+    ('Targets', 'changed')
+    >>> sorted (os.listdir (tmp))
+    ['Targets', 'housing', 'targets.state']
+
+    Adding an IPv6 address to an interface only reads the targets of the
+    node of the interface; changes of other objects are ignored
+
+    >>> node2 = CNDB.Node.query (name = "node2").one ()
+    >>> wr    = CNDB.Wired_Interface.query (name = "wr").one ()
+    >>> net6  = CNDB.IP6_Network ("2001:db8::/64", raw = True)
+    >>> lnk6  = CNDB.Net_Interface_in_IP6_Network \\
+    ...     (wr, net6.reserve ("2001:db8::1/128"), mask_len = 64)
+    >>> prs   = scope.PAP.Person ("Max", "Mustermann", raw = True)
+    >>> scope.commit ()
+    >>> w = writer ()
+    >>> w.changed_nodes (w.state ["last_cid"]) == set ([node2.pid])
+    True
+    >>> for x in w.write_all () :
+    ...     print (x)
+    ('2001_db8___64/node2', 'changed')
+    ('Targets', 'changed')
+    >>> show_file ("2001_db8___64/node2.conf")
+    ++ node2
+    menu = node2
+    title = node2
+    <BLANKLINE>
+    +++ wr_2001_db8__1
+    menu = wr 2001:db8::1
+    title = node2 wr 2001:db8::1
+    host = 2001:db8::1
+    probe = FPing6
+
+    Destroying an interface reads all targets, only the changed group is
+    written
+
+    >>> wr.destroy ()
+    >>> scope.commit ()
+    >>> for x in writer ().write_all () :
+    ...     print (x)
+    ('housing/node2', 'changed')
+    ('2001_db8___64/node2', 'removed')
+    ('Targets', 'changed')
+
+    Creating and destroying an interface between two runs reads all
+    targets, too
+
+    >>> dev = CNDB.Net_Device.query (name = "dev").one ()
+    >>> wr2 = CNDB.Wired_Interface (left = dev, name = "wr2", raw = True)
+    >>> scope.commit ()
+    >>> wr2.destroy ()
+    >>> scope.commit ()
+    >>> w = writer ()
+    >>> print (w.changed_nodes (w.state ["last_cid"]))
+    None
+    >>> w.write_all ()
+    []
+
+    >>> shutil.rmtree (tmp)
+
+"""
+
+__test__ = Scaffold.create_test_dict \
+  ( dict
+      ( test_targets = _test_targets
+      )
+  )
+
+### __END__ CNDB.OMP.__test__.Monitoring_Targets
@@ -113,7 +113,7 @@ _test_code = """
     Invariants: Condition `valid_mask_len` : The `mask_len` must match the one of `right` or of any
     network containing `right`. (mask_len in possible_mask_lens)
         mask_len = 22
-        possible_mask_lens = [24, 25, 26, 27, 28, 29, 30, 31, 32] << sorted ( right.ETM.query ( (Q.net_address.CONTAINS (right.net_address))).attr ("net_address.mask_len"))
+        possible_mask_lens = [24, 25, 26, 27, 28, 29, 30, 31, 32] << right.containing_mask_lens ()
         right = 192.168.23.42
         right.net_address = ...
 
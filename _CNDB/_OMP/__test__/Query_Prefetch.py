@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 Dr. Ralf Schlatterbeck All rights reserved
+# Reichergasse 131, A--3411 Weidling, Austria. rsc@runtux.com
+# #*** <License> ************************************************************#
+# This module is part of the package CNDB.OMP.__test__.
+#
+# This module is licensed under the terms of the BSD 3-Clause License
+# <http://www.c-tanzer.at/license/bsd_3c.html>.
+# #*** </License> ***********************************************************#
+#
+#++
+# Name
+#    CNDB.OMP.__test__.Query_Prefetch
+#
+# Purpose
+#    Test prefetching of query attributes
+#
+# Revision Dates
+#    18-Oct-2026 (RS) Creation
+#    ««revision-date»»···
+#--
+
+from   _CNDB._OMP.__test__.model      import *
+from   _CNDB._OMP.__test__.fixtures   import create as std_fixtures
+
+import _CNDB._OMP.Query_Prefetch
+
+_test_prefetch = """
+    >>> scope = Scaffold.scope (%(p1)s, %(n1)s) # doctest:+ELLIPSIS
+    Creating new scope MOMT__...
+
+    >>> CNDB  = scope.CNDB
+    >>> std_fixtures (scope)
+    >>> names = ("my_node", "my_net_device", "my_person", "my_group")
+    >>> def objects () :
+    ...     return sorted \\
+    ...         ( list (CNDB.Node.query ())
+    ...         + list (CNDB.Net_Device.query ())
+    ...         + list (CNDB.Wired_Interface.query ())
+    ...         + list (CNDB.Wireless_Interface.query ())
+    ...         , key = lambda o : o.pid
+    ...         )
+    >>> def values (objs) :
+    ...     return list \\
+    ...         (tuple (getattr (o, n, None) for n in names) for o in objs)
+
+    >>> lazy = values (objects ())
+    >>> CNDB.OMP.Query_Prefetch.valid_for (scope) is None
+    True
+    >>> objs = CNDB.OMP.Query_Prefetch.prefetch (objects (), * names)
+    >>> cache = CNDB.OMP.Query_Prefetch.valid_for (scope)
+    >>> sorted (cache.values)
+    ['my_group', 'my_net_device', 'my_node', 'my_person']
+    >>> len (cache.values ["my_node"]) == len (objs)
+    True
+
+    Objects without a query attribute are ignored for it
+
+    >>> "my_net_device" in objs [0].attributes, objs [0].type_name
+    (False, 'CNDB.Node')
+    >>> objs [0].pid in cache.values ["my_net_device"]
+    False
+    >>> values (objs) == lazy
+    True
+    >>> for v in sorted (set (values (objs)), key = str) :
+    ...     print (v)
+    (CNDB.Node ('node2'), CNDB.Net_Device (('generic', '', ''), ('node2', ), 'dev'), PAP.Person ('schlatterbeck', 'ralf', '', ''), None)
+    (CNDB.Node ('node2'), None, PAP.Person ('schlatterbeck', 'ralf', '', ''), None)
+    (CNDB.Node ('nogps'), None, PAP.Person ('schlatterbeck', 'ralf', '', ''), None)
+
+    Any change invalidates the prefetched values
+
+    >>> node = objs [0].my_node
+    >>> node.set (position = dict (lat = "48.2", lon = "16.3"))
+    1
+    >>> cache.is_valid, CNDB.OMP.Query_Prefetch.valid_for (scope) is None
+    (False, True)
+    >>> values (objects ()) == lazy
+    True
+
+    A rollback invalidates them, too
+
+    >>> objs = CNDB.OMP.Query_Prefetch.prefetch (objects (), * names)
+    >>> cache = CNDB.OMP.Query_Prefetch.valid_for (scope)
+    >>> cache.is_valid
+    True
+    >>> scope.rollback ()
+    >>> cache.is_valid
+    False
+
+"""
+
+__test__ = Scaffold.create_test_dict \
+  ( dict
+      ( test_prefetch = _test_prefetch
+      )
+  )
+
+### __END__ CNDB.OMP.__test__.Query_Prefetch
@@ -31,6 +31,8 @@
 #    20-Jun-2014 (RS) Re-add `IP_Network.pool`
 #    23-Jun-2014 (RS) Make tests run after model changes
 #     4-Jul-2014 (RS) Added `Id_Entity_permits_Group`
+#    18-Oct-2026 (RS) Add test for address counters of `IP4_Network`
+#    18-Oct-2026 (RS) Add `test_changes`, `Scaffold_Auth`
 #    ««revision-date»»···
 #--
 
@@ -40,6 +42,7 @@ from   _GTW.__test__.rst_harness  import *
 from   _GTW.__test__              import rst_harness
 
 import _CNDB._OMP.import_CNDB
+import _CNDB._OMP.RST_Api_addons
 import _GTW._OMP._Auth.import_Auth
 import _GTW._OMP._PAP.import_PAP
 
@@ -47,14 +50,22 @@ import _GTW._RST._MOM.Client
 
 import json
 
-def run_server (db_url = "hps://", db_name = None) :
-    return rst_harness.run_server ("_CNDB._OMP.__test__.RST", db_url, db_name)
+def run_server \
+        (db_url = "hps://", db_name = None, scaffold_name = "Scaffold") :
+    return rst_harness.run_server \
+        ("_CNDB._OMP.__test__.RST", db_url, db_name, scaffold_name)
 # end def run_server
 
 class CNDB_RST_Test_Command (GTW_RST_Test_Command) :
 
     ANS                     = CNDB
 
+    def create_rst (self, cmd, ** kw) :
+        result = self.__super.create_rst (cmd, ** kw)
+        result.add_entries (CNDB.OMP.RST_Change_Feed (name = "changes"))
+        return result
+    # end def create_rst
+
     def fixtures (self, scope) :
         from _CNDB._OMP.__test__.fixtures import create
         create (scope)
@@ -70,7 +81,24 @@ class CNDB_RST_Test_Command (GTW_RST_Test_Command) :
 
 # end class CNDB_RST_Test_Command
 
-Scaffold   = CNDB_RST_Test_Command ()
+class CNDB_RST_Test_Command_Auth (CNDB_RST_Test_Command) :
+
+    def fixtures (self, scope) :
+        self.__super.fixtures (scope)
+        Auth = scope.Auth
+        Auth.Account.create_new_account_x \
+            ( "admin@ff.example", "admin", enabled = True, suspended = False
+            , superuser = True
+            )
+        Auth.Account.create_new_account_x \
+            ("user@ff.example", "user", enabled = True, suspended = False)
+        scope.commit ()
+    # end def fixtures
+
+# end class CNDB_RST_Test_Command_Auth
+
+Scaffold      = CNDB_RST_Test_Command ()
+Scaffold_Auth = CNDB_RST_Test_Command_Auth ()
 
 ### «text» ### The doctest follows::
 
@@ -213,7 +241,7 @@ _test_limit = r"""
                                           , 'name' : 'generic'
                                           , 'revision' : ''
                                           }
-                                      , 'cid' : 34
+                                      , 'cid' : 42
                                       , 'pid' : 27
                                       , 'type_name' : 'CNDB.Net_Device_Type'
                                       , 'url' : '/v1/CNDB-Net_Device_Type/27'
@@ -228,7 +256,7 @@ _test_limit = r"""
                                                   , 'street' : 'beispiel 23'
                                                   , 'zip' : '1010'
                                                   }
-                                              , 'cid' : 42
+                                              , 'cid' : 50
                                               , 'pid' : 35
                                               , 'type_name' : 'PAP.Address'
                                               , 'url' : '/v1/PAP-Address/35'
@@ -255,13 +283,13 @@ _test_limit = r"""
                                               , 'lon' : 15.8744
                                               }
                                           }
-                                      , 'cid' : 43
+                                      , 'cid' : 51
                                       , 'pid' : 3
                                       , 'type_name' : 'CNDB.Node'
                                       , 'url' : '/v1/CNDB-Node/3'
                                       }
                                   }
-                              , 'cid' : 35
+                              , 'cid' : 43
                               , 'pid' : 28
                               , 'type_name' : 'CNDB.Net_Device'
                               , 'url' : '/v1/CNDB-Net_Device/28'
@@ -269,7 +297,7 @@ _test_limit = r"""
                           , 'mac_address' : ''
                           , 'name' : 'wr'
                           }
-                      , 'cid' : 36
+                      , 'cid' : 44
                       , 'pid' : 29
                       , 'type_name' : 'CNDB.Wired_Interface'
                       , 'url' : '/v1/CNDB-Wired_Interface/29'
@@ -287,19 +315,19 @@ _test_limit = r"""
                                       , 'url' : '/v1/CNDB-IP4_Network/4'
                                       }
                                   }
-                              , 'cid' : 4
+                              , 'cid' : 41
                               , 'pid' : 4
                               , 'type_name' : 'CNDB.IP4_Network'
                               , 'url' : '/v1/CNDB-IP4_Network/4'
                               }
                           }
-                      , 'cid' : 21
+                      , 'cid' : 22
                       , 'pid' : 20
                       , 'type_name' : 'CNDB.IP4_Network'
                       , 'url' : '/v1/CNDB-IP4_Network/20'
                       }
                   }
-              , 'cid' : 38
+              , 'cid' : 46
               , 'pid' : 31
               , 'type_name' : 'CNDB.Wired_Interface_in_IP4_Network'
               , 'url' : '/v1/CNDB-Net_Interface_in_IP4_Network/31'
@@ -330,7 +358,7 @@ _test_limit = r"""
                                           , 'name' : 'generic'
                                           , 'revision' : ''
                                           }
-                                      , 'cid' : 34
+                                      , 'cid' : 42
                                       , 'creation' : {'date' : <datetime>}
                                       , 'last_change' : {'date' : <datetime>}
                                       , 'pid' : 27
@@ -347,7 +375,7 @@ _test_limit = r"""
                                                   , 'street' : 'beispiel 23'
                                                   , 'zip' : '1010'
                                                   }
-                                              , 'cid' : 42
+                                              , 'cid' : 50
                                               , 'creation' : {'date' : <datetime>}
                                               , 'last_change' : {'date' : <datetime>}
                                               , 'pid' : 35
@@ -378,7 +406,7 @@ _test_limit = r"""
                                               , 'lon' : 15.8744
                                               }
                                           }
-                                      , 'cid' : 43
+                                      , 'cid' : 51
                                       , 'creation' : {'date' : <datetime>}
                                       , 'last_change' : {'date' : <datetime>}
                                       , 'pid' : 3
@@ -386,7 +414,7 @@ _test_limit = r"""
                                       , 'url' : '/v1/CNDB-Node/3'
                                       }
                                   }
-                              , 'cid' : 35
+                              , 'cid' : 43
                               , 'creation' : {'date' : <datetime>}
                               , 'last_change' : {'date' : <datetime>}
                               , 'pid' : 28
@@ -396,7 +424,7 @@ _test_limit = r"""
                           , 'mac_address' : ''
                           , 'name' : 'wr'
                           }
-                      , 'cid' : 36
+                      , 'cid' : 44
                       , 'creation' : {'date' : <datetime>}
                       , 'last_change' : {'date' : <datetime>}
                       , 'pid' : 29
@@ -416,7 +444,7 @@ _test_limit = r"""
                                       , 'url' : '/v1/CNDB-IP4_Network/4'
                                       }
                                   }
-                              , 'cid' : 4
+                              , 'cid' : 41
                               , 'creation' : {'date' : <datetime>}
                               , 'last_change' : {'date' : <datetime>}
                               , 'pid' : 4
@@ -424,7 +452,7 @@ _test_limit = r"""
                               , 'url' : '/v1/CNDB-IP4_Network/4'
                               }
                           }
-                      , 'cid' : 21
+                      , 'cid' : 22
                       , 'creation' : {'date' : <datetime>}
                       , 'last_change' : {'date' : <datetime>}
                       , 'pid' : 20
@@ -432,7 +460,7 @@ _test_limit = r"""
                       , 'url' : '/v1/CNDB-IP4_Network/20'
                       }
                   }
-              , 'cid' : 38
+              , 'cid' : 46
               , 'creation' : {'date' : <datetime>}
               , 'last_change' : {'date' : <datetime>}
               , 'pid' : 31
@@ -455,7 +483,7 @@ _test_limit = r"""
             , 'mac_address' : ''
             , 'name' : 'wr'
             }
-        , 'cid' : 36
+        , 'cid' : 44
         , 'pid' : 29
         , 'rels' :
             [ '/v1/CNDB-Wired_Interface/29/documents'
@@ -475,7 +503,7 @@ _test_limit = r"""
     >>> r = show (R.get ("/v1/CNDB-Wired_Interface/29?verbose&fields=name&order_by=pid&limit=1"), cleaner = date_cleaner)
     { 'json' :
         { 'attributes' : {'name' : 'wr'}
-        , 'cid' : 36
+        , 'cid' : 44
         , 'pid' : 29
         , 'rels' :
             [ '/v1/CNDB-Wired_Interface/29/documents'
@@ -501,7 +529,7 @@ _test_limit = r"""
                 }
             , 'name' : 'wr'
             }
-        , 'cid' : 36
+        , 'cid' : 44
         , 'pid' : 29
         , 'rels' :
             [ '/v1/CNDB-Wired_Interface/29/documents'
@@ -532,7 +560,7 @@ _test_limit = r"""
                 }
             , 'name' : 'wr'
             }
-        , 'cid' : 36
+        , 'cid' : 44
         , 'pid' : 29
         , 'rels' :
             [ '/v1/CNDB-Wired_Interface/29/documents'
@@ -571,7 +599,7 @@ _test_limit = r"""
                       }
                   , 'name' : 'wr'
                   }
-              , 'cid' : 36
+              , 'cid' : 44
               , 'pid' : 29
               , 'type_name' : 'CNDB.Wired_Interface'
               , 'url' : '/v1/CNDB-Wired_Interface/29'
@@ -582,6 +610,36 @@ _test_limit = r"""
     , 'url' : 'http://localhost:9999/v1/CNDB-Wired_Interface?verbose&add_fields=my_node&order_by=pid&limit=1'
     }
 
+    >>> r = show (R.get ("/v1/CNDB-IP4_Network/4?verbose&add_fields=addresses_allocated,addresses_cooling,addresses_free,largest_free"))
+    { 'json' :
+        { 'attributes' :
+            { 'addresses_allocated' : 4
+            , 'addresses_cooling' : 0
+            , 'addresses_free' : 252
+            , 'largest_free' : 25
+            , 'net_address' : '192.168.23.0/24'
+            , 'pool' :
+                { 'pid' : 4
+                , 'url' : '/v1/CNDB-IP4_Network/4'
+                }
+            }
+        , 'cid' : 41
+        , 'pid' : 4
+        , 'rels' :
+            [ '/v1/CNDB-IP4_Network/4/documents'
+            , '/v1/CNDB-IP4_Network/4/group_links'
+            , '/v1/CNDB-IP4_Network/4/ip_pool_links'
+            , '/v1/CNDB-IP4_Network/4/virtual_wireless_interface_links'
+            , '/v1/CNDB-IP4_Network/4/wired_interface_links'
+            , '/v1/CNDB-IP4_Network/4/wireless_interface_links'
+            ]
+        , 'type_name' : 'CNDB.IP4_Network'
+        , 'url' : '/v1/CNDB-IP4_Network/4'
+        }
+    , 'status' : 200
+    , 'url' : 'http://localhost:9999/v1/CNDB-IP4_Network/4?verbose&add_fields=addresses_allocated,addresses_cooling,addresses_free,largest_free'
+    }
+
 """
 
 def show_by_pid (ETM) :
@@ -731,7 +789,7 @@ _test_put = r"""
                 , 'url' : '/v1/PAP-Person/1'
                 }
             }
-        , 'cid' : 44
+        , 'cid' : 52
         , 'pid' : 2
         , 'type_name' : 'CNDB.Node'
         , 'url' : '/v1/CNDB-Node/2'
@@ -747,7 +805,7 @@ _test_put = r"""
             , 'name' : 'nogps'
             , 'owner' : 1
             }
-        , 'cid' : 44
+        , 'cid' : 52
         , 'pid' : 2
         , 'rels' :
             [ '/v1/CNDB-Node/2/documents'
@@ -782,7 +840,7 @@ _test_put = r"""
                 , 'url' : '/v1/PAP-Person/1'
                 }
             }
-        , 'cid' : 45
+        , 'cid' : 53
         , 'pid' : 2
         , 'type_name' : 'CNDB.Node'
         , 'url' : '/v1/CNDB-Node/2'
@@ -810,7 +868,7 @@ _test_put = r"""
             , 'middle_name' : 'The'
             , 'title' : ''
             }
-        , 'cid' : 46
+        , 'cid' : 54
         , 'pid' : 36
         , 'type_name' : 'PAP.Person'
         , 'url' : '/v1/PAP-Person/36'
@@ -840,7 +898,7 @@ _test_put = r"""
                 , 'url' : '/v1/PAP-Person/1'
                 }
             }
-        , 'cid' : 47
+        , 'cid' : 55
         , 'pid' : 2
         , 'type_name' : 'CNDB.Node'
         , 'url' : '/v1/CNDB-Node/2'
@@ -856,7 +914,7 @@ _test_put = r"""
     ...     )
     ... )
     >>> s4 = show (requests.put (p, data=cargo_c, headers=headers))
-    { 'json' : {'error' : 'Cid mismatch: requested cid = 45, current cid = 47'}
+    { 'json' : {'error' : 'Cid mismatch: requested cid = 53, current cid = 55'}
     , 'status' : 409
     , 'url' : 'http://localhost:9999/v1/CNDB-Node/2'
     }
@@ -881,7 +939,7 @@ _test_put = r"""
                 , 'url' : '/v1/PAP-Person/36'
                 }
             }
-        , 'cid' : 48
+        , 'cid' : 56
         , 'pid' : 2
         , 'type_name' : 'CNDB.Node'
         , 'url' : '/v1/CNDB-Node/2'
@@ -892,9 +950,77 @@ _test_put = r"""
 
 """
 
+_test_changes = r"""
+    >>> server = run_server (%(p1)s, %(n1)s, "Scaffold_Auth")
+    >>> admin  = ("admin@ff.example", "admin")
+    >>> user   = ("user@ff.example", "user")
+
+    The change feed is available to superusers only
+
+    >>> r = show (R.get ("/changes?after=49&limit=1"))
+    { 'json' : {'description' : 'Unauthorized'}
+    , 'status' : 401
+    , 'url' : 'http://localhost:9999/changes?after=49&limit=1'
+    }
+    >>> r = show (R.get ("/changes?after=49&limit=1", auth = user))
+    { 'json' : {'description' : 'Forbidden'}
+    , 'status' : 403
+    , 'url' : 'http://localhost:9999/changes?after=49&limit=1'
+    }
+
+    >>> r = show (R.get ("/changes?after=49&limit=1", auth = admin))
+    { 'json' :
+        { 'entries' :
+            [ { 'attrs' :
+                  [ 'city'
+                  , 'country'
+                  , 'street'
+                  , 'zip'
+                  ]
+              , 'cid' : 50
+              , 'op' : 'Create'
+              , 'pid' : 35
+              , 'type' : 'PAP.Address'
+              }
+            ]
+        , 'last_cid' : 50
+        }
+    , 'status' : 200
+    , 'url' : 'http://localhost:9999/changes?after=49&limit=1'
+    }
+
+    >>> headers = { "Accept" : "application/x-ndjson" }
+    >>> r = R.get ("/changes?after=49&limit=2", headers = headers, auth = admin)
+    >>> print (r.headers ["content-type"])
+    application/x-ndjson
+    >>> print (pyk.decoded (r.content).strip ())
+    {"attrs":["city","country","street","zip"],"cid":50,"op":"Create","pid":35,"type":"PAP.Address"}
+    {"attrs":["address"],"cid":51,"op":"Modify","pid":3,"type":"CNDB.Node"}
+
+    >>> r = show (R.get ("/changes?after=1000&wait=0.1", auth = admin))
+    { 'json' :
+        { 'entries' : []
+        , 'last_cid' : 1000
+        }
+    , 'status' : 200
+    , 'url' : 'http://localhost:9999/changes?after=1000&wait=0.1'
+    }
+
+    >>> r = show (R.get ("/changes?after=foo", auth = admin))
+    { 'json' :
+        { 'description' : 'Bad request'
+        , 'message' : "invalid literal for int() with base 10: 'foo'"
+        }
+    , 'status' : 400
+    , 'url' : 'http://localhost:9999/changes?after=foo'
+    }
+
+"""
+
 __test__ = Scaffold.create_test_dict \
     ( dict
-        ( test_get         = _test_get
+        ( test_changes     = _test_changes
+        , test_get         = _test_get
         , test_limit       = _test_limit
         , test_local_query = _test_local_query
         , test_put         = _test_put
@@ -38,6 +38,7 @@
 #    12-Mar-2015 (CT) Adapt to sqlalchemy 0.9.8
 #    12-Mar-2015 (CT) Fix `formatted_table` otuput for `IP[46]_Network`
 #                     * postgresql: `IP_Network.pool`, not `IP_Network.node`
+#    18-Oct-2026 (RS) Add range indices to `test_cidr_sq`
 #    ««revision-date»»···
 #--
 
@@ -208,7 +209,12 @@ _test_cidr_sq = """
     >>> print (CNDB.IP6_Network.query (Q.net_address == "2001:db8::20"))
     SQL: SELECT
            cndb_ip6_network."desc" AS cndb_ip6_network_desc,
+           cndb_ip6_network.addresses_allocated AS cndb_ip6_network_addresses_allocated,
+           cndb_ip6_network.addresses_cooling AS cndb_ip6_network_addresses_cooling,
+           cndb_ip6_network.addresses_free AS cndb_ip6_network_addresses_free,
+           cndb_ip6_network.alloc_version AS cndb_ip6_network_alloc_version,
            cndb_ip6_network.expiration_date AS cndb_ip6_network_expiration_date,
+           cndb_ip6_network.largest_free AS cndb_ip6_network_largest_free,
            cndb_ip6_network.net_address AS cndb_ip6_network_net_address,
            cndb_ip6_network.net_address__mask_len AS cndb_ip6_network_net_address__mask_len,
            cndb_ip6_network.net_address__numeric__hi AS cndb_ip6_network_net_address__numeric__hi,
@@ -231,8 +237,13 @@ _test_cidr_sq = """
             AND cndb_ip6_network.net_address__mask_len = :net_address__mask_len_1
 
     >>> print (formatted_table (CNDB.IP4_Network._SAW.sa_table, nl, ""))
+    Column addresses_allocated       : Bigint               Internal Int addresses_allocated
+    Column addresses_cooling         : Bigint               Internal Int addresses_cooling
+    Column addresses_free            : Bigint               Internal Int addresses_free
+    Column alloc_version             : Bigint               Internal Int alloc_version
     Column desc                      : Varchar(80)          Optional String desc
     Column expiration_date           : Datetime             Internal__Structured Date-Time expiration_date
+    Column largest_free              : Integer              Internal Int largest_free
     Column net_address               : Varchar              Primary IP4-network net_address
     Column net_address__mask_len     : Smallint             ----------
     Column net_address__numeric      : Integer              ----------
@@ -243,8 +254,13 @@ _test_cidr_sq = """
     Column pool                      : Integer              Optional__Id_Entity_Reference__Computed_Set Entity pool Id_Entity()
 
     >>> print (formatted_table (CNDB.IP6_Network._SAW.sa_table, nl, ""))
+    Column addresses_allocated       : Bigint               Internal Int addresses_allocated
+    Column addresses_cooling         : Bigint               Internal Int addresses_cooling
+    Column addresses_free            : Bigint               Internal Int addresses_free
+    Column alloc_version             : Bigint               Internal Int alloc_version
     Column desc                      : Varchar(80)          Optional String desc
     Column expiration_date           : Datetime             Internal__Structured Date-Time expiration_date
+    Column largest_free              : Integer              Internal Int largest_free
     Column net_address               : Varchar              Primary IP6-network net_address
     Column net_address__mask_len     : Smallint             ----------
     Column net_address__numeric__hi  : Bigint               ----------
@@ -260,7 +276,12 @@ _test_cidr_sq = """
     >>> show_query (CNDB.IP4_Network.query ((Q.net_address.CONTAINS ("192.168.23.1")) & (Q.electric == False)))
     SQL: SELECT
            cndb_ip4_network."desc" AS cndb_ip4_network_desc,
+           cndb_ip4_network.addresses_allocated AS cndb_ip4_network_addresses_allocated,
+           cndb_ip4_network.addresses_cooling AS cndb_ip4_network_addresses_cooling,
+           cndb_ip4_network.addresses_free AS cndb_ip4_network_addresses_free,
+           cndb_ip4_network.alloc_version AS cndb_ip4_network_alloc_version,
            cndb_ip4_network.expiration_date AS cndb_ip4_network_expiration_date,
+           cndb_ip4_network.largest_free AS cndb_ip4_network_largest_free,
            cndb_ip4_network.net_address AS cndb_ip4_network_net_address,
            cndb_ip4_network.net_address__mask_len AS cndb_ip4_network_net_address__mask_len,
            cndb_ip4_network.net_address__numeric AS cndb_ip4_network_net_address__numeric,
@@ -288,7 +309,12 @@ _test_cidr_sq = """
     >>> show_query (CNDB.IP4_Network.query ().order_by ("-net_address.mask_len", "net_address"))
     SQL: SELECT
            cndb_ip4_network."desc" AS cndb_ip4_network_desc,
+           cndb_ip4_network.addresses_allocated AS cndb_ip4_network_addresses_allocated,
+           cndb_ip4_network.addresses_cooling AS cndb_ip4_network_addresses_cooling,
+           cndb_ip4_network.addresses_free AS cndb_ip4_network_addresses_free,
+           cndb_ip4_network.alloc_version AS cndb_ip4_network_alloc_version,
            cndb_ip4_network.expiration_date AS cndb_ip4_network_expiration_date,
+           cndb_ip4_network.largest_free AS cndb_ip4_network_largest_free,
            cndb_ip4_network.net_address AS cndb_ip4_network_net_address,
            cndb_ip4_network.net_address__mask_len AS cndb_ip4_network_net_address__mask_len,
            cndb_ip4_network.net_address__numeric AS cndb_ip4_network_net_address__numeric,
@@ -309,7 +335,12 @@ _test_cidr_sq = """
     >>> show_query (CNDB.IP4_Network.query ().order_by ("electric", "-has_children", "net_address"))
     SQL: SELECT
            cndb_ip4_network."desc" AS cndb_ip4_network_desc,
+           cndb_ip4_network.addresses_allocated AS cndb_ip4_network_addresses_allocated,
+           cndb_ip4_network.addresses_cooling AS cndb_ip4_network_addresses_cooling,
+           cndb_ip4_network.addresses_free AS cndb_ip4_network_addresses_free,
+           cndb_ip4_network.alloc_version AS cndb_ip4_network_alloc_version,
            cndb_ip4_network.expiration_date AS cndb_ip4_network_expiration_date,
+           cndb_ip4_network.largest_free AS cndb_ip4_network_largest_free,
            cndb_ip4_network.net_address AS cndb_ip4_network_net_address,
            cndb_ip4_network.net_address__mask_len AS cndb_ip4_network_net_address__mask_len,
            cndb_ip4_network.net_address__numeric AS cndb_ip4_network_net_address__numeric,
@@ -328,6 +359,19 @@ _test_cidr_sq = """
            LEFT OUTER JOIN cndb_ip4_network AS cndb_ip4_network__1 ON cndb_ip4_network__1.parent = cndb_ip4_network.pid
          ORDER BY mom_id_entity.electric, cndb_ip4_network__1.parent IS NOT NULL DESC, cndb_ip4_network.net_address__numeric, cndb_ip4_network.net_address__mask_len
 
+    The range indices of `net_address` cover the accidental columns
+    compared by `CONTAINS` and `IN`:
+
+    >>> import _CNDB._OMP.SAW
+    >>> for ET in (CNDB.IP4_Network.E_Type, CNDB.IP6_Network.E_Type) :
+    ...     for i in CNDB.OMP.SAW.range_indices (ET._SAW.sa_table) :
+    ...         print (i.name)
+    ...         print ("   ", ", ".join (c.name for c in i.columns))
+    cndb_ip4_network__net_address__range
+        net_address__numeric, net_address__upper_bound, net_address__mask_len
+    cndb_ip6_network__net_address__range
+        net_address__numeric__hi, net_address__numeric__lo, net_address__upper_bound__hi, net_address__upper_bound__lo, net_address__mask_len
+
 """
 
 _test_q_able = """
@@ -598,12 +642,17 @@ _test_q_able = """
       <SAW : Surrogate `pid` [mom_id_entity.pid]>
       <SAW : String `type_name` [mom_id_entity.type_name]>
     <SAW : CNDB.IP_Network [mom_id_entity]>
+      <SAW : Int `addresses_allocated` (CNDB.IP4_Network | CNDB.IP6_Network)>
+      <SAW : Int `addresses_cooling` (CNDB.IP4_Network | CNDB.IP6_Network)>
+      <SAW : Int `addresses_free` (CNDB.IP4_Network | CNDB.IP6_Network)>
+      <SAW : Int `alloc_version` (CNDB.IP4_Network | CNDB.IP6_Network)>
       <SAW : Rev_Ref `creation`>
       <SAW : String `desc` (CNDB.IP4_Network | CNDB.IP6_Network)>
       <SAW : Link_Ref_List `documents`>
       <SAW : Date-Time `expiration_date` (CNDB.IP4_Network | CNDB.IP6_Network)>
       <SAW : Boolean `has_children`>
       <SAW : Boolean `is_free`>
+      <SAW : Int `largest_free` (CNDB.IP4_Network | CNDB.IP6_Network)>
       <SAW : Rev_Ref `last_change`>
       <SAW : Int `last_cid` [mom_id_entity.last_cid]>
       <SAW : None `net_address` (CNDB.IP4_Network | CNDB.IP6_Network)>
@@ -651,6 +700,10 @@ _test_q_able = """
       <SAW : Surrogate `pid` [mom_id_entity.pid]>
       <SAW : String `type_name` [mom_id_entity.type_name]>
     <SAW : CNDB.IP4_Network [cndb_ip4_network : mom_id_entity]>
+      <SAW : Int `addresses_allocated` [cndb_ip4_network.addresses_allocated]>
+      <SAW : Int `addresses_cooling` [cndb_ip4_network.addresses_cooling]>
+      <SAW : Int `addresses_free` [cndb_ip4_network.addresses_free]>
+      <SAW : Int `alloc_version` [cndb_ip4_network.alloc_version]>
       <SAW : Rev_Ref `creation`>
       <SAW : String `desc` [cndb_ip4_network.desc]>
       <SAW : Link_Ref_List `documents`>
@@ -664,6 +717,7 @@ _test_q_able = """
       <SAW : Boolean `has_children`>
       <SAW : Role_Ref `ip_pool`>
       <SAW : Boolean `is_free`>
+      <SAW : Int `largest_free` [cndb_ip4_network.largest_free]>
       <SAW : Rev_Ref `last_change`>
       <SAW : Int `last_cid` [mom_id_entity.last_cid]>
       <SAW : IP4-network `net_address` ...
@@ -677,6 +731,7 @@ _test_q_able = """
       <SAW : Role_Ref `wired_interface`>
       <SAW : Role_Ref `wireless_interface`>
     <SAW : CNDB.IP_Pool [mom_id_entity]>
+      <SAW : ip-allocation-strategy `allocation_strategy` (CNDB.IP4_Pool | CNDB.IP6_Pool)>
       <SAW : Time Delta `cool_down_period` (CNDB.IP4_Pool | CNDB.IP6_Pool)>
       <SAW : Rev_Ref `creation`>
       <SAW : Link_Ref_List `documents`>
@@ -688,7 +743,10 @@ _test_q_able = """
       <SAW : Entity `node` (CNDB.IP4_Pool | CNDB.IP6_Pool)>
       <SAW : Surrogate `pid` [mom_id_entity.pid]>
       <SAW : String `type_name` [mom_id_entity.type_name]>
+      <SAW : Int `warm_blocks` (CNDB.IP4_Pool | CNDB.IP6_Pool)>
+      <SAW : Int `warm_mask_len` (CNDB.IP4_Pool | CNDB.IP6_Pool)>
     <SAW : CNDB.IP4_Pool [cndb_ip4_pool : mom_id_entity]>
+      <SAW : ip-allocation-strategy `allocation_strategy` [cndb_ip4_pool.allocation_strategy]>
       <SAW : Time Delta `cool_down_period` [cndb_ip4_pool.cool_down_period]>
       <SAW : Rev_Ref `creation`>
       <SAW : Link_Ref_List `documents`>
@@ -702,6 +760,8 @@ _test_q_able = """
       <SAW : Entity `node` [cndb_ip4_pool.node]>
       <SAW : Surrogate `pid` [mom_id_entity.pid]>
       <SAW : String `type_name` [mom_id_entity.type_name]>
+      <SAW : Int `warm_blocks` [cndb_ip4_pool.warm_blocks]>
+      <SAW : Int `warm_mask_len` [cndb_ip4_pool.warm_mask_len]>
     <SAW : CNDB.IP6_DNS_Alias [cndb_ip6_dns_alias : mom_id_entity]>
       <SAW : Rev_Ref `creation`>
       <SAW : Link_Ref_List `documents`>
@@ -712,6 +772,10 @@ _test_q_able = """
       <SAW : Surrogate `pid` [mom_id_entity.pid]>
       <SAW : String `type_name` [mom_id_entity.type_name]>
     <SAW : CNDB.IP6_Network [cndb_ip6_network : mom_id_entity]>
+      <SAW : Int `addresses_allocated` [cndb_ip6_network.addresses_allocated]>
+      <SAW : Int `addresses_cooling` [cndb_ip6_network.addresses_cooling]>
+      <SAW : Int `addresses_free` [cndb_ip6_network.addresses_free]>
+      <SAW : Int `alloc_version` [cndb_ip6_network.alloc_version]>
       <SAW : Rev_Ref `creation`>
       <SAW : String `desc` [cndb_ip6_network.desc]>
       <SAW : Link_Ref_List `documents`>
@@ -725,6 +789,7 @@ _test_q_able = """
       <SAW : Boolean `has_children`>
       <SAW : Role_Ref `ip_pool`>
       <SAW : Boolean `is_free`>
+      <SAW : Int `largest_free` [cndb_ip6_network.largest_free]>
       <SAW : Rev_Ref `last_change`>
       <SAW : Int `last_cid` [mom_id_entity.last_cid]>
       <SAW : IP6-network `net_address` ...
@@ -738,6 +803,7 @@ _test_q_able = """
       <SAW : Role_Ref `wired_interface`>
       <SAW : Role_Ref `wireless_interface`>
     <SAW : CNDB.IP6_Pool [cndb_ip6_pool : mom_id_entity]>
+      <SAW : ip-allocation-strategy `allocation_strategy` [cndb_ip6_pool.allocation_strategy]>
       <SAW : Time Delta `cool_down_period` [cndb_ip6_pool.cool_down_period]>
       <SAW : Rev_Ref `creation`>
       <SAW : Link_Ref_List `documents`>
@@ -751,6 +817,8 @@ _test_q_able = """
       <SAW : Entity `node` [cndb_ip6_pool.node]>
       <SAW : Surrogate `pid` [mom_id_entity.pid]>
       <SAW : String `type_name` [mom_id_entity.type_name]>
+      <SAW : Int `warm_blocks` [cndb_ip6_pool.warm_blocks]>
+      <SAW : Int `warm_mask_len` [cndb_ip6_pool.warm_mask_len]>
     <SAW : CNDB._Net_Credentials_ [mom_id_entity]>
       <SAW : Rev_Ref `creation`>
       <SAW : Link_Ref_List `documents`>
@@ -1219,7 +1287,9 @@ _test_q_able = """
       <SAW : Surrogate `pid` [mom_id_entity.pid]>
       <SAW : IP_Network `right` [cndb_net_interface_in_ip_network.right]>
       <SAW : String `type_name` [mom_id_entity.type_name]>
-    <BLANKLINE>
+
+
+
 
 """
 
@@ -2556,7 +2626,12 @@ _test_q_result_sq = """
     >>> show_query (CNDB.IP4_Network.query (Q.has_children))
     SQL: SELECT
            cndb_ip4_network."desc" AS cndb_ip4_network_desc,
+           cndb_ip4_network.addresses_allocated AS cndb_ip4_network_addresses_allocated,
+           cndb_ip4_network.addresses_cooling AS cndb_ip4_network_addresses_cooling,
+           cndb_ip4_network.addresses_free AS cndb_ip4_network_addresses_free,
+           cndb_ip4_network.alloc_version AS cndb_ip4_network_alloc_version,
            cndb_ip4_network.expiration_date AS cndb_ip4_network_expiration_date,
+           cndb_ip4_network.largest_free AS cndb_ip4_network_largest_free,
            cndb_ip4_network.net_address AS cndb_ip4_network_net_address,
            cndb_ip4_network.net_address__mask_len AS cndb_ip4_network_net_address__mask_len,
            cndb_ip4_network.net_address__numeric AS cndb_ip4_network_net_address__numeric,
@@ -2578,7 +2653,12 @@ _test_q_result_sq = """
     >>> show_query (CNDB.IP4_Network.query (~ Q.has_children))
     SQL: SELECT
            cndb_ip4_network."desc" AS cndb_ip4_network_desc,
+           cndb_ip4_network.addresses_allocated AS cndb_ip4_network_addresses_allocated,
+           cndb_ip4_network.addresses_cooling AS cndb_ip4_network_addresses_cooling,
+           cndb_ip4_network.addresses_free AS cndb_ip4_network_addresses_free,
+           cndb_ip4_network.alloc_version AS cndb_ip4_network_alloc_version,
            cndb_ip4_network.expiration_date AS cndb_ip4_network_expiration_date,
+           cndb_ip4_network.largest_free AS cndb_ip4_network_largest_free,
            cndb_ip4_network.net_address AS cndb_ip4_network_net_address,
            cndb_ip4_network.net_address__mask_len AS cndb_ip4_network_net_address__mask_len,
            cndb_ip4_network.net_address__numeric AS cndb_ip4_network_net_address__numeric,
@@ -2600,7 +2680,12 @@ _test_q_result_sq = """
     >>> show_query (CNDB.IP4_Network.query (Q.expiration_date == None))
     SQL: SELECT
            cndb_ip4_network."desc" AS cndb_ip4_network_desc,
+           cndb_ip4_network.addresses_allocated AS cndb_ip4_network_addresses_allocated,
+           cndb_ip4_network.addresses_cooling AS cndb_ip4_network_addresses_cooling,
+           cndb_ip4_network.addresses_free AS cndb_ip4_network_addresses_free,
+           cndb_ip4_network.alloc_version AS cndb_ip4_network_alloc_version,
            cndb_ip4_network.expiration_date AS cndb_ip4_network_expiration_date,
+           cndb_ip4_network.largest_free AS cndb_ip4_network_largest_free,
            cndb_ip4_network.net_address AS cndb_ip4_network_net_address,
            cndb_ip4_network.net_address__mask_len AS cndb_ip4_network_net_address__mask_len,
            cndb_ip4_network.net_address__numeric AS cndb_ip4_network_net_address__numeric,
@@ -2621,7 +2706,12 @@ _test_q_result_sq = """
     >>> show_query (CNDB.IP4_Network.query (~ Q.expiration_date))
     SQL: SELECT
            cndb_ip4_network."desc" AS cndb_ip4_network_desc,
+           cndb_ip4_network.addresses_allocated AS cndb_ip4_network_addresses_allocated,
+           cndb_ip4_network.addresses_cooling AS cndb_ip4_network_addresses_cooling,
+           cndb_ip4_network.addresses_free AS cndb_ip4_network_addresses_free,
+           cndb_ip4_network.alloc_version AS cndb_ip4_network_alloc_version,
            cndb_ip4_network.expiration_date AS cndb_ip4_network_expiration_date,
+           cndb_ip4_network.largest_free AS cndb_ip4_network_largest_free,
            cndb_ip4_network.net_address AS cndb_ip4_network_net_address,
            cndb_ip4_network.net_address__mask_len AS cndb_ip4_network_net_address__mask_len,
            cndb_ip4_network.net_address__numeric AS cndb_ip4_network_net_address__numeric,
@@ -2642,7 +2732,12 @@ _test_q_result_sq = """
     >>> show_query (CNDB.IP4_Network.query (Q.net_interface == None))
     SQL: SELECT
            cndb_ip4_network."desc" AS cndb_ip4_network_desc,
+           cndb_ip4_network.addresses_allocated AS cndb_ip4_network_addresses_allocated,
+           cndb_ip4_network.addresses_cooling AS cndb_ip4_network_addresses_cooling,
+           cndb_ip4_network.addresses_free AS cndb_ip4_network_addresses_free,
+           cndb_ip4_network.alloc_version AS cndb_ip4_network_alloc_version,
            cndb_ip4_network.expiration_date AS cndb_ip4_network_expiration_date,
+           cndb_ip4_network.largest_free AS cndb_ip4_network_largest_free,
            cndb_ip4_network.net_address AS cndb_ip4_network_net_address,
            cndb_ip4_network.net_address__mask_len AS cndb_ip4_network_net_address__mask_len,
            cndb_ip4_network.net_address__numeric AS cndb_ip4_network_net_address__numeric,
@@ -2665,7 +2760,12 @@ _test_q_result_sq = """
     >>> show_query (CNDB.IP4_Network.query (~ Q.net_interface))
     SQL: SELECT
            cndb_ip4_network."desc" AS cndb_ip4_network_desc,
+           cndb_ip4_network.addresses_allocated AS cndb_ip4_network_addresses_allocated,
+           cndb_ip4_network.addresses_cooling AS cndb_ip4_network_addresses_cooling,
+           cndb_ip4_network.addresses_free AS cndb_ip4_network_addresses_free,
+           cndb_ip4_network.alloc_version AS cndb_ip4_network_alloc_version,
            cndb_ip4_network.expiration_date AS cndb_ip4_network_expiration_date,
+           cndb_ip4_network.largest_free AS cndb_ip4_network_largest_free,
            cndb_ip4_network.net_address AS cndb_ip4_network_net_address,
            cndb_ip4_network.net_address__mask_len AS cndb_ip4_network_net_address__mask_len,
            cndb_ip4_network.net_address__numeric AS cndb_ip4_network_net_address__numeric,
@@ -2688,7 +2788,12 @@ _test_q_result_sq = """
     >>> show_query (CNDB.IP4_Network.query (Q.AND (~ Q.has_children, ~ Q.expiration_date, ~ Q.net_interface)))
     SQL: SELECT
            cndb_ip4_network."desc" AS cndb_ip4_network_desc,
+           cndb_ip4_network.addresses_allocated AS cndb_ip4_network_addresses_allocated,
+           cndb_ip4_network.addresses_cooling AS cndb_ip4_network_addresses_cooling,
+           cndb_ip4_network.addresses_free AS cndb_ip4_network_addresses_free,
+           cndb_ip4_network.alloc_version AS cndb_ip4_network_alloc_version,
            cndb_ip4_network.expiration_date AS cndb_ip4_network_expiration_date,
+           cndb_ip4_network.largest_free AS cndb_ip4_network_largest_free,
            cndb_ip4_network.net_address AS cndb_ip4_network_net_address,
            cndb_ip4_network.net_address__mask_len AS cndb_ip4_network_net_address__mask_len,
            cndb_ip4_network.net_address__numeric AS cndb_ip4_network_net_address__numeric,
@@ -2714,7 +2819,12 @@ _test_q_result_sq = """
     >>> show_query (CNDB.IP4_Network.query (Q.AND (Q.NOT (Q.OR (Q.has_children, Q.expiration_date)), (Q.owner == 42), (Q.net_address.IN ("8.0.0.0/8")), ((Q.net_address.mask_len < 23) | ((Q.net_address.mask_len == 23) & Q.electric))), sort_key = TFL.Sorted_By ("-net_address.mask_len", "net_address")))
     SQL: SELECT
            cndb_ip4_network."desc" AS cndb_ip4_network_desc,
+           cndb_ip4_network.addresses_allocated AS cndb_ip4_network_addresses_allocated,
+           cndb_ip4_network.addresses_cooling AS cndb_ip4_network_addresses_cooling,
+           cndb_ip4_network.addresses_free AS cndb_ip4_network_addresses_free,
+           cndb_ip4_network.alloc_version AS cndb_ip4_network_alloc_version,
            cndb_ip4_network.expiration_date AS cndb_ip4_network_expiration_date,
+           cndb_ip4_network.largest_free AS cndb_ip4_network_largest_free,
            cndb_ip4_network.net_address AS cndb_ip4_network_net_address,
            cndb_ip4_network.net_address__mask_len AS cndb_ip4_network_net_address__mask_len,
            cndb_ip4_network.net_address__numeric AS cndb_ip4_network_net_address__numeric,
@@ -2752,7 +2862,12 @@ _test_q_result_sq = """
     >>> show_query (CNDB.IP4_Network.query (Q.AND (Q.NOT (Q.OR (Q.has_children, Q.expiration_date)), (Q.owner == 42), (Q.net_address.IN ("8.0.0.0/8")), ((Q.net_address.mask_len < 23) | ((Q.net_address.mask_len == 23) & Q.electric)), ~ Q.net_interface), sort_key = TFL.Sorted_By ("-net_address.mask_len", "net_address")))
     SQL: SELECT
            cndb_ip4_network."desc" AS cndb_ip4_network_desc,
+           cndb_ip4_network.addresses_allocated AS cndb_ip4_network_addresses_allocated,
+           cndb_ip4_network.addresses_cooling AS cndb_ip4_network_addresses_cooling,
+           cndb_ip4_network.addresses_free AS cndb_ip4_network_addresses_free,
+           cndb_ip4_network.alloc_version AS cndb_ip4_network_alloc_version,
            cndb_ip4_network.expiration_date AS cndb_ip4_network_expiration_date,
+           cndb_ip4_network.largest_free AS cndb_ip4_network_largest_free,
            cndb_ip4_network.net_address AS cndb_ip4_network_net_address,
            cndb_ip4_network.net_address__mask_len AS cndb_ip4_network_net_address__mask_len,
            cndb_ip4_network.net_address__numeric AS cndb_ip4_network_net_address__numeric,
@@ -2793,7 +2908,12 @@ _test_q_result_sq = """
     >>> show_query (CNDB.IP4_Network.query (Q.AND (Q.is_free, (Q.owner == 42), (Q.net_address.IN ("8.0.0.0/8")), ((Q.net_address.mask_len < 23) | ((Q.net_address.mask_len == 23) & Q.electric))), sort_key = TFL.Sorted_By ("-net_address.mask_len", "net_address")))
     SQL: SELECT
            cndb_ip4_network."desc" AS cndb_ip4_network_desc,
+           cndb_ip4_network.addresses_allocated AS cndb_ip4_network_addresses_allocated,
+           cndb_ip4_network.addresses_cooling AS cndb_ip4_network_addresses_cooling,
+           cndb_ip4_network.addresses_free AS cndb_ip4_network_addresses_free,
+           cndb_ip4_network.alloc_version AS cndb_ip4_network_alloc_version,
            cndb_ip4_network.expiration_date AS cndb_ip4_network_expiration_date,
+           cndb_ip4_network.largest_free AS cndb_ip4_network_largest_free,
            cndb_ip4_network.net_address AS cndb_ip4_network_net_address,
            cndb_ip4_network.net_address__mask_len AS cndb_ip4_network_net_address__mask_len,
            cndb_ip4_network.net_address__numeric AS cndb_ip4_network_net_address__numeric,
@@ -2833,7 +2953,12 @@ _test_q_result_sq = """
     >>> show_query (CNDB.IP4_Network.query (sort_key = TFL.Sorted_By ("electric", "-has_children", "net_address")))
     SQL: SELECT
            cndb_ip4_network."desc" AS cndb_ip4_network_desc,
+           cndb_ip4_network.addresses_allocated AS cndb_ip4_network_addresses_allocated,
+           cndb_ip4_network.addresses_cooling AS cndb_ip4_network_addresses_cooling,
+           cndb_ip4_network.addresses_free AS cndb_ip4_network_addresses_free,
+           cndb_ip4_network.alloc_version AS cndb_ip4_network_alloc_version,
            cndb_ip4_network.expiration_date AS cndb_ip4_network_expiration_date,
+           cndb_ip4_network.largest_free AS cndb_ip4_network_largest_free,
            cndb_ip4_network.net_address AS cndb_ip4_network_net_address,
            cndb_ip4_network.net_address__mask_len AS cndb_ip4_network_net_address__mask_len,
            cndb_ip4_network.net_address__numeric AS cndb_ip4_network_net_address__numeric,
@@ -2855,7 +2980,12 @@ _test_q_result_sq = """
     >>> show_query (CNDB.IP4_Network.query (sort_key = TFL.Sorted_By ("electric", "-has_children", "net_address")).distinct ())
     SQL: SELECT DISTINCT
            cndb_ip4_network."desc" AS cndb_ip4_network_desc,
+           cndb_ip4_network.addresses_allocated AS cndb_ip4_network_addresses_allocated,
+           cndb_ip4_network.addresses_cooling AS cndb_ip4_network_addresses_cooling,
+           cndb_ip4_network.addresses_free AS cndb_ip4_network_addresses_free,
+           cndb_ip4_network.alloc_version AS cndb_ip4_network_alloc_version,
            cndb_ip4_network.expiration_date AS cndb_ip4_network_expiration_date,
+           cndb_ip4_network.largest_free AS cndb_ip4_network_largest_free,
            cndb_ip4_network.net_address AS cndb_ip4_network_net_address,
            cndb_ip4_network.net_address__mask_len AS cndb_ip4_network_net_address__mask_len,
            cndb_ip4_network.net_address__numeric AS cndb_ip4_network_net_address__numeric,
@@ -2878,7 +3008,12 @@ _test_q_result_sq = """
     >>> show_query (CNDB.IP4_Network.query ( Q.net_address.CONTAINS ("8.0.0.0/8"), Q.owner == 42, ~ Q.net_interface_links, sort_key = TFL.Sorted_By ("-net_address.mask_len")))
     SQL: SELECT
            cndb_ip4_network."desc" AS cndb_ip4_network_desc,
+           cndb_ip4_network.addresses_allocated AS cndb_ip4_network_addresses_allocated,
+           cndb_ip4_network.addresses_cooling AS cndb_ip4_network_addresses_cooling,
+           cndb_ip4_network.addresses_free AS cndb_ip4_network_addresses_free,
+           cndb_ip4_network.alloc_version AS cndb_ip4_network_alloc_version,
            cndb_ip4_network.expiration_date AS cndb_ip4_network_expiration_date,
+           cndb_ip4_network.largest_free AS cndb_ip4_network_largest_free,
            cndb_ip4_network.net_address AS cndb_ip4_network_net_address,
            cndb_ip4_network.net_address__mask_len AS cndb_ip4_network_net_address__mask_len,
            cndb_ip4_network.net_address__numeric AS cndb_ip4_network_net_address__numeric,
@@ -3160,7 +3295,12 @@ _test_select = """
                cndb_ip4_dns_alias.name AS cndb_ip4_dns_alias_name,
                cndb_ip4_dns_alias.pid AS cndb_ip4_dns_alias_pid,
                cndb_ip4_network."desc" AS cndb_ip4_network_desc,
+               cndb_ip4_network.addresses_allocated AS cndb_ip4_network_addresses_allocated,
+               cndb_ip4_network.addresses_cooling AS cndb_ip4_network_addresses_cooling,
+               cndb_ip4_network.addresses_free AS cndb_ip4_network_addresses_free,
+               cndb_ip4_network.alloc_version AS cndb_ip4_network_alloc_version,
                cndb_ip4_network.expiration_date AS cndb_ip4_network_expiration_date,
+               cndb_ip4_network.largest_free AS cndb_ip4_network_largest_free,
                cndb_ip4_network.net_address AS cndb_ip4_network_net_address,
                cndb_ip4_network.owner AS cndb_ip4_network_owner,
                cndb_ip4_network.parent AS cndb_ip4_network_parent,
@@ -3170,18 +3310,26 @@ _test_select = """
                cndb_ip4_network_in_ip4_pool."right" AS cndb_ip4_network_in_ip4_pool_right,
                cndb_ip4_network_in_ip4_pool.pid AS cndb_ip4_network_in_ip4_pool_pid,
                cndb_ip4_pool.__raw_name AS cndb_ip4_pool___raw_name,
+               cndb_ip4_pool.allocation_strategy AS cndb_ip4_pool_allocation_strategy,
                cndb_ip4_pool.cool_down_period AS cndb_ip4_pool_cool_down_period,
                cndb_ip4_pool.name AS cndb_ip4_pool_name,
                cndb_ip4_pool.netmask_interval__lower AS cndb_ip4_pool_netmask_interval__lower,
                cndb_ip4_pool.netmask_interval__upper AS cndb_ip4_pool_netmask_interval__upper,
                cndb_ip4_pool.node AS cndb_ip4_pool_node,
                cndb_ip4_pool.pid AS cndb_ip4_pool_pid,
+               cndb_ip4_pool.warm_blocks AS cndb_ip4_pool_warm_blocks,
+               cndb_ip4_pool.warm_mask_len AS cndb_ip4_pool_warm_mask_len,
                cndb_ip6_dns_alias."left" AS cndb_ip6_dns_alias_left,
                cndb_ip6_dns_alias.__raw_name AS cndb_ip6_dns_alias___raw_name,
                cndb_ip6_dns_alias.name AS cndb_ip6_dns_alias_name,
                cndb_ip6_dns_alias.pid AS cndb_ip6_dns_alias_pid,
                cndb_ip6_network."desc" AS cndb_ip6_network_desc,
+               cndb_ip6_network.addresses_allocated AS cndb_ip6_network_addresses_allocated,
+               cndb_ip6_network.addresses_cooling AS cndb_ip6_network_addresses_cooling,
+               cndb_ip6_network.addresses_free AS cndb_ip6_network_addresses_free,
+               cndb_ip6_network.alloc_version AS cndb_ip6_network_alloc_version,
                cndb_ip6_network.expiration_date AS cndb_ip6_network_expiration_date,
+               cndb_ip6_network.largest_free AS cndb_ip6_network_largest_free,
                cndb_ip6_network.net_address AS cndb_ip6_network_net_address,
                cndb_ip6_network.owner AS cndb_ip6_network_owner,
                cndb_ip6_network.parent AS cndb_ip6_network_parent,
@@ -3191,12 +3339,15 @@ _test_select = """
                cndb_ip6_network_in_ip6_pool."right" AS cndb_ip6_network_in_ip6_pool_right,
                cndb_ip6_network_in_ip6_pool.pid AS cndb_ip6_network_in_ip6_pool_pid,
                cndb_ip6_pool.__raw_name AS cndb_ip6_pool___raw_name,
+               cndb_ip6_pool.allocation_strategy AS cndb_ip6_pool_allocation_strategy,
                cndb_ip6_pool.cool_down_period AS cndb_ip6_pool_cool_down_period,
                cndb_ip6_pool.name AS cndb_ip6_pool_name,
                cndb_ip6_pool.netmask_interval__lower AS cndb_ip6_pool_netmask_interval__lower,
                cndb_ip6_pool.netmask_interval__upper AS cndb_ip6_pool_netmask_interval__upper,
                cndb_ip6_pool.node AS cndb_ip6_pool_node,
                cndb_ip6_pool.pid AS cndb_ip6_pool_pid,
+               cndb_ip6_pool.warm_blocks AS cndb_ip6_pool_warm_blocks,
+               cndb_ip6_pool.warm_mask_len AS cndb_ip6_pool_warm_mask_len,
                cndb_net_device."desc" AS cndb_net_device_desc,
                cndb_net_device."left" AS cndb_net_device_left,
                cndb_net_device.__raw_name AS cndb_net_device___raw_name,
@@ -3380,33 +3531,49 @@ _test_select = """
                cndb_firmware_type.pid AS cndb_firmware_type_pid,
                cndb_firmware_type.url AS cndb_firmware_type_url,
                cndb_ip4_network."desc" AS cndb_ip4_network_desc,
+               cndb_ip4_network.addresses_allocated AS cndb_ip4_network_addresses_allocated,
+               cndb_ip4_network.addresses_cooling AS cndb_ip4_network_addresses_cooling,
+               cndb_ip4_network.addresses_free AS cndb_ip4_network_addresses_free,
+               cndb_ip4_network.alloc_version AS cndb_ip4_network_alloc_version,
                cndb_ip4_network.expiration_date AS cndb_ip4_network_expiration_date,
+               cndb_ip4_network.largest_free AS cndb_ip4_network_largest_free,
                cndb_ip4_network.net_address AS cndb_ip4_network_net_address,
                cndb_ip4_network.owner AS cndb_ip4_network_owner,
                cndb_ip4_network.parent AS cndb_ip4_network_parent,
                cndb_ip4_network.pid AS cndb_ip4_network_pid,
                cndb_ip4_network.pool AS cndb_ip4_network_pool,
                cndb_ip4_pool.__raw_name AS cndb_ip4_pool___raw_name,
+               cndb_ip4_pool.allocation_strategy AS cndb_ip4_pool_allocation_strategy,
                cndb_ip4_pool.cool_down_period AS cndb_ip4_pool_cool_down_period,
                cndb_ip4_pool.name AS cndb_ip4_pool_name,
                cndb_ip4_pool.netmask_interval__lower AS cndb_ip4_pool_netmask_interval__lower,
                cndb_ip4_pool.netmask_interval__upper AS cndb_ip4_pool_netmask_interval__upper,
                cndb_ip4_pool.node AS cndb_ip4_pool_node,
                cndb_ip4_pool.pid AS cndb_ip4_pool_pid,
+               cndb_ip4_pool.warm_blocks AS cndb_ip4_pool_warm_blocks,
+               cndb_ip4_pool.warm_mask_len AS cndb_ip4_pool_warm_mask_len,
                cndb_ip6_network."desc" AS cndb_ip6_network_desc,
+               cndb_ip6_network.addresses_allocated AS cndb_ip6_network_addresses_allocated,
+               cndb_ip6_network.addresses_cooling AS cndb_ip6_network_addresses_cooling,
+               cndb_ip6_network.addresses_free AS cndb_ip6_network_addresses_free,
+               cndb_ip6_network.alloc_version AS cndb_ip6_network_alloc_version,
                cndb_ip6_network.expiration_date AS cndb_ip6_network_expiration_date,
+               cndb_ip6_network.largest_free AS cndb_ip6_network_largest_free,
                cndb_ip6_network.net_address AS cndb_ip6_network_net_address,
                cndb_ip6_network.owner AS cndb_ip6_network_owner,
                cndb_ip6_network.parent AS cndb_ip6_network_parent,
                cndb_ip6_network.pid AS cndb_ip6_network_pid,
                cndb_ip6_network.pool AS cndb_ip6_network_pool,
                cndb_ip6_pool.__raw_name AS cndb_ip6_pool___raw_name,
+               cndb_ip6_pool.allocation_strategy AS cndb_ip6_pool_allocation_strategy,
                cndb_ip6_pool.cool_down_period AS cndb_ip6_pool_cool_down_period,
                cndb_ip6_pool.name AS cndb_ip6_pool_name,
                cndb_ip6_pool.netmask_interval__lower AS cndb_ip6_pool_netmask_interval__lower,
                cndb_ip6_pool.netmask_interval__upper AS cndb_ip6_pool_netmask_interval__upper,
                cndb_ip6_pool.node AS cndb_ip6_pool_node,
                cndb_ip6_pool.pid AS cndb_ip6_pool_pid,
+               cndb_ip6_pool.warm_blocks AS cndb_ip6_pool_warm_blocks,
+               cndb_ip6_pool.warm_mask_len AS cndb_ip6_pool_warm_mask_len,
                cndb_net_device_type."desc" AS cndb_net_device_type_desc,
                cndb_net_device_type.__raw_model_no AS cndb_net_device_type___raw_model_no,
                cndb_net_device_type.__raw_name AS cndb_net_device_type___raw_name,
@@ -4370,14 +4537,24 @@ _test_select = """
            LEFT OUTER JOIN cndb_virtual_wireless_interface ON cndb__wireless_interface_.pid = cndb_virtual_wireless_interface.pid
     CNDB.IP_Network
         SELECT cndb_ip4_network."desc" AS cndb_ip4_network_desc,
+               cndb_ip4_network.addresses_allocated AS cndb_ip4_network_addresses_allocated,
+               cndb_ip4_network.addresses_cooling AS cndb_ip4_network_addresses_cooling,
+               cndb_ip4_network.addresses_free AS cndb_ip4_network_addresses_free,
+               cndb_ip4_network.alloc_version AS cndb_ip4_network_alloc_version,
                cndb_ip4_network.expiration_date AS cndb_ip4_network_expiration_date,
+               cndb_ip4_network.largest_free AS cndb_ip4_network_largest_free,
                cndb_ip4_network.net_address AS cndb_ip4_network_net_address,
                cndb_ip4_network.owner AS cndb_ip4_network_owner,
                cndb_ip4_network.parent AS cndb_ip4_network_parent,
                cndb_ip4_network.pid AS cndb_ip4_network_pid,
                cndb_ip4_network.pool AS cndb_ip4_network_pool,
                cndb_ip6_network."desc" AS cndb_ip6_network_desc,
+               cndb_ip6_network.addresses_allocated AS cndb_ip6_network_addresses_allocated,
+               cndb_ip6_network.addresses_cooling AS cndb_ip6_network_addresses_cooling,
+               cndb_ip6_network.addresses_free AS cndb_ip6_network_addresses_free,
+               cndb_ip6_network.alloc_version AS cndb_ip6_network_alloc_version,
                cndb_ip6_network.expiration_date AS cndb_ip6_network_expiration_date,
+               cndb_ip6_network.largest_free AS cndb_ip6_network_largest_free,
                cndb_ip6_network.net_address AS cndb_ip6_network_net_address,
                cndb_ip6_network.owner AS cndb_ip6_network_owner,
                cndb_ip6_network.parent AS cndb_ip6_network_parent,
@@ -4440,7 +4617,12 @@ _test_select = """
            JOIN cndb_ip4_dns_alias ON mom_id_entity.pid = cndb_ip4_dns_alias.pid
     CNDB.IP4_Network
         SELECT cndb_ip4_network."desc" AS cndb_ip4_network_desc,
+               cndb_ip4_network.addresses_allocated AS cndb_ip4_network_addresses_allocated,
+               cndb_ip4_network.addresses_cooling AS cndb_ip4_network_addresses_cooling,
+               cndb_ip4_network.addresses_free AS cndb_ip4_network_addresses_free,
+               cndb_ip4_network.alloc_version AS cndb_ip4_network_alloc_version,
                cndb_ip4_network.expiration_date AS cndb_ip4_network_expiration_date,
+               cndb_ip4_network.largest_free AS cndb_ip4_network_largest_free,
                cndb_ip4_network.net_address AS cndb_ip4_network_net_address,
                cndb_ip4_network.owner AS cndb_ip4_network_owner,
                cndb_ip4_network.parent AS cndb_ip4_network_parent,
@@ -4455,19 +4637,25 @@ _test_select = """
            JOIN cndb_ip4_network ON mom_id_entity.pid = cndb_ip4_network.pid
     CNDB.IP_Pool
         SELECT cndb_ip4_pool.__raw_name AS cndb_ip4_pool___raw_name,
+               cndb_ip4_pool.allocation_strategy AS cndb_ip4_pool_allocation_strategy,
                cndb_ip4_pool.cool_down_period AS cndb_ip4_pool_cool_down_period,
                cndb_ip4_pool.name AS cndb_ip4_pool_name,
                cndb_ip4_pool.netmask_interval__lower AS cndb_ip4_pool_netmask_interval__lower,
                cndb_ip4_pool.netmask_interval__upper AS cndb_ip4_pool_netmask_interval__upper,
                cndb_ip4_pool.node AS cndb_ip4_pool_node,
                cndb_ip4_pool.pid AS cndb_ip4_pool_pid,
+               cndb_ip4_pool.warm_blocks AS cndb_ip4_pool_warm_blocks,
+               cndb_ip4_pool.warm_mask_len AS cndb_ip4_pool_warm_mask_len,
                cndb_ip6_pool.__raw_name AS cndb_ip6_pool___raw_name,
+               cndb_ip6_pool.allocation_strategy AS cndb_ip6_pool_allocation_strategy,
                cndb_ip6_pool.cool_down_period AS cndb_ip6_pool_cool_down_period,
                cndb_ip6_pool.name AS cndb_ip6_pool_name,
                cndb_ip6_pool.netmask_interval__lower AS cndb_ip6_pool_netmask_interval__lower,
                cndb_ip6_pool.netmask_interval__upper AS cndb_ip6_pool_netmask_interval__upper,
                cndb_ip6_pool.node AS cndb_ip6_pool_node,
                cndb_ip6_pool.pid AS cndb_ip6_pool_pid,
+               cndb_ip6_pool.warm_blocks AS cndb_ip6_pool_warm_blocks,
+               cndb_ip6_pool.warm_mask_len AS cndb_ip6_pool_warm_mask_len,
                mom_id_entity.electric AS mom_id_entity_electric,
                mom_id_entity.last_cid AS mom_id_entity_last_cid,
                mom_id_entity.pid AS mom_id_entity_pid,
@@ -4480,12 +4668,15 @@ _test_select = """
             OR mom_id_entity.pid = cndb_ip6_pool.pid
     CNDB.IP4_Pool
         SELECT cndb_ip4_pool.__raw_name AS cndb_ip4_pool___raw_name,
+               cndb_ip4_pool.allocation_strategy AS cndb_ip4_pool_allocation_strategy,
                cndb_ip4_pool.cool_down_period AS cndb_ip4_pool_cool_down_period,
                cndb_ip4_pool.name AS cndb_ip4_pool_name,
                cndb_ip4_pool.netmask_interval__lower AS cndb_ip4_pool_netmask_interval__lower,
                cndb_ip4_pool.netmask_interval__upper AS cndb_ip4_pool_netmask_interval__upper,
                cndb_ip4_pool.node AS cndb_ip4_pool_node,
                cndb_ip4_pool.pid AS cndb_ip4_pool_pid,
+               cndb_ip4_pool.warm_blocks AS cndb_ip4_pool_warm_blocks,
+               cndb_ip4_pool.warm_mask_len AS cndb_ip4_pool_warm_mask_len,
                mom_id_entity.electric AS mom_id_entity_electric,
                mom_id_entity.last_cid AS mom_id_entity_last_cid,
                mom_id_entity.pid AS mom_id_entity_pid,
@@ -4507,7 +4698,12 @@ _test_select = """
            JOIN cndb_ip6_dns_alias ON mom_id_entity.pid = cndb_ip6_dns_alias.pid
     CNDB.IP6_Network
         SELECT cndb_ip6_network."desc" AS cndb_ip6_network_desc,
+               cndb_ip6_network.addresses_allocated AS cndb_ip6_network_addresses_allocated,
+               cndb_ip6_network.addresses_cooling AS cndb_ip6_network_addresses_cooling,
+               cndb_ip6_network.addresses_free AS cndb_ip6_network_addresses_free,
+               cndb_ip6_network.alloc_version AS cndb_ip6_network_alloc_version,
                cndb_ip6_network.expiration_date AS cndb_ip6_network_expiration_date,
+               cndb_ip6_network.largest_free AS cndb_ip6_network_largest_free,
                cndb_ip6_network.net_address AS cndb_ip6_network_net_address,
                cndb_ip6_network.owner AS cndb_ip6_network_owner,
                cndb_ip6_network.parent AS cndb_ip6_network_parent,
@@ -4522,12 +4718,15 @@ _test_select = """
            JOIN cndb_ip6_network ON mom_id_entity.pid = cndb_ip6_network.pid
     CNDB.IP6_Pool
         SELECT cndb_ip6_pool.__raw_name AS cndb_ip6_pool___raw_name,
+               cndb_ip6_pool.allocation_strategy AS cndb_ip6_pool_allocation_strategy,
                cndb_ip6_pool.cool_down_period AS cndb_ip6_pool_cool_down_period,
                cndb_ip6_pool.name AS cndb_ip6_pool_name,
                cndb_ip6_pool.netmask_interval__lower AS cndb_ip6_pool_netmask_interval__lower,
                cndb_ip6_pool.netmask_interval__upper AS cndb_ip6_pool_netmask_interval__upper,
                cndb_ip6_pool.node AS cndb_ip6_pool_node,
                cndb_ip6_pool.pid AS cndb_ip6_pool_pid,
+               cndb_ip6_pool.warm_blocks AS cndb_ip6_pool_warm_blocks,
+               cndb_ip6_pool.warm_mask_len AS cndb_ip6_pool_warm_mask_len,
                mom_id_entity.electric AS mom_id_entity_electric,
                mom_id_entity.last_cid AS mom_id_entity_last_cid,
                mom_id_entity.pid AS mom_id_entity_pid,
@@ -5008,6 +5207,9 @@ _test_select = """
            JOIN cndb_net_interface_in_ip_network ON mom_id_entity.pid = cndb_net_interface_in_ip_network.pid
            JOIN cndb_virtual_wireless_interface ON cndb_net_interface_in_ip_network."left" = cndb_virtual_wireless_interface.pid
 
+
+
+
     CNDB.Object
         SELECT cndb_antenna_type."desc" AS cndb_antenna_type_desc,
                cndb_antenna_type.__raw_model_no AS cndb_antenna_type___raw_model_no,
@@ -6661,8 +6863,13 @@ _test_tables = """
         Column name                      : Varchar(63)          Primary__Raw_Value String name
         Column pid                       : Integer              Internal__Just_Once Surrogate pid primary ForeignKey('mom_id_entity.pid')
     CNDB.IP4_Network (MOM.Id_Entity) <Table cndb_ip4_network>
+        Column addresses_allocated       : Bigint               Internal Int addresses_allocated
+        Column addresses_cooling         : Bigint               Internal Int addresses_cooling
+        Column addresses_free            : Bigint               Internal Int addresses_free
+        Column alloc_version             : Bigint               Internal Int alloc_version
         Column desc                      : Varchar(80)          Optional String desc
         Column expiration_date           : Datetime             Internal__Structured Date-Time expiration_date
+        Column largest_free              : Integer              Internal Int largest_free
         Column net_address               : CIDR                 Primary IP4-network net_address
         Column owner                     : Integer              Optional__Id_Entity_Reference Entity owner Id_Entity()
         Column parent                    : Integer              Internal__Id_Entity_Reference Entity parent Id_Entity()
@@ -6670,20 +6877,28 @@ _test_tables = """
         Column pool                      : Integer              Optional__Id_Entity_Reference__Computed_Set Entity pool Id_Entity()
     CNDB.IP4_Pool (MOM.Id_Entity) <Table cndb_ip4_pool>
         Column __raw_name                : Varchar(40)          Primary__Raw_Value String name
+        Column allocation_strategy       : Varchar(9)           Optional ip-allocation-strategy allocation_strategy
         Column cool_down_period          : Float                Optional Time Delta cool_down_period
         Column name                      : Varchar(40)          Primary__Raw_Value String name
         Column netmask_interval__lower   : Integer              Necessary__Nested Int lower
         Column netmask_interval__upper   : Integer              Necessary__Nested__Computed_Set Int upper
         Column node                      : Integer              Optional__Id_Entity_Reference Entity node Id_Entity()
         Column pid                       : Integer              Internal__Just_Once Surrogate pid primary ForeignKey('mom_id_entity.pid')
+        Column warm_blocks               : Integer              Optional Int warm_blocks
+        Column warm_mask_len             : Integer              Optional__Computed_Set Int warm_mask_len
     CNDB.IP6_DNS_Alias (MOM.Id_Entity) <Table cndb_ip6_dns_alias>
         Column __raw_name                : Varchar(63)          Primary__Raw_Value String name
         Column left                      : Integer              Link_Role__Init_Only Net_Interface_in_IP_Network left Id_Entity()
         Column name                      : Varchar(63)          Primary__Raw_Value String name
         Column pid                       : Integer              Internal__Just_Once Surrogate pid primary ForeignKey('mom_id_entity.pid')
     CNDB.IP6_Network (MOM.Id_Entity) <Table cndb_ip6_network>
+        Column addresses_allocated       : Bigint               Internal Int addresses_allocated
+        Column addresses_cooling         : Bigint               Internal Int addresses_cooling
+        Column addresses_free            : Bigint               Internal Int addresses_free
+        Column alloc_version             : Bigint               Internal Int alloc_version
         Column desc                      : Varchar(80)          Optional String desc
         Column expiration_date           : Datetime             Internal__Structured Date-Time expiration_date
+        Column largest_free              : Integer              Internal Int largest_free
         Column net_address               : CIDR                 Primary IP6-network net_address
         Column owner                     : Integer              Optional__Id_Entity_Reference Entity owner Id_Entity()
         Column parent                    : Integer              Internal__Id_Entity_Reference Entity parent Id_Entity()
@@ -6691,12 +6906,15 @@ _test_tables = """
         Column pool                      : Integer              Optional__Id_Entity_Reference__Computed_Set Entity pool Id_Entity()
     CNDB.IP6_Pool (MOM.Id_Entity) <Table cndb_ip6_pool>
         Column __raw_name                : Varchar(40)          Primary__Raw_Value String name
+        Column allocation_strategy       : Varchar(9)           Optional ip-allocation-strategy allocation_strategy
         Column cool_down_period          : Float                Optional Time Delta cool_down_period
         Column name                      : Varchar(40)          Primary__Raw_Value String name
         Column netmask_interval__lower   : Integer              Necessary__Nested Int lower
         Column netmask_interval__upper   : Integer              Necessary__Nested__Computed_Set Int upper
         Column node                      : Integer              Optional__Id_Entity_Reference Entity node Id_Entity()
         Column pid                       : Integer              Internal__Just_Once Surrogate pid primary ForeignKey('mom_id_entity.pid')
+        Column warm_blocks               : Integer              Optional Int warm_blocks
+        Column warm_mask_len             : Integer              Optional__Computed_Set Int warm_mask_len
     CNDB.WPA_Credentials (MOM.Id_Entity) <Table cndb_wpa_credentials>
         Column key                       : Varchar(32)          Required Key key
         Column left                      : Integer              Link_Role__Init_Only Net_Interface left Id_Entity()
@@ -6811,6 +7029,9 @@ _test_tables = """
     <Table for Surrogate `cert_id`>
         Column cert_id                   : Integer              ---------- primary
 
+
+
+
 """
 
 _test_debug = """
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 Dr. Ralf Schlatterbeck All rights reserved
+# Reichergasse 131, A--3411 Weidling, Austria. rsc@runtux.com
+# #*** <License> ************************************************************#
+# This module is part of the package CNDB.OMP.__test__.
+#
+# This module is licensed under the terms of the BSD 3-Clause License
+# <http://www.c-tanzer.at/license/bsd_3c.html>.
+# #*** </License> ***********************************************************#
+#
+#++
+# Name
+#    CNDB.OMP.__test__.Stored_Left_Refs
+#
+# Purpose
+#    Test stored `my_node` and `my_net_device` of links
+#
+# Revision Dates
+#    18-Oct-2026 (RS) Creation
+#    ««revision-date»»···
+#--
+
+from   _CNDB._OMP.__test__.model      import *
+from   _CNDB._OMP.__test__.fixtures   import create as std_fixtures
+
+import _CNDB._OMP.Stored_Left_Refs
+
+_test_stored = """
+    >>> scope = Scaffold.scope (%(p1)s, %(n1)s) # doctest:+ELLIPSIS
+    Creating new scope MOMT__...
+
+    >>> CNDB = scope.CNDB
+    >>> PAP  = scope.PAP
+    >>> tns  = \\
+    ...     ( "CNDB.Net_Device", "CNDB.Wired_Interface"
+    ...     , "CNDB.Net_Interface_in_IP4_Network"
+    ...     , "CNDB.Wireless_Interface_uses_Antenna", "CNDB.Antenna"
+    ...     )
+    >>> for tn in tns :
+    ...     ET = scope [tn].E_Type
+    ...     print \\
+    ...         ( "%%-40s %%-8s %%s"
+    ...         %% (tn, ET.my_node.kind, ET.my_net_device.kind)
+    ...         )
+    CNDB.Net_Device                          query    query
+    CNDB.Wired_Interface                     internal internal
+    CNDB.Net_Interface_in_IP4_Network        internal internal
+    CNDB.Wireless_Interface_uses_Antenna     internal internal
+    CNDB.Antenna                             query    query
+    >>> CNDB.Wired_Interface.E_Type.stored_left_refs ()
+    ('my_net_device', 'my_node')
+
+    >>> std_fixtures (scope)
+    >>> scope.commit ()
+    >>> rsc   = PAP.Person.query (first_name = "ralf").one ()
+    >>> links = CNDB.Net_Interface_in_IP_Network.query (sort_key = Q.pid)
+    >>> for l in links :
+    ...     print (l.left.name, l.my_node.name, l.my_net_device.name)
+    wr node2 dev
+    wl node2 dev
+    wr node2 dev
+    wl node2 dev
+    >>> CNDB.Net_Interface_in_IP_Network.query (Q.my_person == rsc).count ()
+    4
+
+    Changing `left` updates the stored values
+
+    >>> nogps = CNDB.Node.query (name = "nogps").one ()
+    >>> dtype = CNDB.Net_Device_Type.query ().one ()
+    >>> dev2  = CNDB.Net_Device (left = dtype, node = nogps, name = "dev2")
+    >>> wr2   = CNDB.Wired_Interface (left = dev2, name = "wr2")
+    >>> wr2.my_node.name, wr2.my_net_device.name
+    ('nogps', 'dev2')
+    >>> lnk   = links.first ()
+    >>> lnk.set (left = wr2)
+    3
+    >>> lnk.my_node.name, lnk.my_net_device.name
+    ('nogps', 'dev2')
+    >>> scope.commit ()
+    >>> CNDB.Net_Interface_in_IP_Network.query (Q.my_node == nogps).count ()
+    1
+
+    `update_all` fills in values missing, e.g., after a migration
+
+    >>> lnk.set (my_node = None)
+    1
+    >>> CNDB.OMP.Stored_Left_Refs.update_all (scope)
+    1
+    >>> lnk.my_node.name
+    'nogps'
+
+    Destroying the device destroys its interfaces and their links
+
+    >>> dev2.destroy ()
+    >>> CNDB.Net_Interface_in_IP_Network.query (Q.my_node == nogps).count ()
+    0
+
+"""
+
+__test__ = Scaffold.create_test_dict \
+  ( dict
+      ( test_stored = _test_stored
+      )
+  )
+
+### __END__ CNDB.OMP.__test__.Stored_Left_Refs
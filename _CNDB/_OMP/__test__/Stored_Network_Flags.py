@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 Dr. Ralf Schlatterbeck All rights reserved
+# Reichergasse 131, A--3411 Weidling, Austria. rsc@runtux.com
+# #*** <License> ************************************************************#
+# This module is part of the package CNDB.OMP.__test__.
+#
+# This module is licensed under the terms of the BSD 3-Clause License
+# <http://www.c-tanzer.at/license/bsd_3c.html>.
+# #*** </License> ***********************************************************#
+#
+#++
+# Name
+#    CNDB.OMP.__test__.Stored_Network_Flags
+#
+# Purpose
+#    Test stored `has_children` and `is_free` of IP networks
+#
+# Revision Dates
+#    18-Oct-2026 (RS) Creation
+#    ««revision-date»»···
+#--
+
+from   _CNDB._OMP.__test__.model      import *
+from   _MOM._Attr.Date_Time_Delta     import A_Date_Time_Delta
+
+import _CNDB._OMP.Stored_Network_Flags
+
+_test_flags = """
+    >>> scope = Scaffold.scope (%(p1)s, %(n1)s) # doctest:+ELLIPSIS
+    Creating new scope MOMT__...
+
+    >>> CNDB = scope.CNDB
+    >>> PAP = scope.PAP
+    >>> for tn in ("CNDB.IP_Network", "CNDB.IP4_Network", "CNDB.IP6_Network") :
+    ...     ET = scope [tn].E_Type
+    ...     print ("%%-20s %%-8s %%s" %% (tn, ET.has_children.kind, ET.is_free.kind))
+    CNDB.IP_Network      internal internal
+    CNDB.IP4_Network     internal internal
+    CNDB.IP6_Network     internal internal
+    >>> CNDB.IP4_Network.E_Type.stored_flags ()
+    ('has_children', 'is_free')
+
+    >>> Adr = CNDB.IP4_Network.net_address.P_Type
+    >>> ff  = PAP.Association ("Funkfeuer", short_name = "0xFF", raw = True)
+    >>> rs  = PAP.Person ("Schlatterbeck", "Ralf", raw = True)
+    >>> nod = CNDB.Node (name = "Test-Node", manager = ff, raw = True)
+    >>> dt  = CNDB.Net_Device_Type (name = "Generic", raw = True)
+    >>> dev = CNDB.Net_Device (left = dt, node = nod, name = "dev", raw = True)
+    >>> ifc = CNDB.Wired_Interface (left = dev, name = "iface", raw = True)
+    >>> def show_free () :
+    ...     q = CNDB.IP4_Network.query \\
+    ...         ( Q.is_free, Q.net_address.IN (Adr ('10.0.0.0/30'))
+    ...         , sort_key = TFL.Sorted_By ("net_address")
+    ...         )
+    ...     print (", ".join (str (n.net_address) for n in q))
+
+    >>> pool = CNDB.IP4_Network ('10.0.0.0/24', owner = ff, raw = True)
+    >>> pool.has_children, pool.is_free
+    (False, True)
+    >>> a1 = pool.reserve ('10.0.0.1', owner = rs)
+    >>> pool.has_children, pool.is_free
+    (True, False)
+    >>> show_free ()
+    10.0.0.0, 10.0.0.1, 10.0.0.2/31
+
+    Linking a network to an interface clears `is_free`, destroying the link
+    sets it again
+
+    >>> ni = CNDB.Net_Interface_in_IP_Network (ifc, a1, mask_len = 32)
+    >>> a1.is_free
+    False
+    >>> show_free ()
+    10.0.0.0, 10.0.0.2/31
+    >>> ni.destroy ()
+    >>> a1.is_free
+    True
+    >>> scope.commit ()
+
+    Destroying the last subnet of a network resets its `has_children`
+
+    >>> p31 = CNDB.IP4_Network.instance ('10.0.0.0/31', raw = True)
+    >>> a1.destroy ()
+    >>> p31.has_children, p31.is_free
+    (True, False)
+    >>> CNDB.IP4_Network.instance ('10.0.0.0', raw = True).destroy ()
+    >>> p31.has_children, p31.is_free
+    (False, True)
+    >>> show_free ()
+    10.0.0.0/31, 10.0.0.2/31
+
+    `update_flags` repairs flags set inconsistently
+
+    >>> p31.set (has_children = True)
+    2
+    >>> p31.is_free
+    False
+    >>> p31.update_flags ()
+    >>> p31.has_children, p31.is_free
+    (False, True)
+    >>> scope.commit ()
+
+    `update_all_flags` repairs the flags of all networks, e.g., the default
+    values of a migrated database
+
+    >>> a2 = pool.reserve ('10.0.0.2', owner = rs)
+    >>> ni = CNDB.Net_Interface_in_IP_Network (ifc, a2, mask_len = 32)
+    >>> for n in CNDB.IP4_Network.query () :
+    ...     _ = n.set (has_children = False, is_free = True)
+    >>> CNDB.IP_Network.update_all_flags (scope)
+    9
+    >>> show_free ()
+    10.0.0.0/31, 10.0.0.3
+    >>> for n in CNDB.IP4_Network.query (Q.has_children).order_by (Q.net_address) :
+    ...     print (n.net_address)
+    10.0.0.0/24
+    10.0.0.0/25
+    10.0.0.0/26
+    10.0.0.0/27
+    10.0.0.0/28
+    10.0.0.0/29
+    10.0.0.0/30
+    10.0.0.2/31
+    >>> CNDB.OMP.Stored_Network_Flags.update_all (scope)
+    0
+    >>> scope.commit ()
+
+    `free_many` records the networks becoming unfree by a bulk change
+    following the one of the expiration dates
+
+    >>> a3 = pool.reserve ('10.0.0.3', owner = rs)
+    >>> CNDB.IP_Network.free_many ([a2, a3], A_Date_Time_Delta.cooked ("1d"))
+    >>> [c for c in scope.uncommitted_changes if c.kind == "Modify/Bulk"]
+    [<Modify/Bulk CNDB.IP4_Network 'expiration_date', 2 entities>, <Modify/Bulk CNDB.IP4_Network 'is_free', 1 entities>]
+    >>> a2.is_free, a3.is_free
+    (False, False)
+    >>> scope.commit ()
+
+"""
+
+__test__ = Scaffold.create_test_dict \
+  ( dict
+      ( test_flags = _test_flags
+      )
+  )
+
+### __END__ CNDB.OMP.__test__.Stored_Network_Flags
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 Dr. Ralf Schlatterbeck All rights reserved
+# Reichergasse 131, A--3411 Weidling, Austria. rsc@runtux.com
+# #*** <License> ************************************************************#
+# This module is part of the package CNDB.OMP.__test__.
+#
+# This module is licensed under the terms of the BSD 3-Clause License
+# <http://www.c-tanzer.at/license/bsd_3c.html>.
+# #*** </License> ***********************************************************#
+#
+#++
+# Name
+#    CNDB.OMP.__test__.benchmark_allocation
+#
+# Purpose
+#    Benchmark the IP allocation strategies with synthetic workloads
+#
+# Usage
+#    python -m _CNDB._OMP.__test__.benchmark_allocation \
+#        -ops 100000 -strategies Best_Fit,Spread -families 4
+#
+# Revision Dates
+#    18-Oct-2026 (RS) Creation
+#    18-Oct-2026 (RS) Use `workloads` and `network_fragmentation` of
+#                     `IP_Simulator`
+#    ««revision-date»»···
+#--
+
+from   _CNDB._OMP.__test__.model      import *
+from   _MOM._Attr.Date_Time_Delta import A_Date_Time_Delta
+
+import _CNDB._OMP.IP_Simulator
+
+import _TFL.CAO
+
+import random
+import time
+
+def _percentile (values, p) :
+    if not values :
+        return 0.0
+    values = sorted (values)
+    return values [min (len (values) - 1, int (len (values) * p))]
+# end def _percentile
+
+def run (cmd, family, strategy) :
+    """Run the workload of `family` with `strategy` in a new scope, return
+       a dictionary with the results.
+    """
+    ETM_name, net, masks = CNDB.OMP.IP_Simulator.workloads [family]
+    rand    = random.Random (cmd.seed)
+    weights = []
+    for ml, w in masks :
+        weights.extend ([ml] * w)
+    scope   = Scaffold.scope (cmd.db_url, None)
+    try :
+        CNDB    = scope.CNDB
+        ff      = scope.PAP.Association \
+            ("Funkfeuer", short_name = "0xFF", raw = True)
+        owner   = scope.PAP.Person ("Benchmark", "Allocation", raw = True)
+        pool    = scope [ETM_name] (net, owner = ff, raw = True)
+        Link    = scope [pool.ETM.ip_pool_link.P_Type]
+        ip_pool = scope [Link.E_Type.right.P_Type] \
+            (name = strategy, allocation_strategy = strategy, raw = True)
+        Link (pool, ip_pool)
+        scope.commit ()
+        zero      = A_Date_Time_Delta.cooked ("0d")
+        allocated = []
+        t_alloc   = []
+        t_free    = []
+        failed    = 0
+        for i in range (cmd.ops) :
+            if allocated and rand.random () >= cmd.alloc_ratio :
+                n     = allocated.pop (rand.randrange (len (allocated)))
+                start = time.time ()
+                CNDB.IP_Network.free_many ([n], zero)
+                t_free.append (time.time () - start)
+            else :
+                ml    = rand.choice (weights)
+                start = time.time ()
+                try :
+                    n = ip_pool.allocate (ml, owner)
+                except CNDB.OMP.Error.No_Free_Address_Range :
+                    failed += 1
+                    continue
+                t_alloc.append (time.time () - start)
+                allocated.append (n)
+            if cmd.commit_every and not (i + 1) % cmd.commit_every :
+                scope.commit ()
+        scope.commit ()
+        blocks, frag = CNDB.OMP.IP_Simulator.network_fragmentation ([pool])
+        return dict \
+            ( alloc    = t_alloc
+            , blocks   = blocks
+            , failed   = failed
+            , frag     = frag
+            , free     = t_free
+            , live     = len (allocated)
+            , rows     = scope [ETM_name].count
+            )
+    finally :
+        scope.destroy ()
+# end def run
+
+def _main (cmd) :
+    fmt = "%-10s %-2s %8s %8s %8s %8s %8s %8s %8s %8s %7s"
+    print \
+        ( fmt
+        % ( "strategy", "v", "alloc/us", "p50", "p99", "free/us", "p99"
+          , "live", "rows", "blocks", "frag"
+          )
+        )
+    for family in cmd.families :
+        for strategy in cmd.strategies :
+            r  = run (cmd, family, strategy)
+            us = lambda v : "%.0f" % (v * 1e6, )
+            mean = lambda vs : sum (vs) / len (vs) if vs else 0.0
+            print \
+                ( fmt
+                % ( strategy, family
+                  , us (mean (r ["alloc"]))
+                  , us (_percentile (r ["alloc"], 0.5))
+                  , us (_percentile (r ["alloc"], 0.99))
+                  , us (mean (r ["free"]))
+                  , us (_percentile (r ["free"], 0.99))
+                  , r ["live"], r ["rows"], r ["blocks"]
+                  , "%.3f" % (r ["frag"], )
+                  )
+                )
+            if r ["failed"] :
+                print ("    %s allocations failed" % (r ["failed"], ))
+# end def _main
+
+_Command = TFL.CAO.Cmd \
+    ( handler       = _main
+    , opts          =
+        ( "-alloc_ratio:F=0.6?Fraction of operations allocating a network"
+        , "-commit_every:I=1000?Commit after this many operations"
+        , "-db_url:S=hps://?Database to run the benchmark against"
+        , "-families:S,=4,6?Address families to benchmark"
+        , "-ops:I=10000?Number of allocate/free operations per run"
+        , "-seed:I=42?Seed of the random workload"
+        , "-strategies:S,=Best_Fit,First_Fit,Spread,Aligned"
+            "?Allocation strategies to benchmark"
+        )
+    , max_args      = 0
+    )
+
+if __name__ == "__main__" :
+    _Command ()
+### __END__ CNDB.OMP.__test__.benchmark_allocation
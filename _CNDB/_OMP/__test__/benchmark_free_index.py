@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 Dr. Ralf Schlatterbeck All rights reserved
+# Reichergasse 131, A--3411 Weidling, Austria. rsc@runtux.com
+# #*** <License> ************************************************************#
+# This module is part of the package CNDB.OMP.__test__.
+#
+# This module is licensed under the terms of the BSD 3-Clause License
+# <http://www.c-tanzer.at/license/bsd_3c.html>.
+# #*** </License> ***********************************************************#
+#
+#++
+# Name
+#    CNDB.OMP.__test__.benchmark_free_index
+#
+# Purpose
+#    Benchmark the operations of `IP_Free_Index` at realistic pool sizes
+#
+# Usage
+#    python -m _CNDB._OMP.__test__.benchmark_free_index \
+#        -sizes 10000,100000,1000000 -ops 100000
+#
+#    Fills an index with `size` free blocks of an IPv4 /8 pool, then
+#    allocates and frees blocks like `IP_Network.allocate` and `free` do.
+#    Doesn't need a database: the index is filled directly.
+#
+# Revision Dates
+#    18-Oct-2026 (RS) Creation
+#    ««revision-date»»···
+#--
+
+from   _CNDB                    import CNDB
+from   _TFL                     import TFL
+
+import _CNDB._OMP.IP_Free_Index
+
+import _TFL.CAO
+
+import random
+import time
+
+bitlen = 32
+pool   = (10 << 24, 8)
+
+def _percentile (values, p) :
+    if not values :
+        return 0.0
+    values = sorted (values)
+    return values [min (len (values) - 1, int (len (values) * p))]
+# end def _percentile
+
+def run (cmd, size) :
+    """Fill an index with `size` free blocks, run `cmd.ops` operations on
+       it, return a dictionary with the results.
+    """
+    rand    = random.Random (cmd.seed)
+    index   = CNDB.OMP.IP_Free_Index (None, 1)
+    masks   = cmd.masks
+    ip, ml  = pool
+    blocks  = set ()
+    start   = time.time ()
+    while len (blocks) < size :
+        bml = rand.choice (masks)
+        bip = ip + (rand.randrange (1 << (bml - ml)) << (bitlen - bml))
+        if (bip, bml) not in blocks :
+            blocks.add ((bip, bml))
+            index._add (1, bip, bml, rand.random () < 0.9)
+    t_fill  = time.time () - start
+    taken   = []
+    t_alloc = []
+    t_free  = []
+    for i in range (cmd.ops) :
+        if taken and rand.random () >= cmd.alloc_ratio :
+            key   = taken.pop (rand.randrange (len (taken)))
+            start = time.time ()
+            index._add (1, key [0], key [1], True)
+            t_free.append (time.time () - start)
+        else :
+            start = time.time ()
+            block = index.closest_block (rand.choice (masks))
+            if block is not None :
+                key = block [1:]
+                index._discard_key (key)
+                taken.append (key)
+            t_alloc.append (time.time () - start)
+    return dict (alloc = t_alloc, fill = t_fill, free = t_free)
+# end def run
+
+def _main (cmd) :
+    fmt = "%10s %10s %8s %8s %8s %8s %8s"
+    print \
+        ( fmt
+        % ("blocks", "fill/s", "alloc/us", "p50", "p99", "free/us", "p99")
+        )
+    for size in cmd.sizes :
+        r    = run (cmd, size)
+        us   = lambda v : "%.1f" % (v * 1e6, )
+        mean = lambda vs : sum (vs) / len (vs) if vs else 0.0
+        print \
+            ( fmt
+            % ( size, "%.2f" % (r ["fill"], )
+              , us (mean (r ["alloc"]))
+              , us (_percentile (r ["alloc"], 0.5))
+              , us (_percentile (r ["alloc"], 0.99))
+              , us (mean (r ["free"]))
+              , us (_percentile (r ["free"], 0.99))
+              )
+            )
+# end def _main
+
+_Command = TFL.CAO.Cmd \
+    ( handler       = _main
+    , opts          =
+        ( "-alloc_ratio:F=0.5?Fraction of operations allocating a block"
+        , "-masks:I,=24,27,28,29,30,30,32,32,32,32"
+            "?Mask lengths of the free blocks and of the allocations"
+        , "-ops:I=100000?Number of allocate/free operations per size"
+        , "-seed:I=42?Seed of the random workload"
+        , "-sizes:I,=10000,100000,1000000?Numbers of free blocks in the index"
+        )
+    , max_args      = 0
+    )
+
+if __name__ == "__main__" :
+    _Command ()
+### __END__ CNDB.OMP.__test__.benchmark_free_index
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 Dr. Ralf Schlatterbeck All rights reserved
+# Reichergasse 131, A--3411 Weidling, Austria. rsc@runtux.com
+# #*** <License> ************************************************************#
+# This module is part of the package CNDB.OMP.__test__.
+#
+# This module is licensed under the terms of the BSD 3-Clause License
+# <http://www.c-tanzer.at/license/bsd_3c.html>.
+# #*** </License> ***********************************************************#
+#
+#++
+# Name
+#    CNDB.OMP.__test__.benchmark_range_index
+#
+# Purpose
+#    Benchmark the range indices of `net_address` with allocation and
+#    lookup queries
+#
+# Usage
+#    python -m _CNDB._OMP.__test__.benchmark_range_index \
+#        -db_url sqlite:////tmp/range.sqlite -networks 20000 -lookups 1000
+#
+#    Creates a database with `networks` allocated networks, then shows the
+#    query plans and timings of `CONTAINS` lookups and of the query of
+#    allocation candidates, first without, then with the range indices.
+#    Needs an SQL database, i.e., not `hps`.
+#
+# Revision Dates
+#    18-Oct-2026 (RS) Creation
+#    ««revision-date»»···
+#--
+
+from   _CNDB._OMP.__test__.model      import *
+
+import _CNDB._OMP.SAW
+import _TFL.CAO
+
+from   sqlalchemy.ext.compiler        import compiles
+from   sqlalchemy.sql.expression      import ClauseElement, Executable
+
+import random
+import time
+
+class _Explain_ (Executable, ClauseElement) :
+
+    def __init__ (self, select) :
+        self.select = select
+    # end def __init__
+
+# end class _Explain_
+
+@compiles (_Explain_)
+def _compile_explain (element, compiler, ** kw) :
+    prefix = "EXPLAIN QUERY PLAN " if compiler.dialect.name == "sqlite" \
+        else "EXPLAIN "
+    return prefix + compiler.process (element.select, ** kw)
+# end def _compile_explain
+
+def _percentile (values, p) :
+    if not values :
+        return 0.0
+    values = sorted (values)
+    return values [min (len (values) - 1, int (len (values) * p))]
+# end def _percentile
+
+def setup (cmd) :
+    """Create a new database with a pool of `cmd.networks` allocations,
+       return the scope.
+    """
+    rand    = random.Random (cmd.seed)
+    scope   = Scaffold.scope (cmd.db_url, None, create = True, verbose = False)
+    ff      = scope.PAP.Association ("Funkfeuer", short_name = "0xFF", raw = True)
+    owner   = scope.PAP.Person ("Benchmark", "Range Index", raw = True)
+    pool    = scope.CNDB.IP4_Network (cmd.network, owner = ff, raw = True)
+    ip_pool = scope.CNDB.IP4_Pool (name = "range", raw = True)
+    scope.CNDB.IP4_Network_in_IP4_Pool (pool, ip_pool)
+    for i in range (cmd.networks) :
+        ip_pool.allocate (rand.choice ((32, 32, 32, 30, 29)), owner)
+        if not (i + 1) % 1000 :
+            scope.commit ()
+    scope.commit ()
+    return scope
+# end def setup
+
+def queries (cmd, scope) :
+    """Return the lookup and allocation queries to explain and time."""
+    rand    = random.Random (cmd.seed)
+    ETM     = scope.CNDB.IP4_Network
+    pool    = ETM.instance (cmd.network, raw = True)
+    na      = pool.net_address
+    size    = 1 << (na.bitlen - na.mask_len)
+    lookups = []
+    for i in range (cmd.lookups) :
+        addr = str (na.__class__ (na.ip + rand.randrange (size), 32))
+        lookups.append (ETM.query (Q.net_address.CONTAINS (addr)))
+    alloc   = ETM.query \
+        ( Q.is_free
+        , Q.net_address.IN (na)
+        , Q.pool == pool
+        , Q.owner == pool.owner
+        )
+    return lookups, alloc
+# end def queries
+
+def explain (scope, q) :
+    conn = scope.ems.session.connection
+    for row in conn.execute (_Explain_ (q.sa_query)) :
+        print ("    ", " ".join (str (c) for c in row))
+# end def explain
+
+def timed (qs) :
+    result = []
+    for q in qs :
+        start = time.time ()
+        q.all ()
+        result.append (time.time () - start)
+    return result
+# end def timed
+
+def phase (cmd, scope, with_indices) :
+    conn  = scope.ems.session.connection
+    table = scope.CNDB.IP4_Network.E_Type._SAW.sa_table
+    for index in CNDB.OMP.SAW.range_indices (table) :
+        if with_indices :
+            index.create (bind = conn)
+        else :
+            index.drop   (bind = conn)
+    if conn.dialect.name == "sqlite" :
+        conn.execute ("ANALYZE")
+    else :
+        conn.execute ("ANALYZE %s" % (table.name, ))
+    lookups, alloc = queries (cmd, scope)
+    print ("%s range indices" % ("With" if with_indices else "Without", ))
+    print ("  Lookup plan")
+    explain (scope, lookups [0])
+    print ("  Allocation plan")
+    explain (scope, alloc)
+    us   = lambda v : "%.0f" % (v * 1e6, )
+    mean = lambda vs : sum (vs) / len (vs) if vs else 0.0
+    for name, ts in \
+            ( ("lookup", timed (lookups))
+            , ("alloc",  timed ([alloc] * max (1, cmd.lookups // 10)))
+            ) :
+        print \
+            ( "  %-8s mean %8s us p99 %8s us"
+            % (name, us (mean (ts)), us (_percentile (ts, 0.99)))
+            )
+# end def phase
+
+def _main (cmd) :
+    scope = setup (cmd)
+    try :
+        phase (cmd, scope, False)
+        phase (cmd, scope, True)
+    finally :
+        scope.destroy ()
+# end def _main
+
+_Command = TFL.CAO.Cmd \
+    ( handler       = _main
+    , opts          =
+        ( "-db_url:S=sqlite:////tmp/benchmark_range_index.sqlite"
+            "?Database to run the benchmark against (recreated)"
+        , "-lookups:I=1000?Number of timed lookups per phase"
+        , "-network:S=10.0.0.0/8?Network of the pool"
+        , "-networks:I=2000?Number of networks allocated from the pool"
+        , "-seed:I=42?Seed of the random workload"
+        )
+    , max_args      = 0
+    )
+
+if __name__ == "__main__" :
+    _Command ()
+### __END__ CNDB.OMP.__test__.benchmark_range_index
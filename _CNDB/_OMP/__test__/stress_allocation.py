@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 Dr. Ralf Schlatterbeck All rights reserved
+# Reichergasse 131, A--3411 Weidling, Austria. rsc@runtux.com
+# #*** <License> ************************************************************#
+# This module is part of the package CNDB.OMP.__test__.
+#
+# This module is licensed under the terms of the BSD 3-Clause License
+# <http://www.c-tanzer.at/license/bsd_3c.html>.
+# #*** </License> ***********************************************************#
+#
+#++
+# Name
+#    CNDB.OMP.__test__.stress_allocation
+#
+# Purpose
+#    Stress test of parallel allocations from the same IP pool
+#
+# Usage
+#    python -m _CNDB._OMP.__test__.stress_allocation \
+#        -db_url sqlite:////tmp/stress.sqlite -workers 8 -ops 50
+#
+#    Each worker process opens its own scope and allocates `ops` networks
+#    from the same pool, committing each allocation. Afterwards, the
+#    allocated networks must not overlap and their number must match the
+#    allocations reported by the workers. Needs a database supporting
+#    concurrent writers, i.e., not `hps`.
+#
+# Revision Dates
+#    18-Oct-2026 (RS) Creation
+#    ««revision-date»»···
+#--
+
+from   _CNDB._OMP.__test__.model      import *
+
+import _TFL.CAO
+
+import multiprocessing
+import random
+import sys
+import time
+
+pool_name = "stress"
+_cmd      = None
+
+def _person (scope, i, create = False) :
+    Person = scope.PAP.Person if create else scope.PAP.Person.instance
+    return Person ("Stress", "Worker %d" % (i, ), raw = True)
+# end def _person
+
+def setup (cmd) :
+    """Create a new database with the pool and an owner per worker."""
+    scope = Scaffold.scope (cmd.db_url, None, create = True, verbose = False)
+    try :
+        ff      = scope.PAP.Association \
+            ("Funkfeuer", short_name = "0xFF", raw = True)
+        pool    = scope.CNDB.IP4_Network (cmd.network, owner = ff, raw = True)
+        ip_pool = scope.CNDB.IP4_Pool \
+            (name = pool_name, allocation_strategy = cmd.strategy, raw = True)
+        scope.CNDB.IP4_Network_in_IP4_Pool (pool, ip_pool)
+        for i in range (cmd.workers) :
+            _person (scope, i, create = True)
+        scope.commit ()
+    finally :
+        scope.destroy ()
+# end def setup
+
+def _init (cmd) :
+    ### the command isn't picklable, the forked workers inherit it
+    global _cmd
+    _cmd = cmd
+# end def _init
+
+def worker (i) :
+    """Allocate `cmd.ops` networks for worker `i`, return the number of
+       successful and failed allocations, the elapsed time, and the
+       unexpected errors.
+    """
+    cmd     = _cmd
+    rand    = random.Random (cmd.seed + i)
+    scope   = Scaffold.scope (cmd.db_url, None, create = False, verbose = False)
+    try :
+        ip_pool = scope.CNDB.IP4_Pool.instance (pool_name)
+        owner   = _person (scope, i)
+        errors  = []
+        ok      = failed = 0
+        start   = time.time ()
+        for k in range (cmd.ops) :
+            ml = rand.choice (cmd.mask_lens)
+            try :
+                ip_pool.allocate (ml, owner, commit = True)
+            except \
+                    ( CNDB.OMP.Error.No_Free_Address_Range
+                    , MOM.Error.Commit_Conflict
+                    ) :
+                failed += 1
+            except Exception as exc :
+                ### entities in `exc` aren't picklable, return a string
+                errors.append \
+                    ("worker %d: %s: %s" % (i, exc.__class__.__name__, exc))
+            else :
+                ok += 1
+                continue
+            scope.rollback ()
+            ip_pool = scope.pid_query (ip_pool.pid)
+        return ok, failed, time.time () - start, errors
+    finally :
+        scope.destroy ()
+# end def worker
+
+def check (cmd, allocated) :
+    """Return a list of the errors found in the database."""
+    errors = []
+    scope  = Scaffold.scope (cmd.db_url, None, create = False, verbose = False)
+    try :
+        pool   = scope.CNDB.IP4_Network.instance (cmd.network, raw = True)
+        owners = set (_person (scope, i).pid for i in range (cmd.workers))
+        nws    = list \
+            (  n for n in scope.CNDB.IP4_Network.query ()
+            if n.owner is not None and n.owner.pid in owners
+            )
+        if len (nws) != allocated :
+            errors.append \
+                ( "%d networks in database, but %d allocations"
+                % (len (nws), allocated)
+                )
+        if pool.alloc_version != allocated :
+            errors.append \
+                ( "alloc_version of pool is %d, but %d allocations"
+                % (pool.alloc_version, allocated)
+                )
+        last = None
+        for n in sorted (nws, key = lambda n : n.net_address.ip) :
+            na = n.net_address
+            if last is not None and na.ip < last [0] :
+                errors.append ("%s overlaps %s" % (na, last [1]))
+            end = na.ip + (1 << (na.bitlen - na.mask_len))
+            if last is None or end > last [0] :
+                last = (end, na)
+    finally :
+        scope.destroy ()
+    return errors
+# end def check
+
+def _main (cmd) :
+    setup (cmd)
+    ctx  = multiprocessing.get_context ("fork")
+    pool = ctx.Pool (cmd.workers, initializer = _init, initargs = (cmd, ))
+    try :
+        results = pool.map (worker, range (cmd.workers), chunksize = 1)
+    finally :
+        pool.close ()
+        pool.join  ()
+    allocated = sum (r [0] for r in results)
+    errors    = []
+    for i, (ok, failed, seconds, errs) in enumerate (results) :
+        print \
+            ( "worker %2d: %5d allocated %5d failed %8.2f s"
+            % (i, ok, failed, seconds)
+            )
+        errors.extend (errs)
+    errors.extend (check (cmd, allocated))
+    for e in errors :
+        print (e)
+    print ("%d allocations, %d errors" % (allocated, len (errors)))
+    if errors :
+        sys.exit (1)
+# end def _main
+
+_Command = TFL.CAO.Cmd \
+    ( handler       = _main
+    , opts          =
+        ( "-db_url:S=sqlite:////tmp/stress_allocation.sqlite"
+            "?Database to run the stress test against (recreated)"
+        , "-mask_lens:I,=32,32,32,30,29?Mask lengths allocated at random"
+        , "-network:S=10.0.0.0/16?Network of the pool"
+        , "-ops:I=50?Number of allocations per worker"
+        , "-seed:I=42?Seed of the random mask lengths"
+        , "-strategy:S=Best_Fit?Allocation strategy of the pool"
+        , "-workers:I=4?Number of parallel worker processes"
+        )
+    , max_args      = 0
+    )
+
+if __name__ == "__main__" :
+    _Command ()
+### __END__ CNDB.OMP.__test__.stress_allocation